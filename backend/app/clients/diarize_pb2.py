@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\rdiarize.proto\x12\x10services.diarize"\x1c\n\x0c\x41udioRequest\x12\x0c\n\x04path\x18\x01 \x01(\t"6\n\x07Segment\x12\r\n\x05start\x18\x01 \x01(\x02\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x02\x12\x0f\n\x07speaker\x18\x03 \x01(\t"@\n\x11\x44iarizationResult\x12+\n\x08segments\x18\x01 \x03(\x0b\x32\x19.services.diarize.Segment2U\n\x07\x44iarize\x12J\n\x03Run\x12\x1e.services.diarize.AudioRequest\x1a#.services.diarize.DiarizationResultb\x06proto3'
+    b'\n\rdiarize.proto\x12\x10services.diarize",\n\x0c\x41udioRequest\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06packed\x18\x02 \x01(\x08"*\n\nAudioChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\x0e\n\x06packed\x18\x02 \x01(\x08"6\n\x07Segment\x12\r\n\x05start\x18\x01 \x01(\x02\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x02\x12\x0f\n\x07speaker\x18\x03 \x01(\t"V\n\x0fSpeakerTimeline\x12\x0e\n\x06starts\x18\x01 \x03(\x02\x12\x0c\n\x04\x65nds\x18\x02 \x03(\x02\x12\x13\n\x0bspeaker_idx\x18\x03 \x03(\r\x12\x10\n\x08speakers\x18\x04 \x03(\t"u\n\x11\x44iarizationResult\x12+\n\x08segments\x18\x01 \x03(\x0b\x32\x19.services.diarize.Segment\x12\x33\n\x08timeline\x18\x02 \x01(\x0b\x32!.services.diarize.SpeakerTimeline2\xa7\x01\n\x07\x44iarize\x12J\n\x03Run\x12\x1e.services.diarize.AudioRequest\x1a#.services.diarize.DiarizationResult\x12P\n\tRunChunks\x12\x1c.services.diarize.AudioChunk\x1a#.services.diarize.DiarizationResult(\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -29,11 +29,15 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'diarize_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
     _globals['_AUDIOREQUEST']._serialized_start = 35
-    _globals['_AUDIOREQUEST']._serialized_end = 63
-    _globals['_SEGMENT']._serialized_start = 65
-    _globals['_SEGMENT']._serialized_end = 119
-    _globals['_DIARIZATIONRESULT']._serialized_start = 121
-    _globals['_DIARIZATIONRESULT']._serialized_end = 185
-    _globals['_DIARIZE']._serialized_start = 187
-    _globals['_DIARIZE']._serialized_end = 272
+    _globals['_AUDIOREQUEST']._serialized_end = 79
+    _globals['_AUDIOCHUNK']._serialized_start = 81
+    _globals['_AUDIOCHUNK']._serialized_end = 123
+    _globals['_SEGMENT']._serialized_start = 125
+    _globals['_SEGMENT']._serialized_end = 179
+    _globals['_SPEAKERTIMELINE']._serialized_start = 181
+    _globals['_SPEAKERTIMELINE']._serialized_end = 267
+    _globals['_DIARIZATIONRESULT']._serialized_start = 269
+    _globals['_DIARIZATIONRESULT']._serialized_end = 386
+    _globals['_DIARIZE']._serialized_start = 389
+    _globals['_DIARIZE']._serialized_end = 556
 # @@protoc_insertion_point(module_scope)
@@ -42,6 +42,12 @@ class DiarizeStub:
             response_deserializer=diarize__pb2.DiarizationResult.FromString,
             _registered_method=True,
         )
+        self.RunChunks = channel.stream_unary(
+            '/services.diarize.Diarize/RunChunks',
+            request_serializer=diarize__pb2.AudioChunk.SerializeToString,
+            response_deserializer=diarize__pb2.DiarizationResult.FromString,
+            _registered_method=True,
+        )
 
 
 class DiarizeServicer:
@@ -53,6 +59,12 @@ class DiarizeServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RunChunks(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_DiarizeServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -61,6 +73,11 @@ def add_DiarizeServicer_to_server(servicer, server):
             request_deserializer=diarize__pb2.AudioRequest.FromString,
             response_serializer=diarize__pb2.DiarizationResult.SerializeToString,
         ),
+        'RunChunks': grpc.stream_unary_rpc_method_handler(
+            servicer.RunChunks,
+            request_deserializer=diarize__pb2.AudioChunk.FromString,
+            response_serializer=diarize__pb2.DiarizationResult.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         'services.diarize.Diarize', rpc_method_handlers
@@ -102,3 +119,33 @@ class Diarize:
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def RunChunks(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/services.diarize.Diarize/RunChunks',
+            diarize__pb2.AudioChunk.SerializeToString,
+            diarize__pb2.DiarizationResult.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import partial
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, cast
 
 import grpc  # type: ignore[import-untyped]  # noqa: TC002
@@ -21,21 +23,47 @@ from app.clients import (
 from app.clients import (
     transcribe_pb2 as _transcribe_pb2,
 )
+from app.clients.speaker_timeline import SpeakerTimeline
 
 diarize_pb2 = cast('Any', _diarize_pb2)
 summarize_pb2 = cast('Any', _summarize_pb2)
 transcribe_pb2 = cast('Any', _transcribe_pb2)
 
 if TYPE_CHECKING:  # pragma: no cover - imports for typing only
-    from collections.abc import AsyncIterator
-    from pathlib import Path
+    from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
 
     from google.protobuf.message import Message  # type: ignore[import-untyped]
 
 
 def _message_to_dict(message: Message) -> dict[str, Any]:
-    """Convert protobuf message into plain dictionary."""
-    return cast('dict[str, Any]', MessageToDict(message, preserving_proto_field_name=True))
+    """Convert protobuf message into plain dictionary.
+
+    Scalar fields are always emitted so that zero offsets such as ``start=0.0``
+    survive the conversion.
+    """
+    payload = MessageToDict(
+        message,
+        preserving_proto_field_name=True,
+        always_print_fields_with_no_presence=True,
+    )
+    return cast('dict[str, Any]', payload)
+
+
+async def _iter_audio_chunk_messages(
+    chunk_factory: Callable[..., Message],
+    source: Iterable[bytes] | AsyncIterable[bytes],
+) -> AsyncIterator[Message]:
+    """Wrap raw audio chunks into ``AudioChunk`` request messages.
+
+    gRPC pulls from this iterator only as fast as the transport window allows,
+    so upstream producers are throttled by the remote service.
+    """
+    if hasattr(source, '__aiter__'):
+        async for data in cast('AsyncIterable[bytes]', source):
+            yield chunk_factory(data=bytes(data))
+        return
+    for data in cast('Iterable[bytes]', source):
+        yield chunk_factory(data=bytes(data))
 
 
 class _BaseGrpcClient:
@@ -56,25 +84,25 @@ class TranscribeGrpcClient(_BaseGrpcClient):
         super().__init__(channel)
         self._stub = transcribe_pb2_grpc.TranscribeStub(channel)
 
-    async def run(self, source: Path) -> dict[str, Any]:
-        """Fetch the entire transcript payload for the provided audio source."""
-        request = transcribe_pb2.AudioRequest(path=str(source))
-        response = await self._stub.Run(request)
+    async def run(self, source: Path | Iterable[bytes] | AsyncIterable[bytes]) -> dict[str, Any]:
+        """Fetch the entire transcript payload for the provided audio source.
+
+        A :class:`~pathlib.Path` is resolved on the GPU node, while byte chunks
+        are uploaded through the client-streaming ``RunChunks`` RPC.
+        """
+        if isinstance(source, Path):
+            request = transcribe_pb2.AudioRequest(path=str(source))
+            response = await self._stub.Run(request)
+        else:
+            chunks = _iter_audio_chunk_messages(transcribe_pb2.AudioChunk, source)
+            response = await self._stub.RunChunks(chunks)
         return _message_to_dict(response)
 
     async def stream_run(self, source: Path) -> AsyncIterator[dict[str, Any]]:
-        """Yield transcript fragments for streaming use cases."""
-        payload = await self.run(source)
-        segments = payload.get('segments')
-        if isinstance(segments, list):
-            for segment in segments:
-                if isinstance(segment, dict):
-                    yield {'segment': segment}
-            return
-
-        text = payload.get('text')
-        if isinstance(text, str):
-            yield {'text': text}
+        """Yield transcript segments as the remote service decodes them."""
+        request = transcribe_pb2.AudioRequest(path=str(source))
+        async for segment in self._stub.StreamRun(request):
+            yield {'segment': _message_to_dict(segment)}
 
 
 class DiarizeGrpcClient(_BaseGrpcClient):
@@ -84,20 +112,28 @@ class DiarizeGrpcClient(_BaseGrpcClient):
         super().__init__(channel)
         self._stub = diarize_pb2_grpc.DiarizeStub(channel)
 
-    async def run(self, source: Path) -> dict[str, Any]:
-        """Fetch diarization segments for the provided audio source."""
-        request = diarize_pb2.AudioRequest(path=str(source))
-        response = await self._stub.Run(request)
-        return _message_to_dict(response)
+    async def run(self, source: Path | Iterable[bytes] | AsyncIterable[bytes]) -> dict[str, Any]:
+        """Fetch diarization segments for the provided audio source.
+
+        A :class:`~pathlib.Path` is resolved on the GPU node, while byte chunks
+        are uploaded through the client-streaming ``RunChunks`` RPC. The
+        service is asked for its packed encoding, which is decoded into the
+        :class:`SpeakerTimeline` returned under ``timeline``.
+        """
+        if isinstance(source, Path):
+            request = diarize_pb2.AudioRequest(path=str(source), packed=True)
+            response = await self._stub.Run(request)
+        else:
+            chunk_factory = partial(diarize_pb2.AudioChunk, packed=True)
+            chunks = _iter_audio_chunk_messages(chunk_factory, source)
+            response = await self._stub.RunChunks(chunks)
+        return {'timeline': SpeakerTimeline.from_message(response)}
 
     async def stream_run(self, source: Path) -> AsyncIterator[dict[str, Any]]:
         """Yield diarization segments one by one."""
         payload = await self.run(source)
-        segments = payload.get('segments')
-        if isinstance(segments, list):
-            for segment in segments:
-                if isinstance(segment, dict):
-                    yield segment
+        for segment in payload['timeline'].iter_segments():
+            yield segment
 
 
 class SummarizeGrpcClient(_BaseGrpcClient):
@@ -118,13 +154,14 @@ class SummarizeGrpcClient(_BaseGrpcClient):
         return payload
 
     async def stream_run(self, text: str) -> AsyncIterator[dict[str, Any]]:
-        """Yield summary chunks. Currently returns a single response."""
-        payload = await self.run(text)
-        summary_text = payload.get('summary')
-        if isinstance(summary_text, str):
-            yield {'summary': summary_text}
-            return
-        yield payload
+        """Yield summary text as the remote LLM generates it.
+
+        Every chunk holds the next fragment under ``summary``; the full summary
+        is the concatenation of all fragments.
+        """
+        request = summarize_pb2.TextRequest(text=text)
+        async for fragment in self._stub.StreamRun(request):
+            yield {'summary': fragment.text}
 
 
 __all__ = [
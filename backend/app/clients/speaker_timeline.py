@@ -0,0 +1,138 @@
+"""Columnar diarization results decoded without per-segment objects."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import accumulate, pairwise
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from collections.abc import Iterable, Iterator
+
+
+@dataclass(frozen=True)
+class SpeakerTimeline:
+    """Diarization segments stored column by column and ordered by start time.
+
+    Entry ``i`` of :attr:`starts`, :attr:`ends` and :attr:`speaker_idx`
+    describes one segment; :attr:`speaker_idx` points into :attr:`speakers`.
+    """
+
+    starts: array[float]
+    ends: array[float]
+    speaker_idx: array[int]
+    speakers: tuple[str, ...]
+
+    @classmethod
+    def from_message(cls, message: Any) -> SpeakerTimeline:  # noqa: ANN401
+        """Decode a ``DiarizationResult`` message.
+
+        The packed ``timeline`` field is copied column by column. Servers that
+        predate it send ``Segment`` messages, which are read field by field
+        without going through dictionaries. Either way the segments are put
+        in start order, which :meth:`speaker_at` relies on.
+        """
+        if message.HasField('timeline'):
+            timeline = message.timeline
+            starts = array('d', timeline.starts)
+            ends = array('d', timeline.ends)
+            speaker_idx = array('I', timeline.speaker_idx)
+            if any(later < earlier for earlier, later in pairwise(starts)):
+                order = sorted(range(len(starts)), key=starts.__getitem__)
+                starts = array('d', (starts[index] for index in order))
+                ends = array('d', (ends[index] for index in order))
+                speaker_idx = array('I', (speaker_idx[index] for index in order))
+            return cls(
+                starts=starts,
+                ends=ends,
+                speaker_idx=speaker_idx,
+                speakers=tuple(timeline.speakers),
+            )
+        return cls._build(
+            sorted(
+                ((segment.start, segment.end, segment.speaker) for segment in message.segments),
+                key=lambda row: row[0],
+            )
+        )
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[object]) -> SpeakerTimeline:
+        """Build a timeline from segment dictionaries, skipping malformed entries.
+
+        Missing bounds are treated as open-ended.
+        """
+        rows: list[tuple[float, float, str]] = []
+        for segment in segments:
+            if not isinstance(segment, dict):
+                continue
+            speaker = segment.get('speaker')
+            if not isinstance(speaker, str):
+                continue
+            rows.append(
+                (
+                    _as_float(segment.get('start'), -math.inf),
+                    _as_float(segment.get('end'), math.inf),
+                    speaker,
+                )
+            )
+        rows.sort(key=lambda row: row[0])
+        return cls._build(rows)
+
+    @classmethod
+    def _build(cls, rows: Iterable[tuple[float, float, str]]) -> SpeakerTimeline:
+        """Split ``(start, end, speaker)`` rows into columns."""
+        starts: array[float] = array('d')
+        ends: array[float] = array('d')
+        speaker_idx: array[int] = array('I')
+        speakers: dict[str, int] = {}
+        for start, end, speaker in rows:
+            starts.append(start)
+            ends.append(end)
+            speaker_idx.append(speakers.setdefault(speaker, len(speakers)))
+        return cls(starts=starts, ends=ends, speaker_idx=speaker_idx, speakers=tuple(speakers))
+
+    def __len__(self) -> int:
+        """Return the number of segments."""
+        return len(self.starts)
+
+    @cached_property
+    def _running_max_ends(self) -> list[float]:
+        """Return the largest end time seen up to every segment, for bisection."""
+        return list(accumulate(self.ends, max))
+
+    def speaker_at(self, start: float | None, end: float | None) -> str | None:
+        """Return the speaker of the first segment overlapping ``[start, end)``.
+
+        Open bounds (``None``) extend to the beginning or end of the recording.
+        Returns ``None`` when no segment overlaps.
+        """
+        lower = -math.inf if start is None else start
+        upper = math.inf if end is None else end
+        # Segments are sorted by start, so the first one whose end passes
+        # ``lower`` is the first candidate; it overlaps unless it starts too late.
+        index = bisect_right(self._running_max_ends, lower)
+        if index == len(self) or self.starts[index] >= upper:
+            return None
+        return self.speakers[self.speaker_idx[index]]
+
+    def iter_segments(self) -> Iterator[dict[str, Any]]:
+        """Yield every segment as a ``{'start', 'end', 'speaker'}`` dictionary."""
+        for start, end, index in zip(self.starts, self.ends, self.speaker_idx, strict=True):
+            yield {'start': start, 'end': end, 'speaker': self.speakers[index]}
+
+
+def _as_float(value: object, default: float) -> float:
+    """Convert *value* to float, falling back to *default*."""
+    if value is None:
+        return default
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+
+
+__all__ = ['SpeakerTimeline']
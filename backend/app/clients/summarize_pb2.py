@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x0fsummarize.proto\x12\x12services.summarize"\x1b\n\x0bTextRequest\x12\x0c\n\x04text\x18\x01 \x01(\t"\x17\n\x07Summary\x12\x0c\n\x04text\x18\x01 \x01(\t2P\n\tSummarize\x12\x43\n\x03Run\x12\x1f.services.summarize.TextRequest\x1a\x1b.services.summarize.Summaryb\x06proto3'
+    b'\n\x0fsummarize.proto\x12\x12services.summarize"\x1b\n\x0bTextRequest\x12\x0c\n\x04text\x18\x01 \x01(\t"\x17\n\x07Summary\x12\x0c\n\x04text\x18\x01 \x01(\t2\x9d\x01\n\tSummarize\x12\x43\n\x03Run\x12\x1f.services.summarize.TextRequest\x1a\x1b.services.summarize.Summary\x12K\n\tStreamRun\x12\x1f.services.summarize.TextRequest\x1a\x1b.services.summarize.Summary0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -32,6 +32,6 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals['_TEXTREQUEST']._serialized_end = 66
     _globals['_SUMMARY']._serialized_start = 68
     _globals['_SUMMARY']._serialized_end = 91
-    _globals['_SUMMARIZE']._serialized_start = 93
-    _globals['_SUMMARIZE']._serialized_end = 173
+    _globals['_SUMMARIZE']._serialized_start = 94
+    _globals['_SUMMARIZE']._serialized_end = 251
 # @@protoc_insertion_point(module_scope)
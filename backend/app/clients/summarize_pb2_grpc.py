@@ -42,6 +42,12 @@ class SummarizeStub:
             response_deserializer=summarize__pb2.Summary.FromString,
             _registered_method=True,
         )
+        self.StreamRun = channel.unary_stream(
+            '/services.summarize.Summarize/StreamRun',
+            request_serializer=summarize__pb2.TextRequest.SerializeToString,
+            response_deserializer=summarize__pb2.Summary.FromString,
+            _registered_method=True,
+        )
 
 
 class SummarizeServicer:
@@ -53,6 +59,12 @@ class SummarizeServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def StreamRun(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SummarizeServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -61,6 +73,11 @@ def add_SummarizeServicer_to_server(servicer, server):
             request_deserializer=summarize__pb2.TextRequest.FromString,
             response_serializer=summarize__pb2.Summary.SerializeToString,
         ),
+        'StreamRun': grpc.unary_stream_rpc_method_handler(
+            servicer.StreamRun,
+            request_deserializer=summarize__pb2.TextRequest.FromString,
+            response_serializer=summarize__pb2.Summary.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         'services.summarize.Summarize', rpc_method_handlers
@@ -102,3 +119,33 @@ class Summarize:
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def StreamRun(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/services.summarize.Summarize/StreamRun',
+            summarize__pb2.TextRequest.SerializeToString,
+            summarize__pb2.Summary.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x10transcribe.proto\x12\x13services.transcribe"\x1c\n\x0c\x41udioRequest\x12\x0c\n\x04path\x18\x01 \x01(\t"\x1a\n\nTranscript\x12\x0c\n\x04text\x18\x01 \x01(\t2W\n\nTranscribe\x12I\n\x03Run\x12!.services.transcribe.AudioRequest\x1a\x1f.services.transcribe.Transcriptb\x06proto3'
+    b'\n\x10transcribe.proto\x12\x13services.transcribe"\x1c\n\x0c\x41udioRequest\x12\x0c\n\x04path\x18\x01 \x01(\t"\x1a\n\nAudioChunk\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c"3\n\x07Segment\x12\r\n\x05start\x18\x01 \x01(\x02\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x02\x12\x0c\n\x04text\x18\x03 \x01(\t"J\n\nTranscript\x12\x0c\n\x04text\x18\x01 \x01(\t\x12.\n\x08segments\x18\x02 \x03(\x0b\x32\x1c.services.transcribe.Segment2\xf8\x01\n\nTranscribe\x12I\n\x03Run\x12!.services.transcribe.AudioRequest\x1a\x1f.services.transcribe.Transcript\x12O\n\tRunChunks\x12\x1f.services.transcribe.AudioChunk\x1a\x1f.services.transcribe.Transcript(\x01\x12N\n\tStreamRun\x12!.services.transcribe.AudioRequest\x1a\x1c.services.transcribe.Segment0\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -30,8 +30,12 @@ if not _descriptor._USE_C_DESCRIPTORS:
     DESCRIPTOR._loaded_options = None
     _globals['_AUDIOREQUEST']._serialized_start = 41
     _globals['_AUDIOREQUEST']._serialized_end = 69
-    _globals['_TRANSCRIPT']._serialized_start = 71
-    _globals['_TRANSCRIPT']._serialized_end = 97
-    _globals['_TRANSCRIBE']._serialized_start = 99
-    _globals['_TRANSCRIBE']._serialized_end = 186
+    _globals['_AUDIOCHUNK']._serialized_start = 71
+    _globals['_AUDIOCHUNK']._serialized_end = 97
+    _globals['_SEGMENT']._serialized_start = 99
+    _globals['_SEGMENT']._serialized_end = 150
+    _globals['_TRANSCRIPT']._serialized_start = 152
+    _globals['_TRANSCRIPT']._serialized_end = 226
+    _globals['_TRANSCRIBE']._serialized_start = 229
+    _globals['_TRANSCRIBE']._serialized_end = 477
 # @@protoc_insertion_point(module_scope)
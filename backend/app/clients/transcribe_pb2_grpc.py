@@ -42,6 +42,18 @@ class TranscribeStub:
             response_deserializer=transcribe__pb2.Transcript.FromString,
             _registered_method=True,
         )
+        self.RunChunks = channel.stream_unary(
+            '/services.transcribe.Transcribe/RunChunks',
+            request_serializer=transcribe__pb2.AudioChunk.SerializeToString,
+            response_deserializer=transcribe__pb2.Transcript.FromString,
+            _registered_method=True,
+        )
+        self.StreamRun = channel.unary_stream(
+            '/services.transcribe.Transcribe/StreamRun',
+            request_serializer=transcribe__pb2.AudioRequest.SerializeToString,
+            response_deserializer=transcribe__pb2.Segment.FromString,
+            _registered_method=True,
+        )
 
 
 class TranscribeServicer:
@@ -53,6 +65,18 @@ class TranscribeServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def RunChunks(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamRun(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TranscribeServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -61,6 +85,16 @@ def add_TranscribeServicer_to_server(servicer, server):
             request_deserializer=transcribe__pb2.AudioRequest.FromString,
             response_serializer=transcribe__pb2.Transcript.SerializeToString,
         ),
+        'RunChunks': grpc.stream_unary_rpc_method_handler(
+            servicer.RunChunks,
+            request_deserializer=transcribe__pb2.AudioChunk.FromString,
+            response_serializer=transcribe__pb2.Transcript.SerializeToString,
+        ),
+        'StreamRun': grpc.unary_stream_rpc_method_handler(
+            servicer.StreamRun,
+            request_deserializer=transcribe__pb2.AudioRequest.FromString,
+            response_serializer=transcribe__pb2.Segment.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         'services.transcribe.Transcribe', rpc_method_handlers
@@ -102,3 +136,63 @@ class Transcribe:
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def RunChunks(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/services.transcribe.Transcribe/RunChunks',
+            transcribe__pb2.AudioChunk.SerializeToString,
+            transcribe__pb2.Transcript.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def StreamRun(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/services.transcribe.Transcribe/StreamRun',
+            transcribe__pb2.AudioRequest.SerializeToString,
+            transcribe__pb2.Segment.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
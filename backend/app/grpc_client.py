@@ -6,7 +6,7 @@ import copy
 import json
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import grpc  # type: ignore[import-untyped]
 
@@ -14,7 +14,7 @@ from app.clients import DiarizeGrpcClient, SummarizeGrpcClient, TranscribeGrpcCl
 from app.core.settings import GPUSettings  # noqa: TC001
 
 if TYPE_CHECKING:  # pragma: no cover - only for type hints
-    from collections.abc import AsyncIterator, Iterable
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable
 
     from grpc import aio as grpc_aio
 
@@ -26,9 +26,9 @@ class MockTranscribeClient:
         self._fixture_path = fixture_path
         self._cached_data: dict[str, Any] | None = None
 
-    async def run(self, source: Iterable[bytes]) -> dict[str, Any]:
+    async def run(self, source: Iterable[bytes] | AsyncIterable[bytes]) -> dict[str, Any]:
         """Return transcript data from fixture."""
-        _consume_stream(source)
+        await _consume_stream(source)
         if self._cached_data is None:
             self._cached_data = json.loads(self._fixture_path.read_text(encoding='utf-8'))
         return copy.deepcopy(self._cached_data)
@@ -55,9 +55,9 @@ class MockDiarizeClient:
         self._fixture_path = fixture_path
         self._cached_data: dict[str, Any] | None = None
 
-    async def run(self, source: Iterable[bytes]) -> dict[str, Any]:
+    async def run(self, source: Iterable[bytes] | AsyncIterable[bytes]) -> dict[str, Any]:
         """Return diarization data from fixture."""
-        _consume_stream(source)
+        await _consume_stream(source)
         if self._cached_data is None:
             self._cached_data = json.loads(self._fixture_path.read_text(encoding='utf-8'))
         return copy.deepcopy(self._cached_data)
@@ -124,12 +124,21 @@ def _create_channel(settings: GPUSettings) -> grpc_aio.Channel:
     return grpc.aio.insecure_channel(target)
 
 
-def _consume_stream(stream: Iterable[bytes]) -> None:
+async def _consume_stream(stream: Iterable[bytes] | AsyncIterable[bytes]) -> None:
     """Read the entire stream to emulate GPU client behaviour."""
-    for chunk in stream:
-        if not isinstance(chunk, (bytes, bytearray)):
-            message = 'Audio chunks must be bytes-like'
-            raise TypeError(message)
+    if hasattr(stream, '__aiter__'):
+        async for chunk in cast('AsyncIterable[bytes]', stream):
+            _ensure_bytes(chunk)
+        return
+    for chunk in cast('Iterable[bytes]', stream):
+        _ensure_bytes(chunk)
+
+
+def _ensure_bytes(chunk: object) -> None:
+    """Reject audio chunks that are not bytes-like."""
+    if not isinstance(chunk, (bytes, bytearray)):
+        message = 'Audio chunks must be bytes-like'
+        raise TypeError(message)
 
 
 def create_grpc_client(
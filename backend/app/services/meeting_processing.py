@@ -8,23 +8,33 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, NotRequired, Protocol, TypedDict
 
+from app.clients.speaker_timeline import SpeakerTimeline
+
 if TYPE_CHECKING:  # pragma: no cover - typing only
-    from collections.abc import Iterable, Iterator
+    from collections.abc import AsyncIterable, AsyncIterator
+    from io import BufferedReader
     from pathlib import Path
 
+AUDIO_CHUNK_SIZE = 64 * 1024
+MAX_BUFFERED_AUDIO_CHUNKS = 16
+
 
 class TranscribeClientProtocol(Protocol):
     """Protocol describing the transcription client."""
 
-    async def run(self, source: Iterable[bytes]) -> dict[str, Any]:  # pragma: no cover - protocol
-        """Return transcription payload for the provided audio source."""
+    async def run(
+        self, source: AsyncIterable[bytes]
+    ) -> dict[str, Any]:  # pragma: no cover - protocol
+        """Return transcription payload for the provided audio chunks."""
 
 
 class DiarizeClientProtocol(Protocol):
     """Protocol describing the diarization client."""
 
-    async def run(self, source: Iterable[bytes]) -> dict[str, Any]:  # pragma: no cover - protocol
-        """Return diarization payload for the provided audio source."""
+    async def run(
+        self, source: AsyncIterable[bytes]
+    ) -> dict[str, Any]:  # pragma: no cover - protocol
+        """Return diarization payload for the provided audio chunks."""
 
 
 class SummarizeClientProtocol(Protocol):
@@ -33,6 +43,11 @@ class SummarizeClientProtocol(Protocol):
     async def run(self, transcript: str) -> dict[str, Any]:  # pragma: no cover - protocol
         """Return summary payload for the provided transcript text."""
 
+    def stream_run(
+        self, transcript: str
+    ) -> AsyncIterator[dict[str, Any]]:  # pragma: no cover - protocol
+        """Yield summary payload chunks whose ``summary`` fragments concatenate to the summary."""
+
 
 class MeetingEvent(TypedDict):
     """Structured data describing a single meeting fragment."""
@@ -76,17 +91,80 @@ class MeetingProcessingService:
         Returns:
             Result containing aggregated events and final summary text.
         """
-        transcribe_stream = self._iter_audio_chunks(audio_path)
-        diarize_stream = self._iter_audio_chunks(audio_path)
+        transcribe_payload, diarize_payload = await self._run_audio_services(audio_path)
 
-        transcribe_task = asyncio.create_task(self._transcribe_client.run(transcribe_stream))
-        diarize_task = asyncio.create_task(self._diarize_client.run(diarize_stream))
+        transcript_text = self._build_summary_input(transcribe_payload, diarize_payload)
+        summary_payload = await self._summarize_client.run(transcript_text)
 
-        transcribe_payload, diarize_payload = await asyncio.gather(transcribe_task, diarize_task)
+        return self._build_result(transcribe_payload, diarize_payload, summary_payload)
 
-        transcript_text = self._build_summary_input(transcribe_payload)
-        summary_payload = await self._summarize_client.run(transcript_text)
+    async def stream(self, audio_path: Path) -> AsyncIterator[str | MeetingProcessingResult]:
+        """Execute the processing pipeline and stream the summary as it is generated.
+
+        Args:
+            audio_path: Path to the audio file that should be processed.
+
+        Yields:
+            Consecutive fragments of the summary text while the summarizer
+            produces them, followed by the complete result as the last item.
+        """
+        transcribe_payload, diarize_payload = await self._run_audio_services(audio_path)
+
+        transcript_text = self._build_summary_input(transcribe_payload, diarize_payload)
+        summary_payload: dict[str, Any] = {}
+        summary_parts: list[str] = []
+        async for chunk in self._summarize_client.stream_run(transcript_text):
+            fragment = chunk.get('summary')
+            if isinstance(fragment, str):
+                summary_parts.append(fragment)
+                yield fragment
+            else:
+                summary_payload.update(chunk)
+        if summary_parts:
+            summary_payload['summary'] = ''.join(summary_parts)
+
+        yield self._build_result(transcribe_payload, diarize_payload, summary_payload)
+
+    async def _run_audio_services(self, audio_path: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return the transcription and diarization payloads for *audio_path*."""
+        # The file is read once and every chunk is handed to both services. The
+        # bounded queues let the slower upload throttle the reader.
+        audio_file = audio_path.open('rb')
+        transcribe_queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+            maxsize=MAX_BUFFERED_AUDIO_CHUNKS
+        )
+        diarize_queue: asyncio.Queue[bytes | BaseException | None] = asyncio.Queue(
+            maxsize=MAX_BUFFERED_AUDIO_CHUNKS
+        )
+        reader_task = asyncio.create_task(
+            self._broadcast_audio_chunks(audio_file, (transcribe_queue, diarize_queue))
+        )
+        transcribe_task = asyncio.create_task(
+            self._transcribe_client.run(self._iter_queued_chunks(transcribe_queue))
+        )
+        diarize_task = asyncio.create_task(
+            self._diarize_client.run(self._iter_queued_chunks(diarize_queue))
+        )
+
+        try:
+            transcribe_payload, diarize_payload = await asyncio.gather(
+                transcribe_task, diarize_task
+            )
+        finally:
+            for task in (reader_task, transcribe_task, diarize_task):
+                task.cancel()
+            await asyncio.gather(reader_task, transcribe_task, diarize_task, return_exceptions=True)
+            audio_file.close()
+
+        return transcribe_payload, diarize_payload
 
+    def _build_result(
+        self,
+        transcribe_payload: dict[str, Any],
+        diarize_payload: dict[str, Any],
+        summary_payload: dict[str, Any],
+    ) -> MeetingProcessingResult:
+        """Merge the service payloads into meeting events and the final summary."""
         diarization_segments = self._normalize_diarization_segments(diarize_payload)
         transcript_segments = self._normalize_transcription_segments(transcribe_payload)
 
@@ -109,43 +187,61 @@ class MeetingProcessingService:
 
         return MeetingProcessingResult(events=events, summary=summary)
 
-    def _iter_audio_chunks(
-        self,
-        audio_path: Path,
+    @staticmethod
+    async def _broadcast_audio_chunks(
+        audio_file: BufferedReader,
+        queues: tuple[asyncio.Queue[bytes | BaseException | None], ...],
         *,
-        chunk_size: int = 64 * 1024,
-    ) -> Iterable[bytes]:
-        """Yield audio file contents in fixed-size chunks."""
-
-        def generator() -> Iterator[bytes]:
-            with audio_path.open('rb') as audio_file:
-                while True:
-                    chunk = audio_file.read(chunk_size)
-                    if not chunk:
-                        break
-                    yield chunk
-
-        return generator()
-
-    def _build_summary_input(self, payload: dict[str, Any]) -> str:
-        """Return raw transcript text suitable for summarization input."""
-        segments = payload.get('segments')
-        if isinstance(segments, list):
-            texts: list[str] = []
-            for segment in segments:
-                text = segment.get('text') if isinstance(segment, dict) else None
-                if isinstance(text, str):
-                    cleaned = text.strip()
-                    if cleaned:
-                        texts.append(cleaned)
-            if texts:
-                return ' '.join(texts)
+        chunk_size: int = AUDIO_CHUNK_SIZE,
+    ) -> None:
+        """Read *audio_file* once and put every chunk on each consumer queue.
 
-        text = payload.get('text')
-        if isinstance(text, str):
-            return text.strip()
+        A ``None`` sentinel marks the end of the stream; read errors are
+        forwarded so that consumers fail instead of waiting forever.
+        """
+        item: bytes | BaseException | None
+        while True:
+            try:
+                item = await asyncio.to_thread(audio_file.read, chunk_size)
+            except OSError as exc:
+                item = exc
+            if not item:
+                item = None
+            for queue in queues:
+                await queue.put(item)
+            if not isinstance(item, bytes):
+                return
 
-        return ''
+    @staticmethod
+    async def _iter_queued_chunks(
+        queue: asyncio.Queue[bytes | BaseException | None],
+    ) -> AsyncIterator[bytes]:
+        """Yield audio chunks from *queue* until the end-of-stream sentinel."""
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+
+    def _build_summary_input(
+        self,
+        transcribe_payload: dict[str, Any],
+        diarize_payload: dict[str, Any],
+    ) -> str:
+        """Return the transcript as summarization input, one line per segment.
+
+        Each line opens with the segment's ``Speaker: `` label so that the
+        summarizer's chunking and pre-filter keep speaker turns together.
+        Segments no diarized speaker overlaps are sent without a label.
+        """
+        diarization_segments = self._normalize_diarization_segments(diarize_payload)
+        lines: list[str] = []
+        for segment in self._normalize_transcription_segments(transcribe_payload):
+            speaker = diarization_segments.speaker_at(segment['start'], segment['end'])
+            lines.append(segment['text'] if speaker is None else f'{speaker}: {segment["text"]}')
+        return '\n'.join(lines)
 
     def _normalize_transcription_segments(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
         """Normalize transcription payload to a list of segment dictionaries."""
@@ -189,30 +285,17 @@ class MeetingProcessingService:
 
         return []
 
-    def _normalize_diarization_segments(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
-        """Normalize diarization payload to a list of segment dictionaries."""
-        segments = payload.get('segments')
-        normalized: list[dict[str, Any]] = []
-
-        if not isinstance(segments, list):
-            return normalized
+    def _normalize_diarization_segments(self, payload: dict[str, Any]) -> SpeakerTimeline:
+        """Return the diarization payload as a timeline ordered by start time.
 
-        for segment in segments:
-            if not isinstance(segment, dict):
-                continue
-            speaker = segment.get('speaker')
-            if not isinstance(speaker, str):
-                continue
-            normalized.append(
-                {
-                    'start': self._as_float(segment.get('start')),
-                    'end': self._as_float(segment.get('end')),
-                    'speaker': speaker,
-                }
-            )
-
-        normalized.sort(key=lambda item: (math.inf if item['start'] is None else item['start']))
-        return normalized
+        Real clients already decode a packed :class:`SpeakerTimeline`; plain
+        ``segments`` lists (mock clients, fixtures) are converted.
+        """
+        timeline = payload.get('timeline')
+        if isinstance(timeline, SpeakerTimeline):
+            return timeline
+        segments = payload.get('segments')
+        return SpeakerTimeline.from_segments(segments if isinstance(segments, list) else [])
 
     def _build_summary_fragments(self, payload: dict[str, Any], expected_length: int) -> list[str]:
         """Produce per-segment summary fragments."""
@@ -259,44 +342,11 @@ class MeetingProcessingService:
     def _resolve_speaker(
         self,
         segment: dict[str, Any],
-        diarization_segments: list[dict[str, Any]],
+        diarization_segments: SpeakerTimeline,
     ) -> str:
         """Match a transcription segment to the most relevant speaker."""
-        start = segment.get('start')
-        end = segment.get('end')
-
-        if start is None and end is None:
-            return diarization_segments[0]['speaker'] if diarization_segments else 'Unknown'
-
-        for diar_segment in diarization_segments:
-            diar_start = diar_segment['start']
-            diar_end = diar_segment['end']
-
-            if diar_start is None and diar_end is None:
-                return diar_segment['speaker']
-
-            if self._segments_overlap(start, end, diar_start, diar_end):
-                return diar_segment['speaker']
-
-        return 'Unknown'
-
-    @staticmethod
-    def _segments_overlap(
-        start: float | None,
-        end: float | None,
-        diar_start: float | None,
-        diar_end: float | None,
-    ) -> bool:
-        """Return ``True`` when the provided intervals overlap."""
-        norm_start = float('-inf') if start is None else start
-        norm_end = float('inf') if end is None else end
-        norm_diar_start = float('-inf') if diar_start is None else diar_start
-        norm_diar_end = float('inf') if diar_end is None else diar_end
-
-        if norm_start >= norm_diar_end:
-            return False
-
-        return norm_end > norm_diar_start
+        speaker = diarization_segments.speaker_at(segment.get('start'), segment.get('end'))
+        return 'Unknown' if speaker is None else speaker
 
     @staticmethod
     def _as_float(value: float | str | None) -> float | None:
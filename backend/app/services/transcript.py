@@ -91,6 +91,11 @@ class TranscriptService:
     def stream_transcript(self, meeting_id: str) -> AsyncIterable[StreamItem]:
         """Return async iterable that yields transcript fragments and the summary.
 
+        While the summarizer is generating, every new piece of text is sent as
+        a ``summary`` event carrying only that ``delta``; clients append the
+        pieces. Transcript events and the final ``summary`` event, which holds
+        the full text, follow once the result has been stored.
+
         Args:
             meeting_id: Identifier of the meeting whose transcript should be streamed.
 
@@ -101,12 +106,22 @@ class TranscriptService:
         async def iterator() -> AsyncIterator[StreamItem]:
             meeting_uuid = self._parse_meeting_id(meeting_id)
             audio_path = self._resolve_audio_path(meeting_id)
+            result: MeetingProcessingResult | None = None
             try:
-                result = await self._meeting_processor.process(audio_path)
+                async for update in self._meeting_processor.stream(audio_path):
+                    if isinstance(update, MeetingProcessingResult):
+                        result = update
+                        continue
+                    yield self._build_summary_delta_item(update)
             except Exception:
                 await self._mark_meeting_failed(meeting_uuid)
                 raise
 
+            if result is None:  # pragma: no cover - defensive guard
+                await self._mark_meeting_failed(meeting_uuid)
+                message = 'Meeting processing finished without a result'
+                raise RuntimeError(message)
+
             try:
                 await self._persist_processing_result(meeting_uuid, result)
             except Exception:
@@ -139,6 +154,10 @@ class TranscriptService:
         for event in result.events:
             yield {'event': 'transcript', 'data': event}
 
+    def _build_summary_delta_item(self, delta: str) -> StreamItem:
+        """Return SSE payload for a piece of a summary that is still being generated."""
+        return {'event': 'summary', 'data': {'delta': delta}}
+
     def _build_summary_item(self, result: MeetingProcessingResult) -> StreamItem:
         """Return final summary SSE payload."""
         return {'event': 'summary', 'data': {'summary': result.summary}}
@@ -0,0 +1,109 @@
+"""Tests for the memory-mapped WAV reader shared by the GPU services."""
+
+from __future__ import annotations
+
+import importlib
+import struct
+import sys
+import wave
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+audio = importlib.import_module('gpu_services.audio')
+
+TARGET_RATE = 16000
+STEREO = 2
+STUDIO_RATE = 48000
+FLOAT_FRAMES = 1000
+
+
+def _write_pcm16(path: Path, frames: object, sample_rate: int) -> None:
+    samples = np.asarray(frames, dtype='<i2')
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    with wave.open(str(path), 'wb') as handle:
+        handle.setnchannels(channels)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(samples.tobytes())
+
+
+def _write_float32_extensible(path: Path, frames: object, sample_rate: int) -> None:
+    samples = np.asarray(frames, dtype='<f4')
+    channels = samples.shape[1]
+    subformat = struct.pack('<H', audio.WAVE_FORMAT_IEEE_FLOAT) + bytes(14)
+    fmt = struct.pack(
+        '<HHIIHHHHI16s',
+        audio.WAVE_FORMAT_EXTENSIBLE,
+        channels,
+        sample_rate,
+        sample_rate * channels * 4,
+        channels * 4,
+        32,
+        22,
+        32,
+        0,
+        subformat,
+    )
+    data = samples.tobytes()
+    chunks = b'fmt ' + struct.pack('<I', len(fmt)) + fmt
+    chunks += b'LIST' + struct.pack('<I', 3) + b'abc\x00'
+    chunks += b'data' + struct.pack('<I', len(data)) + data
+    path.write_bytes(b'RIFF' + struct.pack('<I', 4 + len(chunks)) + b'WAVE' + chunks)
+
+
+def test_read_wav_info_reports_duration_from_header(tmp_path: Path) -> None:
+    """Duration and layout come from the header without decoding the samples."""
+    path = tmp_path / 'stereo.wav'
+    _write_pcm16(path, np.zeros((STUDIO_RATE * 3, STEREO)), STUDIO_RATE)
+
+    info = audio.read_wav_info(path)
+
+    assert info.sample_rate == STUDIO_RATE
+    assert info.num_channels == STEREO
+    assert info.num_frames == STUDIO_RATE * 3
+    assert info.duration == pytest.approx(3.0)
+
+
+def test_read_wav_info_rejects_other_formats(tmp_path: Path) -> None:
+    """Non-WAV payloads raise so callers can fall back to a full decoder."""
+    path = tmp_path / 'audio.mp3'
+    path.write_bytes(b'ID3' + bytes(64))
+
+    with pytest.raises(audio.AudioFormatError):
+        audio.read_wav_info(path)
+
+
+def test_wav_reader_mixes_channels_without_resampling(tmp_path: Path) -> None:
+    """16 kHz input is returned as-is apart from channel averaging and scaling."""
+    path = tmp_path / 'float.wav'
+    left = np.linspace(-0.5, 0.5, FLOAT_FRAMES, dtype=np.float32)
+    _write_float32_extensible(path, np.stack([left, -left * 0.5], axis=1), TARGET_RATE)
+
+    reader = audio.open_wav(path)
+
+    assert reader.num_samples == FLOAT_FRAMES
+    np.testing.assert_allclose(reader.read(100, 200), (left * 0.25)[100:200], atol=1e-7)
+    reader.close()
+
+
+@pytest.mark.parametrize('sample_rate', [8000, 44100, STUDIO_RATE])
+def test_wav_reader_resamples_windows_consistently(tmp_path: Path, sample_rate: int) -> None:
+    """Windowed reads match a single full read and preserve the signal."""
+    path = tmp_path / 'tone.wav'
+    times = np.arange(sample_rate) / sample_rate
+    tone = 0.5 * np.sin(2 * np.pi * 440 * times)
+    _write_pcm16(path, np.round(tone * 32767), sample_rate)
+
+    reader = audio.open_wav(path)
+    full = reader.read(0, reader.num_samples)
+    windows = [reader.read(start, start + 3000) for start in range(0, reader.num_samples, 3000)]
+
+    assert reader.num_samples == TARGET_RATE
+    np.testing.assert_allclose(np.concatenate(windows), full, atol=1e-6)
+    expected = 0.5 * np.sin(2 * np.pi * 440 * np.arange(TARGET_RATE) / TARGET_RATE)
+    np.testing.assert_allclose(full[200:-200], expected[200:-200], atol=2e-3)
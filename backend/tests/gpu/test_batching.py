@@ -0,0 +1,154 @@
+"""Tests for the micro-batching scheduler used by the GPU services."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+batching = importlib.import_module('gpu_services.batching')
+metrics = importlib.import_module('gpu_services.metrics')
+
+GOOD_RESULT = 10
+OTHER_RESULT = 20
+
+
+def test_concurrent_submissions_share_one_batch() -> None:
+    """Items queued within the wait window should be processed together."""
+    registry = metrics.MetricsRegistry()
+    seen_batches: list[list[int]] = []
+
+    def process(items: list[int]) -> list[int]:
+        seen_batches.append(items)
+        return [item * 10 for item in items]
+
+    batcher = batching.MicroBatcher(
+        process,
+        max_batch_size=8,
+        max_wait_seconds=0.5,
+        name='test',
+        registry=registry,
+    )
+    futures = batcher.submit_many([1, 2, 3])
+
+    assert [future.result(timeout=5) for future in futures] == [10, 20, 30]
+    assert seen_batches == [[1, 2, 3]]
+
+    batcher.close(timeout=5)
+    histogram = registry.histogram('test_batch_size', '')
+    assert histogram.count == 1
+    assert histogram.total == pytest.approx(3)
+    assert registry.gauge('test_queue_depth', '').value == 0
+
+
+def test_batches_respect_max_batch_size() -> None:
+    """The scheduler should never hand more than ``max_batch_size`` items over."""
+    seen_sizes: list[int] = []
+
+    def process(items: list[str]) -> list[str]:
+        seen_sizes.append(len(items))
+        return [item.upper() for item in items]
+
+    batcher = batching.MicroBatcher(
+        process,
+        max_batch_size=2,
+        max_wait_seconds=0.2,
+        name='limited',
+        registry=metrics.MetricsRegistry(),
+    )
+    futures = batcher.submit_many(['a', 'b', 'c', 'd', 'e'])
+
+    assert [future.result(timeout=5) for future in futures] == ['A', 'B', 'C', 'D', 'E']
+    assert max(seen_sizes) <= 2  # noqa: PLR2004
+    assert sum(seen_sizes) == 5  # noqa: PLR2004
+    batcher.close(timeout=5)
+
+
+def test_batch_errors_are_propagated_to_every_caller() -> None:
+    """A failing item should fail its caller's future with the callback's error."""
+
+    def process(items: list[int]) -> list[int]:
+        message = f'cannot process {len(items)} items'
+        raise ValueError(message)
+
+    batcher = batching.MicroBatcher(
+        process,
+        max_batch_size=4,
+        max_wait_seconds=0.0,
+        name='failing',
+        registry=metrics.MetricsRegistry(),
+    )
+    future = batcher.submit(1)
+
+    with pytest.raises(ValueError, match='cannot process'):
+        future.result(timeout=5)
+    batcher.close(timeout=5)
+
+
+def test_failed_batch_is_retried_item_by_item() -> None:
+    """One bad item should not fail the requests it was batched with."""
+    seen_batches: list[list[int]] = []
+
+    def process(items: list[int]) -> list[int]:
+        seen_batches.append(items)
+        if any(item < 0 for item in items):
+            message = 'negative item'
+            raise ValueError(message)
+        return [item * 10 for item in items]
+
+    registry = metrics.MetricsRegistry()
+    batcher = batching.MicroBatcher(
+        process,
+        max_batch_size=3,
+        max_wait_seconds=0.5,
+        name='retrying',
+        registry=registry,
+    )
+    good, bad, other = batcher.submit_many([1, -1, 2])
+
+    assert good.result(timeout=5) == GOOD_RESULT
+    assert other.result(timeout=5) == OTHER_RESULT
+    with pytest.raises(ValueError, match='negative'):
+        bad.result(timeout=5)
+    assert seen_batches == [[1, -1, 2], [1], [-1], [2]]
+    assert batcher.in_flight == 0
+    batcher.close(timeout=5)
+
+
+def test_items_queued_behind_stop_fail_instead_of_hanging() -> None:
+    """Closing should fail leftover futures and reject later submissions."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def process(items: list[int]) -> list[int]:
+        started.set()
+        release.wait(timeout=5)
+        return items
+
+    batcher = batching.MicroBatcher(
+        process,
+        max_batch_size=1,
+        max_wait_seconds=0.0,
+        name='closing',
+        registry=metrics.MetricsRegistry(),
+    )
+    running = batcher.submit(1)
+    started.wait(timeout=5)
+    # Reproduce an item that raced past close() and landed behind the stop marker.
+    batcher._queue.put(batching._STOP)  # noqa: SLF001
+    leftover: Future[int] = Future()
+    batcher._queue.put(batching._PendingItem(2, leftover, 0.0))  # noqa: SLF001
+    release.set()
+
+    assert running.result(timeout=5) == 1
+    with pytest.raises(RuntimeError, match='closed'):
+        leftover.result(timeout=5)
+    batcher.close(timeout=5)
+    with pytest.raises(RuntimeError, match='closed'):
+        batcher.submit(3)
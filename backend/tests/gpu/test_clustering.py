@@ -0,0 +1,87 @@
+"""Tests for speaker clustering of embedding matrices."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+clustering = importlib.import_module('gpu_services.clustering')
+
+EMBEDDING_DIM = 64
+PRUNED_NEIGHBOURS = 3
+
+
+def _speaker_blobs(sizes: list[int], *, seed: int = 0) -> tuple[object, list[int]]:
+    """Return noisy embeddings around one random centre per speaker, in timeline order."""
+    rng = np.random.default_rng(seed)
+    centres = rng.normal(size=(len(sizes), EMBEDDING_DIM))
+    rows = []
+    labels: list[int] = []
+    for speaker, size in enumerate(sizes):
+        rows.append(centres[speaker] + 0.8 * rng.normal(size=(size, EMBEDDING_DIM)))
+        labels.extend([speaker] * size)
+    return np.concatenate(rows), labels
+
+
+@pytest.mark.parametrize('sizes', [[4, 3], [10, 6, 8], [40, 25, 30], [60]])
+def test_cluster_embeddings_recovers_speakers(sizes: list[int]) -> None:
+    """Both the agglomerative and spectral paths find the speakers without a hint."""
+    embeddings, expected = _speaker_blobs(sizes)
+
+    labels = clustering.cluster_embeddings(embeddings)
+
+    assert labels.tolist() == expected
+
+
+def test_spectral_cluster_searches_pruning_on_a_subset_of_long_recordings() -> None:
+    """Affinity matrices above the search cap still yield the right speakers."""
+    sizes = [200, 150, 120]
+    embeddings, expected = _speaker_blobs(sizes, seed=2)
+    assert len(expected) > clustering.MAX_PRUNING_SEARCH_SIZE
+
+    labels = clustering.spectral_cluster(embeddings)
+
+    assert labels.tolist() == expected
+
+
+def test_cluster_embeddings_honours_known_speaker_count() -> None:
+    """A known speaker count overrides the similarity threshold."""
+    embeddings, _ = _speaker_blobs([5, 5, 5])
+
+    labels = clustering.cluster_embeddings(embeddings, num_speakers=2)
+
+    assert sorted(set(labels.tolist())) == [0, 1]
+
+
+def test_prune_affinity_keeps_symmetric_nearest_neighbours() -> None:
+    """Every row keeps its strongest links and the result stays symmetric."""
+    embeddings, _ = _speaker_blobs([6, 6], seed=1)
+    affinity = clustering.cosine_affinity(embeddings)
+
+    pruned = clustering.prune_affinity(affinity, PRUNED_NEIGHBOURS)
+
+    assert np.allclose(pruned, pruned.T)
+    assert ((pruned > 0).sum(axis=1) >= PRUNED_NEIGHBOURS).all()
+    assert pruned[:6, 6:].sum() == 0
+
+
+def test_distance_clustering_separates_speakers_cosine_cannot() -> None:
+    """Embeddings pointing the same way but differing in scale form separate clusters."""
+    rng = np.random.default_rng(2)
+    direction = rng.normal(size=EMBEDDING_DIM)
+    near = direction + 0.05 * rng.normal(size=(5, EMBEDDING_DIM))
+    far = 3.0 * direction + 0.05 * rng.normal(size=(4, EMBEDDING_DIM))
+    embeddings = np.concatenate([near, far, near[:2]])
+
+    by_cosine = clustering.agglomerative_cluster(embeddings)
+    by_distance = clustering.agglomerative_cluster_by_distance(embeddings, max_distance=2.0)
+
+    assert set(by_cosine.tolist()) == {0}
+    assert by_distance.tolist() == [0] * 5 + [1] * 4 + [0] * 2
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import importlib
 import sys
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from types import SimpleNamespace
@@ -24,10 +27,20 @@ class _SegmentMessageLike(Protocol):
     speaker: str
 
 
+class _SpeakerTimelineLike(Protocol):
+    """Protocol representing the packed diarization timeline message."""
+
+    starts: list[float]
+    ends: list[float]
+    speaker_idx: list[int]
+    speakers: list[str]
+
+
 class _DiarizationResultLike(Protocol):
     """Protocol for the diarization response object used in tests."""
 
     segments: list[_SegmentMessageLike]
+    timeline: _SpeakerTimelineLike
 
 
 class _DiarizeServiceLike(Protocol):
@@ -59,13 +72,18 @@ class _DummySegment:
     start: float
     end: float
     speaker: str
+    identified: bool = False
 
 
 def _build_service(
     monkeypatch: pytest.MonkeyPatch,
     workdir: Path,
+    in_memory_diarizer: object | None = None,
 ) -> _DiarizeServiceLike:
-    """Create a diarization service instance with stubbed dependencies."""
+    """Create a diarization service instance with stubbed dependencies.
+
+    The in-memory pipeline is disabled unless *in_memory_diarizer* is given.
+    """
     config_path = workdir / 'config.yaml'
     vad_path = workdir / 'vad.nemo'
     speaker_path = workdir / 'speaker.nemo'
@@ -83,6 +101,16 @@ def _build_service(
 
     monkeypatch.setattr(diarize_service, 'ensure_nemo_artifacts_available', lambda: artifacts)
     monkeypatch.setattr(diarize_service, 'load_nemo_diarization_pipeline', lambda _: object())
+    monkeypatch.setenv('VAD_CACHE_DIR', str(workdir / 'speech-regions'))
+    if in_memory_diarizer is None:
+        monkeypatch.setenv('DIARIZATION_IN_MEMORY', '0')
+    else:
+        monkeypatch.setenv('DIARIZATION_IN_MEMORY', '1')
+        monkeypatch.setattr(
+            diarize_service,
+            'load_nemo_in_memory_diarizer',
+            lambda _: in_memory_diarizer,
+        )
 
     return diarize_service.DiarizeService()
 
@@ -115,7 +143,7 @@ def test_run_returns_normalised_segments(
         _fake_pipeline,
     )
 
-    request = SimpleNamespace(path=str(audio_path))
+    request = SimpleNamespace(path=str(audio_path), packed=False)
     context = _FakeContext()
 
     response = service.run(request, context)
@@ -159,7 +187,7 @@ def test_run_falls_back_to_single_speaker(
         _empty_pipeline,
     )
 
-    request = SimpleNamespace(path=str(audio_path))
+    request = SimpleNamespace(path=str(audio_path), packed=False)
     context = _FakeContext()
 
     response = service.run(request, context)
@@ -168,3 +196,253 @@ def test_run_falls_back_to_single_speaker(
         (0.0, 5.25, 'Speaker 1')
     ]
     assert context.aborted is None
+
+
+POOL_SIZE = 2
+
+
+def test_pooled_diarizers_run_concurrently(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """With a pool of two, two requests hold different diarizers at the same time."""
+    monkeypatch.setenv('DIARIZATION_POOL_SIZE', str(POOL_SIZE))
+    service = _build_service(monkeypatch, tmp_path)
+    barrier = threading.Barrier(POOL_SIZE, timeout=5)
+    used_diarizers: list[object] = []
+
+    def _fake_nemo(_: Path, diarizer: object) -> list[_DummySegment]:
+        used_diarizers.append(diarizer)
+        barrier.wait()
+        return [_DummySegment(start=0.0, end=1.0, speaker='alpha')]
+
+    monkeypatch.setattr(diarize_service, '_run_nemo_diarization', _fake_nemo)
+
+    run_pipeline = service._run_diarization_pipeline  # type: ignore[attr-defined]  # noqa: SLF001
+    with ThreadPoolExecutor(max_workers=POOL_SIZE) as executor:
+        runs = [executor.submit(run_pipeline, tmp_path / 'a.wav') for _ in range(POOL_SIZE)]
+        results = [run.result(timeout=10) for run in runs]
+
+    assert len(results) == POOL_SIZE
+    assert len({id(diarizer) for diarizer in used_diarizers}) == POOL_SIZE
+
+
+class _SourceLike(Protocol):
+    """Subset of the audio source interface used by the fake diarizer."""
+
+    num_samples: int
+
+
+@dataclass(slots=True)
+class _Labelled:
+    """Segment with an integer speaker id, as produced by the in-memory pipeline."""
+
+    start: float
+    end: float
+    speaker: int
+
+
+class _FakeInMemoryDiarizer:
+    """In-memory diarizer double that labels the first and second half of the audio."""
+
+    sample_rate = 16000
+
+    def __init__(self) -> None:
+        """Start without any recorded calls."""
+        self.num_samples: list[int] = []
+        self.regions: list[object] = []
+
+    def diarize_with_centroids(
+        self,
+        source: _SourceLike,
+        regions: object = None,
+    ) -> SimpleNamespace:
+        """Record the call and split the source between two orthogonal voices."""
+        self.num_samples.append(source.num_samples)
+        self.regions.append(regions)
+        middle = source.num_samples / self.sample_rate / 2
+        return SimpleNamespace(
+            segments=[_Labelled(0.0, middle, 0), _Labelled(middle, 2 * middle, 1)],
+            centroids=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]],
+        )
+
+
+def _write_silent_wav(path: Path, seconds: float) -> None:
+    """Write 16 kHz mono PCM silence."""
+    with wave.open(str(path), 'wb') as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(_FakeInMemoryDiarizer.sample_rate)
+        handle.writeframes(b'\x00\x00' * int(seconds * _FakeInMemoryDiarizer.sample_rate))
+
+
+def test_wav_input_is_diarized_without_temporary_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """WAV requests skip the NeMo manifest and RTTM round trip entirely."""
+    monkeypatch.setenv('DIARIZATION_SHARED_VAD', '1')
+    fake = _FakeInMemoryDiarizer()
+    service = _build_service(monkeypatch, tmp_path, in_memory_diarizer=fake)
+    audio_path = tmp_path / 'meeting.wav'
+    _write_silent_wav(audio_path, 4.0)
+
+    def _no_temporary_directory(*_: object) -> None:
+        message = 'The in-memory path must not create temporary directories'
+        raise AssertionError(message)
+
+    monkeypatch.setattr(diarize_service.tempfile, 'TemporaryDirectory', _no_temporary_directory)
+
+    response = service.run(SimpleNamespace(path=str(audio_path), packed=False), _FakeContext())
+
+    assert fake.num_samples == [4 * _FakeInMemoryDiarizer.sample_rate]
+    assert fake.regions == [[]]
+    assert [(segment.start, segment.end, segment.speaker) for segment in response.segments] == [
+        (0.0, 2.0, 'Speaker 1'),
+        (2.0, 4.0, 'Speaker 2'),
+    ]
+
+
+def test_non_wav_input_falls_back_to_nemo_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Audio the WAV reader cannot map goes through the NeMo file pipeline."""
+    fake = _FakeInMemoryDiarizer()
+    service = _build_service(monkeypatch, tmp_path, in_memory_diarizer=fake)
+    audio_path = tmp_path / 'meeting.mp3'
+    audio_path.write_bytes(b'ID3 not a wav file')
+    nemo_calls: list[Path] = []
+
+    def _fake_nemo(path: Path, _: object) -> list[_DummySegment]:
+        nemo_calls.append(path)
+        return [_DummySegment(start=0.0, end=1.0, speaker='alpha')]
+
+    monkeypatch.setattr(diarize_service, '_run_nemo_diarization', _fake_nemo)
+
+    run_pipeline = service._run_diarization_pipeline  # type: ignore[attr-defined]  # noqa: SLF001
+    segments = run_pipeline(audio_path)
+
+    assert nemo_calls == [audio_path]
+    assert fake.num_samples == []
+    assert [segment.speaker for segment in segments] == ['alpha']
+
+
+def test_speaker_index_keeps_labels_stable_across_meetings(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """With a speaker index, returning voices get the id they were enrolled under."""
+    index_dir = tmp_path / 'speakers'
+    monkeypatch.setenv('DIARIZATION_SPEAKER_INDEX_DIR', str(index_dir))
+    service = _build_service(monkeypatch, tmp_path, in_memory_diarizer=_FakeInMemoryDiarizer())
+    first_path = tmp_path / 'monday.wav'
+    second_path = tmp_path / 'tuesday.wav'
+    _write_silent_wav(first_path, 4.0)
+    _write_silent_wav(second_path, 6.0)
+
+    first = service.run(SimpleNamespace(path=str(first_path), packed=False), _FakeContext())
+    second = service.run(SimpleNamespace(path=str(second_path), packed=False), _FakeContext())
+
+    first_labels = [segment.speaker for segment in first.segments]
+    assert all(label.startswith('voice-') for label in first_labels)
+    assert len(set(first_labels)) == len(first_labels)
+    assert [segment.speaker for segment in second.segments] == first_labels
+    # The second meeting's voices match their stored rows exactly, so nothing is appended.
+    assert (index_dir / 'speakers.txt').read_text(encoding='utf-8').splitlines() == first_labels
+
+
+def test_warm_up_leaves_the_speaker_index_untouched(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Synthetic warm-up noise must not be enrolled as a voice."""
+    index_dir = tmp_path / 'speakers'
+    monkeypatch.setenv('DIARIZATION_SPEAKER_INDEX_DIR', str(index_dir))
+    fake = _FakeInMemoryDiarizer()
+    service = _build_service(monkeypatch, tmp_path, in_memory_diarizer=fake)
+
+    service.warm_up(1.0)  # type: ignore[attr-defined]
+
+    assert fake.num_samples
+    assert not (index_dir / 'speakers.txt').exists()
+
+
+def test_packed_response_merges_adjacent_segments_into_columns(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Packed requests get one column per field with same-speaker neighbours merged."""
+    service = _build_service(monkeypatch, tmp_path)
+    audio_path = tmp_path / 'meeting.wav'
+    audio_path.write_bytes(b'')
+
+    def _fake_pipeline(self: _DiarizeServiceLike, path: Path) -> list[_DummySegment]:
+        del self, path
+        return [
+            _DummySegment(start=2.0, end=3.0, speaker='beta'),
+            _DummySegment(start=0.0, end=1.0, speaker='alpha'),
+            _DummySegment(start=1.0, end=2.0, speaker='alpha'),
+            _DummySegment(start=3.0, end=4.0, speaker='alpha'),
+        ]
+
+    monkeypatch.setattr(diarize_service, '_estimate_audio_duration', lambda _: 4.0)
+    monkeypatch.setattr(
+        diarize_service.DiarizeService,
+        '_run_diarization_pipeline',
+        _fake_pipeline,
+    )
+
+    request = SimpleNamespace(path=str(audio_path), packed=True)
+    response = service.run(request, _FakeContext())
+
+    assert list(response.segments) == []
+    assert list(response.timeline.starts) == [0.0, 2.0, 3.0]
+    assert list(response.timeline.ends) == [2.0, 3.0, 4.0]
+    assert list(response.timeline.speaker_idx) == [0, 1, 0]
+    assert list(response.timeline.speakers) == ['Speaker 1', 'Speaker 2']
+
+
+def test_numpy_backend_runs_without_nemo(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """``DIARIZATION_BACKEND=numpy`` never loads NeMo and only accepts WAV input."""
+
+    def _no_nemo() -> None:
+        message = 'The NumPy backend must not look for NeMo artifacts'
+        raise AssertionError(message)
+
+    monkeypatch.setattr(diarize_service, 'ensure_nemo_artifacts_available', _no_nemo)
+    monkeypatch.setenv('DIARIZATION_BACKEND', 'numpy')
+    monkeypatch.setenv('VAD_CACHE_DIR', str(tmp_path / 'speech-regions'))
+    service = diarize_service.DiarizeService()
+    audio_path = tmp_path / 'meeting.wav'
+    _write_silent_wav(audio_path, 4.0)
+    mp3_path = tmp_path / 'meeting.mp3'
+    mp3_path.write_bytes(b'ID3 not a wav file')
+
+    response = service.run(SimpleNamespace(path=str(audio_path), packed=False), _FakeContext())
+
+    assert [(segment.start, segment.end) for segment in response.segments] == [(0.0, 4.0)]
+    run_pipeline = service._run_diarization_pipeline  # type: ignore[attr-defined]  # noqa: SLF001
+    with pytest.raises(diarize_service.DiarizationResourceError, match='only reads WAV'):
+        run_pipeline(mp3_path)
+
+
+def test_prefork_is_refused_with_a_speaker_index(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Forked workers must not share the single-writer speaker index."""
+    monkeypatch.setenv('DIARIZATION_SPEAKER_INDEX_DIR', str(tmp_path / 'speakers'))
+
+    def _no_load(**_: object) -> None:
+        message = 'The pipeline must not load when prefork is refused'
+        raise AssertionError(message)
+
+    monkeypatch.setattr(diarize_service, 'DiarizeService', _no_load)
+    serve_preforked = diarize_service._serve_preforked  # noqa: SLF001
+
+    with pytest.raises(RuntimeError, match='DIARIZATION_SPEAKER_INDEX_DIR'):
+        serve_preforked('50052', 1, 0.0, 2)
@@ -0,0 +1,38 @@
+"""Tests for the shared numeric environment variable helpers."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+env = importlib.import_module('gpu_services.env')
+
+DEFAULT_WORKERS = 4
+CONFIGURED_WORKERS = 8
+
+
+def test_unset_or_blank_variables_fall_back_to_the_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Blank values behave like unset ones; set values are parsed."""
+    monkeypatch.setenv('TEST_WORKERS', '  ')
+    monkeypatch.delenv('TEST_RATE', raising=False)
+    assert env.get_int_env('TEST_WORKERS', DEFAULT_WORKERS) == DEFAULT_WORKERS
+    assert env.get_float_env('TEST_RATE', 0.5) == pytest.approx(0.5)
+
+    monkeypatch.setenv('TEST_WORKERS', f' {CONFIGURED_WORKERS} ')
+    assert env.get_int_env('TEST_WORKERS', DEFAULT_WORKERS, minimum=1) == CONFIGURED_WORKERS
+
+
+def test_invalid_or_too_small_values_are_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Malformed values and values below the minimum name the variable."""
+    monkeypatch.setenv('TEST_WORKERS', 'many')
+    with pytest.raises(RuntimeError, match='TEST_WORKERS must be a valid integer'):
+        env.get_int_env('TEST_WORKERS', DEFAULT_WORKERS)
+
+    monkeypatch.setenv('TEST_RATE', '-0.5')
+    with pytest.raises(RuntimeError, match='TEST_RATE must be at least 0'):
+        env.get_float_env('TEST_RATE', 0.5, minimum=0.0)
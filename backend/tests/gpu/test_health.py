@@ -0,0 +1,110 @@
+"""Tests for gRPC health reporting shared by the GPU services."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+health = importlib.import_module('gpu_services.health')
+metrics = importlib.import_module('gpu_services.metrics')
+
+
+class _RecordingHealthServicer:
+    """Stand-in for ``grpc_health.v1.health.HealthServicer``."""
+
+    def __init__(self) -> None:
+        self.statuses: dict[str, str] = {}
+
+    def set(self, service: str, status: str) -> None:
+        self.statuses[service] = status
+
+
+def _install_fake_grpc_health(
+    monkeypatch: pytest.MonkeyPatch,
+) -> list[_RecordingHealthServicer]:
+    """Route grpc_health imports to fakes and return the registered servicers."""
+    registered: list[_RecordingHealthServicer] = []
+    fake_modules = {
+        'grpc_health.v1.health': SimpleNamespace(HealthServicer=_RecordingHealthServicer),
+        'grpc_health.v1.health_pb2': SimpleNamespace(
+            HealthCheckResponse=SimpleNamespace(SERVING='SERVING', NOT_SERVING='NOT_SERVING')
+        ),
+        'grpc_health.v1.health_pb2_grpc': SimpleNamespace(
+            add_HealthServicer_to_server=lambda servicer, _: registered.append(servicer)
+        ),
+    }
+    monkeypatch.setattr(health.importlib, 'import_module', fake_modules.__getitem__)
+    return registered
+
+
+def test_service_health_reports_not_serving_until_ready(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Health flips from NOT_SERVING to SERVING for the service and the server."""
+    registered = _install_fake_grpc_health(monkeypatch)
+    registry = metrics.MetricsRegistry()
+
+    service_health = health.ServiceHealth(
+        object(),
+        'services.transcribe.Transcribe',
+        metric_prefix='asr',
+        registry=registry,
+    )
+    (servicer,) = registered
+
+    assert servicer.statuses == {
+        '': 'NOT_SERVING',
+        'services.transcribe.Transcribe': 'NOT_SERVING',
+    }
+    assert not service_health.is_serving
+
+    service_health.set_serving()
+
+    assert set(servicer.statuses.values()) == {'SERVING'}
+    assert registry.gauge('asr_ready', '').value == 1
+
+
+def test_service_health_exports_phase_durations_without_grpc_health(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Start-up phases are timed even when grpcio-health-checking is missing."""
+
+    def missing_module(name: str) -> object:
+        raise ImportError(name)
+
+    monkeypatch.setattr(health.importlib, 'import_module', missing_module)
+    registry = metrics.MetricsRegistry()
+    service_health = health.ServiceHealth(
+        object(),
+        'services.diarize.Diarize',
+        metric_prefix='diarization',
+        registry=registry,
+    )
+
+    with service_health.phase('load'):
+        pass
+    with service_health.phase('warmup'):
+        pass
+
+    rendered = registry.render()
+    assert 'diarization_startup_phase_seconds{phase="load"}' in rendered
+    assert 'diarization_startup_phase_seconds{phase="warmup"}' in rendered
+    assert 'diarization_ready 0' in rendered
+
+
+def test_resolve_warmup_seconds_validates_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Warm-up length falls back to the default and clamps negative values."""
+    assert health.resolve_warmup_seconds('TEST_WARMUP_SECONDS', 5.0) == pytest.approx(5.0)
+
+    monkeypatch.setenv('TEST_WARMUP_SECONDS', '-1')
+    assert health.resolve_warmup_seconds('TEST_WARMUP_SECONDS', 5.0) == pytest.approx(0.0)
+
+    monkeypatch.setenv('TEST_WARMUP_SECONDS', 'soon')
+    with pytest.raises(RuntimeError, match='TEST_WARMUP_SECONDS'):
+        health.resolve_warmup_seconds('TEST_WARMUP_SECONDS', 5.0)
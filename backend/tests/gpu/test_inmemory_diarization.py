@@ -0,0 +1,153 @@
+"""Tests for the in-memory diarization pipeline."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+audio = importlib.import_module('gpu_services.audio')
+inmemory = importlib.import_module('gpu_services.inmemory_diarization')
+windowed = importlib.import_module('gpu_services.windowed_diarization')
+
+SAMPLE_RATE = 16000
+LOW_PITCH = 220.0
+HIGH_PITCH = 880.0
+RMS_SPEECH_THRESHOLD = 0.1
+SPECTRUM_BINS = 40
+WINDOW_SECONDS = 5.0
+SEARCH_VOLUME = 25
+
+
+def _tone(frequency: float, seconds: float) -> object:
+    """Return a sine tone standing in for a speaker's voice."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return 0.5 * np.sin(2 * np.pi * frequency * t)
+
+
+def _silence(seconds: float) -> object:
+    """Return digital silence."""
+    return np.zeros(int(seconds * SAMPLE_RATE))
+
+
+def _energy_vad(windows: object) -> object:
+    """Score windows as speech when their RMS level is high."""
+    rms = np.sqrt((np.asarray(windows) ** 2).mean(axis=1))
+    return (rms > RMS_SPEECH_THRESHOLD).astype(np.float64)
+
+
+def _spectrum_embedder(windows: object, lengths: object) -> object:
+    """Embed windows as coarse power spectra, so each pitch is its own speaker."""
+    rows = []
+    for row, length in zip(np.asarray(windows), np.asarray(lengths), strict=True):
+        power = np.abs(np.fft.rfft(row[:length])) ** 2
+        freqs = np.fft.rfftfreq(int(length), 1 / SAMPLE_RATE)
+        rows.append(np.histogram(freqs, bins=SPECTRUM_BINS, range=(0, 2000), weights=power)[0])
+    return np.asarray(rows)
+
+
+def test_frames_to_regions_applies_hysteresis_and_bridges_gaps() -> None:
+    """Onset/offset thresholds open and close regions; short gaps are merged."""
+    settings = inmemory.InMemoryDiarizationSettings(
+        onset=0.8,
+        offset=0.5,
+        min_duration_off=0.3,
+        min_duration_on=0.2,
+    )
+    probabilities = np.asarray([0.1, 0.9, 0.6, 0.6, 0.2, 0.9, 0.9, 0.1, 0.1, 0.1, 0.1, 0.9])
+
+    regions = inmemory.frames_to_regions(probabilities, 0.1, settings, total_seconds=1.2)
+
+    assert regions == [pytest.approx((0.1, 0.7))]
+
+
+def test_diarize_labels_alternating_speakers() -> None:
+    """Speech regions are found, embedded and clustered without touching disk."""
+    waveform = np.concatenate(
+        [
+            _silence(1.0),
+            _tone(LOW_PITCH, 4.0),
+            _silence(1.5),
+            _tone(HIGH_PITCH, 3.0),
+            _silence(1.5),
+            _tone(LOW_PITCH, 2.0),
+            _silence(1.0),
+        ]
+    )
+    diarizer = inmemory.InMemoryDiarizer(vad_scorer=_energy_vad, embedder=_spectrum_embedder)
+
+    segments = diarizer.diarize(audio.ArrayAudioSource(waveform, SAMPLE_RATE))
+
+    assert [segment.speaker for segment in segments] == [0, 1, 0]
+    expected_spans = [(1.0, 5.0), (6.5, 9.5), (11.0, 13.0)]
+    for segment, (start, end) in zip(segments, expected_spans, strict=True):
+        assert segment.start == pytest.approx(start, abs=0.4)
+        assert segment.end == pytest.approx(end, abs=0.4)
+
+
+def test_settings_read_multiscale_config_values() -> None:
+    """The longest embedding scale and the clustering parameters come from the config."""
+    values = {
+        'diarizer.vad.parameters.onset': 0.7,
+        'diarizer.speaker_embeddings.parameters.window_length_in_sec': [1.5, 1.0, 0.5],
+        'diarizer.clustering.parameters.max_num_speakers': 4,
+        'diarizer.clustering.parameters.max_rp_threshold': 0.15,
+        'diarizer.clustering.parameters.sparse_search_volume': SEARCH_VOLUME,
+    }
+
+    def _select(_: object, key: str, default: object = None) -> object:
+        return values.get(key, default)
+
+    settings = inmemory.InMemoryDiarizationSettings.from_config(object(), _select)
+
+    assert settings.onset == pytest.approx(0.7)
+    assert settings.embedding_window_seconds == pytest.approx(1.5)
+    assert settings.max_speakers == values['diarizer.clustering.parameters.max_num_speakers']
+    assert settings.pruning.max_fraction == pytest.approx(0.15)
+    assert settings.pruning.candidates == SEARCH_VOLUME
+
+
+def test_windowed_diarization_keeps_speakers_consistent_across_windows() -> None:
+    """Speech crossing window boundaries is stitched and labelled like a single pass."""
+    waveform = np.concatenate(
+        [
+            _silence(1.0),
+            _tone(LOW_PITCH, 6.0),
+            _silence(1.5),
+            _tone(HIGH_PITCH, 3.0),
+            _silence(1.5),
+            _tone(LOW_PITCH, 3.0),
+            _silence(1.0),
+        ]
+    )
+    diarizer = inmemory.InMemoryDiarizer(vad_scorer=_energy_vad, embedder=_spectrum_embedder)
+
+    result = windowed.diarize_windowed(
+        diarizer,
+        audio.ArrayAudioSource(waveform, SAMPLE_RATE),
+        window_seconds=WINDOW_SECONDS,
+    )
+
+    assert [segment.speaker for segment in result.segments] == [0, 1, 0]
+    expected_spans = [(1.0, 7.0), (8.5, 11.5), (13.0, 16.0)]
+    for segment, (start, end) in zip(result.segments, expected_spans, strict=True):
+        assert segment.start == pytest.approx(start, abs=0.4)
+        assert segment.end == pytest.approx(end, abs=0.4)
+    assert result.centroids.shape == (2, SPECTRUM_BINS)
+
+
+def test_speaker_linker_matches_each_global_speaker_once_per_window() -> None:
+    """Two window speakers never collapse into one global speaker."""
+    linker = windowed.SpeakerLinker(threshold=0.5)
+    first = linker.link(np.asarray([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]), [10.0, 5.0])
+    second = linker.link(np.asarray([[0.9, 0.1, 0.0], [0.8, 0.2, 0.0]]), [4.0, 1.0])
+
+    assert first == [0, 1]
+    assert second == [0, 2]
+    assert linker.num_speakers == len(set(first + second))
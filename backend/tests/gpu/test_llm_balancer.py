@@ -0,0 +1,76 @@
+"""Tests for the weighted least-outstanding LLM endpoint balancer."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+llm_balancer = importlib.import_module('gpu_services.llm_balancer')
+
+BREAKER_FAILURES = 2
+RESET_SECONDS = 10.0
+HEAVY_WEIGHT = 2.0
+LIGHT_REQUESTS = 2
+
+
+def test_parse_endpoints_reads_weights() -> None:
+    """Endpoints should be comma-separated with optional ``;weight=`` suffixes."""
+    endpoints = llm_balancer.parse_endpoints('http://a:8000/v1;weight=2, http://b:8000/v1,')
+
+    assert endpoints == (
+        llm_balancer.LlmEndpoint('http://a:8000/v1', HEAVY_WEIGHT),
+        llm_balancer.LlmEndpoint('http://b:8000/v1', 1.0),
+    )
+    with pytest.raises(ValueError, match='positive weight'):
+        llm_balancer.parse_endpoints('http://a:8000/v1;weight=0')
+
+
+def test_balancer_spreads_outstanding_requests_by_weight() -> None:
+    """Concurrent requests should fill endpoints in proportion to their weights."""
+    balancer = llm_balancer.LeastOutstandingBalancer(
+        [('heavy', HEAVY_WEIGHT), ('light', 1.0)],
+        failure_threshold=BREAKER_FAILURES,
+        reset_seconds=RESET_SECONDS,
+    )
+
+    acquired = [balancer.acquire() for _ in range(3 * LIGHT_REQUESTS)]
+
+    assert acquired.count('heavy') == HEAVY_WEIGHT * LIGHT_REQUESTS
+    assert acquired.count('light') == LIGHT_REQUESTS
+    for backend in acquired:
+        balancer.release(backend)
+    assert balancer.outstanding('heavy') == 0
+
+
+def test_failing_endpoint_is_ejected_until_a_probe_succeeds() -> None:
+    """Consecutive failures should eject an endpoint until the reset timeout passes."""
+    now = [0.0]
+    balancer = llm_balancer.LeastOutstandingBalancer(
+        [('a', 1.0), ('b', 1.0)],
+        failure_threshold=BREAKER_FAILURES,
+        reset_seconds=RESET_SECONDS,
+        clock=lambda: now[0],
+    )
+    for _ in range(BREAKER_FAILURES):
+        balancer.report('a', success=False)
+
+    assert balancer.is_ejected('a')
+    assert {balancer.acquire() for _ in range(4)} == {'b'}
+    # Avoiding the only healthy endpoint falls back to it rather than failing.
+    assert balancer.acquire(avoid={'b'}) == 'b'
+
+    now[0] = RESET_SECONDS
+    assert balancer.acquire(avoid={'b'}) == 'a'
+    balancer.report('a', success=True)
+    assert not balancer.is_ejected('a')
+
+    for _ in range(BREAKER_FAILURES):
+        balancer.report('a', success=False)
+        balancer.report('b', success=False)
+    with pytest.raises(llm_balancer.CircuitOpenError):
+        balancer.acquire()
@@ -0,0 +1,98 @@
+"""Tests for the OpenAI-compatible LLM stand-in."""
+
+from __future__ import annotations
+
+import importlib
+import random
+import sys
+from pathlib import Path
+from typing import Any, cast
+
+import httpx
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+llm_standin = importlib.import_module('gpu_services.llm_standin')
+metrics = importlib.import_module('gpu_services.metrics')
+summarize_service = importlib.import_module('gpu_services.summarize_service')
+summarize_pb2 = cast('Any', importlib.import_module('app.clients.summarize_pb2'))
+
+RETRY_AFTER_SECONDS = 7
+TRANSCRIPT = '\n'.join(
+    f'Speaker {turn % 2}: Item {turn} ships on Friday with owner {turn}.' for turn in range(20)
+)
+
+
+class _RaisingContext:
+    """Servicer context that fails the test on abort."""
+
+    def abort(self, code: object, details: str) -> None:
+        message = f'Unexpected abort {code}: {details}'
+        raise AssertionError(message)
+
+
+def _start(**settings: Any) -> Any:  # noqa: ANN401
+    """Start a stand-in with *settings* on a free port."""
+    return llm_standin.LlmStandIn(
+        llm_standin.StandInSettings(**settings),
+        registry=metrics.MetricsRegistry(),
+    ).start()
+
+
+def test_summarizer_runs_and_streams_against_the_standin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The summarizer should parse the stand-in's completions in both call modes."""
+    standin = _start()
+    try:
+        monkeypatch.setenv('LLM_API_BASE', standin.url)
+        monkeypatch.setenv('LLM_API_KEY', 'test-key')
+        monkeypatch.setenv('LLM_HTTP2', '0')
+        service = summarize_service.SummarizeService()
+        request = summarize_pb2.TextRequest(text=TRANSCRIPT)
+
+        summary = service.run(request, _RaisingContext()).text
+        fragments = [message.text for message in service.stream_run(request, _RaisingContext())]
+    finally:
+        standin.close()
+
+    assert summary
+    assert set(summary.split()) <= set(TRANSCRIPT.split())
+    assert ''.join(fragments) == summary
+    assert len(fragments) > 1
+    assert standin.requests('ok') >= 2  # noqa: PLR2004 - one request per call mode
+
+
+def test_standin_injects_errors_and_throttling() -> None:
+    """Injected failures should use the status codes and headers of real LLM servers."""
+    payload = {'messages': [{'role': 'user', 'content': 'hello'}]}
+    erroring = _start(error_rate=1.0)
+    throttling = _start(throttle_rate=1.0, retry_after_seconds=RETRY_AFTER_SECONDS)
+    try:
+        error = httpx.post(f'{erroring.url}chat/completions', json=payload)
+        throttled = httpx.post(f'{throttling.url}chat/completions', json=payload)
+        invalid = httpx.post(f'{erroring.url}chat/completions', json={'messages': []})
+    finally:
+        erroring.close()
+        throttling.close()
+
+    assert error.status_code == httpx.codes.SERVICE_UNAVAILABLE
+    assert throttled.status_code == httpx.codes.TOO_MANY_REQUESTS
+    assert throttled.headers['Retry-After'] == str(RETRY_AFTER_SECONDS)
+    assert invalid.status_code == httpx.codes.BAD_REQUEST
+    assert erroring.requests('error') == 1
+    assert erroring.requests('invalid') == 1
+
+
+def test_latency_distribution_parsing() -> None:
+    """Latency specs should parse into distributions and reject unknown ones."""
+    assert llm_standin.LatencyDistribution.parse('0.25').sample(random.Random()) == pytest.approx(
+        0.25
+    )
+    lognormal = llm_standin.LatencyDistribution.parse('lognormal:0.3,0.5')
+    assert lognormal.params == (0.3, 0.5)
+
+    for spec in ('gamma:1', 'uniform:0.1', 'fixed:-1', 'exponential:fast'):
+        with pytest.raises(ValueError, match=r'latency|parameters'):
+            llm_standin.LatencyDistribution.parse(spec)
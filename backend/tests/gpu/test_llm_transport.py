@@ -0,0 +1,184 @@
+"""Tests for the resilient LLM API transport."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+llm_transport = importlib.import_module('gpu_services.llm_transport')
+metrics = importlib.import_module('gpu_services.metrics')
+
+MAX_ATTEMPTS = 3
+RETRY_AFTER_SECONDS = 2
+HEDGE_SAMPLES = 4
+BACKOFF_SECONDS = 0.1
+
+
+def _transport(handler: Any, **policy: Any) -> Any:  # noqa: ANN401
+    """Return a transport answered by *handler* that records its backoff delays."""
+    client = httpx.Client(base_url='https://llm.invalid/', transport=httpx.MockTransport(handler))
+    delays: list[float] = []
+    transport = llm_transport.ResilientTransport(
+        [(client, 1.0)],
+        llm_transport.TransportPolicy(**policy),
+        registry=metrics.MetricsRegistry(),
+        sleep=delays.append,
+    )
+    transport.delays = delays
+    return transport
+
+
+def test_post_retries_server_errors_with_backoff() -> None:
+    """5xx and 429 responses should be retried, honouring ``Retry-After``."""
+    statuses = iter([503, 429, 200])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        del request
+        status = next(statuses)
+        if status == httpx.codes.TOO_MANY_REQUESTS:
+            return httpx.Response(status, headers={'Retry-After': str(RETRY_AFTER_SECONDS)})
+        return httpx.Response(status)
+
+    transport = _transport(_handler, max_attempts=MAX_ATTEMPTS, backoff_seconds=BACKOFF_SECONDS)
+
+    response = transport.post('chat/completions', content=b'{}')
+
+    assert response.status_code == httpx.codes.OK
+    assert len(transport.delays) == MAX_ATTEMPTS - 1
+    assert transport.delays[0] <= BACKOFF_SECONDS
+    assert transport.delays[1] == RETRY_AFTER_SECONDS
+
+
+def test_post_does_not_retry_client_errors() -> None:
+    """A rejected request should be returned after a single attempt."""
+    calls: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(400)
+
+    transport = _transport(_handler, max_attempts=MAX_ATTEMPTS)
+
+    assert transport.post('chat/completions', content=b'{}').status_code == httpx.codes.BAD_REQUEST
+    assert len(calls) == 1
+
+
+def test_retry_moves_to_another_endpoint() -> None:
+    """A request that fails on one endpoint should be retried on a different one."""
+    hosts: list[str] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        hosts.append(request.url.host)
+        return httpx.Response(503 if request.url.host == 'down.invalid' else 200)
+
+    clients = [
+        httpx.Client(base_url=f'https://{host}/', transport=httpx.MockTransport(_handler))
+        for host in ('down.invalid', 'up.invalid')
+    ]
+    transport = llm_transport.ResilientTransport(
+        [(client, 1.0) for client in clients],
+        llm_transport.TransportPolicy(max_attempts=MAX_ATTEMPTS, backoff_seconds=0.0),
+        registry=metrics.MetricsRegistry(),
+    )
+
+    for _ in range(MAX_ATTEMPTS):
+        assert transport.post('chat/completions', content=b'{}').status_code == httpx.codes.OK
+
+    assert hosts.count('up.invalid') == MAX_ATTEMPTS
+    assert hosts.count('down.invalid') <= MAX_ATTEMPTS
+
+
+def test_streamed_requests_do_not_feed_the_hedge_threshold() -> None:
+    """Time to the first byte of a stream must not lower the unary hedge delay."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        del request
+        return httpx.Response(200, content=b'data: [DONE]\n\n')
+
+    transport = _transport(_handler, hedge_quantile=0.5, hedge_min_samples=HEDGE_SAMPLES)
+    try:
+        for _ in range(HEDGE_SAMPLES):
+            with transport.stream('chat/completions', content=b'{}') as response:
+                assert response.status_code == httpx.codes.OK
+        streamed = len(transport._latencies)  # noqa: SLF001
+        transport.post('chat/completions', content=b'{}')
+        posted = len(transport._latencies)  # noqa: SLF001
+    finally:
+        transport.close()
+
+    assert streamed == 0
+    assert posted == 1
+
+
+def test_hedged_duplicate_answers_for_a_stalled_request() -> None:
+    """A request slower than the latency quantile should be answered by its duplicate."""
+    release = threading.Event()
+    calls = [0]
+    lock = threading.Lock()
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        del request
+        with lock:
+            calls[0] += 1
+            call = calls[0]
+        if call == HEDGE_SAMPLES + 1:
+            # The original request stalls until the test finishes.
+            release.wait(timeout=5)
+            return httpx.Response(200, json={'copy': 'original'})
+        return httpx.Response(200, json={'copy': 'hedge'})
+
+    transport = _transport(_handler, hedge_quantile=0.5, hedge_min_samples=HEDGE_SAMPLES)
+    try:
+        for _ in range(HEDGE_SAMPLES):
+            transport.post('chat/completions', content=b'{}')
+
+        response = transport.post('chat/completions', content=b'{}')
+        # The stalled original no longer counts as outstanding once its duplicate won.
+        (client,) = transport.balancer.backends
+        outstanding = transport.balancer.outstanding(client)
+    finally:
+        release.set()
+        transport.close()
+
+    assert response.json() == {'copy': 'hedge'}
+    assert calls[0] == HEDGE_SAMPLES + 2
+    assert outstanding == 0
+
+
+def test_unexpected_probe_error_does_not_leave_the_endpoint_ejected() -> None:
+    """A probe that fails with a non-transport error must still settle the breaker."""
+    outcomes = iter(['connect', 'bug', 'ok'])
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        outcome = next(outcomes)
+        if outcome == 'connect':
+            message = 'connection refused'
+            raise httpx.ConnectError(message, request=request)
+        if outcome == 'bug':
+            message = 'handler bug'
+            raise ValueError(message)
+        return httpx.Response(200)
+
+    transport = _transport(
+        _handler,
+        max_attempts=1,
+        breaker_failures=1,
+        breaker_reset_seconds=0.0,
+    )
+
+    with pytest.raises(httpx.ConnectError):
+        transport.post('chat/completions', content=b'{}')
+    with pytest.raises(ValueError, match='handler bug'):
+        transport.post('chat/completions', content=b'{}')
+
+    assert transport.post('chat/completions', content=b'{}').status_code == httpx.codes.OK
@@ -0,0 +1,87 @@
+"""Tests for the NumPy-only CPU diarization backend."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+audio = importlib.import_module('gpu_services.audio')
+numpy_diarization = importlib.import_module('gpu_services.numpy_diarization')
+bench = importlib.import_module('gpu_services.benchmarks.diarization_cpu')
+
+SAMPLE_RATE = 16_000
+PAUSE_SECONDS = 1.5
+TURNS = ((0, 8.0), (1, 6.0), (0, 7.0), (1, 8.0))
+MAX_WINDOWS = 8
+
+
+def _alternating_voices() -> tuple[NDArray[Any], list[tuple[float, int]]]:
+    """Return two synthetic voices taking turns and the midpoint and speaker of every turn."""
+    rng = np.random.default_rng(0)
+    parts = []
+    midpoints: list[tuple[float, int]] = []
+    offset = 0.0
+    for speaker, seconds in TURNS:
+        f0, formant_scale = bench.VOICES[speaker]
+        parts.append(bench.synthetic_voice(f0, formant_scale, seconds, rng))
+        parts.append(1e-3 * rng.standard_normal(int(PAUSE_SECONDS * SAMPLE_RATE)))
+        midpoints.append((offset + seconds / 2, speaker))
+        offset += seconds + PAUSE_SECONDS
+    return np.concatenate(parts).astype(np.float32), midpoints
+
+
+def test_diarize_separates_two_voices() -> None:
+    """Turns of a low and a high voice are attributed to two alternating speakers."""
+    samples, midpoints = _alternating_voices()
+    diarizer = numpy_diarization.NumpyDiarizer()
+
+    result = diarizer.diarize_with_centroids(audio.ArrayAudioSource(samples, SAMPLE_RATE))
+
+    def speaker_at(seconds: float) -> int:
+        return next(seg.speaker for seg in result.segments if seg.start <= seconds < seg.end)
+
+    assert result.centroids.shape[0] == len({speaker for speaker, _ in TURNS})
+    assert [speaker_at(midpoint) for midpoint, _ in midpoints] == [
+        speaker for _, speaker in midpoints
+    ]
+
+
+def test_diarize_clusters_a_subset_of_windows_above_the_cap() -> None:
+    """Capping the clustered windows keeps the speakers of every turn."""
+    samples, midpoints = _alternating_voices()
+    settings = numpy_diarization.NumpyDiarizationSettings(max_clustered_windows=MAX_WINDOWS)
+    diarizer = numpy_diarization.NumpyDiarizer(settings)
+    source = audio.ArrayAudioSource(samples, SAMPLE_RATE)
+
+    result = diarizer.diarize_with_centroids(source)
+
+    def speaker_at(seconds: float) -> int:
+        return next(seg.speaker for seg in result.segments if seg.start <= seconds < seg.end)
+
+    assert [speaker_at(midpoint) for midpoint, _ in midpoints] == [
+        speaker for _, speaker in midpoints
+    ]
+
+
+def test_region_cepstra_tile_across_read_blocks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reading a region in blocks yields exactly the frames of a single read."""
+    samples, _ = _alternating_voices()
+    source = audio.ArrayAudioSource(samples, SAMPLE_RATE)
+    diarizer = numpy_diarization.NumpyDiarizer()
+    whole = diarizer.cepstra(samples[SAMPLE_RATE : 5 * SAMPLE_RATE])
+
+    monkeypatch.setattr(numpy_diarization, '_READ_BLOCK_SECONDS', 0.37)
+    blocked = diarizer.region_cepstra(source, 1.0, 5.0)
+
+    np.testing.assert_allclose(blocked, whole)
@@ -0,0 +1,74 @@
+"""Tests for preforked serving of a model loaded once in the parent."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from concurrent import futures
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+grpc = pytest.importorskip('grpc')
+prefork = importlib.import_module('gpu_services.prefork')
+
+NUM_WORKERS = 3
+CRASHING_WORKER = 1
+
+
+def test_workers_see_parent_state_and_crashed_workers_restart(tmp_path: Path) -> None:
+    """Each worker runs in its own process with the parent's objects; crashes are retried."""
+    model = {'weights': list(range(1000))}
+
+    def _worker(index: int) -> None:
+        crash_marker = tmp_path / f'crashed-{index}'
+        if index == CRASHING_WORKER and not crash_marker.exists():
+            crash_marker.touch()
+            message = 'simulated crash'
+            raise RuntimeError(message)
+        report = f'{os.getpid()} {sum(model["weights"])}'
+        (tmp_path / f'worker-{index}').write_text(report, encoding='utf-8')
+
+    supervisor = prefork.PreforkSupervisor(_worker, NUM_WORKERS, name='test', restart_delay=0)
+    supervisor.run()
+
+    reports = [
+        (tmp_path / f'worker-{index}').read_text(encoding='utf-8').split()
+        for index in range(NUM_WORKERS)
+    ]
+    pids = {int(pid) for pid, _ in reports}
+    assert len(pids) == NUM_WORKERS
+    assert os.getpid() not in pids
+    assert {int(total) for _, total in reports} == {sum(model['weights'])}
+    assert (tmp_path / f'crashed-{CRASHING_WORKER}').exists()
+    assert supervisor.worker_pids == {}
+
+
+def test_servers_share_the_reserved_port() -> None:
+    """Servers created with the reuse-port options all bind the reserved port."""
+    servers = []
+    with prefork.reserve_port(0) as port:
+        for _ in range(2):
+            server = grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1),
+                options=list(prefork.REUSE_PORT_OPTIONS),
+            )
+            servers.append(server)
+            assert server.add_insecure_port(f'[::]:{port}') == port
+    for server in servers:
+        server.stop(None)
+
+
+def test_prefork_worker_count_must_be_a_non_negative_integer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unset means no forking; malformed values fail at start-up."""
+    monkeypatch.delenv('TEST_PREFORK_WORKERS', raising=False)
+    assert prefork.resolve_prefork_workers('TEST_PREFORK_WORKERS') == 0
+
+    monkeypatch.setenv('TEST_PREFORK_WORKERS', '-1')
+    with pytest.raises(RuntimeError, match='must not be negative'):
+        prefork.resolve_prefork_workers('TEST_PREFORK_WORKERS')
@@ -0,0 +1,39 @@
+"""Tests for the blocking resource pool shared by the GPU services."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+metrics = importlib.import_module('gpu_services.metrics')
+resource_pool = importlib.import_module('gpu_services.resource_pool')
+
+
+def test_acquire_hands_out_each_resource_once() -> None:
+    """A borrowed resource is unavailable until it is returned."""
+    registry = metrics.MetricsRegistry()
+    pool = resource_pool.ResourcePool(['only'], name='test', registry=registry)
+
+    with pool.acquire() as resource:
+        assert resource == 'only'
+        assert registry.gauge('test_pool_in_use', '').value == 1
+        with pytest.raises(TimeoutError), pool.acquire(timeout=0.01):
+            pass
+
+    with pool.acquire(timeout=0.01) as resource:
+        assert resource == 'only'
+
+    assert registry.gauge('test_pool_in_use', '').value == 0
+    assert registry.gauge('test_pool_waiting', '').value == 0
+    assert registry.histogram('test_pool_wait_seconds', '').count == 3  # noqa: PLR2004
+
+
+def test_pool_requires_resources() -> None:
+    """An empty pool would block forever, so it is rejected up front."""
+    with pytest.raises(ValueError, match='at least one'):
+        resource_pool.ResourcePool([], name='empty', registry=metrics.MetricsRegistry())
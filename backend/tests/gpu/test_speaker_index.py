@@ -0,0 +1,96 @@
+"""Tests for the on-disk speaker embedding index."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+speaker_index = importlib.import_module('gpu_services.speaker_index')
+
+DIMENSION = 16
+
+
+def _voices(count: int, *, seed: int = 0) -> NDArray[Any]:
+    """Return *count* random, nearly orthogonal voice embeddings."""
+    return np.random.default_rng(seed).normal(size=(count, DIMENSION))
+
+
+def test_appended_speakers_survive_reopening(tmp_path: Path) -> None:
+    """Rows appended in separate calls are found again by a new index instance."""
+    voices = _voices(3)
+    index = speaker_index.SpeakerIndex(tmp_path)
+    index.append(['alice', 'bob'], voices[:2])
+    index.append(['carol'], voices[2:])
+
+    reopened = speaker_index.SpeakerIndex(tmp_path)
+    matches = reopened.search(voices[::-1] * 5.0)
+
+    assert len(reopened) == len(voices)
+    assert reopened.dimension == DIMENSION
+    assert [row[0].speaker_id for row in matches] == ['carol', 'bob', 'alice']
+    assert all(row[0].similarity == pytest.approx(1.0, abs=1e-5) for row in matches)
+
+
+def test_identify_assigns_each_stored_speaker_once(tmp_path: Path) -> None:
+    """Two similar queries cannot both claim the same stored voice."""
+    voices = _voices(2)
+    index = speaker_index.SpeakerIndex(tmp_path)
+    index.append(['alice'], voices[:1])
+    rng = np.random.default_rng(1)
+    close = voices[0] + 0.1 * rng.normal(size=DIMENSION)
+    closer = voices[0] + 0.05 * rng.normal(size=DIMENSION)
+
+    matches = index.identify(np.stack([close, closer, voices[1]]), threshold=0.7)
+
+    assert matches[0] is None
+    assert matches[1] is not None
+    assert matches[1].speaker_id == 'alice'
+    assert matches[2] is None
+
+
+def test_identify_is_not_crowded_out_by_speakers_with_many_rows(tmp_path: Path) -> None:
+    """A speaker enrolled many times does not hide another speaker's single row."""
+    voices = _voices(2)
+    rng = np.random.default_rng(2)
+    index = speaker_index.SpeakerIndex(tmp_path)
+    index.append(['alice'] * 8, voices[0] + 0.05 * rng.normal(size=(8, DIMENSION)))
+    index.append(['bob'], voices[1:])
+    # Both queries sit between the two voices but lean towards alice.
+    queries = np.stack([2 * voices[0] + voices[1], 1.5 * voices[0] + voices[1]])
+
+    matches = index.identify(queries, threshold=0.0)
+
+    assert [match.speaker_id if match else None for match in matches] == ['alice', 'bob']
+
+
+def test_dimension_mismatch_is_rejected(tmp_path: Path) -> None:
+    """An index keeps the dimension it was created with."""
+    speaker_index.SpeakerIndex(tmp_path).append(['alice'], _voices(1))
+
+    with pytest.raises(speaker_index.SpeakerIndexError, match='stores 16-d'):
+        speaker_index.SpeakerIndex(tmp_path, dimension=DIMENSION * 2)
+
+
+def test_surplus_rows_from_interrupted_append_are_discarded(tmp_path: Path) -> None:
+    """Rows written without their ids are ignored and overwritten by the next append."""
+    voices = _voices(3)
+    index = speaker_index.SpeakerIndex(tmp_path)
+    index.append(['alice'], voices[:1])
+    with (tmp_path / speaker_index.EMBEDDINGS_FILE).open('ab') as handle:
+        handle.write(voices[1].astype('<f4').tobytes())
+
+    index = speaker_index.SpeakerIndex(tmp_path)
+    index.append(['carol'], voices[2:])
+
+    assert [row[0].speaker_id for row in index.search(voices[[0, 2]])] == ['alice', 'carol']
@@ -3,16 +3,24 @@
 from __future__ import annotations
 
 import importlib
+import json
+import re
 import sys
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol, cast
 
+import httpx
 import pytest
 
+pytest.importorskip('numpy')
+
 sys.path.append(str(Path(__file__).resolve().parents[3]))
 
 summarize_service = importlib.import_module('gpu_services.summarize_service')
+llm_transport = importlib.import_module('gpu_services.llm_transport')
 summarize_pb2_module = importlib.import_module('app.clients.summarize_pb2')
 
 summarize_pb2 = cast('Any', summarize_pb2_module)
@@ -54,6 +62,18 @@ class _SummarizeServiceLike(Protocol):
         """Execute the summarization request."""
 
 
+MAP_CONCURRENCY = 3
+CHUNK_COUNT = 6
+# Fits one transcript paragraph, or a reduce request over two short summaries.
+CHUNK_SIZE = 64
+# Fits a reduce request over every partial summary.
+WIDE_CHUNK_SIZE = 200
+FAILING_CHUNK = 2
+# Map level, two merge levels and the final request.
+REDUCE_TREE_DEPTH = 4
+LLM_ATTEMPTS = 2
+
+
 def _build_service(monkeypatch: pytest.MonkeyPatch) -> _SummarizeServiceLike:
     """Instantiate the summarization service with minimal configuration."""
     monkeypatch.setenv('LLM_API_BASE', 'https://llm.invalid')
@@ -111,3 +131,189 @@ def test_run_aborts_on_empty_text(monkeypatch: pytest.MonkeyPatch) -> None:
     assert context.abort_calls == [
         (summarize_service.grpc.StatusCode.INVALID_ARGUMENT, expected_error)
     ]
+
+
+def _chunked_text(
+    monkeypatch: pytest.MonkeyPatch,
+    chunk_size: int = CHUNK_SIZE,
+) -> tuple[_SummarizeServiceLike, str]:
+    """Return a service with small chunks and a text that splits into ``CHUNK_COUNT`` of them."""
+    monkeypatch.setenv('LLM_CHUNK_SIZE', str(chunk_size))
+    monkeypatch.setenv('LLM_CHUNK_OVERLAP', '0')
+    monkeypatch.setenv('LLM_MAP_CONCURRENCY', str(MAP_CONCURRENCY))
+    service = _build_service(monkeypatch)
+    text = '\n\n'.join(
+        f'chunk-{index} discussed item {index}.'
+        + ' Notes were taken on every open point.' * (chunk_size // 10)
+        for index in range(CHUNK_COUNT)
+    )
+    return service, text
+
+
+def test_map_stage_runs_concurrently_and_keeps_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Partial summaries should overlap in time yet reach the final summary in chunk order."""
+    service, text = _chunked_text(monkeypatch, WIDE_CHUNK_SIZE)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def _fake_execute(
+        self: _SummarizeServiceLike,
+        payload: dict[str, Any],
+        ctx: object,
+    ) -> dict[str, Any]:
+        del self, ctx
+        content = payload['messages'][1]['content']
+        match = re.search(r'chunk-(\d+)', content)
+        if match is None:
+            # Merging keeps the partial summaries it was given, in prompt order.
+            merged = ' '.join(re.findall(r'partial-\d+', content))
+            return {'choices': [{'message': {'content': merged}}]}
+        index = int(match.group(1))
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        # Later chunks finish first so that completion order differs from chunk order.
+        time.sleep(0.01 * (CHUNK_COUNT - index))
+        with lock:
+            in_flight[0] -= 1
+        return {'choices': [{'message': {'content': f'partial-{index}'}}]}
+
+    monkeypatch.setattr(summarize_service.SummarizeService, '_execute_llm_request', _fake_execute)
+    context = _DummyContext([])
+
+    summary = service._generate_summary(text, context)  # type: ignore[attr-defined]  # noqa: SLF001
+
+    assert summary.split() == [f'partial-{index}' for index in range(CHUNK_COUNT)]
+    assert in_flight[1] == MAP_CONCURRENCY
+    assert context.abort_calls == []
+
+
+def test_reduce_stage_merges_summaries_in_a_shallow_tree(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Partial summaries that overflow one request should be merged level by level."""
+    service, text = _chunked_text(monkeypatch)
+    requests: list[str] = []
+
+    def _fake_execute(
+        self: _SummarizeServiceLike,
+        payload: dict[str, Any],
+        ctx: object,
+    ) -> dict[str, Any]:
+        del self, ctx
+        requests.append(payload['messages'][1]['content'])
+        return {'choices': [{'message': {'content': 'merged summary of the span'}}]}
+
+    monkeypatch.setattr(summarize_service.SummarizeService, '_execute_llm_request', _fake_execute)
+
+    plan = service._build_final_request(text, _DummyContext([]))  # type: ignore[attr-defined]  # noqa: SLF001
+
+    merges = [request for request in requests if request.startswith(summarize_service.MERGE_PROMPT)]
+    # Six partial summaries merge pairwise into three, then two and finally one request.
+    assert len(requests) == CHUNK_COUNT + len(merges)
+    assert len(merges) == CHUNK_COUNT // 2 + 1
+    assert plan.user_content.startswith(summarize_service.REDUCE_PROMPT)
+    assert plan.llm_calls == len(requests) + 1
+    assert plan.depth == REDUCE_TREE_DEPTH
+
+
+def test_reduce_requests_stay_within_the_chunk_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Summaries too long to merge are truncated instead of overflowing the request."""
+    service, text = _chunked_text(monkeypatch)
+    chunker = summarize_service.TranscriptChunker(summarize_service.ChunkBudget(CHUNK_SIZE))
+    requests: list[str] = []
+
+    def _fake_execute(
+        self: _SummarizeServiceLike,
+        payload: dict[str, Any],
+        ctx: object,
+    ) -> dict[str, Any]:
+        del self, ctx
+        requests.append(payload['messages'][1]['content'])
+        return {'choices': [{'message': {'content': 'A very long partial summary. ' * 40}}]}
+
+    monkeypatch.setattr(summarize_service.SummarizeService, '_execute_llm_request', _fake_execute)
+
+    plan = service._build_final_request(text, _DummyContext([]))  # type: ignore[attr-defined]  # noqa: SLF001
+
+    merges = [request for request in requests if request.startswith(summarize_service.MERGE_PROMPT)]
+    assert merges
+    assert all(chunker.count_tokens(request) <= CHUNK_SIZE for request in merges)
+    assert chunker.count_tokens(plan.user_content) <= CHUNK_SIZE
+
+
+def test_map_stage_aborts_with_worker_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A failing partial summary should abort the call with the status it produced."""
+    service, text = _chunked_text(monkeypatch)
+    unavailable = summarize_service.grpc.StatusCode.UNAVAILABLE
+
+    def _fake_execute(
+        self: _SummarizeServiceLike,
+        payload: dict[str, Any],
+        ctx: Any,  # noqa: ANN401
+    ) -> dict[str, Any]:
+        del self
+        if f'chunk-{FAILING_CHUNK} ' in payload['messages'][1]['content']:
+            ctx.abort(unavailable, 'LLM API is temporarily unavailable')
+        return {'choices': [{'message': {'content': 'partial'}}]}
+
+    monkeypatch.setattr(summarize_service.SummarizeService, '_execute_llm_request', _fake_execute)
+    context = _DummyContext([])
+
+    with pytest.raises(_AbortCalledError):
+        service._generate_summary(text, context)  # type: ignore[attr-defined]  # noqa: SLF001
+
+    assert context.abort_calls == [(unavailable, 'LLM API is temporarily unavailable')]
+
+
+def _mock_transport(handler: Any) -> object:  # noqa: ANN401
+    """Return an LLM transport whose requests are answered by *handler* without backoff."""
+    client = httpx.Client(base_url='https://llm.invalid/', transport=httpx.MockTransport(handler))
+    policy = llm_transport.TransportPolicy(max_attempts=LLM_ATTEMPTS, backoff_seconds=0.0)
+    return llm_transport.ResilientTransport([(client, 1.0)], policy)
+
+
+def test_stream_run_relays_llm_deltas(monkeypatch: pytest.MonkeyPatch) -> None:
+    """`StreamRun` should request a streamed completion and forward each delta."""
+    service = _build_service(monkeypatch)
+    requests: list[dict[str, Any]] = []
+    events = [
+        {'choices': [{'delta': {'role': 'assistant'}}]},
+        {'choices': [{'delta': {'content': ' Ship'}}]},
+        {'choices': [{'delta': {'content': ' on Friday.'}}]},
+    ]
+    body = ''.join(f'data: {json.dumps(event)}\n\n' for event in events) + 'data: [DONE]\n\n'
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, text=body, headers={'Content-Type': 'text/event-stream'})
+
+    service._transport = _mock_transport(_handler)  # type: ignore[attr-defined]  # noqa: SLF001
+    request = summarize_pb2.TextRequest(text='Ship the release on Friday.')
+    context = _DummyContext([])
+
+    chunks = list(service.stream_run(request, context))  # type: ignore[attr-defined]
+
+    assert [chunk.text for chunk in chunks] == ['Ship', ' on Friday.']
+    assert requests[0]['stream'] is True
+    assert context.abort_calls == []
+
+
+def test_stream_run_maps_http_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Streaming failures should be retried, then abort with the same status codes as `Run`."""
+    service = _build_service(monkeypatch)
+    attempts: list[httpx.Request] = []
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request)
+        return httpx.Response(503, text='overloaded')
+
+    service._transport = _mock_transport(_handler)  # type: ignore[attr-defined]  # noqa: SLF001
+    request = summarize_pb2.TextRequest(text='Ship the release on Friday.')
+    context = _DummyContext([])
+
+    with pytest.raises(_AbortCalledError):
+        list(service.stream_run(request, context))  # type: ignore[attr-defined]
+
+    assert len(attempts) == LLM_ATTEMPTS
+    assert context.abort_calls == [
+        (summarize_service.grpc.StatusCode.UNAVAILABLE, 'LLM API is temporarily unavailable')
+    ]
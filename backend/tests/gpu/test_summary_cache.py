@@ -0,0 +1,69 @@
+"""Tests for the on-disk summary cache."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+summary_cache = importlib.import_module('gpu_services.summary_cache')
+summarize_service = importlib.import_module('gpu_services.summarize_service')
+
+ENTRY_BYTES = 10
+CHUNK_COUNT = 4
+
+
+def test_cache_evicts_least_recently_used_across_restarts(tmp_path: Path) -> None:
+    """Entries beyond the byte budget should go oldest-use first, also after reopening."""
+    cache = summary_cache.SummaryCache(tmp_path, max_bytes=2 * ENTRY_BYTES)
+    cache.put('a', 'a' * ENTRY_BYTES)
+    cache.put('b', 'b' * ENTRY_BYTES)
+    # Make ``a`` the most recently used entry on disk, as a later hit would.
+    os.utime(tmp_path / 'b.txt', (1, 1))
+    assert cache.get('a') == 'a' * ENTRY_BYTES
+
+    reopened = summary_cache.SummaryCache(tmp_path, max_bytes=2 * ENTRY_BYTES)
+    reopened.put('c', 'c' * ENTRY_BYTES)
+
+    assert reopened.get('b') is None
+    assert reopened.get('a') == 'a' * ENTRY_BYTES
+    assert reopened.get('c') == 'c' * ENTRY_BYTES
+    assert reopened.total_bytes == 2 * ENTRY_BYTES
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['a.txt', 'c.txt']
+
+
+def test_repeated_summary_is_served_from_cache(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Summarizing the same transcript twice should call the LLM only the first time."""
+    monkeypatch.setenv('LLM_API_BASE', 'https://llm.invalid')
+    monkeypatch.setenv('LLM_API_KEY', 'test-key')
+    monkeypatch.setenv('LLM_CHUNK_SIZE', '10')
+    monkeypatch.setenv('LLM_CHUNK_OVERLAP', '0')
+    monkeypatch.setenv(summary_cache.ENV_CACHE_DIR, str(tmp_path))
+    calls: list[str] = []
+
+    def _fake_execute(self: object, payload: dict[str, Any], ctx: object) -> dict[str, Any]:
+        del self, ctx
+        calls.append(payload['messages'][1]['content'])
+        return {'choices': [{'message': {'content': f'summary {len(calls)}'}}]}
+
+    monkeypatch.setattr(summarize_service.SummarizeService, '_execute_llm_request', _fake_execute)
+    text = '\n\n'.join(f'chunk-{index} discussed item {index}.' for index in range(CHUNK_COUNT))
+
+    first = summarize_service.SummarizeService()._generate_summary(text, None)  # noqa: SLF001
+    llm_calls = len(calls)
+    second = summarize_service.SummarizeService()._generate_summary(text, None)  # noqa: SLF001
+
+    assert llm_calls > CHUNK_COUNT
+    assert second == first
+    assert len(calls) == llm_calls
@@ -0,0 +1,71 @@
+"""Tests for token-budgeted transcript chunking."""
+
+from __future__ import annotations
+
+import importlib
+import itertools
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+summary_chunking = importlib.import_module('gpu_services.summary_chunking')
+
+MAX_TOKENS = 60
+OVERLAP_TOKENS = 8
+TURNS = 30
+
+
+def _transcript() -> str:
+    """Return speaker-labelled lines of a few sentences each."""
+    return '\n'.join(
+        f'Speaker {turn % 3}: We reviewed item {turn}. Owner {turn} ships it on Friday.'
+        for turn in range(TURNS)
+    )
+
+
+def test_chunks_fit_budget_and_end_at_speaker_turns() -> None:
+    """Every chunk stays within the token budget and starts with a speaker label."""
+    chunker = summary_chunking.TranscriptChunker(summary_chunking.ChunkBudget(MAX_TOKENS))
+
+    chunks = chunker.split(_transcript())
+
+    assert len(chunks) > 1
+    assert all(chunker.count_tokens(chunk) <= MAX_TOKENS for chunk in chunks)
+    assert all(chunk.startswith('Speaker ') for chunk in chunks)
+    assert ' '.join(chunks).replace('\n', ' ') == _transcript().replace('\n', ' ')
+
+
+def test_chunks_overlap_by_whole_words() -> None:
+    """Consecutive chunks share the requested number of tokens, cut at word boundaries."""
+    budget = summary_chunking.ChunkBudget(MAX_TOKENS, overlap_tokens=OVERLAP_TOKENS)
+    chunker = summary_chunking.TranscriptChunker(budget)
+    transcript = _transcript()
+
+    chunks = chunker.split(transcript)
+
+    for previous, current in itertools.pairwise(chunks):
+        shared = next(
+            size for size in range(len(current), 0, -1) if previous.endswith(current[:size])
+        )
+        assert 0 < chunker.count_tokens(current[:shared]) <= OVERLAP_TOKENS
+        assert f' {current.split()[0]}' in f' {transcript}'
+
+
+def test_approximate_tokenizer_counts_scripts_differently() -> None:
+    """Cyrillic costs more tokens per character than Latin, and ideographs one each."""
+    tokenizer = summary_chunking.load_tokenizer()
+    latin = 'the team agreed on the release plan'
+    cyrillic = 'команда согласовала план выпуска'
+    ideographs = '团队同意了发布计划'
+
+    def per_char(text: str) -> float:
+        return len(tokenizer.token_starts(text)) / len(text)
+
+    assert per_char(cyrillic) > per_char(latin)
+    assert len(tokenizer.token_starts(ideographs)) == len(ideographs)
+    assert summary_chunking.load_tokenizer() is tokenizer
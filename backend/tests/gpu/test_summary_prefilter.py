@@ -0,0 +1,55 @@
+"""Tests for the extractive transcript pre-filter."""
+
+from __future__ import annotations
+
+import importlib
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+summary_prefilter = importlib.import_module('gpu_services.summary_prefilter')
+
+MAX_TOKENS = 60
+TURNS = 12
+FILLER = 'Yeah, okay.'
+
+
+def _transcript() -> str:
+    """Return turns that pair a specific sentence with filler and a repeated sentence."""
+    return '\n'.join(
+        f'Speaker {turn % 3}: {FILLER} Owner {turn} ships ticket-{100 + turn} on Friday. '
+        'We should sync again.'
+        for turn in range(TURNS)
+    )
+
+
+def test_filter_keeps_specific_sentences_in_order_within_budget() -> None:
+    """Filler and repetition go first; kept sentences stay in order under their speakers."""
+    prefilter = summary_prefilter.ExtractivePrefilter(MAX_TOKENS)
+
+    filtered = prefilter.filter(_transcript())
+
+    assert filtered.kept_tokens <= MAX_TOKENS < filtered.tokens
+    assert FILLER not in filtered.text
+    assert filtered.text.count('We should sync again.') <= 1
+    tickets = [int(ticket) for ticket in re.findall(r'ticket-(\d+)', filtered.text)]
+    assert tickets
+    assert tickets == sorted(tickets)
+    assert all(line.startswith('Speaker ') for line in filtered.text.splitlines())
+
+
+def test_filter_returns_text_within_budget_unchanged() -> None:
+    """A transcript that already fits should not be touched."""
+    text = 'Speaker 0: Short meeting. Nothing to cut.'
+    prefilter = summary_prefilter.ExtractivePrefilter(MAX_TOKENS)
+
+    filtered = prefilter.filter(text)
+
+    assert filtered.text == text
+    assert filtered.compression == 1.0
@@ -0,0 +1,66 @@
+"""Tests for spooling client-streamed audio uploads on the GPU node."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+uploads = importlib.import_module('gpu_services.uploads')
+
+
+def _chunks(*parts: bytes) -> list[SimpleNamespace]:
+    return [SimpleNamespace(data=part) for part in parts]
+
+
+def test_spool_audio_chunks_writes_and_removes_temporary_file(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Uploaded chunks are concatenated into a file that only lives inside the context."""
+    monkeypatch.setenv('AUDIO_UPLOAD_DIR', str(tmp_path))
+
+    with uploads.spool_audio_chunks(_chunks(b'RIFF', b'', b'data')) as audio_path:
+        assert audio_path.parent == tmp_path
+        assert audio_path.suffix == '.wav'
+        assert audio_path.read_bytes() == b'RIFFdata'
+
+    assert not audio_path.exists()
+
+
+def test_spool_audio_chunks_rejects_empty_upload(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Streams without audio bytes are rejected before any inference runs."""
+    monkeypatch.setenv('AUDIO_UPLOAD_DIR', str(tmp_path))
+
+    with (
+        pytest.raises(uploads.AudioUploadError, match='no data'),
+        uploads.spool_audio_chunks(_chunks(b'', b'')),
+    ):
+        pytest.fail('empty uploads must not be yielded')
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spool_audio_chunks_enforces_size_limit(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Uploads larger than the configured limit are aborted and cleaned up."""
+    monkeypatch.setenv('AUDIO_UPLOAD_DIR', str(tmp_path))
+    monkeypatch.setenv('AUDIO_UPLOAD_MAX_BYTES', '6')
+
+    with (
+        pytest.raises(uploads.AudioUploadTooLargeError),
+        uploads.spool_audio_chunks(_chunks(b'RIFF', b'data')),
+    ):
+        pytest.fail('oversized uploads must not be yielded')
+
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,84 @@
+"""Tests for the shared voice-activity detection stage."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+np = pytest.importorskip('numpy')
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+audio = importlib.import_module('gpu_services.audio')
+vad = importlib.import_module('gpu_services.vad')
+
+SAMPLE_RATE = 16_000
+SPEECH_SECONDS = 3.0
+SILENCE_SECONDS = 10.0
+SPEECH_BURSTS = 2
+
+
+def _speech_silence_speech() -> NDArray[Any]:
+    """Return a tone, a long stretch of faint noise and another tone."""
+    rng = np.random.default_rng(0)
+    times = np.arange(int(SPEECH_SECONDS * SAMPLE_RATE)) / SAMPLE_RATE
+    tone = 0.3 * np.sin(2 * np.pi * 220.0 * times)
+    noise = 1e-4 * rng.standard_normal(int(SILENCE_SECONDS * SAMPLE_RATE))
+    return np.concatenate([tone, noise, tone]).astype(np.float32)
+
+
+def test_detect_speech_finds_both_tones() -> None:
+    """The silence between two tones is cut; each tone keeps its padding."""
+    source = audio.ArrayAudioSource(_speech_silence_speech(), SAMPLE_RATE)
+    settings = vad.VadSettings()
+
+    regions = vad.detect_speech(source, settings)
+
+    second_start = SPEECH_SECONDS + SILENCE_SECONDS
+    assert len(regions) == SPEECH_BURSTS
+    assert regions[0][0] == pytest.approx(0.0)
+    assert regions[0][1] == pytest.approx(SPEECH_SECONDS + settings.pad_seconds, abs=0.05)
+    assert regions[1][0] == pytest.approx(second_start - settings.pad_seconds, abs=0.05)
+    assert regions[1][1] == pytest.approx(second_start + SPEECH_SECONDS)
+
+
+def test_cached_regions_are_computed_once_per_content(tmp_path: Path) -> None:
+    """A second lookup for the same bytes is served from the cache without reading audio."""
+    recording = tmp_path / 'meeting.raw'
+    recording.write_bytes(b'same bytes')
+    cache = vad.SpeechRegionCache(tmp_path / 'cache')
+    source = audio.ArrayAudioSource(_speech_silence_speech(), SAMPLE_RATE)
+
+    first = vad.cached_speech_regions(recording, source, cache=cache)
+    copy = tmp_path / 'copy.raw'
+    copy.write_bytes(recording.read_bytes())
+    empty = audio.ArrayAudioSource(np.zeros(0, dtype=np.float32), SAMPLE_RATE)
+    second = vad.cached_speech_regions(copy, empty, cache=cache)
+
+    assert second == first
+    assert len(list((tmp_path / 'cache').glob('*.json'))) == 1
+
+
+def test_speech_only_source_maps_back_to_original_timeline() -> None:
+    """Reads skip the gaps, and compacted times map back onto the recording."""
+    samples = np.arange(10 * SAMPLE_RATE, dtype=np.float32)
+    source = audio.ArrayAudioSource(samples, SAMPLE_RATE)
+    speech = vad.SpeechOnlySource(source, [(1.0, 2.0), (5.0, 7.0)])
+
+    seam = SAMPLE_RATE
+    joined = speech.read(seam - 2, seam + 2)
+
+    assert speech.num_samples == 3 * SAMPLE_RATE
+    expected = samples[[2 * seam - 2, 2 * seam - 1, 5 * seam, 5 * seam + 1]]
+    np.testing.assert_array_equal(joined, expected)
+    assert speech.to_original_seconds(0.5) == pytest.approx(1.5)
+    assert speech.to_original_seconds(1.0) == pytest.approx(5.0)
+    assert speech.to_original_seconds(1.0, is_end=True) == pytest.approx(2.0)
+    assert speech.to_original_seconds(3.0, is_end=True) == pytest.approx(7.0)
@@ -0,0 +1,62 @@
+"""Tests for the core-pinned process pool used by the ASR service."""
+
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+
+worker_pool = importlib.import_module('gpu_services.worker_pool')
+
+_INITIALIZED: dict[str, object] = {}
+
+
+def _record_initialization(num_threads: int, label: str) -> None:
+    """Worker initializer that remembers what it was called with."""
+    _INITIALIZED.update(num_threads=num_threads, label=label)
+
+
+def _initialization_report() -> tuple[dict[str, object], str | None]:
+    """Return the initializer arguments and thread settings seen by the worker."""
+    return dict(_INITIALIZED), os.environ.get('OMP_NUM_THREADS')
+
+
+def test_partition_cores_assigns_disjoint_contiguous_groups() -> None:
+    """Cores are split evenly, with the remainder going to the first workers."""
+    partitions = worker_pool.partition_cores(3, range(8))
+
+    assert partitions == [(0, 1, 2), (3, 4, 5), (6, 7)]
+
+
+def test_partition_cores_rejects_more_workers_than_cores() -> None:
+    """Workers never share a core."""
+    with pytest.raises(ValueError, match='disjoint cores'):
+        worker_pool.partition_cores(3, [0, 1])
+
+
+@pytest.mark.skipif(not hasattr(os, 'sched_getaffinity'), reason='CPU affinity is Linux-only')
+def test_pinned_process_pool_initializes_pinned_workers() -> None:
+    """Each worker runs the initializer with its core count and stays on its cores."""
+    cores = worker_pool.available_cores()[:1]
+    pool = worker_pool.PinnedProcessPool(
+        1,
+        initializer=_record_initialization,
+        initargs=('whisper',),
+        cores=cores,
+    )
+    try:
+        (pid,) = pool.wait_ready()
+        report, omp_threads = pool.submit(0, _initialization_report).result(timeout=30)
+        affinity = pool.submit(0, os.sched_getaffinity, 0).result(timeout=30)
+    finally:
+        pool.shutdown()
+
+    assert pid != os.getpid()
+    assert report == {'num_threads': 1, 'label': 'whisper'}
+    assert omp_threads == '1'
+    assert affinity == set(cores)
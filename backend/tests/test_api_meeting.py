@@ -52,9 +52,9 @@ class _RecordingProcessor:
         self._result = result
         self.calls: list[Path] = []
 
-    async def process(self, audio_path: Path) -> MeetingProcessingResult:
+    async def stream(self, audio_path: Path) -> AsyncIterator[MeetingProcessingResult]:
         self.calls.append(Path(audio_path))
-        return self._result
+        yield self._result
 
 
 class _TestTranscriptService(TranscriptService):
@@ -440,9 +440,9 @@ async def test_stream_missing_meeting_returns_404(
         def __init__(self) -> None:
             self.calls: list[Path] = []
 
-        async def process(self, audio_path: Path) -> NoReturn:
+        def stream(self, audio_path: Path) -> NoReturn:
             self.calls.append(audio_path)
-            message = 'process should not be called for missing meetings'
+            message = 'stream should not be called for missing meetings'
             raise AssertionError(message)
 
     processor = _StubProcessor()
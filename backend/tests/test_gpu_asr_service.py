@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import importlib
 import sys
+import wave
+from concurrent.futures import Future
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
-from typing import Protocol, cast
+from typing import TYPE_CHECKING, ClassVar, Protocol, cast
+
+import pytest
 
 from app.clients import transcribe_pb2
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 EXPECTED_SAMPLE_RATE = 16_000
 
 
@@ -116,6 +123,9 @@ class MonkeyPatchProtocol(Protocol):
     def setattr(self, target: object, name: str, value: object) -> None:
         """Set an attribute on the target object."""
 
+    def setenv(self, name: str, value: str) -> None:
+        """Set an environment variable for the duration of the test."""
+
 
 class AudioRequestFactory(Protocol):
     """Callable protocol describing the AudioRequest constructor."""
@@ -176,3 +186,482 @@ def test_asr_service_run_on_cpu(monkeypatch: MonkeyPatchProtocol, tmp_path: Path
     assert response.text == 'привет из RUMA'
     assert context.abort_calls == []
     assert dummy_tensor.moves == [(('cpu',), {}), ((), {'dtype': 'float32'})]
+
+
+def test_plan_windows_covers_long_audio_with_overlap() -> None:
+    """Long recordings should be split into overlapping Whisper-sized windows."""
+    asr_service = _load_asr_service_module()
+    settings = asr_service.LongFormSettings(
+        chunk_length_seconds=30.0,
+        chunk_overlap_seconds=5.0,
+        batch_size=4,
+    )
+
+    windows = asr_service._plan_windows(  # noqa: SLF001
+        70 * EXPECTED_SAMPLE_RATE,
+        EXPECTED_SAMPLE_RATE,
+        settings,
+    )
+
+    assert [(window.start, window.end) for window in windows] == [
+        (0, 30 * EXPECTED_SAMPLE_RATE),
+        (25 * EXPECTED_SAMPLE_RATE, 55 * EXPECTED_SAMPLE_RATE),
+        (50 * EXPECTED_SAMPLE_RATE, 70 * EXPECTED_SAMPLE_RATE),
+    ]
+
+
+def test_segment_stitcher_drops_words_repeated_in_overlap() -> None:
+    """Words decoded twice inside an overlap should appear only once."""
+    asr_service = _load_asr_service_module()
+    window_cls = asr_service._AudioWindow  # noqa: SLF001
+    windows = [
+        window_cls(start=0, end=30 * EXPECTED_SAMPLE_RATE),
+        window_cls(start=25 * EXPECTED_SAMPLE_RATE, end=55 * EXPECTED_SAMPLE_RATE),
+    ]
+    texts = ['we agreed to ship the release', 'ip the Release on Friday']
+
+    stitcher = asr_service._SegmentStitcher(windows, EXPECTED_SAMPLE_RATE)  # noqa: SLF001
+    segments = [stitcher.push(index, text) for index, text in enumerate(texts)]
+
+    assert [(segment.start, segment.end, segment.text) for segment in segments] == [
+        (0.0, 27.5, 'we agreed to ship the release'),
+        (27.5, 55.0, 'on Friday'),
+    ]
+
+
+class WindowTensor:
+    """Tensor stub that tracks the length of every window it represents."""
+
+    def __init__(self, lengths: list[int]) -> None:
+        self.lengths = lengths
+
+    def __getitem__(self, index: slice) -> WindowTensor:
+        """Slice the batch dimension."""
+        return WindowTensor(self.lengths[index])
+
+    def to(self, *args: object, **kwargs: object) -> WindowTensor:
+        """Ignore device and dtype conversions."""
+        del args, kwargs
+        return self
+
+    def numpy(self) -> WindowTensor:
+        """Stand in for the array sent to worker processes."""
+        return self
+
+
+class BatchRecordingProcessor:
+    """Processor stub that returns one transcript per window in a batch."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.decoded_windows = 0
+
+    def __call__(
+        self,
+        batch: list[list[float]],
+        sampling_rate: int,
+        return_tensors: str,
+    ) -> SimpleNamespace:
+        """Record the batch size and wrap window lengths into a tensor stub."""
+        assert sampling_rate == EXPECTED_SAMPLE_RATE
+        assert return_tensors == 'pt'
+        self.batch_sizes.append(len(batch))
+        return SimpleNamespace(input_features=WindowTensor([len(window) for window in batch]))
+
+    def batch_decode(self, tokens: list[int], skip_special_tokens: bool) -> list[str]:
+        """Describe every decoded window by its position and duration."""
+        assert skip_special_tokens is True
+        texts: list[str] = []
+        for length in tokens:
+            self.decoded_windows += 1
+            seconds = length // EXPECTED_SAMPLE_RATE
+            texts.append(f'window {self.decoded_windows} lasts {seconds} seconds')
+        return texts
+
+
+class BatchModel:
+    """Model stub that echoes window lengths as generated tokens."""
+
+    device = 'cpu'
+
+    def __init__(self) -> None:
+        self.generate_batch_sizes: list[int] = []
+
+    def generate(self, input_features: WindowTensor) -> list[int]:
+        """Return the recorded window lengths."""
+        self.generate_batch_sizes.append(len(input_features.lengths))
+        return list(input_features.lengths)
+
+
+def _concatenate(tensors: list[WindowTensor], dim: int) -> WindowTensor:
+    """Concatenate window tensor stubs along the batch dimension."""
+    assert dim == 0
+    return WindowTensor([length for tensor in tensors for length in tensor.lengths])
+
+
+class LongWaveform(DummyWaveform):
+    """Seventy seconds of silence."""
+
+    def __init__(self) -> None:
+        self._samples = [0.0] * (70 * EXPECTED_SAMPLE_RATE)
+
+
+def _build_long_audio_service(
+    monkeypatch: MonkeyPatchProtocol,
+) -> tuple[object, BatchRecordingProcessor, BatchModel]:
+    """Create an ASR service whose stubs decode a 70 second recording."""
+    asr_service = _load_asr_service_module()
+    processor = BatchRecordingProcessor()
+    model = BatchModel()
+
+    original_import = asr_service.importlib.import_module
+
+    def fake_import(name: str) -> object:
+        if name == 'torch':
+            return SimpleNamespace(
+                float32='float32',
+                cat=_concatenate,
+                from_numpy=lambda array: array,
+                set_num_threads=lambda _: None,
+            )
+        return original_import(name)
+
+    monkeypatch.setattr(asr_service, '_resolve_device', lambda: ('cpu', 'float32'))
+    monkeypatch.setattr(
+        asr_service,
+        '_load_whisper_components',
+        lambda *_: (model, processor),
+    )
+    monkeypatch.setattr(
+        asr_service,
+        '_load_waveform',
+        lambda _: (LongWaveform(), EXPECTED_SAMPLE_RATE),
+    )
+    monkeypatch.setattr(asr_service.importlib, 'import_module', fake_import)
+    monkeypatch.setenv('ASR_BATCH_SIZE', '2')
+
+    return asr_service.ASRService(), processor, model
+
+
+EXPECTED_LONG_SEGMENTS = [
+    (0.0, 27.5, 'window 1 lasts 30 seconds'),
+    (27.5, 52.5, 'window 2 lasts 30 seconds'),
+    (52.5, 70.0, 'window 3 lasts 20 seconds'),
+]
+
+
+def test_asr_service_run_decodes_long_audio_in_batches(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """Long audio should be decoded window by window and returned as segments."""
+    service, processor, model = _build_long_audio_service(monkeypatch)
+    audio_path = tmp_path / 'meeting.wav'
+    audio_path.write_bytes(b'fake-wav')
+
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    context = DummyContext()
+    response = service.run(request, context)  # type: ignore[attr-defined]
+
+    assert processor.batch_sizes == [2, 1]
+    assert sum(model.generate_batch_sizes) == len(response.segments)
+    assert [
+        (segment.start, segment.end, segment.text) for segment in response.segments
+    ] == EXPECTED_LONG_SEGMENTS
+    assert response.text == (
+        'window 1 lasts 30 seconds window 2 lasts 30 seconds window 3 lasts 20 seconds'
+    )
+    assert context.abort_calls == []
+
+
+def test_asr_service_stream_run_yields_segments_in_order(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """StreamRun should emit one message per decoded window in timeline order."""
+    service, _, _ = _build_long_audio_service(monkeypatch)
+    audio_path = tmp_path / 'meeting.wav'
+    audio_path.write_bytes(b'fake-wav')
+
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    context = DummyContext()
+    stream = service.stream_run(request, context)  # type: ignore[attr-defined]
+
+    first = next(stream)
+    assert (first.start, first.end, first.text) == EXPECTED_LONG_SEGMENTS[0]
+    rest = [(segment.start, segment.end, segment.text) for segment in stream]
+    assert rest == EXPECTED_LONG_SEGMENTS[1:]
+    assert context.abort_calls == []
+
+
+def test_asr_service_aborts_with_internal_when_decoding_fails(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """A failing model call should end the RPC with INTERNAL instead of UNKNOWN."""
+    service, _, model = _build_long_audio_service(monkeypatch)
+
+    def fail(input_features: WindowTensor) -> list[int]:
+        del input_features
+        message = 'CUDA out of memory'
+        raise RuntimeError(message)
+
+    monkeypatch.setattr(model, 'generate', fail)
+    audio_path = tmp_path / 'meeting.wav'
+    audio_path.write_bytes(b'fake-wav')
+
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    context = DummyContext()
+    with pytest.raises(RuntimeError, match='abort'):
+        service.run(request, context)  # type: ignore[attr-defined]
+
+    asr_service = _load_asr_service_module()
+    expected_details = 'Failed to transcribe audio file: CUDA out of memory'
+    assert context.abort_calls == [(asr_service.grpc.StatusCode.INTERNAL, expected_details)]
+
+
+def test_asr_service_run_chunks_transcribes_uploaded_audio(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """RunChunks should spool the upload locally and decode it like a path request."""
+    service, _, _ = _build_long_audio_service(monkeypatch)
+    monkeypatch.setenv('AUDIO_UPLOAD_DIR', str(tmp_path))
+
+    chunks = [
+        transcribe_pb2.AudioChunk(data=b'RIFF'),  # type: ignore[attr-defined]
+        transcribe_pb2.AudioChunk(data=b'data'),  # type: ignore[attr-defined]
+    ]
+    context = DummyContext()
+    response = service.run_chunks(iter(chunks), context)  # type: ignore[attr-defined]
+
+    assert [
+        (segment.start, segment.end, segment.text) for segment in response.segments
+    ] == EXPECTED_LONG_SEGMENTS
+    assert context.abort_calls == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_asr_service_memory_maps_wav_input(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """WAV files are read window by window instead of being decoded up front."""
+    service, processor, _ = _build_long_audio_service(monkeypatch)
+    asr_service = _load_asr_service_module()
+
+    def fail_full_decode(_: Path) -> tuple[object, int]:
+        message = 'WAV input must not be decoded in full'
+        raise AssertionError(message)
+
+    monkeypatch.setattr(asr_service, '_load_waveform', fail_full_decode)
+
+    audio_path = tmp_path / 'meeting.wav'
+    with wave.open(str(audio_path), 'wb') as handle:
+        handle.setnchannels(2)
+        handle.setsampwidth(2)
+        handle.setframerate(48000)
+        handle.writeframes(bytes(70 * 48000 * 4))
+
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    context = DummyContext()
+    response = service.run(request, context)  # type: ignore[attr-defined]
+
+    assert [
+        (segment.start, segment.end, segment.text) for segment in response.segments
+    ] == EXPECTED_LONG_SEGMENTS
+    assert processor.batch_sizes == [2, 1]
+    assert context.abort_calls == []
+
+
+TONE_SECONDS = 20
+PAUSE_SECONDS = 30
+
+
+def test_asr_service_skips_silence_and_keeps_original_timestamps(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """Only speech is decoded, and segment times still refer to the full recording."""
+    numpy = pytest.importorskip('numpy')
+    monkeypatch.setenv('ASR_SKIP_SILENCE', '1')
+    monkeypatch.setenv('VAD_CACHE_DIR', str(tmp_path / 'speech-regions'))
+    service, processor, _ = _build_long_audio_service(monkeypatch)
+
+    times = numpy.arange(TONE_SECONDS * EXPECTED_SAMPLE_RATE) / EXPECTED_SAMPLE_RATE
+    tone = (8000 * numpy.sin(2 * numpy.pi * 220.0 * times)).astype('<i2')
+    pause = numpy.zeros(PAUSE_SECONDS * EXPECTED_SAMPLE_RATE, dtype='<i2')
+    audio_path = tmp_path / 'meeting.wav'
+    with wave.open(str(audio_path), 'wb') as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(EXPECTED_SAMPLE_RATE)
+        handle.writeframes(numpy.concatenate([tone, pause, tone]).tobytes())
+
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    response = service.run(request, DummyContext())  # type: ignore[attr-defined]
+
+    total_seconds = 2 * TONE_SECONDS + PAUSE_SECONDS
+    assert processor.batch_sizes == [len(response.segments)]
+    assert response.segments[0].start == pytest.approx(0.0)
+    assert response.segments[1].start > TONE_SECONDS + PAUSE_SECONDS - 1
+    assert response.segments[-1].end == pytest.approx(total_seconds)
+    assert len(list((tmp_path / 'speech-regions').glob('*.json'))) == 1
+
+
+def test_resolve_quantization_only_applies_to_cpu(monkeypatch: MonkeyPatchProtocol) -> None:
+    """Int8 quantization is opt-in and ignored when a GPU is available."""
+    asr_service = _load_asr_service_module()
+
+    monkeypatch.setenv('ASR_CPU_QUANTIZATION', 'none')
+    assert asr_service._resolve_quantization('cpu') is None  # noqa: SLF001
+
+    monkeypatch.setenv('ASR_CPU_QUANTIZATION', 'INT8')
+    assert asr_service._resolve_quantization('cpu') == 'int8'  # noqa: SLF001
+    assert asr_service._resolve_quantization('cuda') is None  # noqa: SLF001
+
+    monkeypatch.setenv('ASR_CPU_QUANTIZATION', 'int4')
+    with pytest.raises(RuntimeError, match='ASR_CPU_QUANTIZATION'):
+        asr_service._resolve_quantization('cpu')  # noqa: SLF001
+
+
+class _PretrainedModel:
+    """Stand-in for a Hugging Face model returned by ``from_pretrained``."""
+
+    def to(self, _: str) -> _PretrainedModel:
+        return self
+
+    def eval(self) -> _PretrainedModel:
+        return self
+
+    @classmethod
+    def from_pretrained(cls, *args: object, **kwargs: object) -> _PretrainedModel:
+        del args, kwargs
+        return cls()
+
+
+def test_load_whisper_components_caches_quantized_model_separately(
+    monkeypatch: MonkeyPatchProtocol,
+) -> None:
+    """The int8 model has its own cache entry and is built by dynamic quantization."""
+    asr_service = _load_asr_service_module()
+    quantized_calls: list[dict[str, object]] = []
+
+    def quantize_dynamic(model: object, layers: set[object], **kwargs: object) -> object:
+        quantized_calls.append({'layers': layers, **kwargs})
+        return SimpleNamespace(quantized=model)
+
+    fake_torch = SimpleNamespace(
+        float32='float32',
+        qint8='qint8',
+        nn=SimpleNamespace(Linear='Linear'),
+        ao=SimpleNamespace(quantization=SimpleNamespace(quantize_dynamic=quantize_dynamic)),
+    )
+    fake_transformers = SimpleNamespace(
+        WhisperForConditionalGeneration=_PretrainedModel,
+        WhisperProcessor=SimpleNamespace(from_pretrained=lambda *_: 'processor'),
+    )
+    modules = {'torch': fake_torch, 'transformers': fake_transformers}
+    monkeypatch.setattr(asr_service.importlib, 'import_module', modules.__getitem__)
+
+    load = asr_service._load_whisper_components  # noqa: SLF001
+    load.cache_clear()
+    try:
+        fp32_model, _ = load('openai/whisper-tiny', 'cpu', 'float32', None)
+        int8_model, _ = load('openai/whisper-tiny', 'cpu', 'float32', 'int8')
+        cached_int8_model, _ = load('openai/whisper-tiny', 'cpu', 'float32', 'int8')
+    finally:
+        load.cache_clear()
+
+    assert isinstance(fp32_model, _PretrainedModel)
+    assert int8_model.quantized is not fp32_model
+    assert cached_int8_model is int8_model
+    assert quantized_calls == [{'layers': {'Linear'}, 'dtype': 'qint8', 'inplace': True}]
+
+
+class _InlineProcessPool:
+    """Run worker-pool calls in the calling thread."""
+
+    instances: ClassVar[list[_InlineProcessPool]] = []
+
+    def __init__(
+        self,
+        num_workers: int,
+        *,
+        initializer: Callable[..., None],
+        initargs: tuple[object, ...],
+    ) -> None:
+        self.core_sets = [(worker,) for worker in range(num_workers)]
+        self.submitted_workers: list[int] = []
+        self.closed = False
+        self._initializer = initializer
+        self._initargs = initargs
+        _InlineProcessPool.instances.append(self)
+
+    def wait_ready(self) -> list[int]:
+        for _ in self.core_sets:
+            self._initializer(1, *self._initargs)
+        return list(range(len(self.core_sets)))
+
+    def submit(self, worker: int, fn: Callable[..., object], *args: object) -> Future[object]:
+        self.submitted_workers.append(worker)
+        future: Future[object] = Future()
+        future.set_result(fn(*args))
+        return future
+
+    def shutdown(self) -> None:
+        self.closed = True
+
+
+WORKER_PROCESSES = 2
+
+
+def test_asr_service_runs_generate_in_worker_processes(
+    monkeypatch: MonkeyPatchProtocol,
+    tmp_path: Path,
+) -> None:
+    """With ASR_WORKER_PROCESSES set, generate() runs in workers and warm-up reaches each one."""
+    asr_service = _load_asr_service_module()
+    monkeypatch.setenv('ASR_WORKER_PROCESSES', str(WORKER_PROCESSES))
+    monkeypatch.setattr(asr_service, 'PinnedProcessPool', _InlineProcessPool)
+    monkeypatch.setattr(
+        asr_service,
+        '_load_whisper_processor',
+        lambda name: asr_service._load_whisper_components(name)[1],  # noqa: SLF001
+    )
+    _InlineProcessPool.instances.clear()
+
+    service, processor, _ = _build_long_audio_service(monkeypatch)
+    (pool,) = _InlineProcessPool.instances
+    service.warm_up(1.0)  # type: ignore[attr-defined]
+    assert sorted(pool.submitted_workers) == list(range(WORKER_PROCESSES))
+
+    audio_path = tmp_path / 'meeting.wav'
+    audio_path.write_bytes(b'fake-wav')
+    processor.decoded_windows = 0
+    request = transcribe_pb2.AudioRequest(path=str(audio_path))  # type: ignore[attr-defined]
+    context = DummyContext()
+    response = service.run(request, context)  # type: ignore[attr-defined]
+
+    assert [
+        (segment.start, segment.end, segment.text) for segment in response.segments
+    ] == EXPECTED_LONG_SEGMENTS
+    assert context.abort_calls == []
+
+    service.close()  # type: ignore[attr-defined]
+    assert pool.closed
+
+
+def test_resolve_worker_processes_only_applies_to_cpu(monkeypatch: MonkeyPatchProtocol) -> None:
+    """Worker processes are a CPU feature and default to in-process inference."""
+    asr_service = _load_asr_service_module()
+
+    assert asr_service._resolve_worker_processes('cpu') == 0  # noqa: SLF001
+
+    monkeypatch.setenv('ASR_WORKER_PROCESSES', '4')
+    assert asr_service._resolve_worker_processes('cpu') == 4  # noqa: SLF001, PLR2004
+    assert asr_service._resolve_worker_processes('cuda') == 0  # noqa: SLF001
+
+    monkeypatch.setenv('ASR_WORKER_PROCESSES', '-1')
+    with pytest.raises(RuntimeError, match='ASR_WORKER_PROCESSES'):
+        asr_service._resolve_worker_processes('cpu')  # noqa: SLF001
@@ -0,0 +1,229 @@
+"""Tests for the real gRPC client wrappers with stubbed transports."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import pytest
+
+from app.clients import (
+    DiarizeGrpcClient,
+    SummarizeGrpcClient,
+    TranscribeGrpcClient,
+    diarize_pb2,
+    summarize_pb2,
+    transcribe_pb2,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+
+diarize_messages = cast('Any', diarize_pb2)
+summarize_messages = cast('Any', summarize_pb2)
+transcribe_messages = cast('Any', transcribe_pb2)
+
+
+class _StreamingStub:
+    """Stub emulating a server-streaming ``StreamRun`` RPC."""
+
+    def __init__(self, segments: list[object]) -> None:
+        self._segments = segments
+        self.requests: list[object] = []
+
+    def StreamRun(self, request: object) -> AsyncIterator[object]:  # noqa: N802
+        self.requests.append(request)
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[object]:
+        for segment in self._segments:
+            yield segment
+
+
+@pytest.mark.asyncio
+async def test_transcribe_stream_run_yields_server_segments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Segments streamed by the server are forwarded one by one."""
+    stub = _StreamingStub(
+        [
+            transcribe_messages.Segment(start=0.0, end=2.5, text='Hello'),
+            transcribe_messages.Segment(start=2.5, end=4.0, text='team'),
+        ]
+    )
+    monkeypatch.setattr(
+        'app.clients.grpc_clients.transcribe_pb2_grpc.TranscribeStub',
+        lambda _: stub,
+    )
+
+    client = TranscribeGrpcClient(cast('Any', object()))
+    chunks = [chunk async for chunk in client.stream_run(Path('/data/raw/meeting.wav'))]
+
+    assert chunks == [
+        {'segment': {'start': 0.0, 'end': 2.5, 'text': 'Hello'}},
+        {'segment': {'start': 2.5, 'end': 4.0, 'text': 'team'}},
+    ]
+    assert [request.path for request in stub.requests] == ['/data/raw/meeting.wav']  # type: ignore[attr-defined]
+
+
+class _UploadStub:
+    """Stub emulating the client-streaming ``RunChunks`` RPC."""
+
+    def __init__(self, response: object) -> None:
+        self._response = response
+        self.uploaded: list[bytes] = []
+        self.packed: list[bool] = []
+
+    async def RunChunks(self, request_iterator: AsyncIterable[Any]) -> object:  # noqa: N802
+        async for chunk in request_iterator:
+            self.uploaded.append(chunk.data)
+            self.packed.append(getattr(chunk, 'packed', False))
+        return self._response
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_run_uploads_audio_chunks_instead_of_paths(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Byte streams are sent through RunChunks so the GPU node needs no shared disk."""
+    transcribe_stub = _UploadStub(
+        transcribe_messages.Transcript(
+            text='Hello',
+            segments=[transcribe_messages.Segment(start=0.0, end=1.0, text='Hello')],
+        )
+    )
+    diarize_stub = _UploadStub(
+        diarize_messages.DiarizationResult(
+            segments=[diarize_messages.Segment(start=0.0, end=1.0, speaker='Speaker 1')]
+        )
+    )
+    monkeypatch.setattr(
+        'app.clients.grpc_clients.transcribe_pb2_grpc.TranscribeStub',
+        lambda _: transcribe_stub,
+    )
+    monkeypatch.setattr(
+        'app.clients.grpc_clients.diarize_pb2_grpc.DiarizeStub',
+        lambda _: diarize_stub,
+    )
+
+    transcript = await TranscribeGrpcClient(cast('Any', object())).run(_chunks(b'RIFF', b'data'))
+    diarization = await DiarizeGrpcClient(cast('Any', object())).run([b'RIFF', b'data'])
+
+    assert transcribe_stub.uploaded == [b'RIFF', b'data']
+    assert diarize_stub.uploaded == [b'RIFF', b'data']
+    assert transcript['segments'] == [{'start': 0.0, 'end': 1.0, 'text': 'Hello'}]
+    assert diarize_stub.packed == [True, True]
+    assert list(diarization['timeline'].iter_segments()) == [
+        {'start': 0.0, 'end': 1.0, 'speaker': 'Speaker 1'}
+    ]
+
+
+class _PathStub:
+    """Stub emulating the unary ``Run`` RPC."""
+
+    def __init__(self, response: object) -> None:
+        self._response = response
+        self.requests: list[Any] = []
+
+    async def Run(self, request: object) -> object:  # noqa: N802
+        self.requests.append(request)
+        return self._response
+
+
+@pytest.mark.asyncio
+async def test_diarize_run_decodes_packed_timeline_into_columns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The packed timeline is decoded into arrays and speaker lookups bisect them."""
+    stub = _PathStub(
+        diarize_messages.DiarizationResult(
+            timeline=diarize_messages.SpeakerTimeline(
+                starts=[0.0, 2.0, 5.0],
+                ends=[2.0, 5.0, 6.0],
+                speaker_idx=[0, 1, 0],
+                speakers=['Speaker 1', 'Speaker 2'],
+            )
+        )
+    )
+    monkeypatch.setattr('app.clients.grpc_clients.diarize_pb2_grpc.DiarizeStub', lambda _: stub)
+
+    payload = await DiarizeGrpcClient(cast('Any', object())).run(Path('/data/raw/meeting.wav'))
+    timeline = payload['timeline']
+
+    assert [request.packed for request in stub.requests] == [True]
+    assert list(timeline.starts) == [0.0, 2.0, 5.0]
+    assert list(timeline.speaker_idx) == [0, 1, 0]
+    assert timeline.speaker_at(2.5, 3.0) == 'Speaker 2'
+    assert timeline.speaker_at(5.5, None) == 'Speaker 1'
+    assert timeline.speaker_at(7.0, 8.0) is None
+
+
+@pytest.mark.asyncio
+async def test_diarize_run_reads_segments_from_servers_without_timeline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Responses from services that ignore the packed flag still decode."""
+    stub = _PathStub(
+        diarize_messages.DiarizationResult(
+            segments=[
+                diarize_messages.Segment(start=0.0, end=1.5, speaker='Speaker 1'),
+                diarize_messages.Segment(start=1.5, end=3.0, speaker='Speaker 2'),
+            ]
+        )
+    )
+    monkeypatch.setattr('app.clients.grpc_clients.diarize_pb2_grpc.DiarizeStub', lambda _: stub)
+
+    payload = await DiarizeGrpcClient(cast('Any', object())).run(Path('/data/raw/meeting.wav'))
+
+    assert payload['timeline'].speakers == ('Speaker 1', 'Speaker 2')
+    assert payload['timeline'].speaker_at(2.0, 2.5) == 'Speaker 2'
+
+
+@pytest.mark.asyncio
+async def test_diarize_run_orders_segments_sent_out_of_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Unsorted segments are ordered by start so speaker lookups bisect correctly."""
+    stub = _PathStub(
+        diarize_messages.DiarizationResult(
+            segments=[
+                diarize_messages.Segment(start=4.0, end=6.0, speaker='Speaker 3'),
+                diarize_messages.Segment(start=0.0, end=2.0, speaker='Speaker 1'),
+                diarize_messages.Segment(start=2.0, end=4.0, speaker='Speaker 2'),
+            ]
+        )
+    )
+    monkeypatch.setattr('app.clients.grpc_clients.diarize_pb2_grpc.DiarizeStub', lambda _: stub)
+
+    payload = await DiarizeGrpcClient(cast('Any', object())).run(Path('/data/raw/meeting.wav'))
+    timeline = payload['timeline']
+
+    assert list(timeline.starts) == [0.0, 2.0, 4.0]
+    assert timeline.speaker_at(0.5, 1.0) == 'Speaker 1'
+    assert timeline.speaker_at(2.5, 3.0) == 'Speaker 2'
+    assert timeline.speaker_at(4.5, 5.0) == 'Speaker 3'
+
+
+@pytest.mark.asyncio
+async def test_summarize_stream_run_yields_server_fragments(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Summary fragments streamed by the server are forwarded as they arrive."""
+    stub = _StreamingStub(
+        [summarize_messages.Summary(text='Ship'), summarize_messages.Summary(text=' on Friday.')]
+    )
+    monkeypatch.setattr(
+        'app.clients.grpc_clients.summarize_pb2_grpc.SummarizeStub',
+        lambda _: stub,
+    )
+
+    client = SummarizeGrpcClient(cast('Any', object()))
+    chunks = [chunk async for chunk in client.stream_run('Ship the release on Friday.')]
+
+    assert chunks == [{'summary': 'Ship'}, {'summary': ' on Friday.'}]
+    assert [request.text for request in stub.requests] == ['Ship the release on Friday.']  # type: ignore[attr-defined]
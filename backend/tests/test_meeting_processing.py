@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
 import json
+import re
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import AsyncIterable, AsyncIterator
 
 import pytest
 
-from app.services.meeting_processing import MeetingProcessingService
+from app.services.meeting_processing import MeetingProcessingResult, MeetingProcessingService
+
+PREFILTER_TURNS = 12
+PREFILTER_TOKENS = 60
 
 
 class _StaticClient:
@@ -22,13 +29,16 @@ class _StaticClient:
         self.streams: list[bytes] = []
         self.calls: list[str] = []
 
-    async def run(self, argument: Iterable[bytes] | str) -> dict[str, object]:
+    async def run(self, argument: AsyncIterable[bytes] | str) -> dict[str, object]:
         if isinstance(argument, str):
             self.calls.append(argument)
         else:
-            self.streams.append(b''.join(argument))
+            self.streams.append(b''.join([chunk async for chunk in argument]))
         return cast('dict[str, object]', json.loads(json.dumps(self.payload)))
 
+    async def stream_run(self, argument: str) -> AsyncIterator[dict[str, object]]:
+        yield await self.run(argument)
+
 
 @pytest.fixture
 def diarize_payload() -> dict[str, object]:
@@ -70,7 +80,7 @@ async def test_meeting_processing_merges_segments(
 
     assert transcribe_client.streams == [b'hello world']
     assert diarize_client.streams == [b'hello world']
-    assert summarize_client.calls == ['Hello World']
+    assert summarize_client.calls == ['A: Hello\nB: World']
 
     assert result.summary == 'This is a summary.'
     assert result.events == [
@@ -91,3 +101,152 @@ async def test_meeting_processing_merges_segments(
             'end': pytest.approx(2.0),
         },
     ]
+
+
+@pytest.mark.asyncio
+async def test_prefiltered_summary_input_keeps_speaker_labels(tmp_path: Path) -> None:
+    """The summarizer's pre-filter keeps each kept sentence under the speaker who said it."""
+    pytest.importorskip('numpy')
+    repository_root = str(Path(__file__).resolve().parents[2])
+    if repository_root not in sys.path:
+        sys.path.append(repository_root)
+    summary_prefilter = importlib.import_module('gpu_services.summary_prefilter')
+
+    transcribe_payload = {
+        'segments': [
+            {
+                'start': float(turn),
+                'end': float(turn + 1),
+                'text': f'Yeah, okay. Owner {turn} ships ticket-{100 + turn} on Friday.',
+            }
+            for turn in range(PREFILTER_TURNS)
+        ]
+    }
+    diarize_payload = {
+        'segments': [
+            {'start': float(turn), 'end': float(turn + 1), 'speaker': f'Speaker {turn % 2 + 1}'}
+            for turn in range(PREFILTER_TURNS)
+        ]
+    }
+    summarize_client = _StaticClient({'summary': 'Tickets ship on Friday.'})
+    service = MeetingProcessingService(
+        _StaticClient(transcribe_payload),
+        _StaticClient(diarize_payload),
+        summarize_client,
+    )
+    audio_path = tmp_path / 'audio.wav'
+    audio_path.write_bytes(b'hello world')
+    await service.process(audio_path)
+
+    prefilter = summary_prefilter.ExtractivePrefilter(PREFILTER_TOKENS)
+    filtered = prefilter.filter(summarize_client.calls[0])
+
+    assert filtered.kept_tokens <= PREFILTER_TOKENS < filtered.tokens
+    lines = filtered.text.splitlines()
+    assert lines
+    for line in lines:
+        match = re.fullmatch(r'(Speaker \d): (?:Yeah, okay\. )?Owner (\d+) ships .+', line)
+        assert match is not None, line
+        assert match.group(1) == f'Speaker {int(match.group(2)) % 2 + 1}'
+
+
+class _StreamingSummarizeClient:
+    """Stream a summary in fragments."""
+
+    def __init__(self, fragments: list[str]) -> None:
+        self.fragments = fragments
+
+    async def run(self, argument: str) -> dict[str, object]:
+        del argument
+        return {'summary': ''.join(self.fragments)}
+
+    async def stream_run(self, argument: str) -> AsyncIterator[dict[str, object]]:
+        del argument
+        for fragment in self.fragments:
+            yield {'summary': fragment}
+
+
+@pytest.mark.asyncio
+async def test_meeting_processing_streams_summary_fragments(
+    diarize_payload: dict[str, object],
+    tmp_path: Path,
+) -> None:
+    """Summary fragments are yielded as they arrive, followed by the merged result."""
+    transcribe_payload = {'segments': [{'start': 0.0, 'end': 1.0, 'text': 'Ship it'}]}
+    fragments = ['Ship', ' on Friday.']
+    service = MeetingProcessingService(
+        _StaticClient(transcribe_payload),
+        _StaticClient(diarize_payload),
+        _StreamingSummarizeClient(fragments),
+    )
+
+    audio_path = tmp_path / 'audio.wav'
+    audio_path.write_bytes(b'hello world')
+    updates = [update async for update in service.stream(audio_path)]
+
+    assert updates[:-1] == fragments
+    result = updates[-1]
+    assert isinstance(result, MeetingProcessingResult)
+    assert result.summary == 'Ship on Friday.'
+    assert [event['summary_fragment'] for event in result.events] == ['Ship on Friday.']
+
+
+class _FailingClient:
+    """Abort after reading the first audio chunk."""
+
+    async def run(self, argument: AsyncIterable[bytes]) -> dict[str, object]:
+        async for _ in argument:
+            message = 'GPU node unavailable'
+            raise RuntimeError(message)
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_meeting_processing_reads_audio_once_for_both_services(
+    monkeypatch: pytest.MonkeyPatch,
+    diarize_payload: dict[str, object],
+    summarize_payload: dict[str, object],
+    tmp_path: Path,
+) -> None:
+    """Every chunk is read from disk once and delivered to both clients."""
+    audio = bytes(range(256)) * 1024
+    audio_path = tmp_path / 'audio.wav'
+    audio_path.write_bytes(audio)
+
+    opened: list[Path] = []
+    original_open = Path.open
+
+    def tracking_open(self: Path, *args: object, **kwargs: object) -> object:
+        if self == audio_path:
+            opened.append(self)
+        return original_open(self, *args, **kwargs)  # type: ignore[call-overload]
+
+    monkeypatch.setattr(Path, 'open', tracking_open)
+
+    transcribe_client = _StaticClient({'segments': []})
+    diarize_client = _StaticClient(diarize_payload)
+    service = MeetingProcessingService(
+        transcribe_client, diarize_client, _StaticClient(summarize_payload)
+    )
+    await service.process(audio_path)
+
+    assert opened == [audio_path]
+    assert transcribe_client.streams == [audio]
+    assert diarize_client.streams == [audio]
+
+
+@pytest.mark.asyncio
+async def test_meeting_processing_stops_reading_when_a_client_fails(
+    diarize_payload: dict[str, object],
+    summarize_payload: dict[str, object],
+    tmp_path: Path,
+) -> None:
+    """A failing upload propagates instead of blocking the shared reader."""
+    audio_path = tmp_path / 'audio.wav'
+    audio_path.write_bytes(b'x' * (4 * 1024 * 1024))
+
+    service = MeetingProcessingService(
+        _FailingClient(), _StaticClient(diarize_payload), _StaticClient(summarize_payload)
+    )
+    with pytest.raises(RuntimeError, match='GPU node unavailable'):
+        await asyncio.wait_for(service.process(audio_path), timeout=5)
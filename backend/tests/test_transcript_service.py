@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, NoReturn, cast
 
 import pytest
 
@@ -12,6 +12,7 @@ from app.services.meeting_processing import MeetingEvent, MeetingProcessingResul
 from app.services.transcript import MeetingNotFoundError, TranscriptService
 
 if TYPE_CHECKING:  # pragma: no cover - imported for typing only
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -25,13 +26,18 @@ DUMMY_USER_HASH = 'dummy-user-hash'
 class _StubProcessor:
     """Return a preconfigured meeting processing result."""
 
-    def __init__(self, result: MeetingProcessingResult) -> None:
+    def __init__(
+        self, result: MeetingProcessingResult, summary_parts: tuple[str, ...] = ()
+    ) -> None:
         self.result = result
+        self.summary_parts = summary_parts
         self.calls: list[Path] = []
 
-    async def process(self, audio_path: Path) -> MeetingProcessingResult:
+    async def stream(self, audio_path: Path) -> AsyncIterator[str | MeetingProcessingResult]:
         self.calls.append(audio_path)
-        return self.result
+        for part in self.summary_parts:
+            yield part
+        yield self.result
 
 
 @pytest.mark.asyncio
@@ -95,6 +101,43 @@ async def test_stream_transcript_persists_results(tmp_path: Path, db_session: As
     assert refreshed_meeting.summary == 'Conversation summary'
 
 
+@pytest.mark.asyncio
+async def test_stream_transcript_streams_summary_fragments(
+    tmp_path: Path, db_session: AsyncSession
+) -> None:
+    """Summary text is streamed as it is generated, before the stored result."""
+    audio_dir = tmp_path / 'audio'
+    audio_dir.mkdir()
+
+    user_repository = UserRepository(db_session)
+    user = await user_repository.create(email='user@example.com', hashed_password=DUMMY_USER_HASH)
+    meeting_repository = MeetingRepository(db_session)
+    meeting = await meeting_repository.create(user_id=user.id, filename='audio.wav')
+    await db_session.commit()
+
+    meeting_id = str(meeting.id)
+    (audio_dir / f'{meeting_id}.wav').write_bytes(b'dummy')
+
+    result = MeetingProcessingResult(events=[], summary='Ship on Friday.')
+    processor = _StubProcessor(result, ('Ship', ' on Friday.'))
+    service = TranscriptService(
+        db_session,
+        cast('MeetingProcessingService', processor),
+        raw_audio_dir=audio_dir,
+    )
+
+    stream = [item async for item in service.stream_transcript(meeting_id)]
+
+    assert stream == [
+        {'event': 'summary', 'data': {'delta': 'Ship'}},
+        {'event': 'summary', 'data': {'delta': ' on Friday.'}},
+        {'event': 'summary', 'data': {'summary': 'Ship on Friday.'}},
+    ]
+    refreshed_meeting = await meeting_repository.get_by_id(meeting.id)
+    assert refreshed_meeting is not None
+    assert refreshed_meeting.summary == 'Ship on Friday.'
+
+
 def test_ensure_audio_available_raises_for_missing_file(tmp_path: Path) -> None:
     """Service raises ``MeetingNotFoundError`` when audio file is absent."""
     processor = _StubProcessor(MeetingProcessingResult(events=[], summary=''))
@@ -116,7 +159,7 @@ class _FailingProcessor:
     def __init__(self, exc: Exception) -> None:
         self.exc = exc
 
-    async def process(self, audio_path: Path) -> MeetingProcessingResult:
+    def stream(self, audio_path: Path) -> NoReturn:
         del audio_path
         raise self.exc
 
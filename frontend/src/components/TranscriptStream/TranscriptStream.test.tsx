@@ -139,6 +139,26 @@ describe('TranscriptStream', () => {
     expect(screen.getByText('Основные итоги встречи')).toBeTruthy();
   });
 
+  it('appends summary deltas until the final summary arrives', async () => {
+    const factory = ((url: string) => new MockEventSource(url)) as EventSourceFactory;
+    renderWithIntl(<TranscriptStream meetingId="meeting-7" eventSourceFactory={factory} />);
+
+    await act(async () => {
+      MockEventSource.instances[0].emitOpen();
+      MockEventSource.instances[0].emitSummary({ delta: 'Ship' });
+      MockEventSource.instances[0].emitSummary({ delta: ' on Friday' });
+    });
+
+    expect(await screen.findByText('Ship on Friday')).toBeTruthy();
+
+    await act(async () => {
+      MockEventSource.instances[0].emitSummary({ summary: 'Ship on Friday.' });
+    });
+
+    expect(await screen.findByText('Ship on Friday.')).toBeTruthy();
+    expect(screen.queryByText('Ship on Friday')).toBeNull();
+  });
+
   it('shows an error status when the stream fails', async () => {
     const factory = ((url: string) => new MockEventSource(url)) as EventSourceFactory;
     renderWithIntl(<TranscriptStream meetingId="meeting-42" eventSourceFactory={factory} />);
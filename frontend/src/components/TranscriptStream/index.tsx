@@ -14,6 +14,11 @@ interface TranscriptChunk {
   speaker?: string | null;
 }
 
+interface SummaryUpdate {
+  text: string;
+  isDelta: boolean;
+}
+
 export interface TranscriptStreamProps {
   meetingId: string;
   eventSourceFactory?: EventSourceFactory;
@@ -53,13 +58,16 @@ function parseTranscriptData(raw: string): TranscriptChunk | null {
   }
 }
 
-function parseSummaryData(raw: string): string | null {
+function parseSummaryData(raw: string): SummaryUpdate | null {
   if (!raw) {
     return null;
   }
 
   try {
     const parsed = JSON.parse(raw) as Record<string, unknown>;
+    if (typeof parsed.delta === 'string') {
+      return parsed.delta ? { text: parsed.delta, isDelta: true } : null;
+    }
     const summaryCandidate =
       typeof parsed.summary === 'string'
         ? parsed.summary
@@ -67,13 +75,13 @@ function parseSummaryData(raw: string): string | null {
           ? parsed.text
           : '';
     const summary = summaryCandidate.trim();
-    return summary ? summary : null;
+    return summary ? { text: summary, isDelta: false } : null;
   } catch {
     const summary = raw.trim();
     if (!summary || summary === '[DONE]') {
       return null;
     }
-    return summary;
+    return { text: summary, isDelta: false };
   }
 }
 
@@ -171,7 +179,10 @@ export default function TranscriptStream({
         return;
       }
 
-      setSummary(parsedSummary);
+      // Pieces of a summary in progress arrive one by one; the final event carries the full text.
+      setSummary((previous) =>
+        parsedSummary.isDelta ? (previous ?? '') + parsedSummary.text : parsedSummary.text,
+      );
     };
 
     const handleError = () => {
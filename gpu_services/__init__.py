@@ -2,7 +2,27 @@
 
 __all__ = [
     'asr_service',
+    'audio',
+    'batching',
+    'clustering',
     'diarization_resources',
     'diarize_service',
+    'health',
+    'inmemory_diarization',
+    'llm_balancer',
+    'llm_standin',
+    'llm_transport',
+    'metrics',
+    'numpy_diarization',
+    'prefork',
+    'resource_pool',
+    'speaker_index',
     'summarize_service',
+    'summary_cache',
+    'summary_chunking',
+    'summary_prefilter',
+    'uploads',
+    'vad',
+    'windowed_diarization',
+    'worker_pool',
 ]
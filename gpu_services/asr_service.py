@@ -2,30 +2,77 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import logging
 import os
 import re
 import time
+from collections import deque
 from concurrent import futures
-from functools import cache
+from dataclasses import dataclass, replace
+from functools import cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Protocol, cast
+from typing import TYPE_CHECKING, Any, NoReturn, Protocol, cast
+
+import numpy as np
 
 from app.clients import transcribe_pb2, transcribe_pb2_grpc
+from gpu_services.audio import (
+    TARGET_SAMPLE_RATE,
+    ArrayAudioSource,
+    AudioFormatError,
+    open_wav,
+)
+from gpu_services.batching import MicroBatcher
+from gpu_services.env import get_float_env, get_int_env
+from gpu_services.health import ServiceHealth, resolve_warmup_seconds
+from gpu_services.metrics import start_metrics_server_from_env
+from gpu_services.prefork import (
+    REUSE_PORT_OPTIONS,
+    PreforkSupervisor,
+    reserve_port,
+    resolve_prefork_workers,
+    start_worker_metrics_server,
+    stop_on_sigterm,
+)
+from gpu_services.uploads import (
+    AudioUploadError,
+    AudioUploadTooLargeError,
+    spool_audio_chunks,
+)
+from gpu_services.vad import (
+    SpeechOnlySource,
+    SpeechRegionCache,
+    VadSettings,
+    cached_speech_regions,
+)
+from gpu_services.worker_pool import PinnedProcessPool
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
+    from concurrent.futures import Future
+
+    from gpu_services.audio import AudioSource
+    from gpu_services.uploads import AudioChunk
 
     class AudioRequest(Protocol):
         """Typed representation of the transcribe.AudioRequest message."""
 
         path: str
 
+    class Segment(Protocol):
+        """Typed representation of the transcribe.Segment message."""
+
+        start: float
+        end: float
+        text: str
+
     class Transcript(Protocol):
         """Typed representation of the transcribe.Transcript message."""
 
         text: str
+        segments: list[Segment]
 
     class TranscribeServicer(Protocol):
         """Protocol for the generated Transcribe service base class."""
@@ -34,6 +81,7 @@ if TYPE_CHECKING:
 
 else:  # pragma: no cover - runtime fallbacks
     AudioRequest = transcribe_pb2.AudioRequest
+    Segment = transcribe_pb2.Segment
     Transcript = transcribe_pb2.Transcript
     TranscribeServicer = transcribe_pb2_grpc.TranscribeServicer
 
@@ -41,6 +89,8 @@ add_transcribe_servicer_to_server = transcribe_pb2_grpc.add_TranscribeServicer_t
 
 grpc = importlib.import_module('grpc')
 
+SERVICE_NAME = 'services.transcribe.Transcribe'
+
 
 class ServicerContext(Protocol):
     """Minimal subset of the gRPC servicer context used by the ASR service."""
@@ -61,30 +111,192 @@ class GrpcServer(Protocol):
     def wait_for_termination(self) -> None:  # pragma: no cover - gRPC runtime
         """Block until the server shuts down."""
 
+    def stop(self, grace: float | None) -> object:  # pragma: no cover - gRPC runtime
+        """Stop the server, letting active calls finish for *grace* seconds."""
+
 
 LOGGER = logging.getLogger(__name__)
 
+WHISPER_WINDOW_SECONDS = 30.0
+DEFAULT_CHUNK_LENGTH_SECONDS = WHISPER_WINDOW_SECONDS
+DEFAULT_CHUNK_OVERLAP_SECONDS = 5.0
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_MAX_BATCH_SIZE = 16
+DEFAULT_MAX_BATCH_WAIT_MS = 10.0
+
+DEFAULT_WARMUP_SECONDS = 5.0
+
+ENV_CPU_QUANTIZATION = 'ASR_CPU_QUANTIZATION'
+CPU_QUANTIZATION_MODES = ('none', 'int8')
+
+ENV_WORKER_PROCESSES = 'ASR_WORKER_PROCESSES'
+
+ENV_SKIP_SILENCE = 'ASR_SKIP_SILENCE'
+ENV_PREFORK_WORKERS = 'ASR_PREFORK_WORKERS'
+# Compacting a recording that is almost all speech saves too little to be worth it.
+MAX_SPEECH_FRACTION = 0.95
+
+
+@dataclass(frozen=True)
+class LongFormSettings:
+    """Windowing parameters used for long-form Whisper transcription."""
+
+    chunk_length_seconds: float
+    chunk_overlap_seconds: float
+    batch_size: int
+
+    @classmethod
+    def from_env(cls) -> LongFormSettings:
+        """Load long-form transcription settings from environment variables."""
+        chunk_length = get_float_env('ASR_CHUNK_LENGTH_SECONDS', DEFAULT_CHUNK_LENGTH_SECONDS)
+        chunk_overlap = get_float_env('ASR_CHUNK_OVERLAP_SECONDS', DEFAULT_CHUNK_OVERLAP_SECONDS)
+        batch_size = get_int_env('ASR_BATCH_SIZE', DEFAULT_BATCH_SIZE)
+
+        if not 0 < chunk_length <= WHISPER_WINDOW_SECONDS:
+            message = (
+                'ASR_CHUNK_LENGTH_SECONDS must be positive and must not exceed '
+                f'{WHISPER_WINDOW_SECONDS:g} seconds'
+            )
+            raise RuntimeError(message)
+        if not 0 <= chunk_overlap < chunk_length:
+            message = 'ASR_CHUNK_OVERLAP_SECONDS must be non-negative and below the chunk length'
+            raise RuntimeError(message)
+        if batch_size < 1:
+            message = 'ASR_BATCH_SIZE must be greater than 0'
+            raise RuntimeError(message)
+
+        return cls(
+            chunk_length_seconds=chunk_length,
+            chunk_overlap_seconds=chunk_overlap,
+            batch_size=batch_size,
+        )
+
+
+@dataclass(frozen=True)
+class BatchSchedulerSettings:
+    """Limits applied by the cross-request micro-batching scheduler."""
+
+    max_batch_size: int
+    max_wait_seconds: float
+
+    @classmethod
+    def from_env(cls) -> BatchSchedulerSettings:
+        """Load scheduler limits from environment variables."""
+        max_batch_size = get_int_env('ASR_MAX_BATCH_SIZE', DEFAULT_MAX_BATCH_SIZE)
+        max_wait_ms = get_float_env('ASR_MAX_BATCH_WAIT_MS', DEFAULT_MAX_BATCH_WAIT_MS)
+        if max_batch_size < 1:
+            message = 'ASR_MAX_BATCH_SIZE must be greater than 0'
+            raise RuntimeError(message)
+        if max_wait_ms < 0:
+            message = 'ASR_MAX_BATCH_WAIT_MS must not be negative'
+            raise RuntimeError(message)
+        return cls(max_batch_size=max_batch_size, max_wait_seconds=max_wait_ms / 1000)
+
+
+@dataclass(frozen=True)
+class _AudioWindow:
+    """Sample range of a single Whisper decoding window."""
+
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class _TranscriptSegment:
+    """Stitched transcription of a window with timestamps in seconds."""
+
+    start: float
+    end: float
+    text: str
+
 
 class ASRService(TranscribeServicer):
     """gRPC servicer stub for the Whisper-based ASR pipeline."""
 
-    def __init__(self) -> None:
-        """Initialise the Whisper model and supporting components."""
+    def __init__(self, *, load_model: bool = True) -> None:
+        """Configure the service and, unless deferred, load the Whisper model.
+
+        Args:
+            load_model: Load the model immediately. ``serve`` passes ``False``
+                so the server can report NOT_SERVING while :meth:`load` runs.
+        """
         self._model_name = _resolve_model_name()
         self._device, self._dtype_name = _resolve_device()
+        self._quantization = _resolve_quantization(self._device)
+        self._worker_processes = _resolve_worker_processes(self._device)
+        self._model: Any = None
+        self._processor: Any = None
+        self._pool: PinnedProcessPool | None = None
+        self._long_form = LongFormSettings.from_env()
+        self._region_cache = _open_region_cache()
+        self._vad_settings = VadSettings.from_env()
+
+        self._batchers = self._create_batchers()
+        if load_model:
+            self.load()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Return whether the Whisper model is ready for inference."""
+        return self._processor is not None
+
+    @property
+    def worker_processes(self) -> int:
+        """Return how many worker processes run ``generate()``; ``0`` means in-process."""
+        return self._worker_processes
+
+    def restart_after_fork(self) -> None:
+        """Start fresh batch schedulers in a forked server process.
+
+        The scheduler threads of the parent do not exist in the child, so
+        its inherited schedulers would never process a batch.
+        """
+        self._batchers = self._create_batchers()
+
+    def load(self) -> None:
+        """Load the Whisper model and processor, or start the worker processes."""
         LOGGER.info(
-            "Loading Whisper model '%s' on device '%s' with dtype '%s'",
+            "Loading Whisper model '%s' on device '%s' with dtype '%s' and quantization '%s'",
             self._model_name,
             self._device,
             self._dtype_name,
+            self._quantization or 'none',
         )
+        if self._worker_processes:
+            self._start_worker_pool()
+            return
+
         model, processor = _load_whisper_components(
             self._model_name,
             self._device,
             self._dtype_name,
+            self._quantization,
         )
-        self._model: Any = model
-        self._processor: Any = processor
+        self._model = model
+        self._processor = processor
+
+    def warm_up(self, seconds: float) -> None:
+        """Decode *seconds* of synthetic silence on every inference worker."""
+        num_samples = int(seconds * TARGET_SAMPLE_RATE)
+        if num_samples <= 0:
+            return
+        source = ArrayAudioSource(np.zeros(num_samples, dtype=np.float32), TARGET_SAMPLE_RATE)
+
+        def _warm(batcher: MicroBatcher[Any, str]) -> None:
+            for _ in self._decode_source(source, 'synthetic warm-up audio', batcher):
+                pass
+
+        with futures.ThreadPoolExecutor(max_workers=len(self._batchers)) as executor:
+            for warmed in [executor.submit(_warm, batcher) for batcher in self._batchers]:
+                warmed.result()
+
+    def close(self) -> None:
+        """Stop the batch schedulers and any worker processes."""
+        for batcher in self._batchers:
+            batcher.close()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
 
     def run(
         self,
@@ -100,70 +312,375 @@ class ASRService(TranscribeServicer):
         Returns:
             Transcript message with normalised transcription text.
         """
+        audio_path = self._resolve_audio_path(request, context)
+        return self._build_transcript(audio_path, context)
+
+    def run_chunks(
+        self,
+        request_iterator: Iterator[AudioChunk],
+        context: ServicerContext,
+    ) -> Transcript:
+        """Transcribe audio uploaded as a stream of chunks.
+
+        Args:
+            request_iterator: Audio chunks sent by the client.
+            context: gRPC request context.
+
+        Returns:
+            Transcript message with normalised transcription text.
+        """
+        with _receive_upload(request_iterator, context) as audio_path:
+            return self._build_transcript(audio_path, context)
+
+    def stream_run(
+        self,
+        request: AudioRequest,
+        context: ServicerContext,
+    ) -> Iterator[Segment]:
+        """Stream transcript segments as soon as their windows are decoded.
+
+        Args:
+            request: Incoming gRPC request with audio metadata.
+            context: gRPC request context.
+
+        Yields:
+            Segment messages in timeline order.
+        """
+        segment_cls = getattr(transcribe_pb2, 'Segment')  # noqa: B009
+        audio_path = self._resolve_audio_path(request, context)
+        for segment in self._iter_transcript_segments(audio_path, context):
+            yield cast(
+                'Segment',
+                segment_cls(
+                    start=segment.start,
+                    end=segment.end,
+                    text=_post_process_transcript(segment.text),
+                ),
+            )
+
+    Run = run
+    RunChunks = run_chunks
+    StreamRun = stream_run
+
+    def _build_transcript(self, audio_path: Path, context: ServicerContext) -> Transcript:
+        """Decode *audio_path* and assemble the unary Transcript response."""
+        segment_cls = getattr(transcribe_pb2, 'Segment')  # noqa: B009
+        transcript_cls = getattr(transcribe_pb2, 'Transcript')  # noqa: B009
+
+        segments = list(self._iter_transcript_segments(audio_path, context))
+        normalised_text = _post_process_transcript(' '.join(segment.text for segment in segments))
+        LOGGER.debug('Transcription after normalisation: %s', normalised_text)
+
+        response = transcript_cls(text=normalised_text)
+        for segment in segments:
+            response.segments.append(
+                segment_cls(
+                    start=segment.start,
+                    end=segment.end,
+                    text=_post_process_transcript(segment.text),
+                )
+            )
+        return cast('Transcript', response)
+
+    def _iter_transcript_segments(
+        self,
+        audio_path: Path,
+        context: ServicerContext,
+    ) -> Iterator[_TranscriptSegment]:
+        """Decode the audio file and yield stitched segments in order."""
+        if not self.is_loaded:
+            _abort(context, grpc.StatusCode.UNAVAILABLE, 'Whisper model is still loading')
+        source = self._open_audio_source(audio_path, context)
+        try:
+            segments = self._decode_segments(audio_path, source)
+            while True:
+                try:
+                    segment = next(segments)
+                except StopIteration:
+                    return
+                except Exception as exc:  # decoding errors come back through batch futures
+                    LOGGER.exception('Failed to transcribe audio file %s', audio_path)
+                    _abort(
+                        context,
+                        grpc.StatusCode.INTERNAL,
+                        f'Failed to transcribe audio file: {exc}',
+                    )
+                yield segment
+        finally:
+            source.close()
+
+    def _decode_segments(
+        self,
+        audio_path: Path,
+        source: AudioSource,
+    ) -> Iterator[_TranscriptSegment]:
+        """Decode *source*, skipping silence when the region cache allows it."""
+        speech = self._speech_only_source(audio_path, source)
+        if speech is None:
+            yield from self._decode_source(source, str(audio_path))
+            return
+        for segment in self._decode_source(speech, f'speech regions of {audio_path}'):
+            yield replace(
+                segment,
+                start=speech.to_original_seconds(segment.start),
+                end=speech.to_original_seconds(segment.end, is_end=True),
+            )
+
+    def _speech_only_source(
+        self,
+        audio_path: Path,
+        source: AudioSource,
+    ) -> SpeechOnlySource | None:
+        """Return a view of *source* without its silences, or ``None`` to decode it all.
+
+        The regions come from the cache shared with the diarization service.
+        Recordings in which no speech was detected are decoded in full, so a
+        detector miss never produces an empty transcript.
+        """
+        if self._region_cache is None:
+            return None
+        regions = cached_speech_regions(
+            audio_path,
+            source,
+            cache=self._region_cache,
+            settings=self._vad_settings,
+        )
+        speech = SpeechOnlySource(source, regions)
+        if not speech.num_samples or speech.num_samples > MAX_SPEECH_FRACTION * source.num_samples:
+            return None
+        LOGGER.info(
+            'Skipping %.1f of %.1f seconds of silence in %s',
+            (source.num_samples - speech.num_samples) / source.sample_rate,
+            source.num_samples / source.sample_rate,
+            audio_path,
+        )
+        return speech
+
+    def _decode_source(
+        self,
+        source: AudioSource,
+        description: str,
+        batcher: MicroBatcher[Any, str] | None = None,
+    ) -> Iterator[_TranscriptSegment]:
+        """Decode *source* window by window and yield stitched segments in order.
+
+        All windows of one source go to the same scheduler, by default the
+        one with the fewest items in flight.
+        """
+        if batcher is None:
+            batcher = min(self._batchers, key=lambda candidate: candidate.in_flight)
+        sample_rate = source.sample_rate
+        inference_start = time.perf_counter()
+        windows = _plan_windows(source.num_samples, sample_rate, self._long_form)
+        LOGGER.info(
+            'Decoding %s in %d window(s) with batch size %d',
+            description,
+            len(windows),
+            self._long_form.batch_size,
+        )
+
+        stitcher = _SegmentStitcher(windows, sample_rate)
+        pending: deque[Future[str]] = deque()
+        next_index = 0
+        batch_size = self._long_form.batch_size
+        for offset in range(0, len(windows), batch_size):
+            batch = windows[offset : offset + batch_size]
+            features = self._extract_features(
+                [source.read(window.start, window.end) for window in batch],
+                sample_rate,
+            )
+            pending.extend(batcher.submit_many(features))
+
+            # Emit windows that finished while the next batch was being prepared.
+            while pending and pending[0].done():
+                segment = stitcher.push(next_index, pending.popleft().result())
+                next_index += 1
+                if segment is not None:
+                    yield segment
+
+        while pending:
+            segment = stitcher.push(next_index, pending.popleft().result())
+            next_index += 1
+            if segment is not None:
+                yield segment
+
+        inference_duration = time.perf_counter() - inference_start
+        LOGGER.info(
+            'Finished Whisper inference for %s in %.2f seconds',
+            description,
+            inference_duration,
+        )
+
+    def _resolve_audio_path(self, request: AudioRequest, context: ServicerContext) -> Path:
+        """Normalise and validate the audio path from the request."""
         received_path = (request.path or '').strip()
         LOGGER.info('Received transcription request for path: %s', received_path or '<empty>')
 
         if not received_path:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, 'Audio path must be provided')
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, 'Audio path must be provided')
 
         audio_path = Path(received_path)
         if not audio_path.exists():
-            context.abort(grpc.StatusCode.NOT_FOUND, f'Audio file not found: {audio_path}')
+            _abort(
+                context,
+                grpc.StatusCode.NOT_FOUND,
+                f'Audio file not found: {audio_path}',
+            )
         if not audio_path.is_file():
-            context.abort(
+            _abort(
+                context,
                 grpc.StatusCode.INVALID_ARGUMENT,
                 f'Audio path is not a file: {audio_path}',
             )
+        return audio_path
 
+    def _open_audio_source(self, audio_path: Path, context: ServicerContext) -> AudioSource:
+        """Memory-map WAV input, falling back to a full decode for other formats."""
+        try:
+            source: AudioSource = open_wav(audio_path, target_sample_rate=TARGET_SAMPLE_RATE)
+        except AudioFormatError as exc:
+            LOGGER.info('Decoding %s in memory: %s', audio_path, exc)
+            waveform, sample_rate = self._read_waveform(audio_path, context)
+            return ArrayAudioSource(waveform.squeeze(0).numpy(), sample_rate)
+        except FileNotFoundError:
+            _abort(context, grpc.StatusCode.NOT_FOUND, f'Audio file not found: {audio_path}')
+        except OSError as exc:
+            LOGGER.exception('Failed to open audio file %s', audio_path)
+            _abort(context, grpc.StatusCode.INTERNAL, f'Failed to load audio file: {exc}')
+
+        if source.num_samples == 0:
+            source.close()
+            _abort(context, grpc.StatusCode.INVALID_ARGUMENT, 'Audio file contains no samples')
+        return source
+
+    def _read_waveform(self, audio_path: Path, context: ServicerContext) -> tuple[Any, int]:
+        """Load the waveform and translate loader errors to gRPC statuses."""
         try:
             waveform, sample_rate = _load_waveform(audio_path)
         except FileNotFoundError:
-            context.abort(grpc.StatusCode.NOT_FOUND, f'Audio file not found: {audio_path}')
+            _abort(
+                context,
+                grpc.StatusCode.NOT_FOUND,
+                f'Audio file not found: {audio_path}',
+            )
         except Exception as exc:  # pragma: no cover - defensive, torchaudio raises RuntimeError
             LOGGER.exception('Failed to load audio file %s', audio_path)
-            context.abort(grpc.StatusCode.INTERNAL, f'Failed to load audio file: {exc}')
+            _abort(context, grpc.StatusCode.INTERNAL, f'Failed to load audio file: {exc}')
 
         if waveform.numel() == 0:
-            context.abort(grpc.StatusCode.INVALID_ARGUMENT, 'Audio file contains no samples')
-
-        inference_start = time.perf_counter()
-        torch = importlib.import_module('torch')
+            _abort(
+                context,
+                grpc.StatusCode.INVALID_ARGUMENT,
+                'Audio file contains no samples',
+            )
+        return waveform, sample_rate
 
+    def _extract_features(self, batch: list[Any], sample_rate: int) -> list[Any]:
+        """Compute Whisper input features and split them into per-window rows."""
         inputs = self._processor(
-            waveform.squeeze(0).numpy(),
+            batch,
             sampling_rate=sample_rate,
             return_tensors='pt',
         )
+        input_features = inputs.input_features
+        if len(batch) == 1:
+            return [input_features]
+        return [input_features[index : index + 1] for index in range(len(batch))]
 
-        input_features = inputs.input_features.to(self._model.device)
-        input_features = input_features.to(dtype=getattr(torch, self._dtype_name))
+    def _generate_batch(self, rows: list[Any]) -> list[str]:
+        """Decode feature rows gathered by the scheduler with a single ``generate`` call."""
+        return _generate_texts((self._model, self._processor), self._dtype_name, rows)
 
-        generated_tokens = self._model.generate(input_features)
-        transcription = self._processor.batch_decode(
-            generated_tokens,
-            skip_special_tokens=True,
-        )[0]
+    def _create_batchers(self) -> list[MicroBatcher[Any, str]]:
+        """Start the batch schedulers that feed ``generate()``.
 
-        inference_duration = time.perf_counter() - inference_start
-        LOGGER.info(
-            'Finished Whisper inference for %s in %.2f seconds',
-            audio_path,
-            inference_duration,
+        In-process inference uses a single scheduler. With worker processes
+        every worker gets its own scheduler so batches run in parallel.
+        """
+        scheduler_settings = BatchSchedulerSettings.from_env()
+        batch_callbacks: list[Callable[[list[Any]], list[str]]] = (
+            [partial(self._generate_on_worker, worker) for worker in range(self._worker_processes)]
+            if self._worker_processes
+            else [self._generate_batch]
         )
-
-        normalised_text = _post_process_transcript(transcription)
-        LOGGER.debug('Transcription after normalisation: %s', normalised_text)
-
-        transcript_cls = getattr(transcribe_pb2, 'Transcript')  # noqa: B009
-        response = transcript_cls(text=normalised_text)
-        return cast('Transcript', response)
-
-    Run = run
+        return [
+            MicroBatcher(
+                callback,
+                max_batch_size=scheduler_settings.max_batch_size,
+                max_wait_seconds=scheduler_settings.max_wait_seconds,
+                name='asr',
+            )
+            for callback in batch_callbacks
+        ]
+
+    def _generate_on_worker(self, worker: int, rows: list[Any]) -> list[str]:
+        """Decode feature rows on one of the worker processes."""
+        if self._pool is None:
+            message = 'ASR worker processes are not running'
+            raise RuntimeError(message)
+        arrays = [row.numpy() for row in rows]
+        result: list[str] = self._pool.submit(worker, _generate_in_worker, arrays).result()
+        return result
+
+    def _start_worker_pool(self) -> None:
+        """Start the worker processes and wait until each has loaded its model."""
+        pool = PinnedProcessPool(
+            self._worker_processes,
+            initializer=_initialize_worker,
+            initargs=(self._model_name, self._dtype_name, self._quantization),
+        )
+        try:
+            pids = pool.wait_ready()
+        except Exception:
+            pool.shutdown()
+            raise
+        for pid, cores in zip(pids, pool.core_sets, strict=True):
+            LOGGER.info('ASR worker %d uses %d core(s): %s', pid, len(cores), cores)
+        self._pool = pool
+        # Feature extraction stays in the front-end process; only generate() runs in workers.
+        self._processor = _load_whisper_processor(self._model_name)
+
+
+def _abort(context: ServicerContext, code: object, message: str) -> NoReturn:
+    """Abort a gRPC request and satisfy static type checkers."""
+    context.abort(code, message)
+    error_message = 'gRPC abort unexpectedly returned control'
+    raise RuntimeError(error_message)
+
+
+@contextlib.contextmanager
+def _receive_upload(
+    request_iterator: Iterator[AudioChunk],
+    context: ServicerContext,
+) -> Iterator[Path]:
+    """Spool an uploaded audio stream and translate upload errors to gRPC statuses."""
+    try:
+        with spool_audio_chunks(request_iterator) as audio_path:
+            yield audio_path
+    except AudioUploadTooLargeError as exc:
+        _abort(context, grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+    except AudioUploadError as exc:
+        _abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
+
+def _create_server(
+    max_workers: int,
+    options: Sequence[tuple[str, object]] = (),
+) -> GrpcServer:
+    """Instantiate a gRPC server for the ASR service."""
+    return grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), options=list(options))
 
 
-def _create_server(max_workers: int) -> GrpcServer:
-    """Instantiate a gRPC server for the ASR service."""
-    return grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+def _open_region_cache() -> SpeechRegionCache | None:
+    """Open the speech region cache when ``ASR_SKIP_SILENCE`` enables it."""
+    value = os.getenv(ENV_SKIP_SILENCE, '0').strip().lower()
+    if value not in {'1', 'true', 'yes'}:
+        return None
+    try:
+        return SpeechRegionCache.from_env()
+    except OSError as exc:
+        LOGGER.warning('Speech region cache unavailable, decoding silence too: %s', exc)
+        return None
 
 
 def _resolve_model_name() -> str:
@@ -190,28 +707,133 @@ def _resolve_device() -> tuple[str, str]:
     return 'cpu', 'float32'
 
 
+def _resolve_quantization(device: str) -> str | None:
+    """Return the weight quantization requested for CPU inference, if any."""
+    requested = os.getenv(ENV_CPU_QUANTIZATION, 'none').strip().lower() or 'none'
+    if requested not in CPU_QUANTIZATION_MODES:
+        allowed = ', '.join(CPU_QUANTIZATION_MODES)
+        message = f'{ENV_CPU_QUANTIZATION} must be one of: {allowed}'
+        raise RuntimeError(message)
+    if requested == 'none':
+        return None
+    if device != 'cpu':
+        LOGGER.warning('%s=%s is ignored on device %s', ENV_CPU_QUANTIZATION, requested, device)
+        return None
+    return requested
+
+
+def _resolve_worker_processes(device: str) -> int:
+    """Return how many pinned worker processes should run inference (0 = in-process)."""
+    workers = get_int_env(ENV_WORKER_PROCESSES, 0)
+    if workers < 0:
+        message = f'{ENV_WORKER_PROCESSES} must not be negative'
+        raise RuntimeError(message)
+    if workers and device != 'cpu':
+        LOGGER.warning('%s=%d is ignored on device %s', ENV_WORKER_PROCESSES, workers, device)
+        return 0
+    return workers
+
+
 @cache
 def _load_whisper_components(
     model_name: str,
     device: str,
     dtype_name: str,
+    quantization: str | None = None,
 ) -> tuple[Any, Any]:
-    """Load and cache the Whisper model and processor."""
+    """Load and cache the Whisper model and processor.
+
+    The quantization mode is part of the cache key, so an int8 model never
+    replaces (or keeps alive) the full-precision one.
+    """
     torch = importlib.import_module('torch')
     transformers = importlib.import_module('transformers')
 
     dtype = getattr(torch, dtype_name)
-    LOGGER.info('Loading Whisper resources (model=%s, device=%s)', model_name, device)
+    LOGGER.info(
+        'Loading Whisper resources (model=%s, device=%s, quantization=%s)',
+        model_name,
+        device,
+        quantization or 'none',
+    )
 
     model = transformers.WhisperForConditionalGeneration.from_pretrained(
         model_name,
         torch_dtype=dtype,
     ).to(device)
+    if quantization == 'int8':
+        # Dynamic quantization stores Linear weights as int8 and quantizes
+        # activations on the fly; the conversion happens in place so the
+        # float32 weights are released once loading finishes.
+        model.eval()
+        model = torch.ao.quantization.quantize_dynamic(
+            model,
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+            inplace=True,
+        )
     processor = transformers.WhisperProcessor.from_pretrained(model_name)
 
     return model, processor
 
 
+def _load_whisper_processor(model_name: str) -> object:
+    """Load the Whisper processor without the model weights."""
+    transformers = importlib.import_module('transformers')
+    return transformers.WhisperProcessor.from_pretrained(model_name)
+
+
+def _generate_texts(components: tuple[Any, Any], dtype_name: str, rows: list[Any]) -> list[str]:
+    """Run ``generate`` over the concatenated feature rows and decode the tokens."""
+    model, processor = components
+    torch = importlib.import_module('torch')
+
+    input_features = rows[0] if len(rows) == 1 else torch.cat(rows, dim=0)
+    input_features = input_features.to(model.device)
+    input_features = input_features.to(dtype=getattr(torch, dtype_name))
+
+    generated_tokens = model.generate(input_features)
+    decoded = processor.batch_decode(
+        generated_tokens,
+        skip_special_tokens=True,
+    )
+    return [str(text) for text in decoded]
+
+
+# Model state of a worker process, populated once by ``_initialize_worker``.
+_WORKER_STATE: dict[str, Any] = {}
+
+
+def _initialize_worker(
+    num_threads: int,
+    model_name: str,
+    dtype_name: str,
+    quantization: str | None,
+) -> None:
+    """Load a private Whisper copy inside a pinned worker process."""
+    logging.basicConfig(level=os.getenv('ASR_LOG_LEVEL', 'INFO'))
+    torch = importlib.import_module('torch')
+    torch.set_num_threads(num_threads)
+    _WORKER_STATE['components'] = _load_whisper_components(
+        model_name,
+        'cpu',
+        dtype_name,
+        quantization,
+    )
+    _WORKER_STATE['dtype_name'] = dtype_name
+
+
+def _generate_in_worker(arrays: list[Any]) -> list[str]:
+    """Decode feature arrays sent by the front-end process."""
+    torch = importlib.import_module('torch')
+    rows = [torch.from_numpy(array) for array in arrays]
+    return _generate_texts(
+        _WORKER_STATE['components'],
+        _WORKER_STATE['dtype_name'],
+        rows,
+    )
+
+
 def _load_waveform(audio_path: Path) -> tuple[Any, int]:
     """Load, normalise channels and resample the input waveform."""
     torchaudio = importlib.import_module('torchaudio')
@@ -221,15 +843,104 @@ def _load_waveform(audio_path: Path) -> tuple[Any, int]:
     if waveform.size(0) > 1:
         waveform = waveform.mean(dim=0, keepdim=True)
 
-    target_sample_rate = 16000
-    if sample_rate != target_sample_rate:
-        waveform = torchaudio.functional.resample(waveform, sample_rate, target_sample_rate)
-        sample_rate = target_sample_rate
+    if sample_rate != TARGET_SAMPLE_RATE:
+        waveform = torchaudio.functional.resample(waveform, sample_rate, TARGET_SAMPLE_RATE)
+        sample_rate = TARGET_SAMPLE_RATE
 
     waveform = waveform.to(dtype=torch.float32)
     return waveform, sample_rate
 
 
+def _plan_windows(
+    num_samples: int,
+    sample_rate: int,
+    settings: LongFormSettings,
+) -> list[_AudioWindow]:
+    """Split the waveform into overlapping windows that fit the Whisper context."""
+    window_size = max(1, int(settings.chunk_length_seconds * sample_rate))
+    overlap = min(int(settings.chunk_overlap_seconds * sample_rate), window_size - 1)
+    if num_samples <= window_size:
+        return [_AudioWindow(start=0, end=num_samples)]
+
+    step = window_size - overlap
+    windows: list[_AudioWindow] = []
+    start = 0
+    while True:
+        end = min(start + window_size, num_samples)
+        windows.append(_AudioWindow(start=start, end=end))
+        if end >= num_samples:
+            break
+        start += step
+    return windows
+
+
+class _SegmentStitcher:
+    """Turn decoded window texts into timestamped segments one window at a time.
+
+    Each window owns the audio between the middles of its overlaps with the
+    neighbouring windows, and words repeated at the beginning of a window
+    because of the overlap are dropped.
+    """
+
+    def __init__(self, windows: list[_AudioWindow], sample_rate: int) -> None:
+        self._windows = windows
+        self._sample_rate = sample_rate
+        self._previous_words: list[str] = []
+
+    def push(self, index: int, text: str) -> _TranscriptSegment | None:
+        """Stitch the text of window *index*; windows must be pushed in order."""
+        words = text.split()
+        if self._previous_words:
+            words = words[_count_duplicated_words(self._previous_words, words) :]
+        if not words:
+            return None
+        self._previous_words = words
+
+        window = self._windows[index]
+        start = window.start
+        if index > 0:
+            start = (self._windows[index - 1].end + window.start) // 2
+        end = window.end
+        if index < len(self._windows) - 1:
+            end = (window.end + self._windows[index + 1].start) // 2
+
+        return _TranscriptSegment(
+            start=start / self._sample_rate,
+            end=end / self._sample_rate,
+            text=' '.join(words),
+        )
+
+
+_MAX_LEADING_SKIP = 1
+
+
+def _count_duplicated_words(previous: list[str], current: list[str]) -> int:
+    """Return how many leading words of *current* repeat the tail of *previous*.
+
+    A partial word cut at the window start is tolerated when it precedes a
+    repeated run of at least two words.
+    """
+    previous_norm = [_normalise_word(word) for word in previous]
+    current_norm = [_normalise_word(word) for word in current]
+
+    best_drop = 0
+    best_length = 0
+    for skip in range(min(_MAX_LEADING_SKIP, len(current_norm)) + 1):
+        limit = min(len(previous_norm), len(current_norm) - skip)
+        for length in range(limit, best_length, -1):
+            if previous_norm[-length:] == current_norm[skip : skip + length]:
+                if skip == 0 or length > 1:
+                    best_length = length
+                    best_drop = skip + length
+                break
+    return best_drop
+
+
+def _normalise_word(word: str) -> str:
+    """Lowercase a word and strip punctuation for overlap comparison."""
+    return re.sub(r'[^\w]', '', word.lower())
+
+
 _POST_PROCESS_RULES = ((re.compile(r'\bрум\b', re.IGNORECASE), 'RUMA'),)
 
 
@@ -242,18 +953,82 @@ def _post_process_transcript(transcript: str) -> str:
 
 
 def serve() -> None:
-    """Start the ASR gRPC service."""
+    """Start the ASR gRPC service.
+
+    The server starts reporting NOT_SERVING right away and flips to SERVING
+    once the model is loaded and a synthetic warm-up inference has finished.
+    """
     logging.basicConfig(level=os.getenv('ASR_LOG_LEVEL', 'INFO'))
     port = os.getenv('ASR_SERVICE_PORT', '50051')
     max_workers = int(os.getenv('ASR_MAX_WORKERS', '4'))
+    warmup_seconds = resolve_warmup_seconds('ASR_WARMUP_SECONDS', DEFAULT_WARMUP_SECONDS)
+    prefork_workers = resolve_prefork_workers(ENV_PREFORK_WORKERS)
+    if prefork_workers:
+        _serve_preforked(port, max_workers, warmup_seconds, prefork_workers)
+        return
 
+    start_metrics_server_from_env('ASR_METRICS_PORT')
     server = _create_server(max_workers=max_workers)
-    add_transcribe_servicer_to_server(ASRService(), server)
+    service = ASRService(load_model=False)
+    add_transcribe_servicer_to_server(service, server)
+    health = ServiceHealth(server, SERVICE_NAME, metric_prefix='asr')
     server.add_insecure_port(f'[::]:{port}')
 
     LOGGER.info('Starting ASR service on port %s', port)
     server.start()
-    server.wait_for_termination()
+    with health.phase('load'):
+        service.load()
+    with health.phase('warmup'):
+        service.warm_up(warmup_seconds)
+    health.set_serving()
+    try:
+        server.wait_for_termination()
+    finally:
+        service.close()
+
+
+def _serve_preforked(
+    port: str,
+    max_workers: int,
+    warmup_seconds: float,
+    num_workers: int,
+) -> None:
+    """Load Whisper once, then fork *num_workers* servers that share it on *port*.
+
+    Every worker warms up and reports SERVING on its own; the parent only
+    supervises them. Each worker serves metrics on ``ASR_METRICS_PORT`` plus
+    its index.
+    """
+    service = ASRService(load_model=False)
+    if service.worker_processes:
+        message = f'{ENV_PREFORK_WORKERS} cannot be combined with {ENV_WORKER_PROCESSES}'
+        raise RuntimeError(message)
+    LOGGER.info('Loading the ASR model before forking %d server process(es)', num_workers)
+    service.load()
+
+    def _worker(index: int) -> None:
+        service.restart_after_fork()
+        start_worker_metrics_server('ASR_METRICS_PORT', index)
+        server = _create_server(max_workers=max_workers, options=REUSE_PORT_OPTIONS)
+        add_transcribe_servicer_to_server(service, server)
+        health = ServiceHealth(server, SERVICE_NAME, metric_prefix='asr')
+        server.add_insecure_port(f'[::]:{port}')
+        server.start()
+        LOGGER.info('ASR worker %d (pid %d) listening on port %s', index, os.getpid(), port)
+        with health.phase('warmup'):
+            service.warm_up(warmup_seconds)
+        health.set_serving()
+        stop_on_sigterm(server)
+        try:
+            server.wait_for_termination()
+        finally:
+            service.close()
+
+    try:
+        with reserve_port(int(port)):
+            PreforkSupervisor(_worker, num_workers, name='asr').run()
+    finally:
+        service.close()
 
 
 def main() -> None:
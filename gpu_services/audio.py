@@ -0,0 +1,361 @@
+"""Memory-mapped WAV access with on-demand 16 kHz mono resampling."""
+
+from __future__ import annotations
+
+import logging
+import math
+import struct
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from numpy.typing import NDArray
+
+LOGGER = logging.getLogger(__name__)
+
+TARGET_SAMPLE_RATE: Final = 16000
+
+WAVE_FORMAT_PCM: Final = 0x0001
+WAVE_FORMAT_IEEE_FLOAT: Final = 0x0003
+WAVE_FORMAT_EXTENSIBLE: Final = 0xFFFE
+
+_RIFF_HEADER = struct.Struct('<4sI4s')
+_CHUNK_HEADER = struct.Struct('<4sI')
+_FMT_CHUNK = struct.Struct('<HHIIHH')
+_FMT_EXTENSIBLE_MIN_SIZE: Final = 40
+_FMT_SUBFORMAT_OFFSET: Final = 24
+
+_KAISER_BETA: Final = 5.0
+_FILTER_HALF_LENGTH_FACTOR: Final = 10
+
+
+class AudioFormatError(ValueError):
+    """Raised when a file is not a WAV layout that can be memory-mapped."""
+
+
+@dataclass(frozen=True)
+class WavInfo:
+    """Layout of the sample data inside a PCM or IEEE float WAV file."""
+
+    sample_rate: int
+    num_channels: int
+    bits_per_sample: int
+    format_tag: int
+    data_offset: int
+    num_frames: int
+
+    @property
+    def duration(self) -> float:
+        """Return the recording length in seconds."""
+        return self.num_frames / float(self.sample_rate)
+
+
+class AudioSource(Protocol):
+    """Mono audio that can be read in sample ranges of a fixed sample rate."""
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the values returned by :meth:`read`."""
+
+    @property
+    def num_samples(self) -> int:
+        """Return the number of samples available at :attr:`sample_rate`."""
+
+    def read(self, start: int, stop: int) -> NDArray[np.float32]:
+        """Return samples ``[start, stop)`` as a float32 array."""
+
+    def close(self) -> None:
+        """Release resources held by the source."""
+
+
+def read_wav_info(path: Path) -> WavInfo:
+    """Parse the RIFF header of *path* without touching the sample data.
+
+    Raises:
+        AudioFormatError: If the file is not an uncompressed PCM/float WAV.
+    """
+    file_size = path.stat().st_size
+    with path.open('rb') as handle:
+        header = handle.read(_RIFF_HEADER.size)
+        if len(header) < _RIFF_HEADER.size:
+            message = f'{path} is too short to be a WAV file'
+            raise AudioFormatError(message)
+        riff_id, _, wave_id = _RIFF_HEADER.unpack(header)
+        if riff_id != b'RIFF' or wave_id != b'WAVE':
+            message = f'{path} is not a RIFF/WAVE file'
+            raise AudioFormatError(message)
+
+        fmt: tuple[int, int, int, int, int] | None = None
+        while True:
+            chunk_header = handle.read(_CHUNK_HEADER.size)
+            if len(chunk_header) < _CHUNK_HEADER.size:
+                message = f'{path} has no data chunk'
+                raise AudioFormatError(message)
+            chunk_id, chunk_size = _CHUNK_HEADER.unpack(chunk_header)
+            if chunk_id == b'fmt ':
+                fmt = _parse_fmt_chunk(handle.read(chunk_size), path)
+                if chunk_size % 2:
+                    handle.seek(1, 1)
+            elif chunk_id == b'data':
+                break
+            else:
+                handle.seek(chunk_size + chunk_size % 2, 1)
+        data_offset = handle.tell()
+
+    if fmt is None:
+        message = f'{path} has no fmt chunk before its data'
+        raise AudioFormatError(message)
+    format_tag, num_channels, sample_rate, block_align, bits_per_sample = fmt
+
+    # Streaming writers leave the data size at 0 or 0xFFFFFFFF; trust the file.
+    available = max(file_size - data_offset, 0)
+    data_size = available if chunk_size in {0, 0xFFFFFFFF} else min(chunk_size, available)
+    return WavInfo(
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        bits_per_sample=bits_per_sample,
+        format_tag=format_tag,
+        data_offset=data_offset,
+        num_frames=data_size // block_align,
+    )
+
+
+def _parse_fmt_chunk(payload: bytes, path: Path) -> tuple[int, int, int, int, int]:
+    """Validate a ``fmt`` chunk and return its relevant fields."""
+    if len(payload) < _FMT_CHUNK.size:
+        message = f'{path} has a truncated fmt chunk'
+        raise AudioFormatError(message)
+    format_tag, channels, sample_rate, _, block_align, bits = _FMT_CHUNK.unpack_from(payload)
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(payload) >= _FMT_EXTENSIBLE_MIN_SIZE:
+        (format_tag,) = struct.unpack_from('<H', payload, _FMT_SUBFORMAT_OFFSET)
+
+    supported_bits = {
+        WAVE_FORMAT_PCM: {8, 16, 24, 32},
+        WAVE_FORMAT_IEEE_FLOAT: {32, 64},
+    }
+    if bits not in supported_bits.get(format_tag, set()):
+        message = f'{path} uses unsupported WAV encoding {format_tag:#06x}/{bits} bit'
+        raise AudioFormatError(message)
+    if channels < 1 or sample_rate < 1 or block_align != channels * bits // 8:
+        message = f'{path} has an inconsistent fmt chunk'
+        raise AudioFormatError(message)
+    return format_tag, channels, sample_rate, block_align, bits
+
+
+class WavReader:
+    """Read mono windows at a target sample rate from a memory-mapped WAV file.
+
+    Only the frames needed for the requested window (plus the resampling
+    filter context) are decoded, so memory usage is bounded by the window size
+    rather than by the recording length.
+    """
+
+    def __init__(self, path: Path, *, target_sample_rate: int = TARGET_SAMPLE_RATE) -> None:
+        """Parse the header of *path* and map its sample data."""
+        self._path = path
+        self._info = read_wav_info(path)
+        self._samples: np.memmap | None = None
+        if self._info.num_frames:
+            self._samples = _map_samples(path, self._info)
+        self._target_sample_rate = target_sample_rate
+        self._resampler: _PolyphaseResampler | None = None
+        if self._info.sample_rate != target_sample_rate:
+            self._resampler = _PolyphaseResampler(self._info.sample_rate, target_sample_rate)
+
+    @property
+    def info(self) -> WavInfo:
+        """Return the parsed header."""
+        return self._info
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the values returned by :meth:`read`."""
+        return self._target_sample_rate
+
+    @property
+    def num_samples(self) -> int:
+        """Return the recording length in samples at :attr:`sample_rate`."""
+        if self._resampler is None:
+            return self._info.num_frames
+        return self._resampler.output_length(self._info.num_frames)
+
+    def read(self, start: int, stop: int) -> NDArray[np.float32]:
+        """Return resampled mono samples ``[start, stop)`` as a float32 array."""
+        start = max(start, 0)
+        stop = min(stop, self.num_samples)
+        if stop <= start:
+            return np.zeros(0, dtype=np.float32)
+        if self._resampler is None:
+            return self._read_frames(start, stop)
+        first, last = self._resampler.input_range(start, stop)
+        return self._resampler.resample(self._read_frames(first, last), first, start, stop)
+
+    def close(self) -> None:
+        """Drop the memory map so the operating system can release the mapping."""
+        self._samples = None
+
+    def _read_frames(self, first: int, last: int) -> NDArray[np.float32]:
+        """Return mono frames ``[first, last)`` with zeros outside the file."""
+        frames = np.zeros(last - first, dtype=np.float32)
+        lower = max(first, 0)
+        upper = min(last, self._info.num_frames)
+        if self._samples is not None and lower < upper:
+            frames[lower - first : upper - first] = _mix_to_mono(
+                self._samples[lower:upper],
+                self._info,
+            )
+        return frames
+
+
+class ArrayAudioSource:
+    """Expose an in-memory mono waveform through the :class:`AudioSource` interface."""
+
+    def __init__(self, samples: object, sample_rate: int) -> None:
+        """Wrap *samples*, anything convertible to a one-dimensional array."""
+        self._samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        self._sample_rate = sample_rate
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the wrapped waveform."""
+        return self._sample_rate
+
+    @property
+    def num_samples(self) -> int:
+        """Return the number of wrapped samples."""
+        return int(self._samples.shape[0])
+
+    def read(self, start: int, stop: int) -> NDArray[np.float32]:
+        """Return samples ``[start, stop)``."""
+        return self._samples[max(start, 0) : max(stop, 0)]
+
+    def close(self) -> None:
+        """Nothing to release for in-memory audio."""
+
+
+def open_wav(path: Path, *, target_sample_rate: int = TARGET_SAMPLE_RATE) -> WavReader:
+    """Open *path* for windowed reads at *target_sample_rate*."""
+    return WavReader(path, target_sample_rate=target_sample_rate)
+
+
+_SAMPLE_DTYPES: Final[dict[tuple[int, int], np.dtype[Any]]] = {
+    (WAVE_FORMAT_PCM, 8): np.dtype(np.uint8),
+    (WAVE_FORMAT_PCM, 16): np.dtype('<i2'),
+    (WAVE_FORMAT_PCM, 32): np.dtype('<i4'),
+    (WAVE_FORMAT_IEEE_FLOAT, 32): np.dtype('<f4'),
+    (WAVE_FORMAT_IEEE_FLOAT, 64): np.dtype('<f8'),
+}
+
+
+def _map_samples(path: Path, info: WavInfo) -> np.memmap:
+    """Memory-map the data chunk as a ``(frames, channels[, bytes])`` array."""
+    if info.bits_per_sample == 24:  # noqa: PLR2004 - packed 24-bit PCM has no NumPy dtype
+        dtype: np.dtype[Any] = np.dtype(np.uint8)
+        shape: tuple[int, ...] = (info.num_frames, info.num_channels, 3)
+    else:
+        dtype = _SAMPLE_DTYPES[(info.format_tag, info.bits_per_sample)]
+        shape = (info.num_frames, info.num_channels)
+    return np.memmap(path, dtype=dtype, mode='r', offset=info.data_offset, shape=shape)
+
+
+def _mix_to_mono(raw: NDArray[np.generic], info: WavInfo) -> NDArray[np.float32]:
+    """Convert raw interleaved frames to float32 in ``[-1, 1]`` and average channels."""
+    bits = info.bits_per_sample
+    if info.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+        samples = raw.astype(np.float32)
+    elif bits == 8:  # noqa: PLR2004 - 8-bit PCM is unsigned
+        samples = (raw.astype(np.float32) - 128.0) / 128.0
+    elif bits == 24:  # noqa: PLR2004
+        packed = raw.astype(np.int32)
+        values = packed[..., 0] | (packed[..., 1] << 8) | (packed[..., 2] << 16)
+        values = (values << 8) >> 8  # sign-extend the 24-bit value
+        samples = values.astype(np.float32) / float(1 << 23)
+    else:
+        samples = raw.astype(np.float32) / float(1 << (bits - 1))
+
+    if info.num_channels == 1:
+        return samples[:, 0]
+    return samples.mean(axis=1, dtype=np.float32)
+
+
+class _PolyphaseResampler:
+    """Rational-factor resampler equivalent to upsample, low-pass filter, decimate.
+
+    The Kaiser-windowed sinc filter follows the usual ``resample_poly``
+    design. Output sample ``n`` only depends on input frames in
+    :meth:`input_range`, so any window can be produced independently and the
+    results match a single pass over the whole recording.
+    """
+
+    def __init__(self, source_rate: int, target_rate: int) -> None:
+        divisor = math.gcd(source_rate, target_rate)
+        self._up = target_rate // divisor
+        self._down = source_rate // divisor
+
+        max_rate = max(self._up, self._down)
+        self._half_length = _FILTER_HALF_LENGTH_FACTOR * max_rate
+        taps = _design_lowpass(2 * self._half_length + 1, 1.0 / max_rate) * self._up
+
+        # bank[phase, j] holds tap ``phase + j * up``; the reversed rows can be
+        # applied directly to contiguous input windows.
+        self._taps_per_phase = -(-taps.shape[0] // self._up)
+        padded = np.zeros(self._taps_per_phase * self._up, dtype=np.float64)
+        padded[: taps.shape[0]] = taps
+        bank = padded.reshape(self._taps_per_phase, self._up).T
+        self._bank = np.ascontiguousarray(bank[:, ::-1], dtype=np.float32)
+
+    def output_length(self, input_length: int) -> int:
+        """Return the number of output samples produced for *input_length* frames."""
+        return -(-input_length * self._up // self._down)
+
+    def input_range(self, start: int, stop: int) -> tuple[int, int]:
+        """Return the input frames ``[first, last)`` needed for outputs ``[start, stop)``."""
+        first = (start * self._down + self._half_length) // self._up - (self._taps_per_phase - 1)
+        last = ((stop - 1) * self._down + self._half_length) // self._up + 1
+        return first, last
+
+    def resample(
+        self,
+        frames: NDArray[np.float32],
+        first: int,
+        start: int,
+        stop: int,
+    ) -> NDArray[np.float32]:
+        """Compute outputs ``[start, stop)`` from input *frames* beginning at *first*."""
+        count = stop - start
+        output = np.empty(count, dtype=np.float32)
+        windows = sliding_window_view(frames, self._taps_per_phase)
+        for offset in range(min(self._up, count)):
+            position = (start + offset) * self._down + self._half_length
+            phase = position % self._up
+            window_start = position // self._up - (self._taps_per_phase - 1) - first
+            outputs = len(range(offset, count, self._up))
+            rows = windows[
+                window_start : window_start + (outputs - 1) * self._down + 1 : self._down
+            ]
+            output[offset :: self._up] = rows @ self._bank[phase]
+        return output
+
+
+def _design_lowpass(num_taps: int, cutoff: float) -> NDArray[np.float64]:
+    """Return a unity-gain Kaiser-windowed sinc filter with *cutoff* relative to Nyquist."""
+    positions = np.arange(num_taps, dtype=np.float64) - (num_taps - 1) / 2
+    taps = cutoff * np.sinc(cutoff * positions) * np.kaiser(num_taps, _KAISER_BETA)
+    return taps / taps.sum()
+
+
+__all__: Final = (
+    'TARGET_SAMPLE_RATE',
+    'ArrayAudioSource',
+    'AudioFormatError',
+    'AudioSource',
+    'WavInfo',
+    'WavReader',
+    'open_wav',
+    'read_wav_info',
+)
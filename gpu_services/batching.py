@@ -0,0 +1,238 @@
+"""Micro-batching scheduler that merges concurrent inference requests."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from gpu_services.metrics import BATCH_SIZE_BUCKETS, REGISTRY, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+ItemT = TypeVar('ItemT')
+ResultT = TypeVar('ResultT')
+
+
+@dataclass(frozen=True)
+class _PendingItem(Generic[ItemT, ResultT]):
+    """Queued item together with the future that receives its result."""
+
+    item: ItemT
+    future: Future[ResultT]
+    enqueued_at: float
+
+
+_STOP: Final = object()
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """Collect items from concurrent callers and process them in batches.
+
+    A single worker thread waits for the first queued item, then keeps
+    collecting items until either ``max_batch_size`` is reached or
+    ``max_wait_seconds`` have elapsed. The whole batch is handed to
+    ``process_batch`` which must return one result per item, in order.
+    When a batch fails, its items are retried one by one so that a single
+    bad item does not fail the requests it happened to be batched with.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[ItemT]], Sequence[ResultT]],
+        *,
+        max_batch_size: int,
+        max_wait_seconds: float,
+        name: str,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """Start the background worker that drains the request queue."""
+        if max_batch_size < 1:
+            message = 'max_batch_size must be greater than 0'
+            raise ValueError(message)
+        if max_wait_seconds < 0:
+            message = 'max_wait_seconds must not be negative'
+            raise ValueError(message)
+
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_seconds
+        self._queue: queue.Queue[_PendingItem[ItemT, ResultT] | object] = queue.Queue()
+        self._closed = False
+        self._in_flight = 0
+        # Guards ``_closed`` and ``_in_flight`` so that no item is queued behind ``_STOP``.
+        self._lock = threading.Lock()
+
+        self._queue_depth = registry.gauge(
+            f'{name}_queue_depth',
+            'Number of items waiting for the batch scheduler',
+        )
+        self._batch_size = registry.histogram(
+            f'{name}_batch_size',
+            'Number of items processed per batch',
+            buckets=BATCH_SIZE_BUCKETS,
+        )
+        self._queue_wait = registry.histogram(
+            f'{name}_queue_wait_seconds',
+            'Time items spent queued before their batch started',
+        )
+        self._batch_duration = registry.histogram(
+            f'{name}_batch_duration_seconds',
+            'Wall-clock time spent processing a batch',
+        )
+
+        self._worker = threading.Thread(target=self._run, name=f'{name}-batcher', daemon=True)
+        self._worker.start()
+
+    @property
+    def max_batch_size(self) -> int:
+        """Return the largest number of items processed together."""
+        return self._max_batch_size
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of items queued or being processed."""
+        return self._in_flight
+
+    def submit(self, item: ItemT) -> Future[ResultT]:
+        """Queue *item* for batched processing and return a future for its result."""
+        future: Future[ResultT] = Future()
+        with self._lock:
+            if self._closed:
+                message = 'Cannot submit items to a closed batcher'
+                raise RuntimeError(message)
+            self._in_flight += 1
+            # Counted before the worker can take the item, so the gauge never goes negative.
+            self._queue_depth.inc()
+            self._queue.put(_PendingItem(item, future, time.perf_counter()))
+        return future
+
+    def submit_many(self, items: Iterable[ItemT]) -> list[Future[ResultT]]:
+        """Queue several items and return their futures in submission order."""
+        return [self.submit(item) for item in items]
+
+    def close(self, timeout: float | None = None) -> None:
+        """Stop accepting items and wait for queued batches to finish."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        """Worker loop collecting and dispatching batches until closed."""
+        try:
+            while True:
+                first = self._queue.get()
+                if first is _STOP:
+                    return
+
+                batch = [first]
+                stop_requested = self._fill_batch(batch)
+                self._dispatch([entry for entry in batch if isinstance(entry, _PendingItem)])
+                if stop_requested:
+                    return
+        finally:
+            self._fail_leftovers()
+
+    def _fail_leftovers(self) -> None:
+        """Fail every item still queued once the worker has stopped."""
+        leftovers: list[_PendingItem[ItemT, ResultT]] = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if isinstance(entry, _PendingItem):
+                leftovers.append(entry)
+        if not leftovers:
+            return
+
+        LOGGER.warning('Failing %d item(s) queued after the batcher stopped', len(leftovers))
+        self._queue_depth.dec(len(leftovers))
+        with self._lock:
+            self._in_flight -= len(leftovers)
+        error = RuntimeError('Batcher was closed before the item was processed')
+        for entry in leftovers:
+            entry.future.set_exception(error)
+
+    def _fill_batch(self, batch: list[object]) -> bool:
+        """Extend *batch* until it is full or the wait budget is spent."""
+        deadline = time.perf_counter() + self._max_wait_seconds
+        while len(batch) < self._max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    entry = self._queue.get(timeout=remaining)
+                else:
+                    entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is _STOP:
+                return True
+            batch.append(entry)
+        return False
+
+    def _dispatch(self, batch: list[_PendingItem[ItemT, ResultT]]) -> None:
+        """Run the batch callback and fan results back out to the futures."""
+        self._queue_depth.dec(len(batch))
+        started = time.perf_counter()
+        for entry in batch:
+            self._queue_wait.observe(started - entry.enqueued_at)
+        self._batch_size.observe(len(batch))
+
+        try:
+            results = list(self._process_batch([entry.item for entry in batch]))
+        except Exception as exc:  # errors are forwarded to the waiting callers
+            if len(batch) == 1:
+                LOGGER.exception('Batch processing failed for 1 item')
+                batch[0].future.set_exception(exc)
+            else:
+                LOGGER.warning(
+                    'Batch processing failed for %d items; retrying them one by one',
+                    len(batch),
+                    exc_info=exc,
+                )
+                for entry in batch:
+                    self._dispatch_single(entry)
+            return
+        finally:
+            self._batch_duration.observe(time.perf_counter() - started)
+            with self._lock:
+                self._in_flight -= len(batch)
+
+        if len(results) != len(batch):
+            message = f'Batch callback returned {len(results)} results for {len(batch)} items'
+            LOGGER.error(message)
+            for entry in batch:
+                entry.future.set_exception(RuntimeError(message))
+            return
+
+        for entry, result in zip(batch, results, strict=True):
+            entry.future.set_result(result)
+
+    def _dispatch_single(self, entry: _PendingItem[ItemT, ResultT]) -> None:
+        """Process *entry* on its own after the batch it was part of failed."""
+        try:
+            results = list(self._process_batch([entry.item]))
+        except Exception as exc:  # errors are forwarded to the waiting caller
+            LOGGER.exception('Processing failed for an item retried on its own')
+            entry.future.set_exception(exc)
+            return
+        if len(results) != 1:
+            message = f'Batch callback returned {len(results)} results for 1 item'
+            LOGGER.error(message)
+            entry.future.set_exception(RuntimeError(message))
+            return
+        entry.future.set_result(results[0])
+
+
+__all__: Final = ('MicroBatcher',)
@@ -0,0 +1,10 @@
+"""Performance benchmarks for the GPU services."""
+
+__all__ = [
+    'asr_cpu',
+    'diarization_cpu',
+    'speaker_index',
+    'summarize_load',
+    'summary_chunking',
+    'summary_prefilter',
+]
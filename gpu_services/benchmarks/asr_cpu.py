@@ -0,0 +1,202 @@
+"""Compare fp32 and int8 CPU Whisper inference by real-time factor and peak RSS.
+
+Each mode runs in a fresh interpreter so that peak RSS reflects only that
+model. Run from the repository root::
+
+    python -m gpu_services.benchmarks.asr_cpu sample_dialogue.wav --repeats 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from gpu_services.audio import AudioFormatError, read_wav_info
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+REPO_ROOT: Final = Path(__file__).resolve().parents[2]
+DEFAULT_AUDIO: Final = REPO_ROOT / 'sample_dialogue.wav'
+QUANTIZATION_BY_MODE: Final = {'fp32': 'none', 'int8': 'int8'}
+BASELINE_MODE: Final = 'fp32'
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements collected for a single inference mode."""
+
+    mode: str
+    audio_seconds: float
+    load_seconds: float
+    decode_seconds: float
+    peak_rss_mib: float
+
+    @property
+    def real_time_factor(self) -> float:
+        """Return processing time per second of audio (lower is faster)."""
+        if self.audio_seconds <= 0:
+            return float('inf')
+        return self.decode_seconds / self.audio_seconds
+
+
+class _RaisingContext:
+    """Minimal servicer context that turns aborts into exceptions."""
+
+    def abort(self, code: object, details: str) -> None:
+        message = f'ASR request aborted with {code}: {details}'
+        raise RuntimeError(message)
+
+
+def _audio_duration(path: Path) -> float:
+    """Return the duration of *path* in seconds."""
+    try:
+        return read_wav_info(path).duration
+    except AudioFormatError:
+        torchaudio = importlib.import_module('torchaudio')
+        info = torchaudio.info(str(path))
+        return info.num_frames / float(info.sample_rate)
+
+
+def _peak_rss_mib() -> float:
+    """Return the peak resident set size of the current process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return peak / divisor
+
+
+def run_mode(mode: str, audio_paths: Sequence[Path], repeats: int) -> BenchmarkResult:
+    """Load Whisper in *mode* inside this process and transcribe every file."""
+    os.environ['ASR_CPU_QUANTIZATION'] = QUANTIZATION_BY_MODE[mode]
+    os.environ['CUDA_VISIBLE_DEVICES'] = ''
+
+    asr_service = importlib.import_module('gpu_services.asr_service')
+    transcribe_pb2 = importlib.import_module('app.clients.transcribe_pb2')
+
+    load_start = time.perf_counter()
+    service = asr_service.ASRService()
+    load_seconds = time.perf_counter() - load_start
+
+    context = _RaisingContext()
+    # The first request pays for lazy initialisation inside torch; keep it out of the timing.
+    service.run(transcribe_pb2.AudioRequest(path=str(audio_paths[0])), context)
+
+    decode_start = time.perf_counter()
+    for _ in range(repeats):
+        for path in audio_paths:
+            service.run(transcribe_pb2.AudioRequest(path=str(path)), context)
+    decode_seconds = time.perf_counter() - decode_start
+
+    return BenchmarkResult(
+        mode=mode,
+        audio_seconds=sum(_audio_duration(path) for path in audio_paths) * repeats,
+        load_seconds=load_seconds,
+        decode_seconds=decode_seconds,
+        peak_rss_mib=_peak_rss_mib(),
+    )
+
+
+def _run_isolated(
+    mode: str,
+    audio_paths: Sequence[Path],
+    repeats: int,
+    model_size: str,
+) -> BenchmarkResult:
+    """Run :func:`run_mode` in a child interpreter and parse its JSON report."""
+    env = dict(os.environ)
+    env['ASR_MODEL_SIZE'] = model_size
+    python_path = [str(REPO_ROOT / 'backend'), str(REPO_ROOT)]
+    if env.get('PYTHONPATH'):
+        python_path.append(env['PYTHONPATH'])
+    env['PYTHONPATH'] = os.pathsep.join(python_path)
+
+    command = [
+        sys.executable,
+        '-m',
+        'gpu_services.benchmarks.asr_cpu',
+        '--worker',
+        mode,
+        '--repeats',
+        str(repeats),
+        *(str(path) for path in audio_paths),
+    ]
+    completed = subprocess.run(command, env=env, check=True, capture_output=True, text=True)  # noqa: S603
+    payload = json.loads(completed.stdout.strip().splitlines()[-1])
+    return BenchmarkResult(**payload)
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Render benchmark results as an aligned text table."""
+    baseline = next((result for result in results if result.mode == BASELINE_MODE), None)
+    header = (
+        f'{"mode":<6} {"audio s":>9} {"load s":>8} {"decode s":>9} '
+        f'{"RTF":>7} {"speedup":>8} {"peak RSS MiB":>13}'
+    )
+    lines = [header, '-' * len(header)]
+    for result in results:
+        speedup = (
+            baseline.decode_seconds / result.decode_seconds
+            if baseline is not None and result.decode_seconds > 0
+            else float('nan')
+        )
+        lines.append(
+            f'{result.mode:<6} {result.audio_seconds:>9.1f} {result.load_seconds:>8.1f} '
+            f'{result.decode_seconds:>9.1f} {result.real_time_factor:>7.3f} '
+            f'{speedup:>7.2f}x {result.peak_rss_mib:>13.0f}'
+        )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('audio', nargs='*', type=Path, default=[DEFAULT_AUDIO])
+    parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=sorted(QUANTIZATION_BY_MODE),
+        default=['fp32', 'int8'],
+    )
+    parser.add_argument('--model-size', default=os.getenv('ASR_MODEL_SIZE', 'tiny'))
+    parser.add_argument('--repeats', type=int, default=1)
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    parser.add_argument('--worker', choices=sorted(QUANTIZATION_BY_MODE), help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.asr_cpu``."""
+    args = _parse_args(argv)
+    missing = [str(path) for path in args.audio if not path.is_file()]
+    if missing:
+        message = 'Audio files not found: ' + ', '.join(missing)
+        raise SystemExit(message)
+
+    if args.worker is not None:
+        logging.basicConfig(level=logging.WARNING)
+        result = run_mode(args.worker, args.audio, args.repeats)
+        sys.stdout.write(json.dumps(asdict(result)) + '\n')
+        return
+
+    results = [
+        _run_isolated(mode, args.audio, args.repeats, args.model_size) for mode in args.modes
+    ]
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
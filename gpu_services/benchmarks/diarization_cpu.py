@@ -0,0 +1,215 @@
+"""Measure the real-time factor of the NumPy CPU diarization backend.
+
+Synthetic meetings are assembled from harmonic voices with distinct pitch
+and formants taking turns, so the benchmark needs no audio files and can
+also report whether the expected number of speakers was found. WAV files
+given on the command line are benchmarked as well. Run from the
+repository root::
+
+    python -m gpu_services.benchmarks.diarization_cpu --minutes 1 10 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.audio import TARGET_SAMPLE_RATE, ArrayAudioSource, open_wav
+from gpu_services.numpy_diarization import NumpyDiarizer
+from gpu_services.vad import detect_speech
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.audio import AudioSource
+
+DEFAULT_MINUTES: Final = (1.0, 10.0, 30.0)
+DEFAULT_SPEAKERS: Final = 3
+# (f0 in Hz, formant scale) of every synthetic speaker, in the order they join.
+VOICES: Final = ((110.0, 1.0), (220.0, 1.18), (165.0, 0.88), (260.0, 1.3))
+# First three formants of a handful of vowels, in Hz.
+_VOWEL_FORMANTS: Final = (
+    (730.0, 1090.0, 2440.0),
+    (270.0, 2290.0, 3010.0),
+    (530.0, 1840.0, 2480.0),
+    (570.0, 840.0, 2410.0),
+    (300.0, 870.0, 2240.0),
+)
+_CLIP_SECONDS: Final = 20.0
+_SYLLABLE_SECONDS: Final = 0.18
+_TURN_SECONDS: Final = (3.0, 10.0)
+_PAUSE_SECONDS: Final = 0.5
+_FORMANT_BANDWIDTH_HZ: Final = 120.0
+_MAX_HARMONIC_HZ: Final = 4000.0
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timings for one recording."""
+
+    name: str
+    audio_seconds: float
+    expected_speakers: int | None
+    found_speakers: int
+    vad_seconds: float
+    diarize_seconds: float
+
+    @property
+    def real_time_factor(self) -> float:
+        """Return processing time per second of audio, VAD included (lower is faster)."""
+        if self.audio_seconds <= 0:
+            return float('inf')
+        return (self.vad_seconds + self.diarize_seconds) / self.audio_seconds
+
+
+def synthetic_voice(
+    f0: float,
+    formant_scale: float,
+    seconds: float,
+    rng: np.random.Generator,
+) -> NDArray[np.float32]:
+    """Return a vowel-babbling harmonic voice with slowly drifting pitch."""
+    count = int(seconds * TARGET_SAMPLE_RATE)
+    times = np.arange(count) / TARGET_SAMPLE_RATE
+    pitch = f0 * (1.0 + 0.06 * np.sin(2 * np.pi * 0.7 * times + rng.uniform(0, 2 * np.pi)))
+    phase = 2 * np.pi * np.cumsum(pitch) / TARGET_SAMPLE_RATE
+    syllables = (times / _SYLLABLE_SECONDS).astype(np.int64)
+    vowels = rng.integers(0, len(_VOWEL_FORMANTS), int(syllables[-1]) + 1)[syllables]
+    formants = np.asarray(_VOWEL_FORMANTS)[vowels] * formant_scale
+
+    signal = np.zeros(count)
+    for harmonic in range(1, int(_MAX_HARMONIC_HZ / f0) + 1):
+        offsets = (harmonic * pitch)[:, None] - formants
+        envelope = np.exp(-((offsets / _FORMANT_BANDWIDTH_HZ) ** 2)).sum(axis=1) + 0.01
+        signal += envelope * np.sin(harmonic * phase) / harmonic**0.3
+    signal *= 0.5 * (1.0 - np.cos(2 * np.pi * 4.0 * times))
+    signal *= 0.3 / max(float(np.abs(signal).max()), 1e-9)
+    return signal.astype(np.float32)
+
+
+def synthetic_meeting(
+    seconds: float,
+    num_speakers: int,
+    *,
+    seed: int = 0,
+) -> NDArray[np.float32]:
+    """Return *seconds* of speakers taking 3-10 s turns separated by short pauses.
+
+    One clip per voice is synthesised up front and turns are cut from it at
+    random offsets, so long meetings cost little more than short ones.
+    """
+    rng = np.random.default_rng(seed)
+    clips = [synthetic_voice(f0, scale, _CLIP_SECONDS, rng) for f0, scale in VOICES[:num_speakers]]
+    pause = 1e-3 * rng.standard_normal(int(_PAUSE_SECONDS * TARGET_SAMPLE_RATE))
+    total = int(seconds * TARGET_SAMPLE_RATE)
+    parts: list[NDArray[np.float32]] = []
+    length = 0
+    speaker = 0
+    while length < total:
+        turn = int(rng.uniform(*_TURN_SECONDS) * TARGET_SAMPLE_RATE)
+        offset = int(rng.integers(0, len(clips[speaker]) - turn))
+        parts.extend([clips[speaker][offset : offset + turn], pause.astype(np.float32)])
+        length += turn + len(pause)
+        speaker = (speaker + int(rng.integers(1, num_speakers))) % num_speakers
+    return np.concatenate(parts)[:total]
+
+
+def run_source(
+    name: str,
+    source: AudioSource,
+    diarizer: NumpyDiarizer,
+    *,
+    expected_speakers: int | None = None,
+) -> BenchmarkResult:
+    """Time speech detection and diarization of *source*."""
+    vad_start = time.perf_counter()
+    regions = detect_speech(source, diarizer.settings.vad)
+    vad_seconds = time.perf_counter() - vad_start
+
+    diarize_start = time.perf_counter()
+    result = diarizer.diarize_with_centroids(source, regions)
+    diarize_seconds = time.perf_counter() - diarize_start
+
+    return BenchmarkResult(
+        name=name,
+        audio_seconds=source.num_samples / source.sample_rate,
+        expected_speakers=expected_speakers,
+        found_speakers=result.centroids.shape[0],
+        vad_seconds=vad_seconds,
+        diarize_seconds=diarize_seconds,
+    )
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Render benchmark results as an aligned text table."""
+    header = (
+        f'{"recording":<24} {"audio s":>8} {"speakers":>9} {"VAD s":>7} '
+        f'{"diarize s":>10} {"RTF":>8}'
+    )
+    lines = [header, '-' * len(header)]
+    for result in results:
+        expected = '?' if result.expected_speakers is None else str(result.expected_speakers)
+        speakers = f'{result.found_speakers}/{expected}'
+        lines.append(
+            f'{result.name:<24} {result.audio_seconds:>8.0f} {speakers:>9} '
+            f'{result.vad_seconds:>7.2f} {result.diarize_seconds:>10.2f} '
+            f'{result.real_time_factor:>8.4f}',
+        )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('audio', nargs='*', type=Path, help='WAV files to benchmark as well')
+    parser.add_argument('--minutes', nargs='*', type=float, default=list(DEFAULT_MINUTES))
+    parser.add_argument(
+        '--speakers',
+        type=int,
+        default=DEFAULT_SPEAKERS,
+        choices=range(2, len(VOICES) + 1),
+    )
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.diarization_cpu``."""
+    args = _parse_args(argv)
+    diarizer = NumpyDiarizer()
+    results: list[BenchmarkResult] = []
+    for minutes in args.minutes:
+        samples = synthetic_meeting(minutes * 60.0, args.speakers)
+        results.append(
+            run_source(
+                f'synthetic {minutes:g} min',
+                ArrayAudioSource(samples, TARGET_SAMPLE_RATE),
+                diarizer,
+                expected_speakers=args.speakers,
+            ),
+        )
+    for path in args.audio:
+        source = open_wav(path, target_sample_rate=diarizer.sample_rate)
+        try:
+            results.append(run_source(path.name, source, diarizer))
+        finally:
+            source.close()
+
+    if args.json:
+        for result in results:
+            payload = {**asdict(result), 'real_time_factor': result.real_time_factor}
+            sys.stdout.write(json.dumps(payload) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,159 @@
+"""Measure speaker index append and lookup latency at realistic index sizes.
+
+Builds throw-away indexes filled with random unit vectors and times
+meeting-sized appends and identifications against each. Run from the
+repository root::
+
+    python -m gpu_services.benchmarks.speaker_index --sizes 1000 10000 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.speaker_index import SpeakerIndex, new_speaker_id
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+DEFAULT_SIZES: Final = (1_000, 10_000, 50_000)
+DEFAULT_DIMENSION: Final = 192
+DEFAULT_SPEAKERS_PER_MEETING: Final = 4
+_BUILD_CHUNK: Final = 10_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Latency measurements for one index size."""
+
+    stored_speakers: int
+    dimension: int
+    disk_mib: float
+    open_ms: float
+    append_ms: float
+    lookup_p50_ms: float
+    lookup_p95_ms: float
+
+
+def _random_voices(rng: np.random.Generator, count: int, dimension: int) -> np.ndarray:
+    """Return *count* random embeddings."""
+    return rng.standard_normal((count, dimension), dtype=np.float32)
+
+
+def _percentile_ms(samples: Sequence[float], percentile: float) -> float:
+    """Return the given percentile of *samples* (seconds) in milliseconds."""
+    return float(np.percentile(np.asarray(samples), percentile) * 1000.0)
+
+
+def run_size(
+    stored_speakers: int,
+    *,
+    dimension: int,
+    speakers_per_meeting: int,
+    repeats: int,
+    seed: int = 0,
+) -> BenchmarkResult:
+    """Fill an index with *stored_speakers* rows and time appends and lookups."""
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory(prefix='speaker-index-bench-') as tmp_dir:
+        directory = Path(tmp_dir)
+        index = SpeakerIndex(directory, dimension=dimension)
+        for offset in range(0, stored_speakers, _BUILD_CHUNK):
+            count = min(_BUILD_CHUNK, stored_speakers - offset)
+            index.append(
+                [f'seed-{offset + row}' for row in range(count)],
+                _random_voices(rng, count, dimension),
+            )
+
+        open_start = time.perf_counter()
+        index = SpeakerIndex(directory)
+        open_seconds = time.perf_counter() - open_start
+
+        lookups: list[float] = []
+        appends: list[float] = []
+        for _ in range(repeats):
+            meeting = _random_voices(rng, speakers_per_meeting, dimension)
+            lookup_start = time.perf_counter()
+            matches = index.identify(meeting)
+            lookups.append(time.perf_counter() - lookup_start)
+
+            speaker_ids = [
+                match.speaker_id if match is not None else new_speaker_id() for match in matches
+            ]
+            append_start = time.perf_counter()
+            index.append(speaker_ids, meeting)
+            appends.append(time.perf_counter() - append_start)
+
+        disk_bytes = sum(path.stat().st_size for path in directory.iterdir())
+
+    return BenchmarkResult(
+        stored_speakers=stored_speakers,
+        dimension=dimension,
+        disk_mib=disk_bytes / (1024 * 1024),
+        open_ms=open_seconds * 1000.0,
+        append_ms=_percentile_ms(appends, 50),
+        lookup_p50_ms=_percentile_ms(lookups, 50),
+        lookup_p95_ms=_percentile_ms(lookups, 95),
+    )
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Render benchmark results as an aligned text table."""
+    header = (
+        f'{"speakers":>9} {"dim":>5} {"disk MiB":>9} {"open ms":>8} '
+        f'{"append ms":>10} {"lookup p50":>11} {"lookup p95":>11}'
+    )
+    lines = [header, '-' * len(header)]
+    lines.extend(
+        f'{result.stored_speakers:>9} {result.dimension:>5} {result.disk_mib:>9.1f} '
+        f'{result.open_ms:>8.1f} {result.append_ms:>10.2f} '
+        f'{result.lookup_p50_ms:>11.2f} {result.lookup_p95_ms:>11.2f}'
+        for result in results
+    )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument('--dimension', type=int, default=DEFAULT_DIMENSION)
+    parser.add_argument(
+        '--speakers-per-meeting',
+        type=int,
+        default=DEFAULT_SPEAKERS_PER_MEETING,
+    )
+    parser.add_argument('--repeats', type=int, default=200)
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.speaker_index``."""
+    args = _parse_args(argv)
+    results = [
+        run_size(
+            size,
+            dimension=args.dimension,
+            speakers_per_meeting=args.speakers_per_meeting,
+            repeats=args.repeats,
+        )
+        for size in args.sizes
+    ]
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+r"""Load-test the summarizer over gRPC against the local LLM stand-in.
+
+LLM stand-ins (:mod:`gpu_services.llm_standin`) and a ``SummarizeService``
+gRPC server are started in this process, unless ``--llm-url`` or
+``--target`` point at running ones. Synthetic meeting transcripts are
+then sent at every concurrency level. For each level the report lists
+the throughput, latency percentiles of the gRPC calls, the time to the
+first fragment when streaming, the gRPC failures and what the LLM saw:
+requests, injected failures and generated tokens.
+
+The summarizer reads its settings from the environment as in production,
+so chunking, map concurrency, retries and hedging are tuned by rerunning
+with other values, e.g. ``LLM_CHUNK_SIZE=1500`` or ``LLM_MAP_CONCURRENCY=8``.
+Run from the repository root::
+
+    PYTHONPATH=backend:. python -m gpu_services.benchmarks.summarize_load \
+        --concurrency 1 4 16 --latency lognormal:0.5,0.6 --error-rate 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent import futures
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+from app.clients import summarize_pb2, summarize_pb2_grpc
+from gpu_services.benchmarks.summary_prefilter import synthetic_meeting
+from gpu_services.llm_standin import (
+    DEFAULT_LATENCY,
+    OUTCOMES,
+    LatencyDistribution,
+    LlmStandIn,
+    StandInSettings,
+)
+from gpu_services.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+grpc = importlib.import_module('grpc')
+
+DEFAULT_CONCURRENCY: Final = (1, 4, 16)
+DEFAULT_REQUESTS: Final = 32
+DEFAULT_MINUTES: Final = 30.0
+DEFAULT_TOKENS_PER_SECOND: Final = 60.0
+DEFAULT_TIMEOUT_SECONDS: Final = 300.0
+STANDIN_FAILURES: Final = ('error', 'throttled')
+
+
+@dataclass(frozen=True)
+class CallSample:
+    """Outcome of one gRPC call."""
+
+    seconds: float
+    # Time to the first streamed fragment, ``None`` for unary calls and failures.
+    first_fragment_seconds: float | None
+    # gRPC status code name.
+    status: str
+
+
+@dataclass(frozen=True)
+class LlmUsage:
+    """Requests and tokens served by the in-process LLM stand-ins."""
+
+    requests: int = 0
+    failures: int = 0
+    tokens: int = 0
+
+    def __sub__(self, other: LlmUsage) -> LlmUsage:
+        """Return the usage between the snapshot *other* and this one."""
+        return LlmUsage(
+            requests=self.requests - other.requests,
+            failures=self.failures - other.failures,
+            tokens=self.tokens - other.tokens,
+        )
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    """Throughput and latency of the summarizer at one concurrency level."""
+
+    concurrency: int
+    requests: int
+    seconds: float
+    throughput: float
+    p50_seconds: float
+    p90_seconds: float
+    p99_seconds: float
+    first_fragment_p50_seconds: float | None
+    failures: dict[str, int] = field(default_factory=dict)
+    # ``None`` when the LLM is not an in-process stand-in.
+    llm: LlmUsage | None = None
+
+
+def start_standins(settings: StandInSettings, replicas: int) -> list[LlmStandIn]:
+    """Start *replicas* LLM stand-ins on free local ports."""
+    return [
+        LlmStandIn(settings, name=f'llm_standin_{index}', registry=MetricsRegistry()).start()
+        for index in range(replicas)
+    ]
+
+
+def llm_usage(standins: Sequence[LlmStandIn]) -> LlmUsage:
+    """Return the requests and tokens *standins* served so far."""
+    return LlmUsage(
+        requests=sum(standin.requests(outcome) for standin in standins for outcome in OUTCOMES),
+        failures=sum(
+            standin.requests(outcome) for standin in standins for outcome in STANDIN_FAILURES
+        ),
+        tokens=sum(standin.completion_tokens for standin in standins),
+    )
+
+
+def start_summarizer(llm_urls: Sequence[str]) -> tuple[Any, str]:
+    """Start a ``SummarizeService`` gRPC server that uses *llm_urls*.
+
+    Returns:
+        The running gRPC server and the address to connect to.
+    """
+    os.environ['LLM_API_BASE'] = ','.join(llm_urls)
+    os.environ.setdefault('LLM_API_KEY', 'load-test')
+    summarize_service = importlib.import_module('gpu_services.summarize_service')
+    settings = summarize_service.SummarizerSettings.from_env()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=settings.server_workers))
+    summarize_service.add_summarize_servicer_to_server(
+        summarize_service.SummarizeService(),
+        server,
+    )
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    return server, f'127.0.0.1:{port}'
+
+
+def call_summarizer(
+    stub: Any,  # noqa: ANN401 - generated gRPC stub
+    text: str,
+    *,
+    stream: bool,
+    timeout: float,
+) -> CallSample:
+    """Summarize *text* through *stub* and measure the call."""
+    request = getattr(summarize_pb2, 'TextRequest')(text=text)  # noqa: B009
+    start = time.perf_counter()
+    first_fragment: float | None = None
+    try:
+        if stream:
+            for _ in stub.StreamRun(request, timeout=timeout):
+                if first_fragment is None:
+                    first_fragment = time.perf_counter() - start
+        else:
+            stub.Run(request, timeout=timeout)
+    except grpc.RpcError as exc:
+        return CallSample(time.perf_counter() - start, None, exc.code().name)
+    return CallSample(time.perf_counter() - start, first_fragment, 'OK')
+
+
+def run_level(
+    stub: Any,  # noqa: ANN401 - generated gRPC stub
+    transcripts: Sequence[str],
+    concurrency: int,
+    *,
+    stream: bool,
+    timeout: float,
+) -> tuple[list[CallSample], float]:
+    """Send every transcript with *concurrency* calls in flight.
+
+    Returns:
+        The samples of all calls and the wall-clock seconds they took.
+    """
+    start = time.perf_counter()
+    with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+        call = functools.partial(call_summarizer, stub, stream=stream, timeout=timeout)
+        samples = list(executor.map(call, transcripts))
+    return samples, time.perf_counter() - start
+
+
+def summarize_level(
+    concurrency: int,
+    samples: Sequence[CallSample],
+    seconds: float,
+    llm: LlmUsage | None,
+) -> LoadResult:
+    """Aggregate the samples of one concurrency level."""
+    succeeded = [sample for sample in samples if sample.status == 'OK']
+    latencies = np.array([sample.seconds for sample in succeeded] or [np.nan])
+    first_fragments = [
+        sample.first_fragment_seconds
+        for sample in succeeded
+        if sample.first_fragment_seconds is not None
+    ]
+    p50, p90, p99 = (float(value) for value in np.percentile(latencies, (50, 90, 99)))
+    return LoadResult(
+        concurrency=concurrency,
+        requests=len(samples),
+        seconds=seconds,
+        throughput=len(succeeded) / seconds if seconds else 0.0,
+        p50_seconds=p50,
+        p90_seconds=p90,
+        p99_seconds=p99,
+        first_fragment_p50_seconds=float(np.median(first_fragments)) if first_fragments else None,
+        failures=dict(
+            collections.Counter(sample.status for sample in samples if sample.status != 'OK'),
+        ),
+        llm=llm,
+    )
+
+
+def format_report(results: Sequence[LoadResult]) -> str:
+    """Render load test results as an aligned text table."""
+    header = (
+        f'{"concurrency":>11} {"requests":>8} {"req/s":>7} {"p50 s":>7} {"p90 s":>7} '
+        f'{"p99 s":>7} {"first s":>7} {"llm req":>7} {"llm err":>7} {"tokens":>8}  failures'
+    )
+    lines = [header, '-' * len(header)]
+    for result in results:
+        first = result.first_fragment_p50_seconds
+        llm = result.llm
+        failures = ', '.join(f'{code}={count}' for code, count in result.failures.items())
+        lines.append(
+            f'{result.concurrency:>11} {result.requests:>8} {result.throughput:>7.2f} '
+            f'{result.p50_seconds:>7.2f} {result.p90_seconds:>7.2f} {result.p99_seconds:>7.2f} '
+            f'{"-" if first is None else f"{first:.2f}":>7} '
+            f'{"-" if llm is None else llm.requests:>7} '
+            f'{"-" if llm is None else llm.failures:>7} '
+            f'{"-" if llm is None else llm.tokens:>8}  {failures or "-"}',
+        )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('--concurrency', nargs='*', type=int, default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument(
+        '--requests',
+        type=int,
+        default=DEFAULT_REQUESTS,
+        help='transcripts sent per concurrency level',
+    )
+    parser.add_argument('--minutes', type=float, default=DEFAULT_MINUTES)
+    parser.add_argument('--stream', action='store_true', help='call StreamRun instead of Run')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT_SECONDS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    parser.add_argument('--target', help='address of a running summarizer, e.g. localhost:50053')
+    parser.add_argument('--llm-url', action='append', help='LLM API base URL instead of stand-ins')
+
+    standin = parser.add_argument_group('LLM stand-in')
+    standin.add_argument('--replicas', type=int, default=1)
+    standin.add_argument('--latency', default=DEFAULT_LATENCY, help='time to the first token')
+    standin.add_argument('--tokens-per-second', type=float, default=DEFAULT_TOKENS_PER_SECOND)
+    standin.add_argument('--error-rate', type=float, default=0.0)
+    standin.add_argument('--throttle-rate', type=float, default=0.0)
+    standin.add_argument('--slots', type=int, default=0, help='concurrent generations per replica')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.summarize_load``."""
+    args = _parse_args(argv)
+    standins: list[LlmStandIn] = []
+    if not args.target and not args.llm_url:
+        settings = StandInSettings(
+            latency=LatencyDistribution.parse(args.latency),
+            tokens_per_second=args.tokens_per_second,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            slots=args.slots,
+            seed=args.seed,
+        )
+        standins = start_standins(settings, args.replicas)
+
+    server = None
+    target = args.target
+    if not target:
+        server, target = start_summarizer(args.llm_url or [standin.url for standin in standins])
+
+    channel = grpc.insecure_channel(target)
+    stub = summarize_pb2_grpc.SummarizeStub(channel)
+    results: list[LoadResult] = []
+    try:
+        for level, concurrency in enumerate(args.concurrency):
+            # Every transcript is different so that a summary cache cannot answer it.
+            transcripts = [
+                synthetic_meeting(args.minutes, seed=args.seed + level * args.requests + index).text
+                for index in range(args.requests)
+            ]
+            before = llm_usage(standins)
+            samples, seconds = run_level(
+                stub,
+                transcripts,
+                concurrency,
+                stream=args.stream,
+                timeout=args.timeout,
+            )
+            llm = llm_usage(standins) - before if standins else None
+            results.append(summarize_level(concurrency, samples, seconds, llm))
+    finally:
+        channel.close()
+        if server is not None:
+            server.stop(None)
+        for standin in standins:
+            standin.close()
+
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,207 @@
+"""Compare token-budgeted chunking with the former character chunker.
+
+Multi-hour synthetic transcripts in English, Russian and Chinese are split
+by both chunkers. The character chunker gets the character budget that the
+token budget was traditionally translated into (four characters per
+token). For each run the report lists how many LLM calls the chunks need,
+how full they are in tokens and how many overflow the token budget. Run
+from the repository root::
+
+    python -m gpu_services.benchmarks.summary_chunking --hours 1 3 6
+
+Pass ``--tokenizer`` with a Hugging Face tokenizer name to count exact
+tokens instead of the built-in estimate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.summary_chunking import ChunkBudget, TranscriptChunker, load_tokenizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_HOURS: Final = (1.0, 3.0, 6.0)
+DEFAULT_MAX_TOKENS: Final = 3000
+DEFAULT_OVERLAP_TOKENS: Final = 75
+# How many characters one token was assumed to cover when budgets were set in characters.
+CHARS_PER_TOKEN_GUESS: Final = 4
+WORDS_PER_MINUTE: Final = 150
+SPEAKERS: Final = 4
+# Source text per language; transcripts are random sentences of its words
+# (characters for Chinese).
+VOCABULARIES: Final = {
+    'en': (
+        'we need to ship the release before friday and the owner of the migration '
+        'will check the dashboard with the team next week because the budget was '
+        'approved after the review of customer feedback'
+    ),
+    'ru': (
+        'нам нужно выпустить релиз до пятницы и ответственный за миграцию проверит '
+        'панель мониторинга вместе с командой на следующей неделе потому что бюджет '
+        'утвердили после обзора отзывов клиентов'
+    ),
+    'zh': '我们需要在周五之前发布版本负责迁移的同事下周会和团队一起检查监控面板因为预算已经批准',
+}
+_WORDS_PER_SENTENCE: Final = (6, 18)
+_SENTENCES_PER_TURN: Final = (1, 5)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Chunking statistics for one transcript and chunker."""
+
+    name: str
+    chunker: str
+    characters: int
+    tokens: int
+    chunks: int
+    mean_fill: float
+    overflowing: int
+    seconds: float
+
+
+def synthetic_transcript(hours: float, language: str, *, seed: int = 0) -> str:
+    """Return *hours* of ``Speaker N:`` turns of random sentences in *language*."""
+    rng = np.random.default_rng(seed)
+    if language == 'zh':
+        vocabulary, separator, stop = list(VOCABULARIES[language]), '', '。'
+    else:
+        vocabulary, separator, stop = VOCABULARIES[language].split(), ' ', '.'
+    remaining = int(hours * 60 * WORDS_PER_MINUTE)
+    lines: list[str] = []
+    while remaining > 0:
+        sentences: list[str] = []
+        for _ in range(int(rng.integers(*_SENTENCES_PER_TURN))):
+            count = int(rng.integers(*_WORDS_PER_SENTENCE))
+            words = [vocabulary[index] for index in rng.integers(0, len(vocabulary), count)]
+            sentence = separator.join(words)
+            sentences.append(sentence[:1].upper() + sentence[1:] + stop)
+            remaining -= count
+        lines.append(f'Speaker {int(rng.integers(0, SPEAKERS))}: {separator.join(sentences)}')
+    return '\n'.join(lines)
+
+
+def character_chunks(text: str, chunk_size: int, chunk_overlap: int) -> list[str]:
+    """Split *text* into character-budgeted chunks the way the summarizer used to."""
+    if len(text) <= chunk_size:
+        return [text]
+    chunks: list[str] = []
+    start = 0
+    while start < len(text):
+        end = min(len(text), start + chunk_size)
+        boundary = end
+        if end < len(text):
+            for separator, shift in (('\n\n', 0), ('. ', 1), (' ', 0)):
+                found = text.rfind(separator, start, end)
+                if found > start:
+                    boundary = found + shift
+                    break
+        boundary = max(boundary, start + 1)
+        chunk = text[start:boundary].strip()
+        if chunk:
+            chunks.append(chunk)
+        if boundary >= len(text):
+            break
+        start = max(boundary - min(chunk_overlap, chunk_size - 1), 0)
+    return chunks
+
+
+def run_chunker(
+    name: str,
+    label: str,
+    text: str,
+    split: Callable[[str], list[str]],
+    counter: TranscriptChunker,
+) -> BenchmarkResult:
+    """Time *split* on *text* and measure its chunks with *counter*'s tokenizer."""
+    start = time.perf_counter()
+    chunks = split(text)
+    seconds = time.perf_counter() - start
+    sizes = np.array([counter.count_tokens(chunk) for chunk in chunks])
+    max_tokens = counter.budget.max_tokens
+    return BenchmarkResult(
+        name=name,
+        chunker=label,
+        characters=len(text),
+        tokens=counter.count_tokens(text),
+        chunks=len(chunks),
+        mean_fill=float(np.minimum(sizes, max_tokens).mean() / max_tokens),
+        overflowing=int((sizes > max_tokens).sum()),
+        seconds=seconds,
+    )
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Render benchmark results as an aligned text table."""
+    header = (
+        f'{"transcript":<12} {"chunker":<10} {"chars":>9} {"tokens":>9} {"chunks":>7} '
+        f'{"fill":>6} {"overflow":>9} {"seconds":>8}'
+    )
+    lines = [header, '-' * len(header)]
+    lines.extend(
+        f'{result.name:<12} {result.chunker:<10} {result.characters:>9} {result.tokens:>9} '
+        f'{result.chunks:>7} {result.mean_fill:>6.0%} {result.overflowing:>9} '
+        f'{result.seconds:>8.3f}'
+        for result in results
+    )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('--hours', nargs='*', type=float, default=list(DEFAULT_HOURS))
+    parser.add_argument(
+        '--languages',
+        nargs='*',
+        choices=sorted(VOCABULARIES),
+        default=sorted(VOCABULARIES),
+    )
+    parser.add_argument('--max-tokens', type=int, default=DEFAULT_MAX_TOKENS)
+    parser.add_argument('--overlap-tokens', type=int, default=DEFAULT_OVERLAP_TOKENS)
+    parser.add_argument('--tokenizer', default='', help='Hugging Face tokenizer to count with')
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.summary_chunking``."""
+    args = _parse_args(argv)
+    budget = ChunkBudget(max_tokens=args.max_tokens, overlap_tokens=args.overlap_tokens)
+    chunker = TranscriptChunker(budget, load_tokenizer(args.tokenizer))
+    char_size = args.max_tokens * CHARS_PER_TOKEN_GUESS
+    char_overlap = args.overlap_tokens * CHARS_PER_TOKEN_GUESS
+
+    results: list[BenchmarkResult] = []
+    for language in args.languages:
+        for hours in args.hours:
+            name = f'{language} {hours:g} h'
+            text = synthetic_transcript(hours, language)
+            results.append(
+                run_chunker(
+                    name,
+                    'characters',
+                    text,
+                    lambda value: character_chunks(value, char_size, char_overlap),
+                    chunker,
+                ),
+            )
+            results.append(run_chunker(name, 'tokens', text, chunker.split, chunker))
+
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
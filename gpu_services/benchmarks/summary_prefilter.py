@@ -0,0 +1,255 @@
+"""Measure how much the extractive pre-filter shrinks transcripts and what it keeps.
+
+Synthetic meetings mix topical discussion with filler ("Yeah.", "Okay
+so."), verbatim repetition and planted decisions and action items that
+each carry a unique ticket id. Every transcript is cut to a fraction of
+its tokens by three strategies that share the sentence splitting and
+budgeting:
+
+* ``tfidf``: the TF-IDF salience ranking of the summarizer's pre-filter;
+* ``head``: the first sentences, i.e. truncation;
+* ``random``: a random subset of sentences.
+
+As proxies for summary quality the report lists the share of planted
+decisions that survive, the share of distinct words that survive, the
+share of speakers that still appear and the share of kept tokens that are
+filler. ``chunks`` is the number of LLM map calls the text needs. Run
+from the repository root::
+
+    python -m gpu_services.benchmarks.summary_prefilter --minutes 60 180
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.summary_chunking import ChunkBudget, TranscriptChunker
+from gpu_services.summary_prefilter import ExtractivePrefilter, score_sentences, split_sentences
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+DEFAULT_MINUTES: Final = (60.0, 180.0)
+DEFAULT_RATIOS: Final = (0.5, 0.3)
+DEFAULT_CHUNK_TOKENS: Final = 3000
+SENTENCES_PER_MINUTE: Final = 12
+SPEAKERS: Final = ('Alice', 'Bob', 'Carol', 'Dmitri', 'Wen', 'Priya')
+FILLERS: Final = (
+    'Yeah.',
+    'Okay so.',
+    'Right, right.',
+    'Mm-hmm.',
+    'I mean, sure.',
+    'Yeah, exactly.',
+    'Okay.',
+    'Sorry, go ahead.',
+    'Can you hear me?',
+    'Let me think.',
+)
+GLUE: Final = 'we the to and should need it is for on with this that our'
+TOPICS: Final = (
+    'billing invoices payment refund currency ledger reconciliation tax',
+    'migration database schema replica failover backup postgres index',
+    'hiring candidate interview onboarding recruiter offer backend role',
+    'frontend dashboard chart filter export widget latency page',
+    'security audit token rotation access policy vendor compliance',
+)
+VERBS: Final = 'ship review migrate document escalate benchmark approve rollback'
+DAYS: Final = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday')
+# Share of sentences of each kind; the rest is topical discussion.
+FILLER_SHARE: Final = 0.35
+REPEAT_SHARE: Final = 0.08
+FACT_SHARE: Final = 0.04
+_TURN_SENTENCES: Final = (1, 5)
+_TOPIC_SENTENCE_WORDS: Final = (8, 18)
+_TOPIC_MINUTES: Final = 15
+_FACT_PATTERN: Final = re.compile(r'ticket-\d+')
+_LABEL_PATTERN: Final = re.compile(r'^([^\n:]{1,40}):', re.MULTILINE)
+_WORD_PATTERN: Final = re.compile(r'[^\W_]+')
+
+
+@dataclass(frozen=True)
+class SyntheticMeeting:
+    """Generated transcript and the planted decisions it contains."""
+
+    text: str
+    facts: frozenset[str]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Compression and quality proxies of one strategy on one transcript."""
+
+    name: str
+    strategy: str
+    kept: float
+    chunks: int
+    fact_recall: float
+    word_recall: float
+    speaker_recall: float
+    filler_share: float
+    seconds: float
+
+
+def synthetic_meeting(minutes: float, *, seed: int = 0) -> SyntheticMeeting:
+    """Return a meeting of about *minutes* with filler, repetition and planted decisions."""
+    rng = np.random.default_rng(seed)
+    glue, verbs = GLUE.split(), VERBS.split()
+    total = int(minutes * SENTENCES_PER_MINUTE)
+    kinds = rng.choice(
+        4,
+        size=total,
+        p=[
+            FILLER_SHARE,
+            REPEAT_SHARE,
+            FACT_SHARE,
+            1 - FILLER_SHARE - REPEAT_SHARE - FACT_SHARE,
+        ],
+    )
+    spoken: list[str] = []
+    facts: set[str] = set()
+    for index, kind in enumerate(kinds):
+        topic = TOPICS[int(index / SENTENCES_PER_MINUTE / _TOPIC_MINUTES) % len(TOPICS)].split()
+        if kind == 0:
+            sentence = FILLERS[int(rng.integers(len(FILLERS)))]
+        elif kind == 1 and spoken:
+            sentence = spoken[int(rng.integers(len(spoken)))]
+        elif kind == 2:  # noqa: PLR2004 - sentence kind
+            ticket = f'ticket-{1000 + len(facts)}'
+            facts.add(ticket)
+            sentence = (
+                f'Decision: {SPEAKERS[int(rng.integers(len(SPEAKERS)))]} will '
+                f'{verbs[int(rng.integers(len(verbs)))]} the {topic[0]} work in {ticket} '
+                f'by {DAYS[int(rng.integers(len(DAYS)))]}.'
+            )
+        else:
+            count = int(rng.integers(*_TOPIC_SENTENCE_WORDS))
+            pool = topic + glue
+            words = [pool[int(word)] for word in rng.integers(0, len(pool), count)]
+            sentence = ' '.join(words).capitalize() + '.'
+        spoken.append(sentence)
+
+    lines: list[str] = []
+    position = 0
+    while position < len(spoken):
+        size = int(rng.integers(*_TURN_SENTENCES))
+        speaker = SPEAKERS[int(rng.integers(len(SPEAKERS)))]
+        lines.append(f'{speaker}: {" ".join(spoken[position : position + size])}')
+        position += size
+    return SyntheticMeeting(text='\n'.join(lines), facts=frozenset(facts))
+
+
+def strategies(seed: int) -> dict[str, Callable[[Sequence[str]], NDArray[np.float64]]]:
+    """Return the sentence rankings to compare, keyed by name."""
+    # Offset from the meeting's seed so that the random ranking is independent of the
+    # draws that decided which sentences are filler.
+    rng = np.random.default_rng(seed + 1)
+    return {
+        'tfidf': score_sentences,
+        'head': lambda sentences: -np.arange(len(sentences), dtype=np.float64),
+        'random': lambda sentences: rng.random(len(sentences)),
+    }
+
+
+def evaluate(
+    name: str,
+    strategy: str,
+    meeting: SyntheticMeeting,
+    prefilter: ExtractivePrefilter,
+    chunker: TranscriptChunker,
+) -> BenchmarkResult:
+    """Filter *meeting* with *prefilter* and measure what survived."""
+    start = time.perf_counter()
+    filtered = prefilter.filter(meeting.text)
+    seconds = time.perf_counter() - start
+
+    text = filtered.text
+    kept_facts = set(_FACT_PATTERN.findall(text)) & meeting.facts
+    words = set(_WORD_PATTERN.findall(meeting.text.lower()))
+    kept_words = set(_WORD_PATTERN.findall(text.lower())) & words
+    speakers = set(_LABEL_PATTERN.findall(meeting.text))
+    kept_speakers = set(_LABEL_PATTERN.findall(text)) & speakers
+    spans = split_sentences(text)
+    sentences = [text[start:end] for start, end in zip(spans.starts, spans.ends, strict=True)]
+    filler_tokens = sum(chunker.count_tokens(s) for s in sentences if s in FILLERS)
+    return BenchmarkResult(
+        name=name,
+        strategy=strategy,
+        kept=filtered.compression,
+        chunks=len(chunker.split(text)),
+        fact_recall=len(kept_facts) / max(1, len(meeting.facts)),
+        word_recall=len(kept_words) / max(1, len(words)),
+        speaker_recall=len(kept_speakers) / max(1, len(speakers)),
+        filler_share=filler_tokens / max(1, filtered.kept_tokens),
+        seconds=seconds,
+    )
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    """Render benchmark results as an aligned text table."""
+    header = (
+        f'{"transcript":<16} {"strategy":<8} {"kept":>6} {"chunks":>7} {"facts":>6} '
+        f'{"words":>6} {"speakers":>9} {"filler":>7} {"seconds":>8}'
+    )
+    lines = [header, '-' * len(header)]
+    lines.extend(
+        f'{result.name:<16} {result.strategy:<8} {result.kept:>6.0%} {result.chunks:>7} '
+        f'{result.fact_recall:>6.0%} {result.word_recall:>6.0%} '
+        f'{result.speaker_recall:>9.0%} {result.filler_share:>7.0%} {result.seconds:>8.3f}'
+        for result in results
+    )
+    return '\n'.join(lines)
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0] if __doc__ else None)
+    parser.add_argument('--minutes', nargs='*', type=float, default=list(DEFAULT_MINUTES))
+    parser.add_argument(
+        '--ratios',
+        nargs='*',
+        type=float,
+        default=list(DEFAULT_RATIOS),
+        help='token budgets as fractions of the transcript',
+    )
+    parser.add_argument('--chunk-tokens', type=int, default=DEFAULT_CHUNK_TOKENS)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', action='store_true', help='print results as JSON lines')
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entrypoint for ``python -m gpu_services.benchmarks.summary_prefilter``."""
+    args = _parse_args(argv)
+    chunker = TranscriptChunker(ChunkBudget(max_tokens=args.chunk_tokens))
+    results: list[BenchmarkResult] = []
+    for minutes in args.minutes:
+        meeting = synthetic_meeting(minutes, seed=args.seed)
+        tokens = chunker.count_tokens(meeting.text)
+        results.append(
+            evaluate(f'{minutes:g} min', 'none', meeting, ExtractivePrefilter(tokens), chunker),
+        )
+        for ratio in args.ratios:
+            name = f'{minutes:g} min @{ratio:.0%}'
+            for strategy, scorer in strategies(args.seed).items():
+                prefilter = ExtractivePrefilter(max(1, int(tokens * ratio)), scorer=scorer)
+                results.append(evaluate(name, strategy, meeting, prefilter, chunker))
+
+    if args.json:
+        for result in results:
+            sys.stdout.write(json.dumps(asdict(result)) + '\n')
+    else:
+        sys.stdout.write(format_report(results) + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,404 @@
+"""Speaker clustering of embedding matrices with NumPy.
+
+Long recordings use normalised maximum eigengap spectral clustering
+(NME-SC), the method behind NeMo's clustering diarizer. Its speaker count
+estimate is unreliable with only a few dozen embeddings, so short recordings
+use average-linkage agglomerative clustering with a cosine threshold instead.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+DEFAULT_MAX_SPEAKERS: Final = 8
+DEFAULT_SIMILARITY_THRESHOLD: Final = 0.4
+DEFAULT_MAX_PRUNING_FRACTION: Final = 0.25
+DEFAULT_PRUNING_CANDIDATES: Final = 10
+MIN_SPECTRAL_EMBEDDINGS: Final = 30
+# The pruning search runs one eigendecomposition per candidate, so larger
+# affinity matrices are searched on an evenly spaced subset of their rows.
+MAX_PRUNING_SEARCH_SIZE: Final = 300
+
+_KMEANS_ITERATIONS: Final = 100
+
+
+@dataclass(frozen=True)
+class PruningSearch:
+    """Neighbour counts tried when pruning the spectral affinity matrix.
+
+    The names of NeMo's clustering config are ``max_rp_threshold`` and
+    ``sparse_search_volume``.
+    """
+
+    max_fraction: float = DEFAULT_MAX_PRUNING_FRACTION
+    candidates: int = DEFAULT_PRUNING_CANDIDATES
+
+
+def normalise_rows(embeddings: NDArray[Any]) -> NDArray[np.float64]:
+    """Return *embeddings* scaled to unit L2 norm per row."""
+    matrix = np.asarray(embeddings, dtype=np.float64)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.maximum(norms, 1e-12)
+
+
+def cosine_similarity(embeddings: NDArray[Any]) -> NDArray[np.float64]:
+    """Return the pairwise cosine similarity of the rows of *embeddings*."""
+    unit = normalise_rows(embeddings)
+    return np.clip(unit @ unit.T, -1.0, 1.0)
+
+
+def cosine_affinity(embeddings: NDArray[Any]) -> NDArray[np.float64]:
+    """Return pairwise cosine similarity min-max scaled to ``[0, 1]``."""
+    similarity = cosine_similarity(embeddings)
+    low, high = float(similarity.min()), float(similarity.max())
+    return (similarity - low) / max(high - low, 1e-12)
+
+
+def prune_affinity(affinity: NDArray[np.float64], neighbours: int) -> NDArray[np.float64]:
+    """Connect every row to its *neighbours* most similar rows.
+
+    The result is a binary adjacency matrix, symmetrised by averaging. Weak
+    cross-speaker similarities that would blur the eigengap are dropped.
+    """
+    size = affinity.shape[0]
+    if neighbours >= size:
+        return np.ones_like(affinity)
+    keep = np.argpartition(-affinity, neighbours - 1, axis=1)[:, :neighbours]
+    binary = np.zeros_like(affinity)
+    binary[np.arange(size)[:, None], keep] = 1.0
+    return (binary + binary.T) / 2.0
+
+
+def _laplacian_spectrum(
+    affinity: NDArray[np.float64],
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Return eigenvalues and eigenvectors of the normalised graph Laplacian."""
+    degrees = affinity.sum(axis=1)
+    inv_sqrt = 1.0 / np.sqrt(np.maximum(degrees, 1e-12))
+    laplacian = np.eye(affinity.shape[0]) - inv_sqrt[:, None] * affinity * inv_sqrt[None, :]
+    eigenvalues, eigenvectors = np.linalg.eigh(laplacian)
+    return eigenvalues, eigenvectors
+
+
+def _largest_eigengap(eigenvalues: NDArray[np.float64], max_speakers: int) -> tuple[int, float]:
+    """Return the speaker count at the largest eigengap and the size of that gap."""
+    limit = min(max_speakers, len(eigenvalues) - 1)
+    if limit < 1:
+        return 1, 0.0
+    gaps = np.diff(eigenvalues[: limit + 1])
+    best = int(np.argmax(gaps))
+    return best + 1, float(gaps[best])
+
+
+def estimate_num_speakers(eigenvalues: NDArray[np.float64], max_speakers: int) -> int:
+    """Pick the speaker count at the largest gap between consecutive eigenvalues."""
+    return _largest_eigengap(eigenvalues, max_speakers)[0]
+
+
+def select_pruning(
+    affinity: NDArray[np.float64],
+    max_speakers: int,
+    pruning: PruningSearch | None = None,
+) -> tuple[int, NDArray[np.float64], NDArray[np.float64]]:
+    """Choose how many neighbours to keep per row with the NME criterion.
+
+    Each candidate neighbour count ``p`` is scored by ``p / g``, where ``g``
+    is the largest eigengap of the pruned Laplacian divided by its largest
+    eigenvalue. A sparse graph with a clear gap wins.
+
+    Matrices larger than :data:`MAX_PRUNING_SEARCH_SIZE` are searched on an
+    evenly spaced subset of rows and the winning neighbour fraction is
+    scaled back up, so only the chosen pruning is decomposed at full size.
+
+    Args:
+        affinity: Symmetric affinity matrix scaled to ``[0, 1]``.
+        max_speakers: Upper bound for the speaker count behind the eigengap.
+        pruning: Largest share of rows kept as neighbours and how many
+            neighbour counts are tried.
+
+    Returns:
+        The chosen neighbour count and the eigenvalues and eigenvectors of
+        the corresponding Laplacian.
+    """
+    pruning = pruning or PruningSearch()
+    size = affinity.shape[0]
+    search = affinity
+    if size > MAX_PRUNING_SEARCH_SIZE:
+        rows = np.linspace(0, size - 1, num=MAX_PRUNING_SEARCH_SIZE).round().astype(int)
+        search = affinity[np.ix_(rows, rows)]
+    search_size = search.shape[0]
+    upper = max(1, math.ceil(search_size * pruning.max_fraction))
+    options = np.unique(np.linspace(1, upper, num=max(1, pruning.candidates)).round().astype(int))
+
+    best_score = math.inf
+    best: tuple[int, NDArray[np.float64], NDArray[np.float64]] | None = None
+    for neighbours in options.tolist():
+        eigenvalues, eigenvectors = _laplacian_spectrum(prune_affinity(search, neighbours))
+        _, gap = _largest_eigengap(eigenvalues, max_speakers)
+        normalised_gap = gap / max(float(eigenvalues[-1]), 1e-12)
+        score = neighbours / max(normalised_gap, 1e-12)
+        if best is None or score < best_score:
+            best_score = score
+            best = (neighbours, eigenvalues, eigenvectors)
+
+    if best is None:  # pragma: no cover - options always holds at least one value
+        message = 'No pruning candidates were evaluated'
+        raise RuntimeError(message)
+    if search_size == size:
+        return best
+    neighbours = max(1, round(best[0] * size / search_size))
+    eigenvalues, eigenvectors = _laplacian_spectrum(prune_affinity(affinity, neighbours))
+    return neighbours, eigenvalues, eigenvectors
+
+
+def kmeans(points: NDArray[np.float64], num_clusters: int, *, seed: int = 0) -> NDArray[np.int64]:
+    """Cluster *points* with k-means++ initialisation and Lloyd iterations."""
+    rng = np.random.default_rng(seed)
+    centroids = [points[rng.integers(len(points))]]
+    for _ in range(1, num_clusters):
+        distances = np.min(
+            ((points[:, None, :] - np.asarray(centroids)[None, :, :]) ** 2).sum(axis=2),
+            axis=1,
+        )
+        total = distances.sum()
+        if total <= 0:
+            centroids.append(points[rng.integers(len(points))])
+            continue
+        centroids.append(points[rng.choice(len(points), p=distances / total)])
+
+    centres = np.asarray(centroids)
+    labels = np.zeros(len(points), dtype=np.int64)
+    for iteration in range(_KMEANS_ITERATIONS):
+        distances = ((points[:, None, :] - centres[None, :, :]) ** 2).sum(axis=2)
+        new_labels = np.argmin(distances, axis=1).astype(np.int64)
+        if iteration > 0 and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for cluster in range(num_clusters):
+            members = points[labels == cluster]
+            if len(members):
+                centres[cluster] = members.mean(axis=0)
+    return labels
+
+
+def relabel_by_first_appearance(labels: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Renumber cluster ids so they appear in increasing order along the timeline."""
+    mapping: dict[int, int] = {}
+    for label in labels.tolist():
+        mapping.setdefault(label, len(mapping))
+    return np.asarray([mapping[label] for label in labels.tolist()], dtype=np.int64)
+
+
+def speaker_centroids(embeddings: NDArray[Any], labels: NDArray[np.int64]) -> NDArray[np.float64]:
+    """Return the unit-length mean embedding of every cluster, indexed by label."""
+    unit = normalise_rows(embeddings)
+    count = int(labels.max()) + 1 if len(labels) else 0
+    sums = np.zeros((count, unit.shape[1]))
+    np.add.at(sums, labels, unit)
+    return normalise_rows(sums)
+
+
+def spectral_cluster(
+    embeddings: NDArray[Any],
+    *,
+    num_speakers: int | None = None,
+    max_speakers: int = DEFAULT_MAX_SPEAKERS,
+    pruning: PruningSearch | None = None,
+    seed: int = 0,
+) -> NDArray[np.int64]:
+    """Cluster embeddings with NME spectral clustering.
+
+    Args:
+        embeddings: Matrix with one embedding per row, in timeline order.
+        num_speakers: Known number of speakers. Estimated from the eigengap
+            of the pruned affinity matrix when omitted.
+        max_speakers: Upper bound for the estimated number of speakers.
+        pruning: Neighbour counts tried when pruning the affinity matrix.
+        seed: Seed for the k-means initialisation.
+
+    Returns:
+        Integer labels numbered by first appearance.
+    """
+    count = len(embeddings)
+    if count <= 1:
+        return np.zeros(count, dtype=np.int64)
+
+    _, eigenvalues, eigenvectors = select_pruning(
+        cosine_affinity(embeddings),
+        max_speakers,
+        pruning,
+    )
+    clusters = num_speakers or estimate_num_speakers(eigenvalues, max_speakers)
+    clusters = max(1, min(clusters, count))
+    if clusters == 1:
+        return np.zeros(count, dtype=np.int64)
+
+    spectral = normalise_rows(eigenvectors[:, :clusters])
+    return relabel_by_first_appearance(kmeans(spectral, clusters, seed=seed))
+
+
+def _average_linkage(
+    similarity: NDArray[np.float64],
+    *,
+    num_speakers: int | None,
+    threshold: float,
+) -> NDArray[np.int64]:
+    """Merge the most similar clusters of a pairwise similarity matrix in turn.
+
+    The matrix is modified in place. Merging stops at *num_speakers* clusters,
+    or without it once no two clusters are more similar than *threshold*.
+    """
+    count = similarity.shape[0]
+    np.fill_diagonal(similarity, -np.inf)
+    sizes = np.ones(count)
+    labels = np.arange(count, dtype=np.int64)
+    target = max(1, num_speakers or 1)
+
+    for _ in range(count - target):
+        keep, drop = divmod(int(np.argmax(similarity)), count)
+        if num_speakers is None and similarity[keep, drop] < threshold:
+            break
+        # Average linkage: the merged row is the size-weighted mean of both rows.
+        merged = (sizes[keep] * similarity[keep] + sizes[drop] * similarity[drop]) / (
+            sizes[keep] + sizes[drop]
+        )
+        similarity[keep, :] = merged
+        similarity[:, keep] = merged
+        similarity[drop, :] = -np.inf
+        similarity[:, drop] = -np.inf
+        similarity[keep, keep] = -np.inf
+        sizes[keep] += sizes[drop]
+        labels[labels == drop] = keep
+
+    return relabel_by_first_appearance(labels)
+
+
+def agglomerative_cluster(
+    embeddings: NDArray[Any],
+    *,
+    num_speakers: int | None = None,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+) -> NDArray[np.int64]:
+    """Cluster embeddings by average-linkage agglomeration on cosine similarity.
+
+    Args:
+        embeddings: Matrix with one embedding per row, in timeline order.
+        num_speakers: Stop once this many clusters remain. Without it,
+            merging stops when no two clusters are more similar than
+            *threshold* on average.
+        threshold: Minimum average cosine similarity for a merge.
+
+    Returns:
+        Integer labels numbered by first appearance.
+    """
+    count = len(embeddings)
+    if count <= 1:
+        return np.zeros(count, dtype=np.int64)
+    return _average_linkage(
+        cosine_similarity(embeddings),
+        num_speakers=num_speakers,
+        threshold=threshold,
+    )
+
+
+def euclidean_distances(embeddings: NDArray[Any]) -> NDArray[np.float64]:
+    """Return the pairwise Euclidean distance of the rows of *embeddings*."""
+    matrix = np.asarray(embeddings, dtype=np.float64)
+    squared = (matrix**2).sum(axis=1)
+    gram = matrix @ matrix.T
+    return np.sqrt(np.maximum(squared[:, None] + squared[None, :] - 2.0 * gram, 0.0))
+
+
+def agglomerative_cluster_by_distance(
+    embeddings: NDArray[Any],
+    *,
+    max_distance: float,
+    num_speakers: int | None = None,
+) -> NDArray[np.int64]:
+    """Cluster embeddings by average-linkage agglomeration on Euclidean distance.
+
+    Suited to features whose scale carries information, such as cepstral
+    means, where cosine similarity would ignore the differences that matter.
+
+    Args:
+        embeddings: Matrix with one embedding per row, in timeline order.
+        max_distance: Largest average distance between two clusters that are
+            still merged.
+        num_speakers: Stop once this many clusters remain, ignoring
+            *max_distance*.
+
+    Returns:
+        Integer labels numbered by first appearance.
+    """
+    count = len(embeddings)
+    if count <= 1:
+        return np.zeros(count, dtype=np.int64)
+    return _average_linkage(
+        -euclidean_distances(embeddings),
+        num_speakers=num_speakers,
+        threshold=-max_distance,
+    )
+
+
+def cluster_embeddings(
+    embeddings: NDArray[Any],
+    *,
+    num_speakers: int | None = None,
+    max_speakers: int = DEFAULT_MAX_SPEAKERS,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    pruning: PruningSearch | None = None,
+) -> NDArray[np.int64]:
+    """Cluster speaker embeddings with the method suited to how many there are.
+
+    Spectral clustering is used from :data:`MIN_SPECTRAL_EMBEDDINGS`
+    embeddings upwards and agglomerative clustering below that. The eigengap
+    cannot express "one speaker", so a recording whose embeddings are on
+    average more similar than *threshold* is treated as a single speaker,
+    just as the final agglomerative merge would be.
+    """
+    count = len(embeddings)
+    if count < MIN_SPECTRAL_EMBEDDINGS:
+        return agglomerative_cluster(embeddings, num_speakers=num_speakers, threshold=threshold)
+    if num_speakers is None:
+        similarity = cosine_similarity(embeddings)
+        mean_similarity = (similarity.sum() - np.trace(similarity)) / (count * (count - 1))
+        if mean_similarity >= threshold:
+            return np.zeros(count, dtype=np.int64)
+    return spectral_cluster(
+        embeddings,
+        num_speakers=num_speakers,
+        max_speakers=max_speakers,
+        pruning=pruning,
+    )
+
+
+__all__: Final = (
+    'DEFAULT_MAX_PRUNING_FRACTION',
+    'DEFAULT_MAX_SPEAKERS',
+    'DEFAULT_PRUNING_CANDIDATES',
+    'DEFAULT_SIMILARITY_THRESHOLD',
+    'MAX_PRUNING_SEARCH_SIZE',
+    'MIN_SPECTRAL_EMBEDDINGS',
+    'PruningSearch',
+    'agglomerative_cluster',
+    'agglomerative_cluster_by_distance',
+    'cluster_embeddings',
+    'cosine_affinity',
+    'cosine_similarity',
+    'estimate_num_speakers',
+    'euclidean_distances',
+    'kmeans',
+    'normalise_rows',
+    'prune_affinity',
+    'relabel_by_first_appearance',
+    'select_pruning',
+    'speaker_centroids',
+    'spectral_cluster',
+)
@@ -2,19 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import json
 import logging
 import os
 import tempfile
-import threading
 import time
+import wave
 from concurrent import futures
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn, Protocol, cast
 
+import numpy as np
+
 from app.clients import diarize_pb2, diarize_pb2_grpc
+from gpu_services.audio import AudioFormatError, open_wav, read_wav_info
 from gpu_services.diarization_resources import (
     DiarizationDependencyError,
     DiarizationResourceError,
@@ -22,13 +27,51 @@ from gpu_services.diarization_resources import (
     ensure_nemo_artifacts_available,
     load_nemo_diarization_pipeline,
 )
+from gpu_services.health import ServiceHealth, resolve_warmup_seconds
+from gpu_services.inmemory_diarization import InMemoryDiarizer, load_nemo_in_memory_diarizer
+from gpu_services.metrics import start_metrics_server_from_env
+from gpu_services.numpy_diarization import NumpyDiarizationSettings, NumpyDiarizer
+from gpu_services.prefork import (
+    REUSE_PORT_OPTIONS,
+    PreforkSupervisor,
+    reserve_port,
+    resolve_prefork_workers,
+    start_worker_metrics_server,
+    stop_on_sigterm,
+)
+from gpu_services.resource_pool import ResourcePool
+from gpu_services.speaker_index import (
+    ENV_INDEX_DIR,
+    SpeakerIndex,
+    SpeakerIndexError,
+    new_speaker_id,
+    resolve_match_threshold,
+)
+from gpu_services.uploads import (
+    AudioUploadError,
+    AudioUploadTooLargeError,
+    spool_audio_chunks,
+)
+from gpu_services.vad import SpeechRegionCache, VadSettings, cached_speech_regions
+from gpu_services.windowed_diarization import DEFAULT_WINDOW_SECONDS, diarize_windowed
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.uploads import AudioChunk
 
     class AudioRequest(Protocol):
         """Typed representation of the diarize.AudioRequest message."""
 
         path: str
+        packed: bool
+
+    class PackableAudioChunk(AudioChunk, Protocol):
+        """Typed representation of the diarize.AudioChunk message."""
+
+        packed: bool
 
     class Segment(Protocol):
         """Typed representation of the diarize.Segment message."""
@@ -37,10 +80,19 @@ if TYPE_CHECKING:
         end: float
         speaker: str
 
+    class SpeakerTimeline(Protocol):
+        """Typed representation of the diarize.SpeakerTimeline message."""
+
+        starts: list[float]
+        ends: list[float]
+        speaker_idx: list[int]
+        speakers: list[str]
+
     class DiarizationResult(Protocol):
         """Typed representation of the diarize.DiarizationResult message."""
 
         segments: list[Segment]
+        timeline: SpeakerTimeline
 
     class DiarizeServicer(Protocol):
         """Protocol for the generated Diarize service base class."""
@@ -50,6 +102,7 @@ if TYPE_CHECKING:
 
 else:  # pragma: no cover - runtime fallbacks
     AudioRequest = diarize_pb2.AudioRequest
+    PackableAudioChunk = diarize_pb2.AudioChunk
     Segment = diarize_pb2.Segment
     DiarizationResult = diarize_pb2.DiarizationResult
     DiarizeServicer = diarize_pb2_grpc.DiarizeServicer
@@ -57,6 +110,19 @@ else:  # pragma: no cover - runtime fallbacks
 
 grpc = importlib.import_module('grpc')
 
+SERVICE_NAME = 'services.diarize.Diarize'
+DEFAULT_WARMUP_SECONDS = 5.0
+WARMUP_SAMPLE_RATE = 16000
+ENV_POOL_SIZE = 'DIARIZATION_POOL_SIZE'
+DEFAULT_POOL_SIZE = 1
+ENV_IN_MEMORY = 'DIARIZATION_IN_MEMORY'
+ENV_WINDOW_SECONDS = 'DIARIZATION_WINDOW_SECONDS'
+ENV_SHARED_VAD = 'DIARIZATION_SHARED_VAD'
+ENV_BACKEND = 'DIARIZATION_BACKEND'
+ENV_PREFORK_WORKERS = 'DIARIZATION_PREFORK_WORKERS'
+BACKEND_NEMO = 'nemo'
+BACKEND_NUMPY = 'numpy'
+
 
 class ServicerContext(Protocol):
     """Minimal subset of the gRPC servicer context used by the diarization service."""
@@ -77,6 +143,9 @@ class GrpcServer(Protocol):
     def wait_for_termination(self) -> None:  # pragma: no cover - gRPC runtime
         """Block until the server shuts down."""
 
+    def stop(self, grace: float | None) -> object:  # pragma: no cover - gRPC runtime
+        """Stop the server, letting active calls finish for *grace* seconds."""
+
 
 LOGGER = logging.getLogger(__name__)
 
@@ -88,6 +157,7 @@ class _SegmentResult:
     start: float
     end: float
     speaker: str
+    identified: bool = False
 
 
 class _Diarizer(Protocol):
@@ -121,6 +191,10 @@ class _OmegaModule(Protocol):
 
 if TYPE_CHECKING:
     from collections.abc import Callable as TypingCallable
+
+    from gpu_services.audio import AudioSource
+
+    _SpeechRegionLookup = TypingCallable[[Path, AudioSource], list[tuple[float, float]]]
 else:  # pragma: no cover - runtime fallback
     from collections.abc import Callable as _TypingCallableRuntime
 
@@ -129,20 +203,51 @@ else:  # pragma: no cover - runtime fallback
 
 _RTTM_MIN_FIELDS = 9
 _RTTM_SPEAKER_INDEX = 7
+# Matched centroids at least this similar to a stored row add nothing to the index.
+_REDUNDANT_SIMILARITY = 0.95
 _RTTM_START_INDEX = 3
 _RTTM_DURATION_INDEX = 4
+# Same-speaker segments separated by less than this are merged (float32 rounding).
+_MERGE_GAP_SECONDS = 1e-3
 
 
 class DiarizeService(DiarizeServicer):
-    """gRPC servicer implementation backed by the NeMo diarization pipeline."""
+    """gRPC servicer implementation backed by the NeMo diarization pipeline.
+
+    Setting ``DIARIZATION_BACKEND=numpy`` swaps NeMo for the model-free
+    :class:`NumpyDiarizer`, which runs on CPU-only hosts.
+    """
+
+    def __init__(self, *, load_model: bool = True) -> None:
+        """Initialise the service and, unless deferred, load the diarization pipeline.
 
-    def __init__(self) -> None:
-        """Initialise the service and validate that diarization resources exist."""
+        Args:
+            load_model: Load the pipeline immediately. ``serve`` passes ``False``
+                so the server can report NOT_SERVING while :meth:`load` runs.
+        """
         self._artifacts: NemoModelArtifacts | None = None
         self._diarizer: _Diarizer | None = None
-        self._diarizer_lock = threading.Lock()
+        self._diarizer_pool: ResourcePool[_Diarizer | NumpyDiarizer] | None = None
+        self._in_memory_diarizer: InMemoryDiarizer | None = None
+        self._speaker_index: SpeakerIndex | None = None
+        self._window_seconds = 0.0
+        self._speech_regions: _SpeechRegionLookup | None = None
         self._initialisation_error: str | None = None
-
+        self._loaded = False
+        if load_model:
+            self.load()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return whether the pipeline loaded successfully."""
+        return self._loaded and self._initialisation_error is None
+
+    def load(self) -> None:
+        """Validate diarization resources and load the configured backend."""
+        if _resolve_backend() == BACKEND_NUMPY:
+            self._load_numpy_backend()
+            self._loaded = True
+            return
         try:
             artifacts = ensure_nemo_artifacts_available()
             self._artifacts = artifacts
@@ -184,7 +289,60 @@ class DiarizeService(DiarizeServicer):
                 LOGGER.debug('Unexpected diarization initialisation error details', exc_info=exc)
             else:
                 self._diarizer = loaded_diarizer
-                LOGGER.info('NeMo diarization pipeline successfully initialised')
+                diarizers: list[_Diarizer | NumpyDiarizer] = [
+                    loaded_diarizer,
+                    *_load_diarizer_replicas(artifacts),
+                ]
+                self._diarizer_pool = ResourcePool(diarizers, name='diarization')
+                LOGGER.info(
+                    'NeMo diarization pipeline successfully initialised with %d instance(s)',
+                    len(diarizers),
+                )
+                self._in_memory_diarizer = _load_in_memory_diarizer(artifacts)
+                if self._in_memory_diarizer is not None:
+                    self._speaker_index = _open_speaker_index()
+                    self._window_seconds = _resolve_window_seconds()
+                    self._speech_regions = _shared_speech_regions()
+        self._loaded = True
+
+    def _load_numpy_backend(self) -> None:
+        """Set up the NumPy diarizer, which needs neither NeMo nor model files.
+
+        The diarizer is stateless, so every pool slot shares one instance and
+        the pool only bounds how many recordings are diarized at once.
+        Windowing and speaker identification compare NeMo embeddings and stay
+        disabled.
+        """
+        diarizer = NumpyDiarizer(NumpyDiarizationSettings.from_env())
+        pool_size = _resolve_pool_size()
+        self._diarizer_pool = ResourcePool([diarizer] * pool_size, name='diarization')
+        self._speech_regions = _shared_speech_regions()
+        LOGGER.info('NumPy CPU diarization backend initialised with %d slot(s)', pool_size)
+
+    def warm_up(self, seconds: float) -> None:
+        """Diarize *seconds* of synthetic noise once on every pooled diarizer.
+
+        Warm-up runs skip the speaker index so that noise is never enrolled
+        as a voice.
+        """
+        if seconds <= 0 or not self.is_ready or self._diarizer_pool is None:
+            return
+        pool_size = self._diarizer_pool.size
+        with tempfile.TemporaryDirectory(prefix='diarize-warmup-') as tmp_dir:
+            audio_path = Path(tmp_dir) / 'warmup.wav'
+            _write_warmup_audio(audio_path, seconds)
+            # Concurrent runs each hold a different diarizer, so every instance warms up.
+            with futures.ThreadPoolExecutor(max_workers=pool_size) as executor:
+                runs = [
+                    executor.submit(
+                        self._run_diarization_pipeline,
+                        audio_path,
+                        identify_speakers=False,
+                    )
+                    for _ in range(pool_size)
+                ]
+                segment_counts = [len(run.result()) for run in runs]
+        LOGGER.debug('Warm-up diarization produced %s segment(s)', segment_counts)
 
     def run(
         self,
@@ -205,6 +363,48 @@ class DiarizeService(DiarizeServicer):
 
         self._ensure_ready(context)
         audio_path = self._resolve_audio_path(received_path, context)
+        return self._diarize_file(audio_path, context, packed=request.packed)
+
+    def run_chunks(
+        self,
+        request_iterator: Iterator[PackableAudioChunk],
+        context: ServicerContext,
+    ) -> DiarizationResult:
+        """Diarize audio uploaded as a stream of chunks.
+
+        Args:
+            request_iterator: Audio chunks sent by the client.
+            context: gRPC request context.
+
+        Returns:
+            Diarization result with normalised speaker segments.
+        """
+        LOGGER.info('Received diarization request with streamed audio')
+
+        self._ensure_ready(context)
+        packed: list[bool] = []
+
+        def _record_packed(chunks: Iterator[PackableAudioChunk]) -> Iterator[PackableAudioChunk]:
+            for chunk in chunks:
+                if not packed:
+                    packed.append(chunk.packed)
+                yield chunk
+
+        with self._receive_upload(_record_packed(request_iterator), context) as audio_path:
+            return self._diarize_file(audio_path, context, packed=bool(packed and packed[0]))
+
+    def _diarize_file(
+        self,
+        audio_path: Path,
+        context: ServicerContext,
+        *,
+        packed: bool = False,
+    ) -> DiarizationResult:
+        """Run diarization for a validated local file and build the response.
+
+        With *packed*, segments are returned as a columnar ``SpeakerTimeline``
+        instead of one ``Segment`` message each.
+        """
         audio_duration = self._read_audio_duration(audio_path, context)
 
         inference_start = time.perf_counter()
@@ -218,7 +418,7 @@ class DiarizeService(DiarizeServicer):
             raw_segments = [_SegmentResult(0.0, max(audio_duration, 0.0), 'Speaker 1')]
 
         clipped_segments = _clip_segments_to_duration(raw_segments, audio_duration)
-        normalised_segments = _normalise_speaker_labels(clipped_segments)
+        normalised_segments = _normalise_speaker_labels(_merge_adjacent_segments(clipped_segments))
 
         inference_duration = time.perf_counter() - inference_start
         LOGGER.info(
@@ -228,8 +428,12 @@ class DiarizeService(DiarizeServicer):
             inference_duration,
         )
 
-        segment_cls = getattr(diarize_pb2, 'Segment')  # noqa: B009
         result_cls = getattr(diarize_pb2, 'DiarizationResult')  # noqa: B009
+        if packed:
+            response = result_cls(timeline=_pack_segments(normalised_segments))
+            return cast('DiarizationResult', response)
+
+        segment_cls = getattr(diarize_pb2, 'Segment')  # noqa: B009
         response = result_cls()
         for segment in normalised_segments:
             response.segments.append(
@@ -244,6 +448,10 @@ class DiarizeService(DiarizeServicer):
 
     def _ensure_ready(self, context: ServicerContext) -> None:
         """Validate that service dependencies were initialised correctly."""
+        if not self._loaded:
+            self._abort(
+                context, grpc.StatusCode.UNAVAILABLE, 'Diarization pipeline is still loading'
+            )
         if self._initialisation_error is not None:
             self._abort(context, grpc.StatusCode.FAILED_PRECONDITION, self._initialisation_error)
 
@@ -264,6 +472,21 @@ class DiarizeService(DiarizeServicer):
 
         return audio_path
 
+    @contextlib.contextmanager
+    def _receive_upload(
+        self,
+        request_iterator: Iterator[AudioChunk],
+        context: ServicerContext,
+    ) -> Iterator[Path]:
+        """Spool an uploaded audio stream and translate upload errors to gRPC statuses."""
+        try:
+            with spool_audio_chunks(request_iterator) as audio_path:
+                yield audio_path
+        except AudioUploadTooLargeError as exc:
+            self._abort(context, grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+        except AudioUploadError as exc:
+            self._abort(context, grpc.StatusCode.INVALID_ARGUMENT, str(exc))
+
     def _read_audio_duration(self, audio_path: Path, context: ServicerContext) -> float:
         """Load metadata required for fallbacks and logging."""
         try:
@@ -301,18 +524,277 @@ class DiarizeService(DiarizeServicer):
         raise RuntimeError(error_message)
 
     Run = run
+    RunChunks = run_chunks
 
-    def _run_diarization_pipeline(self, audio_path: Path) -> list[_SegmentResult]:
-        """Execute the configured diarization backend for the provided audio file."""
-        diarizer = self._diarizer
-        if diarizer is None:
+    def _run_diarization_pipeline(
+        self,
+        audio_path: Path,
+        *,
+        identify_speakers: bool = True,
+    ) -> list[_SegmentResult]:
+        """Execute the configured diarization backend for the provided audio file.
+
+        Each NeMo diarizer keeps per-request manifest paths in its ``cfg``, so a
+        request borrows one instance from the pool for its whole run. WAV input
+        is diarized in memory when that path is enabled; the pool slot is still
+        held so concurrency on the accelerator stays bounded by the pool size.
+        The NumPy backend fills the pool with :class:`NumpyDiarizer` slots.
+        Without *identify_speakers*, the speaker index is neither searched nor
+        extended.
+        """
+        pool = self._diarizer_pool
+        if pool is None:
             message = 'Diarization pipeline is not initialised'
             raise DiarizationResourceError(message)
 
-        with self._diarizer_lock:
+        with pool.acquire() as diarizer:
+            if isinstance(diarizer, NumpyDiarizer):
+                return _run_numpy_diarization(
+                    audio_path,
+                    diarizer,
+                    speech_regions=self._speech_regions,
+                )
+            if self._in_memory_diarizer is not None:
+                segments = _run_in_memory_diarization(
+                    audio_path,
+                    self._in_memory_diarizer,
+                    self._speaker_index if identify_speakers else None,
+                    window_seconds=self._window_seconds,
+                    speech_regions=self._speech_regions,
+                )
+                if segments is not None:
+                    return segments
             return _run_nemo_diarization(audio_path, diarizer)
 
 
+def _resolve_backend() -> str:
+    """Return the diarization backend selected by ``DIARIZATION_BACKEND``."""
+    backend = os.getenv(ENV_BACKEND, BACKEND_NEMO).strip().lower() or BACKEND_NEMO
+    if backend not in {BACKEND_NEMO, BACKEND_NUMPY}:
+        message = f'{ENV_BACKEND} must be {BACKEND_NEMO!r} or {BACKEND_NUMPY!r}'
+        raise RuntimeError(message)
+    return backend
+
+
+def _resolve_pool_size() -> int:
+    """Return how many diarizer instances may run concurrently."""
+    raw_value = os.getenv(ENV_POOL_SIZE, str(DEFAULT_POOL_SIZE)).strip()
+    try:
+        pool_size = int(raw_value)
+    except ValueError as exc:
+        message = f'{ENV_POOL_SIZE} must be a valid integer'
+        raise RuntimeError(message) from exc
+    if pool_size < 1:
+        message = f'{ENV_POOL_SIZE} must be greater than 0'
+        raise RuntimeError(message)
+    return pool_size
+
+
+def _load_diarizer_replicas(artifacts: NemoModelArtifacts) -> list[_Diarizer]:
+    """Load the extra diarizer instances requested by ``DIARIZATION_POOL_SIZE``.
+
+    Every replica reads its own copy of the config, so per-request updates on
+    one instance never leak into another. Loading stops at the first failure
+    (for example when the GPU runs out of memory) and the pool runs with the
+    instances loaded so far.
+    """
+    replicas: list[_Diarizer] = []
+    target = _resolve_pool_size() - 1
+    try:
+        while len(replicas) < target:
+            replicas.append(cast('_Diarizer', load_nemo_diarization_pipeline(artifacts)))
+    except Exception:
+        LOGGER.exception(
+            'Failed to load diarizer replica %d; continuing with %d instance(s)',
+            len(replicas) + 2,
+            len(replicas) + 1,
+        )
+    return replicas
+
+
+def _in_memory_enabled() -> bool:
+    """Return whether ``DIARIZATION_IN_MEMORY`` allows the in-memory pipeline."""
+    value = os.getenv(ENV_IN_MEMORY, '0').strip().lower()
+    return value in {'1', 'true', 'yes'}
+
+
+def _load_in_memory_diarizer(artifacts: NemoModelArtifacts) -> InMemoryDiarizer | None:
+    """Load the in-memory pipeline, or return ``None`` to keep the file-based one."""
+    if not _in_memory_enabled():
+        LOGGER.info('In-memory diarization disabled via %s', ENV_IN_MEMORY)
+        return None
+    try:
+        diarizer = load_nemo_in_memory_diarizer(artifacts)
+    except (
+        DiarizationDependencyError,
+        DiarizationResourceError,
+        ImportError,
+        AttributeError,
+        RuntimeError,
+        TypeError,
+        ValueError,
+        OSError,
+    ) as exc:
+        LOGGER.warning('In-memory diarization unavailable, using NeMo manifests: %s', exc)
+        LOGGER.debug('In-memory diarization initialisation error details', exc_info=exc)
+        return None
+    LOGGER.info('In-memory diarization enabled for WAV input')
+    return diarizer
+
+
+def _resolve_window_seconds() -> float:
+    """Return the window length for long recordings; ``0`` diarizes files in one pass."""
+    raw_value = os.getenv(ENV_WINDOW_SECONDS, str(DEFAULT_WINDOW_SECONDS)).strip()
+    try:
+        window_seconds = float(raw_value)
+    except ValueError as exc:
+        message = f'{ENV_WINDOW_SECONDS} must be a number'
+        raise RuntimeError(message) from exc
+    if window_seconds < 0:
+        message = f'{ENV_WINDOW_SECONDS} must not be negative'
+        raise RuntimeError(message)
+    return window_seconds
+
+
+def _shared_speech_regions() -> _SpeechRegionLookup | None:
+    """Return a lookup into the speech regions shared with the ASR service, if enabled."""
+    value = os.getenv(ENV_SHARED_VAD, '0').strip().lower()
+    if value not in {'1', 'true', 'yes'}:
+        LOGGER.info('Shared speech regions disabled via %s', ENV_SHARED_VAD)
+        return None
+    try:
+        cache = SpeechRegionCache.from_env()
+    except OSError as exc:
+        LOGGER.warning('Speech region cache unavailable, using the NeMo VAD: %s', exc)
+        return None
+    return partial(cached_speech_regions, cache=cache, settings=VadSettings.from_env())
+
+
+def _open_speaker_index() -> SpeakerIndex | None:
+    """Open the speaker index configured for cross-meeting identification, if any."""
+    try:
+        index = SpeakerIndex.from_env()
+    except (SpeakerIndexError, OSError) as exc:
+        LOGGER.warning('Speaker index unavailable, speakers will not be identified: %s', exc)
+        return None
+    if index is not None:
+        LOGGER.info('Identifying speakers against %d stored embedding(s)', len(index))
+    return index
+
+
+def _run_in_memory_diarization(
+    audio_path: Path,
+    diarizer: InMemoryDiarizer,
+    speaker_index: SpeakerIndex | None = None,
+    *,
+    window_seconds: float = 0.0,
+    speech_regions: _SpeechRegionLookup | None = None,
+) -> list[_SegmentResult] | None:
+    """Diarize a WAV file without manifests or RTTM files.
+
+    Recordings longer than *window_seconds* are diarized window by window
+    with speakers linked across windows. With *speech_regions*, the regions
+    shared with the ASR service replace the NeMo VAD. With a speaker
+    index, every speaker is labelled with the id of the stored voice it
+    matches or enrolled under a new id.
+
+    Returns:
+        The speaker segments, or ``None`` when the file is not a plain WAV and
+        has to go through the NeMo file pipeline instead.
+    """
+    try:
+        source = open_wav(audio_path, target_sample_rate=diarizer.sample_rate)
+    except AudioFormatError as exc:
+        LOGGER.debug('Using NeMo manifests for %s: %s', audio_path, exc)
+        return None
+
+    LOGGER.info('Running in-memory diarization for %s', audio_path)
+    try:
+        regions = None if speech_regions is None else speech_regions(audio_path, source)
+        if window_seconds > 0:
+            result = diarize_windowed(
+                diarizer,
+                source,
+                window_seconds=window_seconds,
+                regions=regions,
+            )
+        else:
+            result = diarizer.diarize_with_centroids(source, regions)
+    finally:
+        source.close()
+
+    if speaker_index is None or not result.segments:
+        return [
+            _SegmentResult(start=seg.start, end=seg.end, speaker=f'speaker_{seg.speaker}')
+            for seg in result.segments
+        ]
+
+    speaker_ids = _identify_speakers(speaker_index, result.centroids)
+    return [
+        _SegmentResult(
+            start=seg.start,
+            end=seg.end,
+            speaker=speaker_ids[seg.speaker],
+            identified=True,
+        )
+        for seg in result.segments
+    ]
+
+
+def _run_numpy_diarization(
+    audio_path: Path,
+    diarizer: NumpyDiarizer,
+    *,
+    speech_regions: _SpeechRegionLookup | None = None,
+) -> list[_SegmentResult]:
+    """Diarize a WAV file with the NumPy backend.
+
+    Raises:
+        DiarizationResourceError: If the file is not a WAV file; the backend
+            has no decoder for other formats.
+    """
+    try:
+        source = open_wav(audio_path, target_sample_rate=diarizer.sample_rate)
+    except AudioFormatError as exc:
+        message = f'The NumPy diarization backend only reads WAV audio: {exc}'
+        raise DiarizationResourceError(message) from exc
+
+    LOGGER.info('Running NumPy diarization for %s', audio_path)
+    try:
+        regions = None if speech_regions is None else speech_regions(audio_path, source)
+        result = diarizer.diarize_with_centroids(source, regions)
+    finally:
+        source.close()
+    return [
+        _SegmentResult(start=seg.start, end=seg.end, speaker=f'speaker_{seg.speaker}')
+        for seg in result.segments
+    ]
+
+
+def _identify_speakers(index: SpeakerIndex, centroids: NDArray[np.float64]) -> list[str]:
+    """Return a stored or newly enrolled speaker id for every centroid row.
+
+    Unmatched centroids are enrolled under new ids. A matched centroid is
+    only appended when it is less than ``_REDUNDANT_SIMILARITY`` similar to
+    the speaker's closest stored row, so a voice collects new rows as it
+    drifts rather than one per meeting.
+    """
+    matches = index.identify(centroids, threshold=resolve_match_threshold())
+    speaker_ids = [match.speaker_id if match is not None else new_speaker_id() for match in matches]
+    novel = [
+        row
+        for row, match in enumerate(matches)
+        if match is None or match.similarity < _REDUNDANT_SIMILARITY
+    ]
+    index.append([speaker_ids[row] for row in novel], np.asarray(centroids)[novel])
+    LOGGER.info(
+        'Matched %d of %d speaker(s) against the speaker index',
+        sum(match is not None for match in matches),
+        len(matches),
+    )
+    return speaker_ids
+
+
 def _run_nemo_diarization(
     audio_path: Path,
     diarizer: _Diarizer,
@@ -462,12 +944,18 @@ def _parse_rttm_segments(rttm_path: Path) -> list[_SegmentResult]:
 
 
 def _normalise_speaker_labels(segments: list[_SegmentResult]) -> list[_SegmentResult]:
-    """Assign canonical "Speaker N" labels preserving first appearance order."""
+    """Assign canonical "Speaker N" labels preserving first appearance order.
+
+    Speakers identified through the speaker index keep their stored id.
+    """
     mapping: dict[str, str] = {}
     normalised: list[_SegmentResult] = []
     next_index = 1
 
     for segment in segments:
+        if segment.identified:
+            normalised.append(segment)
+            continue
         speaker_key = segment.speaker or 'unknown'
         if speaker_key not in mapping:
             mapping[speaker_key] = f'Speaker {next_index}'
@@ -484,28 +972,64 @@ def _normalise_speaker_labels(segments: list[_SegmentResult]) -> list[_SegmentRe
     return normalised
 
 
+def _merge_adjacent_segments(segments: list[_SegmentResult]) -> list[_SegmentResult]:
+    """Sort segments by start time and merge neighbours that share a speaker."""
+    merged: list[_SegmentResult] = []
+    for segment in sorted(segments, key=lambda item: (item.start, item.end)):
+        last = merged[-1] if merged else None
+        if (
+            last is not None
+            and last.speaker == segment.speaker
+            and segment.start <= last.end + _MERGE_GAP_SECONDS
+        ):
+            merged[-1] = replace(last, end=max(last.end, segment.end))
+        else:
+            merged.append(segment)
+    return merged
+
+
+def _pack_segments(segments: list[_SegmentResult]) -> SpeakerTimeline:
+    """Build a ``SpeakerTimeline`` message with one column per segment field."""
+    speakers: dict[str, int] = {}
+    speaker_idx = [speakers.setdefault(seg.speaker, len(speakers)) for seg in segments]
+    timeline_cls = getattr(diarize_pb2, 'SpeakerTimeline')  # noqa: B009
+    timeline = timeline_cls(
+        starts=[seg.start for seg in segments],
+        ends=[seg.end for seg in segments],
+        speaker_idx=speaker_idx,
+        speakers=list(speakers),
+    )
+    return cast('SpeakerTimeline', timeline)
+
+
 def _clip_segments_to_duration(
     segments: list[_SegmentResult],
     duration: float,
 ) -> list[_SegmentResult]:
     """Ensure diarization segments stay within the bounds of the audio clip."""
     if duration <= 0:
-        return [
-            _SegmentResult(start=max(0.0, seg.start), end=max(0.0, seg.end), speaker=seg.speaker)
-            for seg in segments
-        ]
+        return [replace(seg, start=max(0.0, seg.start), end=max(0.0, seg.end)) for seg in segments]
 
     clipped: list[_SegmentResult] = []
     for segment in segments:
         start = min(max(segment.start, 0.0), duration)
         end = min(max(segment.end, start), duration)
-        clipped.append(_SegmentResult(start=start, end=end, speaker=segment.speaker))
+        clipped.append(replace(segment, start=start, end=end))
 
     return clipped
 
 
 def _estimate_audio_duration(audio_path: Path) -> float:
-    """Return the duration of the provided audio file in seconds."""
+    """Return the duration of the provided audio file in seconds.
+
+    WAV durations come straight from the header; other formats are probed via
+    torchaudio and only decoded when their metadata lacks a frame count.
+    """
+    try:
+        return read_wav_info(audio_path).duration
+    except AudioFormatError:
+        LOGGER.debug('%s is not a plain WAV file, probing with torchaudio', audio_path)
+
     torchaudio = importlib.import_module('torchaudio')
     info = torchaudio.info(str(audio_path))
     if info.num_frames > 0 and info.sample_rate > 0:
@@ -518,26 +1042,122 @@ def _estimate_audio_duration(audio_path: Path) -> float:
     return waveform.size(1) / float(sample_rate)
 
 
-def _create_server(max_workers: int) -> GrpcServer:
+def _write_warmup_audio(audio_path: Path, seconds: float) -> None:
+    """Write low-level white noise as 16 kHz mono PCM for pipeline warm-up."""
+    num_frames = int(seconds * WARMUP_SAMPLE_RATE)
+    noise = np.random.default_rng(0).normal(0.0, 0.01, num_frames)
+    samples = np.clip(noise * 32767, -32768, 32767).astype('<i2')
+    with wave.open(str(audio_path), 'wb') as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(WARMUP_SAMPLE_RATE)
+        handle.writeframes(samples.tobytes())
+
+
+def _create_server(
+    max_workers: int,
+    options: Sequence[tuple[str, object]] = (),
+) -> GrpcServer:
     """Instantiate a gRPC server for the diarization service."""
-    return grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    return grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), options=list(options))
 
 
 def serve() -> None:
-    """Start the diarization gRPC service."""
+    """Start the diarization gRPC service.
+
+    The server starts reporting NOT_SERVING right away and flips to SERVING
+    once the pipeline is loaded and a synthetic warm-up run has finished.
+    """
     logging.basicConfig(level=os.getenv('DIARIZATION_LOG_LEVEL', 'INFO'))
     port = os.getenv('DIARIZATION_SERVICE_PORT', '50052')
     max_workers = int(os.getenv('DIARIZATION_MAX_WORKERS', '4'))
+    warmup_seconds = resolve_warmup_seconds('DIARIZATION_WARMUP_SECONDS', DEFAULT_WARMUP_SECONDS)
+    pool_size = _resolve_pool_size()
+    if pool_size > max_workers:
+        LOGGER.warning(
+            '%s=%d exceeds DIARIZATION_MAX_WORKERS=%d; only %d diarizations can run at once',
+            ENV_POOL_SIZE,
+            pool_size,
+            max_workers,
+            max_workers,
+        )
+
+    prefork_workers = resolve_prefork_workers(ENV_PREFORK_WORKERS)
+    if prefork_workers:
+        _serve_preforked(port, max_workers, warmup_seconds, prefork_workers)
+        return
 
+    start_metrics_server_from_env('DIARIZATION_METRICS_PORT')
     server = _create_server(max_workers=max_workers)
-    add_diarize_servicer_to_server(DiarizeService(), server)
+    service = DiarizeService(load_model=False)
+    add_diarize_servicer_to_server(service, server)
+    health = ServiceHealth(server, SERVICE_NAME, metric_prefix='diarization')
     server.add_insecure_port(f'[::]:{port}')
 
     LOGGER.info('Starting diarization service on port %s', port)
     server.start()
+    with health.phase('load'):
+        service.load()
+    if service.is_ready:
+        with health.phase('warmup'):
+            service.warm_up(warmup_seconds)
+        health.set_serving()
+    else:
+        LOGGER.error('Diarization pipeline is unavailable; reporting NOT_SERVING')
     server.wait_for_termination()
 
 
+def _serve_preforked(
+    port: str,
+    max_workers: int,
+    warmup_seconds: float,
+    num_workers: int,
+) -> None:
+    """Load the diarization pipeline once, then fork *num_workers* servers on *port*.
+
+    Every worker holds the whole diarizer pool, so up to
+    ``num_workers * DIARIZATION_POOL_SIZE`` recordings are diarized at once.
+    Each worker serves metrics on ``DIARIZATION_METRICS_PORT`` plus its index.
+
+    Raises:
+        RuntimeError: If ``DIARIZATION_SPEAKER_INDEX_DIR`` is set. The
+            speaker index supports a single appending process, and forked
+            workers would corrupt it.
+    """
+    if os.getenv(ENV_INDEX_DIR, '').strip():
+        message = (
+            f'{ENV_PREFORK_WORKERS} cannot be combined with {ENV_INDEX_DIR}; '
+            'the speaker index only supports one writing process'
+        )
+        raise RuntimeError(message)
+    service = DiarizeService(load_model=False)
+    LOGGER.info(
+        'Loading the diarization pipeline before forking %d server process(es)',
+        num_workers,
+    )
+    service.load()
+    if not service.is_ready:
+        message = 'Diarization pipeline is unavailable; not forking server processes'
+        raise RuntimeError(message)
+
+    def _worker(index: int) -> None:
+        start_worker_metrics_server('DIARIZATION_METRICS_PORT', index)
+        server = _create_server(max_workers=max_workers, options=REUSE_PORT_OPTIONS)
+        add_diarize_servicer_to_server(service, server)
+        health = ServiceHealth(server, SERVICE_NAME, metric_prefix='diarization')
+        server.add_insecure_port(f'[::]:{port}')
+        server.start()
+        LOGGER.info('Diarization worker %d (pid %d) listening on port %s', index, os.getpid(), port)
+        with health.phase('warmup'):
+            service.warm_up(warmup_seconds)
+        health.set_serving()
+        stop_on_sigterm(server)
+        server.wait_for_termination()
+
+    with reserve_port(int(port)):
+        PreforkSupervisor(_worker, num_workers, name='diarization').run()
+
+
 def main() -> None:
     """Entrypoint for running the diarization service as a module."""
     serve()
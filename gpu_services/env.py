@@ -0,0 +1,49 @@
+"""Numeric environment variables shared by the GPU services' settings."""
+
+from __future__ import annotations
+
+import os
+from typing import Final
+
+
+def get_int_env(name: str, default: int, *, minimum: int | None = None) -> int:
+    """Return the integer environment variable *name*, or *default* when unset or blank.
+
+    Raises:
+        RuntimeError: If the value is not an integer or is below *minimum*.
+    """
+    raw_value = os.getenv(name, '').strip()
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError as exc:
+        message = f'{name} must be a valid integer'
+        raise RuntimeError(message) from exc
+    if minimum is not None and value < minimum:
+        message = f'{name} must be at least {minimum}'
+        raise RuntimeError(message)
+    return value
+
+
+def get_float_env(name: str, default: float, *, minimum: float | None = None) -> float:
+    """Return the float environment variable *name*, or *default* when unset or blank.
+
+    Raises:
+        RuntimeError: If the value is not a number or is below *minimum*.
+    """
+    raw_value = os.getenv(name, '').strip()
+    if not raw_value:
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError as exc:
+        message = f'{name} must be a valid float value'
+        raise RuntimeError(message) from exc
+    if minimum is not None and value < minimum:
+        message = f'{name} must be at least {minimum:g}'
+        raise RuntimeError(message)
+    return value
+
+
+__all__: Final = ('get_float_env', 'get_int_env')
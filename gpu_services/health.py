@@ -0,0 +1,129 @@
+"""gRPC health reporting and start-up timing shared by the GPU services."""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import logging
+import os
+import time
+from typing import TYPE_CHECKING, Final, Protocol
+
+from gpu_services.metrics import REGISTRY, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+OVERALL_HEALTH: Final = ''
+
+
+class _HealthServicer(Protocol):
+    """Subset of ``grpc_health.v1.health.HealthServicer`` used here."""
+
+    def set(self, service: str, status: object) -> None:
+        """Update the status reported for *service*."""
+
+
+class ServiceHealth:
+    """Publish SERVING/NOT_SERVING through the standard gRPC health service.
+
+    The health servicer comes from the optional ``grpcio-health-checking``
+    package. Without it the status is still logged and exported as metrics.
+    """
+
+    def __init__(
+        self,
+        server: object,
+        service_name: str,
+        *,
+        metric_prefix: str,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """Register the health servicer on *server* and report NOT_SERVING."""
+        self._service_name = service_name
+        self._metric_prefix = metric_prefix
+        self._registry = registry
+        self._servicer = _register_health_servicer(server)
+        self._ready = registry.gauge(
+            f'{metric_prefix}_ready',
+            'Whether the service reports SERVING (1) or NOT_SERVING (0)',
+        )
+        self.set_not_serving()
+
+    @property
+    def is_serving(self) -> bool:
+        """Return whether the service currently reports SERVING."""
+        return self._ready.value == 1
+
+    def set_serving(self) -> None:
+        """Report that the service accepts traffic."""
+        self._set_status('SERVING')
+        self._ready.set(1)
+        LOGGER.info('%s is SERVING', self._service_name)
+
+    def set_not_serving(self) -> None:
+        """Report that the service must not receive traffic."""
+        self._set_status('NOT_SERVING')
+        self._ready.set(0)
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Log and export the duration of a start-up phase such as ``load``."""
+        LOGGER.info('%s: %s started', self._service_name, name)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - started
+            self._registry.gauge(
+                f'{self._metric_prefix}_startup_phase_seconds',
+                'Duration of the service start-up phases',
+                labels={'phase': name},
+            ).set(duration)
+            LOGGER.info('%s: %s finished in %.2f seconds', self._service_name, name, duration)
+
+    def _set_status(self, status_name: str) -> None:
+        if self._servicer is None:
+            return
+        health_pb2 = importlib.import_module('grpc_health.v1.health_pb2')
+        status = getattr(health_pb2.HealthCheckResponse, status_name)
+        for service in (OVERALL_HEALTH, self._service_name):
+            self._servicer.set(service, status)
+
+
+def _register_health_servicer(server: object) -> _HealthServicer | None:
+    """Attach ``grpc.health.v1.Health`` to *server* when the package is installed."""
+    try:
+        health = importlib.import_module('grpc_health.v1.health')
+        health_pb2_grpc = importlib.import_module('grpc_health.v1.health_pb2_grpc')
+    except ImportError:
+        LOGGER.warning(
+            'grpcio-health-checking is not installed; the gRPC health service is disabled'
+        )
+        return None
+
+    servicer: _HealthServicer = health.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(servicer, server)
+    return servicer
+
+
+def resolve_warmup_seconds(env_name: str, default: float) -> float:
+    """Return the synthetic warm-up audio length configured in *env_name*."""
+    raw_value = os.getenv(env_name, '').strip()
+    if not raw_value:
+        return default
+    try:
+        value = float(raw_value)
+    except ValueError as exc:
+        message = f'{env_name} must be a number of seconds'
+        raise RuntimeError(message) from exc
+    return max(value, 0.0)
+
+
+__all__: Final = (
+    'OVERALL_HEALTH',
+    'ServiceHealth',
+    'resolve_warmup_seconds',
+)
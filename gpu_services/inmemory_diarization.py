@@ -0,0 +1,474 @@
+"""Diarization on in-memory audio without NeMo's manifest and RTTM files.
+
+The pipeline follows NeMo's clustering diarizer: frame-level VAD, speaker
+embeddings over sliding windows inside the detected speech, then speaker
+clustering. Unlike NeMo it embeds a single scale and skips the MSDD
+refinement, so it is opt-in (``DIARIZATION_IN_MEMORY``). The models are plain
+callables over NumPy arrays, so the NeMo adapters live in
+:func:`load_nemo_in_memory_diarizer` and everything else runs (and is
+tested) without torch.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final, Protocol
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from gpu_services.audio import TARGET_SAMPLE_RATE
+from gpu_services.clustering import (
+    DEFAULT_MAX_SPEAKERS,
+    DEFAULT_SIMILARITY_THRESHOLD,
+    PruningSearch,
+    cluster_embeddings,
+    speaker_centroids,
+)
+from gpu_services.diarization_resources import ensure_dependencies_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.audio import AudioSource
+    from gpu_services.diarization_resources import NemoModelArtifacts
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE: Final = 64
+
+
+class VadScorer(Protocol):
+    """Return the speech probability of every row of a ``[batch, samples]`` array."""
+
+    def __call__(self, windows: NDArray[np.float32]) -> NDArray[np.floating[Any]]:
+        """Score equally sized audio windows."""
+
+
+class SpeakerEmbedder(Protocol):
+    """Return one embedding per zero-padded row of a ``[batch, samples]`` array."""
+
+    def __call__(
+        self,
+        windows: NDArray[np.float32],
+        lengths: NDArray[np.int64],
+    ) -> NDArray[np.floating[Any]]:
+        """Embed audio windows whose valid lengths are given by *lengths*."""
+
+
+@dataclass(frozen=True)
+class InMemoryDiarizationSettings:
+    """Window sizes and VAD thresholds for the in-memory pipeline.
+
+    The defaults follow NeMo's meeting inference config; :meth:`from_config`
+    picks up the VAD, embedding and clustering values of the deployed
+    diarization YAML instead.
+    """
+
+    vad_window_seconds: float = 0.63
+    vad_shift_seconds: float = 0.08
+    onset: float = 0.8
+    offset: float = 0.5
+    pad_onset: float = 0.0
+    pad_offset: float = 0.0
+    min_duration_on: float = 0.0
+    min_duration_off: float = 0.6
+    embedding_window_seconds: float = 1.5
+    embedding_shift_seconds: float = 0.75
+    min_embedding_seconds: float = 0.3
+    max_speakers: int = DEFAULT_MAX_SPEAKERS
+    similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    pruning: PruningSearch = field(default_factory=PruningSearch)
+
+    @classmethod
+    def from_config(
+        cls,
+        cfg: object,
+        select: Callable[..., object],
+    ) -> InMemoryDiarizationSettings:
+        """Read overrides from a NeMo diarization config.
+
+        Args:
+            cfg: Loaded OmegaConf diarization config.
+            select: ``OmegaConf.select``, used to read optional keys.
+        """
+        defaults = cls()
+
+        def _value(key: str, default: float) -> float:
+            raw = select(cfg, key, default=default)
+            if isinstance(raw, Iterable) and not isinstance(raw, str):
+                # Multi-scale configs list several windows; the longest scale comes first.
+                raw = next(iter(raw), default)
+            try:
+                return float(str(raw))
+            except ValueError:
+                return default
+
+        vad = 'diarizer.vad.parameters'
+        embeddings = 'diarizer.speaker_embeddings.parameters'
+        clustering = 'diarizer.clustering.parameters'
+        return cls(
+            vad_window_seconds=_value(f'{vad}.window_length_in_sec', defaults.vad_window_seconds),
+            vad_shift_seconds=_value(f'{vad}.shift_length_in_sec', defaults.vad_shift_seconds),
+            onset=_value(f'{vad}.onset', defaults.onset),
+            offset=_value(f'{vad}.offset', defaults.offset),
+            pad_onset=_value(f'{vad}.pad_onset', defaults.pad_onset),
+            pad_offset=_value(f'{vad}.pad_offset', defaults.pad_offset),
+            min_duration_on=_value(f'{vad}.min_duration_on', defaults.min_duration_on),
+            min_duration_off=_value(f'{vad}.min_duration_off', defaults.min_duration_off),
+            embedding_window_seconds=_value(
+                f'{embeddings}.window_length_in_sec',
+                defaults.embedding_window_seconds,
+            ),
+            embedding_shift_seconds=_value(
+                f'{embeddings}.shift_length_in_sec',
+                defaults.embedding_shift_seconds,
+            ),
+            max_speakers=int(_value(f'{clustering}.max_num_speakers', defaults.max_speakers)),
+            pruning=PruningSearch(
+                max_fraction=_value(
+                    f'{clustering}.max_rp_threshold',
+                    defaults.pruning.max_fraction,
+                ),
+                candidates=int(
+                    _value(f'{clustering}.sparse_search_volume', defaults.pruning.candidates),
+                ),
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class EmbeddingWindow:
+    """Audio span embedded as one unit, with the speech region it belongs to."""
+
+    start: float
+    end: float
+    region: int
+
+    @property
+    def centre(self) -> float:
+        """Return the midpoint of the window in seconds."""
+        return (self.start + self.end) / 2.0
+
+
+@dataclass(frozen=True)
+class DiarizedSegment:
+    """Speech attributed to a single speaker cluster."""
+
+    start: float
+    end: float
+    speaker: int
+
+
+@dataclass(frozen=True)
+class SpeakerDiarization:
+    """Segments of one recording plus a centroid embedding per speaker."""
+
+    segments: list[DiarizedSegment]
+    centroids: NDArray[np.float64]
+
+
+class InMemoryDiarizer:
+    """Diarize an :class:`AudioSource` without touching disk."""
+
+    def __init__(
+        self,
+        *,
+        vad_scorer: VadScorer,
+        embedder: SpeakerEmbedder,
+        settings: InMemoryDiarizationSettings | None = None,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Store the model callables and pipeline settings."""
+        self._vad_scorer = vad_scorer
+        self._embedder = embedder
+        self._settings = settings or InMemoryDiarizationSettings()
+        self._sample_rate = sample_rate
+        self._batch_size = batch_size
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate the models expect."""
+        return self._sample_rate
+
+    @property
+    def settings(self) -> InMemoryDiarizationSettings:
+        """Return the active pipeline settings."""
+        return self._settings
+
+    def speech_regions(self, source: AudioSource) -> list[tuple[float, float]]:
+        """Return ``(start, end)`` speech regions in seconds."""
+        settings = self._settings
+        probabilities = self._frame_speech_probabilities(source)
+        return frames_to_regions(
+            probabilities,
+            settings.vad_shift_seconds,
+            settings,
+            total_seconds=source.num_samples / source.sample_rate,
+        )
+
+    def embed_windows(
+        self,
+        source: AudioSource,
+        windows: Sequence[EmbeddingWindow],
+    ) -> NDArray[np.float32]:
+        """Return one speaker embedding per window, in order."""
+        rate = source.sample_rate
+        batches: list[NDArray[np.float32]] = []
+        for offset in range(0, len(windows), self._batch_size):
+            chunk = windows[offset : offset + self._batch_size]
+            spans = [(round(w.start * rate), round(w.end * rate)) for w in chunk]
+            lengths = np.asarray([stop - start for start, stop in spans], dtype=np.int64)
+            padded = np.zeros((len(chunk), int(lengths.max())), dtype=np.float32)
+            for row, (start, stop) in enumerate(spans):
+                samples = source.read(start, stop)
+                padded[row, : len(samples)] = samples
+            batches.append(np.asarray(self._embedder(padded, lengths), dtype=np.float32))
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.concatenate(batches, axis=0)
+
+    def diarize(self, source: AudioSource) -> list[DiarizedSegment]:
+        """Run VAD, embedding and clustering over *source*."""
+        return self.diarize_with_centroids(source).segments
+
+    def diarize_with_centroids(
+        self,
+        source: AudioSource,
+        regions: Sequence[tuple[float, float]] | None = None,
+    ) -> SpeakerDiarization:
+        """Diarize *source* and keep the mean embedding of every speaker.
+
+        Row ``n`` of the returned centroids belongs to speaker ``n``.
+
+        Args:
+            source: Audio to diarize.
+            regions: Precomputed ``(start, end)`` speech regions in seconds,
+                for example from :mod:`gpu_services.vad`. The VAD model only
+                runs when they are omitted.
+        """
+        settings = self._settings
+        if regions is None:
+            regions = self.speech_regions(source)
+        windows = plan_embedding_windows(regions, settings)
+        if not windows:
+            return SpeakerDiarization([], np.zeros((0, 0), dtype=np.float64))
+        embeddings = self.embed_windows(source, windows)
+        labels = cluster_embeddings(
+            embeddings,
+            max_speakers=settings.max_speakers,
+            threshold=settings.similarity_threshold,
+            pruning=settings.pruning,
+        )
+        return SpeakerDiarization(
+            segments=windows_to_segments(regions, windows, labels.tolist()),
+            centroids=speaker_centroids(embeddings, labels),
+        )
+
+    def _frame_speech_probabilities(self, source: AudioSource) -> NDArray[np.float64]:
+        """Score one VAD window centred on every ``vad_shift_seconds`` frame."""
+        rate = source.sample_rate
+        window = max(1, round(self._settings.vad_window_seconds * rate))
+        shift = max(1, round(self._settings.vad_shift_seconds * rate))
+        num_frames = math.ceil(source.num_samples / shift)
+        lead = window // 2 - shift // 2
+
+        probabilities: list[NDArray[np.float64]] = []
+        for first in range(0, num_frames, self._batch_size):
+            count = min(self._batch_size, num_frames - first)
+            start = first * shift - lead
+            stop = start + (count - 1) * shift + window
+            # Reads are clamped to the file; the edges are zero padded.
+            samples = source.read(max(start, 0), min(stop, source.num_samples))
+            padded = np.zeros(stop - start, dtype=np.float32)
+            padded[max(-start, 0) : max(-start, 0) + len(samples)] = samples
+            windows = sliding_window_view(padded, window)[::shift][:count]
+            scores = self._vad_scorer(np.ascontiguousarray(windows))
+            probabilities.append(np.asarray(scores, dtype=np.float64))
+        if not probabilities:
+            return np.zeros(0, dtype=np.float64)
+        return np.concatenate(probabilities)
+
+
+def frames_to_regions(
+    probabilities: NDArray[np.floating[Any]],
+    frame_seconds: float,
+    settings: InMemoryDiarizationSettings,
+    *,
+    total_seconds: float,
+) -> list[tuple[float, float]]:
+    """Turn frame-level speech probabilities into speech regions.
+
+    Speech starts when a frame reaches ``onset`` and ends when one drops
+    below ``offset``. Regions are padded, gaps shorter than
+    ``min_duration_off`` are bridged and regions shorter than
+    ``min_duration_on`` are dropped.
+    """
+    raw: list[tuple[float, float]] = []
+    start: int | None = None
+    for index, probability in enumerate(np.asarray(probabilities).tolist()):
+        if start is None and probability >= settings.onset:
+            start = index
+        elif start is not None and probability < settings.offset:
+            raw.append((start * frame_seconds, index * frame_seconds))
+            start = None
+    if start is not None:
+        raw.append((start * frame_seconds, len(probabilities) * frame_seconds))
+
+    merged: list[tuple[float, float]] = []
+    for region_start, region_end in raw:
+        padded_start = max(0.0, region_start - settings.pad_onset)
+        padded_end = min(total_seconds, region_end + settings.pad_offset)
+        if merged and padded_start - merged[-1][1] < settings.min_duration_off:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], padded_end))
+        else:
+            merged.append((padded_start, padded_end))
+
+    return [
+        (region_start, region_end)
+        for region_start, region_end in merged
+        if region_end - region_start >= max(settings.min_duration_on, 1e-9)
+    ]
+
+
+def plan_embedding_windows(
+    regions: Sequence[tuple[float, float]],
+    settings: InMemoryDiarizationSettings,
+) -> list[EmbeddingWindow]:
+    """Cover every speech region with overlapping embedding windows.
+
+    Regions shorter than one window are embedded whole; the last window of a
+    longer region is aligned with its end so no speech is left uncovered.
+    """
+    length = settings.embedding_window_seconds
+    shift = settings.embedding_shift_seconds
+    windows: list[EmbeddingWindow] = []
+    for index, (start, end) in enumerate(regions):
+        duration = end - start
+        if duration < settings.min_embedding_seconds:
+            continue
+        if duration <= length:
+            windows.append(EmbeddingWindow(start, end, index))
+            continue
+        offset = start
+        while offset + length < end:
+            windows.append(EmbeddingWindow(offset, offset + length, index))
+            offset += shift
+        windows.append(EmbeddingWindow(end - length, end, index))
+    return windows
+
+
+def windows_to_segments(
+    regions: Sequence[tuple[float, float]],
+    windows: Sequence[EmbeddingWindow],
+    labels: Sequence[int],
+) -> list[DiarizedSegment]:
+    """Split speech regions between their windows and merge same-speaker runs.
+
+    Each window owns the part of its region that is closer to its centre
+    than to a neighbouring window's centre.
+    """
+    segments: list[DiarizedSegment] = []
+    for position, (window, label) in enumerate(zip(windows, labels, strict=True)):
+        region_start, region_end = regions[window.region]
+        previous = windows[position - 1] if position > 0 else None
+        following = windows[position + 1] if position + 1 < len(windows) else None
+        start = (
+            (previous.centre + window.centre) / 2.0
+            if previous is not None and previous.region == window.region
+            else region_start
+        )
+        end = (
+            (window.centre + following.centre) / 2.0
+            if following is not None and following.region == window.region
+            else region_end
+        )
+        if end <= start:
+            continue
+        last = segments[-1] if segments else None
+        if last is not None and last.speaker == label and math.isclose(last.end, start):
+            segments[-1] = DiarizedSegment(last.start, end, label)
+        else:
+            segments.append(DiarizedSegment(start, end, label))
+    return segments
+
+
+def load_nemo_in_memory_diarizer(
+    artifacts: NemoModelArtifacts,
+    settings: InMemoryDiarizationSettings | None = None,
+) -> InMemoryDiarizer:
+    """Restore the NeMo VAD and speaker models and wrap them for in-memory use.
+
+    Args:
+        artifacts: Validated NeMo model and config paths.
+        settings: Pipeline settings. Read from the diarization config at
+            ``artifacts.config_path`` when omitted.
+    """
+    ensure_dependencies_available()
+    torch = importlib.import_module('torch')
+    models = importlib.import_module('nemo.collections.asr.models')
+    if settings is None:
+        omegaconf = importlib.import_module('omegaconf').OmegaConf
+        cfg = omegaconf.load(str(artifacts.config_path))
+        settings = InMemoryDiarizationSettings.from_config(cfg, omegaconf.select)
+
+    device = 'cuda' if torch.cuda.is_available() else 'cpu'
+    LOGGER.info('Loading NeMo VAD and speaker models for in-memory diarization on %s', device)
+    vad_model = models.EncDecClassificationModel.restore_from(
+        str(artifacts.vad_model_path),
+        map_location=device,
+    ).eval()
+    speaker_model = models.EncDecSpeakerLabelModel.restore_from(
+        str(artifacts.speaker_model_path),
+        map_location=device,
+    ).eval()
+
+    labels = list(getattr(getattr(vad_model, 'cfg', None), 'labels', None) or [])
+    speech_index = labels.index('speech') if 'speech' in labels else 1
+
+    def score(windows: NDArray[np.float32]) -> NDArray[np.floating[Any]]:
+        signal = torch.from_numpy(windows).to(device)
+        lengths = torch.full((len(windows),), windows.shape[1], dtype=torch.long, device=device)
+        with torch.inference_mode():
+            logits = vad_model(input_signal=signal, input_signal_length=lengths)
+            probabilities = torch.softmax(logits, dim=-1)[:, speech_index]
+        result: NDArray[np.floating[Any]] = probabilities.float().cpu().numpy()
+        return result
+
+    def embed(
+        windows: NDArray[np.float32],
+        lengths: NDArray[np.int64],
+    ) -> NDArray[np.floating[Any]]:
+        signal = torch.from_numpy(windows).to(device)
+        signal_lengths = torch.from_numpy(lengths).to(device)
+        with torch.inference_mode():
+            _, embeddings = speaker_model.forward(
+                input_signal=signal,
+                input_signal_length=signal_lengths,
+            )
+        result: NDArray[np.floating[Any]] = embeddings.float().cpu().numpy()
+        return result
+
+    return InMemoryDiarizer(vad_scorer=score, embedder=embed, settings=settings)
+
+
+__all__: Final = (
+    'DiarizedSegment',
+    'EmbeddingWindow',
+    'InMemoryDiarizationSettings',
+    'InMemoryDiarizer',
+    'SpeakerDiarization',
+    'SpeakerEmbedder',
+    'VadScorer',
+    'frames_to_regions',
+    'load_nemo_in_memory_diarizer',
+    'plan_embedding_windows',
+    'windows_to_segments',
+)
@@ -0,0 +1,221 @@
+"""Spread LLM API requests over several weighted endpoints.
+
+Every request goes to the endpoint with the fewest requests in flight per
+unit of weight, so a replica that answers slowly receives less new work
+and concurrent map calls of one meeting land on different replicas. Idle
+endpoints are chosen at random in proportion to their weight.
+
+Each endpoint has its own :class:`CircuitBreaker`, which ejects it
+passively: after consecutive failures it receives no requests until the
+reset timeout has passed, then a single probe decides whether it rejoins.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Collection, Hashable, Sequence
+
+BackendT = TypeVar('BackendT', bound='Hashable')
+
+DEFAULT_WEIGHT: Final = 1.0
+ENDPOINT_SEPARATOR: Final = ','
+_WEIGHT_PREFIX: Final = ';weight='
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of sending a request while every endpoint is ejected."""
+
+
+@dataclass(frozen=True)
+class LlmEndpoint:
+    """Base URL of one LLM API replica and its share of the load."""
+
+    url: str
+    weight: float = DEFAULT_WEIGHT
+
+
+def parse_endpoints(raw_value: str) -> tuple[LlmEndpoint, ...]:
+    """Parse comma-separated ``url`` or ``url;weight=N`` entries.
+
+    Raises:
+        ValueError: If an entry has no URL or a weight that is not a positive number.
+    """
+    endpoints: list[LlmEndpoint] = []
+    for raw_entry in raw_value.split(ENDPOINT_SEPARATOR):
+        entry = raw_entry.strip()
+        if not entry:
+            continue
+        url, _, raw_weight = entry.partition(_WEIGHT_PREFIX)
+        try:
+            weight = float(raw_weight) if raw_weight else DEFAULT_WEIGHT
+        except ValueError as exc:
+            message = f'Invalid weight in LLM endpoint {entry!r}'
+            raise ValueError(message) from exc
+        if not url.strip() or weight <= 0:
+            message = f'LLM endpoint {entry!r} needs a URL and a positive weight'
+            raise ValueError(message)
+        endpoints.append(LlmEndpoint(url=url.strip(), weight=weight))
+    return tuple(endpoints)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_seconds: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Open after *failure_threshold* failures in a row (``0`` never opens)."""
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are currently being rejected."""
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """Return whether a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or self._clock() - self._opened_at < self._reset_seconds:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit past the threshold."""
+        with self._lock:
+            self._failures += 1
+            if self._probing or (
+                self._failure_threshold and self._failures >= self._failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self._probing = False
+
+
+@dataclass
+class _Member(Generic[BackendT]):
+    """Balancer bookkeeping of one backend."""
+
+    backend: BackendT
+    weight: float
+    breaker: CircuitBreaker
+    outstanding: int = 0
+
+
+class LeastOutstandingBalancer(Generic[BackendT]):
+    """Weighted least-outstanding-requests balancer with passive ejection."""
+
+    def __init__(
+        self,
+        backends: Sequence[tuple[BackendT, float]],
+        *,
+        failure_threshold: int,
+        reset_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Balance over ``(backend, weight)`` pairs; backends must be distinct."""
+        if not backends:
+            message = 'At least one backend is required'
+            raise ValueError(message)
+        self._members = {
+            backend: _Member(
+                backend=backend,
+                weight=weight,
+                breaker=CircuitBreaker(failure_threshold, reset_seconds, clock=clock),
+            )
+            for backend, weight in backends
+        }
+        self._lock = threading.Lock()
+        self._rng = random.Random()
+
+    @property
+    def backends(self) -> tuple[BackendT, ...]:
+        """Return every backend, ejected ones included."""
+        return tuple(self._members)
+
+    def outstanding(self, backend: BackendT) -> int:
+        """Return the number of requests *backend* is currently serving."""
+        return self._members[backend].outstanding
+
+    def is_ejected(self, backend: BackendT) -> bool:
+        """Return whether *backend* is currently ejected."""
+        return self._members[backend].breaker.is_open
+
+    def acquire(self, avoid: Collection[BackendT] = ()) -> BackendT:
+        """Reserve the least loaded healthy backend for one request.
+
+        Backends in *avoid*, typically the ones a request already failed on,
+        are only used when no other backend is healthy. Every acquired
+        backend must be handed back with :meth:`release`.
+
+        Raises:
+            CircuitOpenError: If every backend is ejected.
+        """
+        with self._lock:
+            preferred = [member for member in self._members.values() if member.backend not in avoid]
+            for candidates in (preferred, list(self._members.values())):
+                member = self._admit(candidates)
+                if member is not None:
+                    member.outstanding += 1
+                    return member.backend
+        message = 'Every LLM API endpoint is ejected after repeated failures'
+        raise CircuitOpenError(message)
+
+    def release(self, backend: BackendT) -> None:
+        """Finish a request that :meth:`acquire` reserved on *backend*."""
+        with self._lock:
+            self._members[backend].outstanding -= 1
+
+    def report(self, backend: BackendT, *, success: bool) -> None:
+        """Update the health of *backend* with the outcome of one request."""
+        breaker = self._members[backend].breaker
+        if success:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def _admit(self, candidates: list[_Member[BackendT]]) -> _Member[BackendT] | None:
+        """Return the least loaded candidate whose breaker admits a request."""
+        remaining = list(candidates)
+        while remaining:
+            lowest = min(member.outstanding / member.weight for member in remaining)
+            ties = [member for member in remaining if member.outstanding / member.weight == lowest]
+            member = self._rng.choices(ties, weights=[tie.weight for tie in ties])[0]
+            if member.breaker.allow():
+                return member
+            remaining.remove(member)
+        return None
+
+
+__all__: Final = (
+    'DEFAULT_WEIGHT',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'LeastOutstandingBalancer',
+    'LlmEndpoint',
+    'parse_endpoints',
+)
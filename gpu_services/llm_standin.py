@@ -0,0 +1,509 @@
+"""OpenAI-compatible chat completions stand-in for load tests of the summarizer.
+
+The stand-in answers ``POST .../chat/completions`` like a self-hosted LLM
+server, without a model: the reply is a selection of words of the last
+user message, evenly spaced so that it keeps the order of the input. What
+makes it useful is its timing and its failures:
+
+* the time to the first token follows a configurable distribution
+  (``fixed:0.2``, ``uniform:0.1,0.5``, ``exponential:0.3`` or
+  ``lognormal:0.3,0.6`` with the median and sigma of the log);
+* tokens are generated at a fixed rate, streamed as server-sent events
+  when the request asks for ``"stream": true``;
+* a share of the requests fail with ``503`` or are throttled with ``429``
+  and ``Retry-After``;
+* at most ``slots`` requests generate at once and later ones queue, which
+  is how a GPU server with a bounded batch behaves under load.
+
+Words stand in for tokens throughout. Only the standard library is used,
+so the stand-in runs in a bare Python container::
+
+    python -m gpu_services.llm_standin
+
+and the summarizer is pointed at it with ``LLM_API_BASE=http://localhost:8000/v1/``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any, Final
+
+from gpu_services.env import get_float_env, get_int_env
+from gpu_services.metrics import REGISTRY, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_PORT: Final = 8000
+DEFAULT_LATENCY: Final = 'lognormal:0.3,0.5'
+DEFAULT_TOKENS_PER_SECOND: Final = 60.0
+DEFAULT_MAX_OUTPUT_TOKENS: Final = 256
+# Replies are this fraction of the prompt, like a summary of it.
+DEFAULT_OUTPUT_RATIO: Final = 0.25
+DEFAULT_RETRY_AFTER_SECONDS: Final = 1.0
+COMPLETIONS_PATH: Final = '/chat/completions'
+# Number of parameters every latency distribution takes.
+LATENCY_KINDS: Final = {'fixed': 1, 'uniform': 2, 'exponential': 1, 'lognormal': 2}
+QUEUE_BUCKETS: Final = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+OUTCOMES: Final = ('ok', 'error', 'throttled', 'invalid', 'disconnected')
+
+
+@dataclass(frozen=True)
+class LatencyDistribution:
+    """Distribution of the time to the first token, in seconds."""
+
+    kind: str = 'fixed'
+    params: tuple[float, ...] = (0.0,)
+
+    @classmethod
+    def parse(cls, raw_value: str) -> LatencyDistribution:
+        """Parse ``kind:param[,param]``, e.g. ``lognormal:0.3,0.6``; a bare number is fixed.
+
+        Raises:
+            ValueError: If the kind is unknown or its parameters are invalid.
+        """
+        kind, _, raw_params = raw_value.strip().partition(':')
+        if not raw_params:
+            kind, raw_params = 'fixed', kind
+        expected = LATENCY_KINDS.get(kind)
+        if expected is None:
+            known = ', '.join(LATENCY_KINDS)
+            message = f'Unknown latency distribution {kind!r}, expected one of {known}'
+            raise ValueError(message)
+        try:
+            params = tuple(float(param) for param in raw_params.split(','))
+        except ValueError as exc:
+            message = f'Invalid latency parameters in {raw_value!r}'
+            raise ValueError(message) from exc
+        if len(params) != expected or any(param < 0 for param in params):
+            message = f'{kind} latency takes {expected} non-negative parameter(s): {raw_value!r}'
+            raise ValueError(message)
+        return cls(kind=kind, params=params)
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency from the distribution."""
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'exponential':
+            return rng.expovariate(1 / self.params[0]) if self.params[0] else 0.0
+        if self.kind == 'lognormal':
+            median, sigma = self.params
+            return median * math.exp(rng.gauss(0.0, sigma))
+        return self.params[0]
+
+
+@dataclass(frozen=True)
+class StandInSettings:
+    """Behaviour of the LLM stand-in.
+
+    The defaults answer instantly and never fail; :meth:`from_env` defaults
+    to a more realistic lognormal latency and generation rate.
+    """
+
+    latency: LatencyDistribution = field(default_factory=LatencyDistribution)
+    # ``0`` generates the whole reply at once.
+    tokens_per_second: float = 0.0
+    max_output_tokens: int = DEFAULT_MAX_OUTPUT_TOKENS
+    output_ratio: float = DEFAULT_OUTPUT_RATIO
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after_seconds: float = DEFAULT_RETRY_AFTER_SECONDS
+    # ``0`` lets every request generate at once.
+    slots: int = 0
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        """Reject failure rates that do not form a probability."""
+        rates = (self.error_rate, self.throttle_rate)
+        if min(rates) < 0 or sum(rates) > 1:
+            message = 'error_rate and throttle_rate must be non-negative and add up to at most 1'
+            raise ValueError(message)
+
+    @classmethod
+    def from_env(cls) -> StandInSettings:
+        """Load the settings from ``LLM_STANDIN_*`` environment variables."""
+        raw_latency = os.getenv('LLM_STANDIN_LATENCY', '').strip() or DEFAULT_LATENCY
+        raw_seed = os.getenv('LLM_STANDIN_SEED', '').strip()
+        try:
+            return cls(
+                latency=LatencyDistribution.parse(raw_latency),
+                tokens_per_second=get_float_env(
+                    'LLM_STANDIN_TOKENS_PER_SECOND',
+                    DEFAULT_TOKENS_PER_SECOND,
+                    minimum=0.0,
+                ),
+                max_output_tokens=get_int_env(
+                    'LLM_STANDIN_MAX_OUTPUT_TOKENS',
+                    DEFAULT_MAX_OUTPUT_TOKENS,
+                    minimum=1,
+                ),
+                output_ratio=get_float_env(
+                    'LLM_STANDIN_OUTPUT_RATIO',
+                    DEFAULT_OUTPUT_RATIO,
+                    minimum=0.0,
+                ),
+                error_rate=get_float_env('LLM_STANDIN_ERROR_RATE', 0.0, minimum=0.0),
+                throttle_rate=get_float_env('LLM_STANDIN_THROTTLE_RATE', 0.0, minimum=0.0),
+                retry_after_seconds=get_float_env(
+                    'LLM_STANDIN_RETRY_AFTER_SECONDS',
+                    DEFAULT_RETRY_AFTER_SECONDS,
+                    minimum=0.0,
+                ),
+                slots=get_int_env('LLM_STANDIN_SLOTS', 0, minimum=0),
+                seed=int(raw_seed) if raw_seed else None,
+            )
+        except ValueError as exc:
+            message = f'Invalid LLM stand-in settings: {exc}'
+            raise RuntimeError(message) from exc
+
+
+class LlmStandIn:
+    """Threaded HTTP server that imitates an OpenAI-compatible chat completions API."""
+
+    def __init__(
+        self,
+        settings: StandInSettings | None = None,
+        *,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        name: str = 'llm_standin',
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """Bind to *host* and *port* (``0`` picks a free port); call :meth:`start` to serve."""
+        self._settings = settings or StandInSettings()
+        self._rng = random.Random(self._settings.seed)
+        self._rng_lock = threading.Lock()
+        self._slots = threading.Semaphore(self._settings.slots) if self._settings.slots else None
+        self._outcomes = {
+            outcome: registry.counter(
+                f'{name}_requests_total',
+                'Requests answered by the LLM stand-in',
+                labels={'outcome': outcome},
+            )
+            for outcome in OUTCOMES
+        }
+        self._tokens = registry.counter(
+            f'{name}_completion_tokens_total',
+            'Tokens generated by the LLM stand-in',
+        )
+        self._active = registry.gauge(f'{name}_active', 'Requests generating a reply')
+        self._queued = registry.histogram(
+            f'{name}_queue_seconds',
+            'Time requests waited for a free generation slot',
+            buckets=QUEUE_BUCKETS,
+        )
+        self._server = _StandInServer((host, port), self._handler_class())
+        self._thread: threading.Thread | None = None
+
+    @property
+    def settings(self) -> StandInSettings:
+        """Return the behaviour of the stand-in."""
+        return self._settings
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to use as ``LLM_API_BASE``."""
+        host, port = self._server.server_address[:2]
+        return f'http://{host!s}:{port}/v1/'
+
+    def requests(self, outcome: str) -> int:
+        """Return how many requests ended with *outcome*, one of :data:`OUTCOMES`."""
+        return int(self._outcomes[outcome].value)
+
+    @property
+    def completion_tokens(self) -> int:
+        """Return the number of tokens generated so far."""
+        return int(self._tokens.value)
+
+    def start(self) -> LlmStandIn:
+        """Serve requests from a daemon thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name='llm-standin',
+            daemon=True,
+        )
+        self._thread.start()
+        LOGGER.info('LLM stand-in listening on %s', self.url)
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until :meth:`close` is called elsewhere."""
+        LOGGER.info('LLM stand-in listening on %s', self.url)
+        self._server.serve_forever()
+
+    def close(self) -> None:
+        """Stop serving and release the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _handle(self, handler: BaseHTTPRequestHandler) -> None:
+        """Answer the request received by *handler*."""
+        if not handler.path.rstrip('/').endswith(COMPLETIONS_PATH):
+            _send_error(handler, 404, 'Unknown endpoint', 'not_found')
+            return
+        body = handler.rfile.read(int(handler.headers.get('Content-Length') or 0))
+        try:
+            payload = json.loads(body)
+            words, prompt_tokens = self._reply_words(payload)
+        except ValueError as exc:
+            self._outcomes['invalid'].inc()
+            _send_error(handler, 400, str(exc), 'invalid_request_error')
+            return
+
+        with self._rng_lock:
+            draw = self._rng.random()
+            first_token_seconds = self._settings.latency.sample(self._rng)
+        if draw < self._settings.error_rate:
+            self._outcomes['error'].inc()
+            _send_error(handler, 503, 'Injected server error', 'server_error')
+            return
+        if draw < self._settings.error_rate + self._settings.throttle_rate:
+            self._outcomes['throttled'].inc()
+            headers = {'Retry-After': f'{self._settings.retry_after_seconds:g}'}
+            _send_error(handler, 429, 'Injected rate limit', 'rate_limit_error', headers)
+            return
+
+        with self._generation_slot():
+            time.sleep(first_token_seconds)
+            try:
+                if payload.get('stream'):
+                    self._stream(handler, payload, words)
+                else:
+                    self._complete(handler, payload, words, prompt_tokens)
+            except (BrokenPipeError, ConnectionResetError):
+                self._outcomes['disconnected'].inc()
+                handler.close_connection = True
+                return
+        self._outcomes['ok'].inc()
+
+    def _reply_words(self, payload: object) -> tuple[list[str], int]:
+        """Return the words of the reply to *payload* and the number of prompt tokens.
+
+        Raises:
+            ValueError: If *payload* is not a request with messages of string content.
+        """
+        if not isinstance(payload, dict):
+            message = 'request body must be a JSON object'
+            raise ValueError(message)  # noqa: TRY004 - reported as a 400 like other bad input
+        messages = payload.get('messages')
+        if not isinstance(messages, list) or not messages:
+            message = 'messages must be a non-empty list'
+            raise ValueError(message)
+        contents = [item.get('content') if isinstance(item, dict) else None for item in messages]
+        if not all(isinstance(content, str) for content in contents):
+            message = 'every message needs string content'
+            raise ValueError(message)
+        prompt_tokens = sum(len(str(content).split()) for content in contents)
+        words = str(contents[-1]).split()
+        if not words:
+            return ['ok'], prompt_tokens
+
+        limit = self._settings.max_output_tokens
+        requested = payload.get('max_tokens')
+        if isinstance(requested, int) and requested > 0:
+            limit = min(limit, requested)
+        count = max(1, min(limit, round(len(words) * self._settings.output_ratio)))
+        step = len(words) / count
+        return [words[int(index * step)] for index in range(count)], prompt_tokens
+
+    @contextlib.contextmanager
+    def _generation_slot(self) -> Iterator[None]:
+        """Wait for a free generation slot and hold it for the block."""
+        start = time.perf_counter()
+        if self._slots is not None:
+            self._slots.acquire()
+        self._queued.observe(time.perf_counter() - start)
+        self._active.inc()
+        try:
+            yield
+        finally:
+            self._active.dec()
+            if self._slots is not None:
+                self._slots.release()
+
+    def _paced(self, words: list[str]) -> Iterator[str]:
+        """Yield *words* no faster than ``tokens_per_second``, counting them."""
+        rate = self._settings.tokens_per_second
+        for word in words:
+            if rate:
+                time.sleep(1 / rate)
+            self._tokens.inc()
+            yield word
+
+    def _complete(
+        self,
+        handler: BaseHTTPRequestHandler,
+        payload: dict[str, Any],
+        words: list[str],
+        prompt_tokens: int,
+    ) -> None:
+        """Generate the whole reply, then send it as one completion object."""
+        content = ' '.join(self._paced(words))
+        choice = {
+            'index': 0,
+            'message': {'role': 'assistant', 'content': content},
+            'finish_reason': 'stop',
+        }
+        usage = {
+            'prompt_tokens': prompt_tokens,
+            'completion_tokens': len(words),
+            'total_tokens': prompt_tokens + len(words),
+        }
+        completion = {
+            **_completion_fields(payload, 'chat.completion'),
+            'choices': [choice],
+            'usage': usage,
+        }
+        _send_json(handler, 200, completion)
+
+    def _stream(
+        self,
+        handler: BaseHTTPRequestHandler,
+        payload: dict[str, Any],
+        words: list[str],
+    ) -> None:
+        """Send the reply as server-sent completion chunks while it is generated."""
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/event-stream')
+        handler.send_header('Cache-Control', 'no-cache')
+        handler.send_header('Transfer-Encoding', 'chunked')
+        handler.end_headers()
+        fields = _completion_fields(payload, 'chat.completion.chunk')
+        _send_event(handler, {**fields, 'choices': [_delta({'role': 'assistant'})]})
+        for index, word in enumerate(self._paced(words)):
+            content = word if index == 0 else f' {word}'
+            _send_event(handler, {**fields, 'choices': [_delta({'content': content})]})
+        _send_event(handler, {**fields, 'choices': [_delta({}, finish_reason='stop')]})
+        _send_chunk(handler, b'data: [DONE]\n\n')
+        # A zero-length chunk ends the chunked response body.
+        _send_chunk(handler, b'')
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        """Return the request handler class bound to this stand-in."""
+        standin = self
+
+        class _CompletionsHandler(BaseHTTPRequestHandler):
+            # Keep connections alive so that clients pool them like with a real server.
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server naming convention
+                standin._handle(self)  # noqa: SLF001
+
+            def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+                LOGGER.debug(format, *args)
+
+        return _CompletionsHandler
+
+
+class _StandInServer(ThreadingHTTPServer):
+    """HTTP server that does not print tracebacks for clients that hang up."""
+
+    daemon_threads = True
+
+    def handle_error(self, request: object, client_address: object) -> None:
+        """Log failed connections quietly; clients drop idle keep-alive connections."""
+        del request
+        LOGGER.debug('Connection from %s failed', client_address, exc_info=True)
+
+
+def _completion_fields(payload: dict[str, Any], kind: str) -> dict[str, Any]:
+    """Return the identifying fields shared by every completion object."""
+    return {
+        'id': f'chatcmpl-{uuid.uuid4().hex}',
+        'object': kind,
+        'created': int(time.time()),
+        'model': str(payload.get('model') or 'standin'),
+    }
+
+
+def _delta(delta: dict[str, str], finish_reason: str | None = None) -> dict[str, Any]:
+    """Return one streamed choice carrying *delta*."""
+    return {'index': 0, 'delta': delta, 'finish_reason': finish_reason}
+
+
+def _send_json(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    data: dict[str, Any],
+    headers: dict[str, str] | None = None,
+) -> None:
+    """Send *data* as a complete JSON response."""
+    body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+    handler.send_response(status)
+    handler.send_header('Content-Type', 'application/json')
+    handler.send_header('Content-Length', str(len(body)))
+    for key, value in (headers or {}).items():
+        handler.send_header(key, value)
+    handler.end_headers()
+    handler.wfile.write(body)
+
+
+def _send_error(
+    handler: BaseHTTPRequestHandler,
+    status: int,
+    message: str,
+    error_type: str,
+    headers: dict[str, str] | None = None,
+) -> None:
+    """Send an OpenAI-style error object."""
+    _send_json(handler, status, {'error': {'message': message, 'type': error_type}}, headers)
+
+
+def _send_event(handler: BaseHTTPRequestHandler, data: dict[str, Any]) -> None:
+    """Send *data* as one server-sent event."""
+    _send_chunk(handler, f'data: {json.dumps(data, ensure_ascii=False)}\n\n'.encode())
+
+
+def _send_chunk(handler: BaseHTTPRequestHandler, data: bytes) -> None:
+    """Write *data* as one chunk of a chunked response and flush it."""
+    handler.wfile.write(f'{len(data):x}\r\n'.encode() + data + b'\r\n')
+    handler.wfile.flush()
+
+
+def serve() -> None:
+    """Run the stand-in configured by ``LLM_STANDIN_*`` environment variables."""
+    logging.basicConfig(level=os.getenv('LLM_STANDIN_LOG_LEVEL', 'INFO'))
+    port = int(os.getenv('LLM_STANDIN_PORT', str(DEFAULT_PORT)))
+    settings = StandInSettings.from_env()
+    LOGGER.info('LLM stand-in settings: %s', settings)
+    standin = LlmStandIn(settings, host='0.0.0.0', port=port)  # noqa: S104
+    try:
+        standin.serve_forever()
+    except KeyboardInterrupt:
+        LOGGER.info('Stopping LLM stand-in')
+    finally:
+        standin.close()
+
+
+def main() -> None:
+    """Entrypoint for running the stand-in as a module."""
+    serve()
+
+
+if __name__ == '__main__':
+    main()
+
+
+__all__: Final = (
+    'DEFAULT_PORT',
+    'OUTCOMES',
+    'LatencyDistribution',
+    'LlmStandIn',
+    'StandInSettings',
+    'serve',
+)
@@ -0,0 +1,547 @@
+"""Resilient HTTP transport for the OpenAI-compatible LLM API.
+
+A single slow or failing LLM replica should cost one extra request, not a
+failed summary. :class:`ResilientTransport` wraps one ``httpx.Client`` per
+endpoint and sends every request with:
+
+* retries of timeouts, connection errors, HTTP 429 and 5xx responses, with
+  full-jitter exponential backoff (``Retry-After`` is honoured);
+* an optional hedged duplicate that is sent when the first copy is still
+  running after a quantile of recent latencies, whichever answers first wins;
+* balancing over several endpoints (see :mod:`gpu_services.llm_balancer`):
+  every attempt goes to the least loaded healthy endpoint, retries and
+  hedges prefer endpoints the request has not been sent to yet, and
+  endpoints that keep failing are ejected until a probe succeeds. When
+  every endpoint is ejected, requests fail fast with
+  :class:`~gpu_services.llm_balancer.CircuitOpenError`.
+
+Streaming requests are retried until their response headers arrive; once
+text is flowing a failure is final. They are never hedged.
+
+:func:`build_llm_client` creates the pooled client itself: HTTP/2 keep-alive
+connections (when the optional ``h2`` package is installed) with as many
+pooled connections as the service can have requests in flight.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import importlib.util
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent import futures
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Final
+
+import httpx
+import numpy as np
+
+from gpu_services.env import get_float_env, get_int_env
+from gpu_services.llm_balancer import CircuitOpenError, LeastOutstandingBalancer
+from gpu_services.metrics import REGISTRY, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping, Sequence
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS: Final = 3
+DEFAULT_BACKOFF_SECONDS: Final = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS: Final = 8.0
+DEFAULT_HEDGE_MIN_SAMPLES: Final = 20
+DEFAULT_BREAKER_FAILURES: Final = 5
+DEFAULT_BREAKER_RESET_SECONDS: Final = 30.0
+DEFAULT_KEEPALIVE_SECONDS: Final = 60.0
+DEFAULT_MAX_IN_FLIGHT: Final = 16
+# Recent successful latencies the hedge threshold is computed from.
+LATENCY_WINDOW: Final = 256
+ATTEMPT_BUCKETS: Final = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0)
+
+HTTP_TOO_MANY_REQUESTS: Final = 429
+HTTP_SERVER_ERROR_MIN: Final = 500
+
+_RETRYABLE_ERRORS: Final = (httpx.TimeoutException, httpx.TransportError)
+
+
+@dataclass(frozen=True)
+class TransportPolicy:
+    """Retry, hedging and circuit breaker settings of :class:`ResilientTransport`.
+
+    Attributes:
+        max_attempts: Requests sent per call, the first one included.
+        backoff_seconds: Upper bound of the jittered delay before the first retry;
+            it doubles with every further retry.
+        backoff_max_seconds: Cap of the backoff delay.
+        hedge_quantile: Latency quantile after which a duplicate request is sent;
+            ``0`` disables hedging.
+        hedge_min_samples: Latencies to observe before hedging starts.
+        breaker_failures: Consecutive failures that eject an endpoint; ``0`` disables it.
+        breaker_reset_seconds: How long an endpoint stays ejected before a probe.
+        http2: Use HTTP/2 when the ``h2`` package is installed.
+        max_in_flight: Requests callers send concurrently; bounds the hedging threads.
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    backoff_seconds: float = DEFAULT_BACKOFF_SECONDS
+    backoff_max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS
+    hedge_quantile: float = 0.0
+    hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES
+    breaker_failures: int = DEFAULT_BREAKER_FAILURES
+    breaker_reset_seconds: float = DEFAULT_BREAKER_RESET_SECONDS
+    http2: bool = True
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+
+    @classmethod
+    def from_env(cls) -> TransportPolicy:
+        """Load the policy from ``LLM_*`` environment variables."""
+        hedge_quantile = get_float_env('LLM_HEDGE_QUANTILE', 0.0, minimum=0.0)
+        if hedge_quantile >= 1:
+            message = 'LLM_HEDGE_QUANTILE must be smaller than 1'
+            raise RuntimeError(message)
+        return cls(
+            max_attempts=get_int_env('LLM_MAX_ATTEMPTS', DEFAULT_MAX_ATTEMPTS, minimum=1),
+            backoff_seconds=get_float_env(
+                'LLM_RETRY_BACKOFF_SECONDS',
+                DEFAULT_BACKOFF_SECONDS,
+                minimum=0.0,
+            ),
+            backoff_max_seconds=get_float_env(
+                'LLM_RETRY_BACKOFF_MAX_SECONDS',
+                DEFAULT_BACKOFF_MAX_SECONDS,
+                minimum=0.0,
+            ),
+            hedge_quantile=hedge_quantile,
+            hedge_min_samples=get_int_env(
+                'LLM_HEDGE_MIN_SAMPLES',
+                DEFAULT_HEDGE_MIN_SAMPLES,
+                minimum=1,
+            ),
+            breaker_failures=get_int_env(
+                'LLM_BREAKER_FAILURES',
+                DEFAULT_BREAKER_FAILURES,
+                minimum=0,
+            ),
+            breaker_reset_seconds=get_float_env(
+                'LLM_BREAKER_RESET_SECONDS',
+                DEFAULT_BREAKER_RESET_SECONDS,
+                minimum=0.0,
+            ),
+            http2=os.getenv('LLM_HTTP2', '1').strip() not in {'0', 'false', 'no'},
+        )
+
+
+class LatencyWindow:
+    """Sliding window of recent request latencies."""
+
+    def __init__(self, size: int = LATENCY_WINDOW) -> None:
+        """Keep the latest *size* observations."""
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of observations in the window."""
+        return len(self._samples)
+
+    def observe(self, seconds: float) -> None:
+        """Add one latency."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float) -> float:
+        """Return the *q* quantile of the window."""
+        with self._lock:
+            samples = np.fromiter(self._samples, dtype=np.float64)
+        return float(np.quantile(samples, q))
+
+
+class ResilientTransport:
+    """Send LLM API requests with retries, hedging and balancing over endpoints."""
+
+    def __init__(
+        self,
+        backends: Sequence[tuple[httpx.Client, float]],
+        policy: TransportPolicy | None = None,
+        *,
+        name: str = 'llm',
+        registry: MetricsRegistry = REGISTRY,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Balance over ``(client, weight)`` pairs; metrics use the *name* prefix.
+
+        Hedging runs at most two attempts per request on threads of its own,
+        sized from the policy's ``max_in_flight``; a request that finds them
+        all busy is sent unhedged on the caller's thread.
+        """
+        self._policy = policy or TransportPolicy()
+        self._sleep = sleep
+        self._rng = random.Random()
+        self._balancer = LeastOutstandingBalancer(
+            backends,
+            failure_threshold=self._policy.breaker_failures,
+            reset_seconds=self._policy.breaker_reset_seconds,
+        )
+        self._latencies = LatencyWindow()
+        self._hedge_executor: futures.ThreadPoolExecutor | None = None
+        # One slot per hedging thread, held by an attempt until it finishes.
+        self._hedge_slots = threading.BoundedSemaphore(2 * self._policy.max_in_flight)
+        if self._policy.hedge_quantile > 0:
+            self._hedge_executor = futures.ThreadPoolExecutor(
+                max_workers=2 * self._policy.max_in_flight,
+                thread_name_prefix=f'{name}-hedge',
+            )
+
+        self._registry = registry
+        self._name = name
+        self._retries = registry.counter(f'{name}_retries_total', 'Requests sent again')
+        self._hedges = registry.counter(f'{name}_hedges_total', 'Hedged duplicate requests sent')
+        self._hedge_wins = registry.counter(
+            f'{name}_hedge_wins_total',
+            'Hedged duplicates that answered before the original request',
+        )
+        self._rejections = registry.counter(
+            f'{name}_circuit_rejections_total',
+            'Requests refused while every endpoint was ejected',
+        )
+
+    @property
+    def balancer(self) -> LeastOutstandingBalancer[httpx.Client]:
+        """Return the balancer that picks the client of every attempt."""
+        return self._balancer
+
+    def close(self) -> None:
+        """Close the HTTP clients and stop the hedging threads."""
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False, cancel_futures=True)
+        for client in self._balancer.backends:
+            client.close()
+
+    def post(self, path: str, *, content: bytes) -> httpx.Response:
+        """POST *content* to *path* and return the first acceptable response.
+
+        Retries go to endpoints the request has not failed on yet, when
+        there are any. Responses that are still retryable after the last
+        attempt are returned as they are, so the caller sees the final
+        status code.
+
+        Raises:
+            CircuitOpenError: If every endpoint is ejected.
+            httpx.TimeoutException: If the last attempt timed out.
+            httpx.TransportError: If the last attempt could not reach the API.
+        """
+        tried: set[httpx.Client] = set()
+        attempt = 1
+        while True:
+            response, error = self._outcome(functools.partial(self._send, path, content, tried))
+            last_attempt = attempt >= self._policy.max_attempts
+            if error is not None and (last_attempt or not isinstance(error, _RETRYABLE_ERRORS)):
+                raise error
+            if response is not None and (last_attempt or not _is_retryable(response)):
+                return response
+            self._wait_before_retry(attempt, response, error)
+            attempt += 1
+
+    @contextlib.contextmanager
+    def stream(self, path: str, *, content: bytes) -> Iterator[httpx.Response]:
+        """POST *content* to *path* and yield the streaming response.
+
+        Attempts are repeated until response headers with a non-retryable
+        status arrive; the body is never replayed.
+        """
+        tried: set[httpx.Client] = set()
+        attempt = 1
+        while True:
+            with contextlib.ExitStack() as stack:
+                response, error = self._outcome(
+                    functools.partial(self._open_stream, stack, path, content, tried),
+                )
+                last_attempt = attempt >= self._policy.max_attempts
+                if error is not None and (last_attempt or not isinstance(error, _RETRYABLE_ERRORS)):
+                    raise error
+                if response is not None and (last_attempt or not _is_retryable(response)):
+                    yield response
+                    return
+            self._wait_before_retry(attempt, response, error)
+            attempt += 1
+
+    @staticmethod
+    def _outcome(
+        send: Callable[[], httpx.Response],
+    ) -> tuple[httpx.Response | None, Exception | None]:
+        """Run *send* and return its response or the exception it raised."""
+        try:
+            return send(), None
+        except Exception as exc:  # noqa: BLE001 - classified by the retry loop
+            return None, exc
+
+    def _wait_before_retry(
+        self,
+        attempt: int,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> None:
+        """Sleep for the jittered backoff of *attempt* before the next one."""
+        ceiling = min(
+            self._policy.backoff_max_seconds,
+            self._policy.backoff_seconds * 2 ** (attempt - 1),
+        )
+        delay = self._rng.uniform(0.0, ceiling)
+        if response is not None:
+            delay = max(delay, min(_retry_after(response), self._policy.backoff_max_seconds))
+            reason = f'HTTP {response.status_code}'
+        else:
+            reason = repr(error)
+        LOGGER.warning(
+            'LLM API attempt %d/%d failed (%s); retrying in %.2f s',
+            attempt,
+            self._policy.max_attempts,
+            reason,
+            delay,
+        )
+        self._retries.inc()
+        self._sleep(delay)
+
+    def _send(self, path: str, content: bytes, tried: set[httpx.Client]) -> httpx.Response:
+        """Send one request, hedging it to another endpoint when it runs long."""
+        primary_lease = _Lease(self._balancer, self._acquire(tried))
+        hedge_after = self._hedge_delay()
+        executor = self._hedge_executor
+        if hedge_after is None or executor is None or not self._hedge_slots.acquire(blocking=False):
+            return self._attempt(primary_lease, path, content)
+
+        primary = executor.submit(self._hedged_attempt, primary_lease, path, content)
+        done, _ = futures.wait([primary], timeout=hedge_after)
+        if done or not self._hedge_slots.acquire(blocking=False):
+            return primary.result()
+        try:
+            backup_client = self._balancer.acquire(avoid=tried)
+        except CircuitOpenError:
+            self._hedge_slots.release()
+            return primary.result()
+        tried.add(backup_client)
+        backup_lease = _Lease(self._balancer, backup_client)
+
+        self._hedges.inc()
+        LOGGER.debug('LLM API request exceeded %.2f s; sending a hedged duplicate', hedge_after)
+        backup = executor.submit(self._hedged_attempt, backup_lease, path, content)
+        try:
+            return self._first_acceptable(primary, backup)
+        finally:
+            # httpx cannot interrupt a request already on the wire, so the losing
+            # copy runs on, but it no longer counts against its endpoint's load.
+            primary_lease.release()
+            backup_lease.release()
+
+    def _first_acceptable(
+        self,
+        primary: futures.Future[httpx.Response],
+        backup: futures.Future[httpx.Response],
+    ) -> httpx.Response:
+        """Return the first acceptable response of a hedged pair, else the last one."""
+        pending = {primary, backup}
+        fallback = primary
+        while pending:
+            done, pending = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                fallback = future
+                if future.exception() is None and not _is_retryable(future.result()):
+                    if future is backup:
+                        self._hedge_wins.inc()
+                    return future.result()
+        # Both copies failed: report the one that finished last.
+        return fallback.result()
+
+    def _acquire(self, tried: set[httpx.Client]) -> httpx.Client:
+        """Reserve a client for the next attempt, preferring ones not in *tried*."""
+        try:
+            client = self._balancer.acquire(avoid=tried)
+        except CircuitOpenError:
+            self._rejections.inc()
+            raise
+        tried.add(client)
+        return client
+
+    def _hedge_delay(self) -> float | None:
+        """Return how long to wait before hedging, or ``None`` when not hedging."""
+        policy = self._policy
+        if policy.hedge_quantile <= 0 or len(self._latencies) < policy.hedge_min_samples:
+            return None
+        return self._latencies.quantile(policy.hedge_quantile)
+
+    def _attempt(self, lease: _Lease, path: str, content: bytes) -> httpx.Response:
+        """Send one request with the leased client and release it afterwards."""
+        client = lease.client
+        try:
+            return self._measured(client, lambda: client.post(path, content=content))
+        finally:
+            lease.release()
+
+    def _hedged_attempt(self, lease: _Lease, path: str, content: bytes) -> httpx.Response:
+        """Run :meth:`_attempt` on a hedging thread and free its slot afterwards."""
+        try:
+            return self._attempt(lease, path, content)
+        finally:
+            self._hedge_slots.release()
+
+    def _open_stream(
+        self,
+        stack: contextlib.ExitStack,
+        path: str,
+        content: bytes,
+        tried: set[httpx.Client],
+    ) -> httpx.Response:
+        """Open one streaming request inside *stack*, which releases its client on exit."""
+        client = self._acquire(tried)
+        stack.callback(self._balancer.release, client)
+
+        def _open() -> httpx.Response:
+            response = stack.enter_context(client.stream('POST', path, content=content))
+            if response.is_error:
+                response.read()
+            return response
+
+        # Only the headers have arrived at this point. That is not comparable
+        # with a complete unary response, so it stays out of the hedge window.
+        return self._measured(client, _open, hedge_sample=False)
+
+    def _measured(
+        self,
+        client: httpx.Client,
+        send: Callable[[], httpx.Response],
+        *,
+        hedge_sample: bool = True,
+    ) -> httpx.Response:
+        """Run *send*, export its latency and report its outcome for *client*.
+
+        Successful latencies feed the hedge threshold when *hedge_sample* is set.
+        """
+        started = time.perf_counter()
+        try:
+            response = send()
+        except httpx.TimeoutException:
+            self._record(client, time.perf_counter() - started, 'timeout')
+            raise
+        except httpx.TransportError:
+            self._record(client, time.perf_counter() - started, 'transport_error')
+            raise
+        except BaseException:
+            # Any other failure must still settle the endpoint's breaker, or a
+            # half-open probe would stay outstanding forever.
+            self._record(client, time.perf_counter() - started, 'error')
+            raise
+
+        elapsed = time.perf_counter() - started
+        if _is_retryable(response):
+            self._record(client, elapsed, f'http_{response.status_code}')
+        else:
+            self._record(client, elapsed, 'ok')
+            if hedge_sample:
+                self._latencies.observe(elapsed)
+        return response
+
+    def _record(self, client: httpx.Client, seconds: float, outcome: str) -> None:
+        """Export one attempt and update the health of *client*'s endpoint."""
+        endpoint = str(client.base_url)
+        self._registry.histogram(
+            f'{self._name}_attempt_seconds',
+            'Latency of individual LLM API attempts by endpoint and outcome',
+            buckets=ATTEMPT_BUCKETS,
+            labels={'endpoint': endpoint, 'outcome': outcome},
+        ).observe(seconds)
+        # Ejection is decided when the attempt completes; the outstanding count
+        # is released separately once the response is no longer in use.
+        self._balancer.report(client, success=outcome == 'ok')
+        self._registry.gauge(
+            f'{self._name}_endpoint_ejected',
+            'Whether an LLM API endpoint is ejected after repeated failures',
+            labels={'endpoint': endpoint},
+        ).set(1.0 if self._balancer.is_ejected(client) else 0.0)
+
+
+class _Lease:
+    """Balancer reservation of one client that is released at most once."""
+
+    def __init__(self, balancer: LeastOutstandingBalancer[httpx.Client], client: httpx.Client):
+        """Hold the reservation of *client* made on *balancer*."""
+        self._balancer = balancer
+        self.client = client
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        """Hand the client back to the balancer unless that already happened."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._balancer.release(self.client)
+
+
+def build_llm_client(
+    *,
+    base_url: str,
+    headers: Mapping[str, str],
+    timeout: float,
+    pool_size: int,
+    http2: bool = True,
+) -> httpx.Client:
+    """Return an HTTP client with *pool_size* keep-alive connections.
+
+    HTTP/2 multiplexes concurrent requests over those connections; it is
+    used when requested and the ``h2`` package is installed.
+    """
+    if http2 and importlib.util.find_spec('h2') is None:
+        LOGGER.warning('The h2 package is not installed; the LLM API client uses HTTP/1.1')
+        http2 = False
+    return httpx.Client(
+        base_url=base_url,
+        headers=dict(headers),
+        timeout=timeout,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=DEFAULT_KEEPALIVE_SECONDS,
+        ),
+    )
+
+
+def _is_retryable(response: httpx.Response) -> bool:
+    """Return whether *response* is worth sending the request again."""
+    return (
+        response.status_code == HTTP_TOO_MANY_REQUESTS
+        or response.status_code >= HTTP_SERVER_ERROR_MIN
+    )
+
+
+def _retry_after(response: httpx.Response) -> float:
+    """Return the delay requested by a ``Retry-After`` header, ``0`` when absent."""
+    raw_value = response.headers.get('Retry-After', '').strip()
+    if not raw_value:
+        return 0.0
+    if raw_value.isdigit():
+        return float(raw_value)
+    try:
+        retry_at = parsedate_to_datetime(raw_value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+__all__: Final = (
+    'DEFAULT_BACKOFF_MAX_SECONDS',
+    'DEFAULT_BACKOFF_SECONDS',
+    'DEFAULT_BREAKER_FAILURES',
+    'DEFAULT_BREAKER_RESET_SECONDS',
+    'DEFAULT_MAX_ATTEMPTS',
+    'DEFAULT_MAX_IN_FLIGHT',
+    'LatencyWindow',
+    'ResilientTransport',
+    'TransportPolicy',
+    'build_llm_client',
+)
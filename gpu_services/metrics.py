@@ -0,0 +1,309 @@
+"""Lightweight in-process metrics shared by the GPU services."""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, ClassVar, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS: Final = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BATCH_SIZE_BUCKETS: Final = (1, 2, 4, 8, 16, 32, 64)
+
+_LabelSet = tuple[tuple[str, str], ...]
+
+
+def _freeze_labels(labels: Mapping[str, str] | None) -> _LabelSet:
+    """Return a hashable, ordered representation of metric labels."""
+    if not labels:
+        return ()
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: _LabelSet, extra: Iterable[tuple[str, str]] = ()) -> str:
+    """Render labels using the Prometheus text exposition format."""
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ''
+    rendered = ','.join(f'{key}="{value}"' for key, value in pairs)
+    return f'{{{rendered}}}'
+
+
+@dataclass
+class Counter:
+    """Monotonically increasing counter."""
+
+    kind: ClassVar[str] = 'counter'
+
+    name: str
+    labels: _LabelSet = ()
+    _value: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the counter by *amount*."""
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        """Return the current counter value."""
+        return self._value
+
+    def render(self) -> list[str]:
+        """Return exposition lines for the counter."""
+        return [f'{self.name}{_format_labels(self.labels)} {self._value}']
+
+
+@dataclass
+class Gauge:
+    """Value that can go up and down."""
+
+    kind: ClassVar[str] = 'gauge'
+
+    name: str
+    labels: _LabelSet = ()
+    _value: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def set(self, value: float) -> None:
+        """Replace the gauge value."""
+        with self._lock:
+            self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increase the gauge by *amount*."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrease the gauge by *amount*."""
+        with self._lock:
+            self._value -= amount
+
+    @property
+    def value(self) -> float:
+        """Return the current gauge value."""
+        return self._value
+
+    def render(self) -> list[str]:
+        """Return exposition lines for the gauge."""
+        return [f'{self.name}{_format_labels(self.labels)} {self._value}']
+
+
+@dataclass
+class Histogram:
+    """Cumulative histogram with fixed upper bounds."""
+
+    kind: ClassVar[str] = 'histogram'
+
+    name: str
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    labels: _LabelSet = ()
+    _counts: list[int] = field(default_factory=list, repr=False)
+    _sum: float = 0.0
+    _count: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.buckets = tuple(sorted(self.buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a single observation."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    @property
+    def count(self) -> int:
+        """Return the number of recorded observations."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Return the sum of recorded observations."""
+        return self._sum
+
+    def bucket_counts(self) -> dict[float, int]:
+        """Return cumulative observation counts keyed by bucket upper bound."""
+        with self._lock:
+            counts = list(self._counts)
+        cumulative: dict[float, int] = {}
+        running = 0
+        for bound, count in zip((*self.buckets, float('inf')), counts, strict=True):
+            running += count
+            cumulative[bound] = running
+        return cumulative
+
+    def render(self) -> list[str]:
+        """Return exposition lines for the histogram."""
+        lines = []
+        for bound, count in self.bucket_counts().items():
+            upper = '+Inf' if bound == float('inf') else f'{bound:g}'
+            lines.append(
+                f'{self.name}_bucket{_format_labels(self.labels, [("le", upper)])} {count}'
+            )
+        lines.append(f'{self.name}_sum{_format_labels(self.labels)} {self._sum}')
+        lines.append(f'{self.name}_count{_format_labels(self.labels)} {self._count}')
+        return lines
+
+
+Metric = Counter | Gauge | Histogram
+
+
+class MetricsRegistry:
+    """Thread-safe collection of named metrics."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[tuple[str, _LabelSet], Metric] = {}
+        self._descriptions: dict[str, str] = {}
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        labels: Mapping[str, str] | None = None,
+    ) -> Counter:
+        """Return the counter registered under *name*, creating it on first use."""
+        frozen = _freeze_labels(labels)
+        metric = self._get_or_create(name, description, frozen, lambda: Counter(name, frozen))
+        if not isinstance(metric, Counter):
+            message = f'Metric {name} is not a counter'
+            raise TypeError(message)
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labels: Mapping[str, str] | None = None,
+    ) -> Gauge:
+        """Return the gauge registered under *name*, creating it on first use."""
+        frozen = _freeze_labels(labels)
+        metric = self._get_or_create(name, description, frozen, lambda: Gauge(name, frozen))
+        if not isinstance(metric, Gauge):
+            message = f'Metric {name} is not a gauge'
+            raise TypeError(message)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+        labels: Mapping[str, str] | None = None,
+    ) -> Histogram:
+        """Return the histogram registered under *name*, creating it on first use."""
+        frozen = _freeze_labels(labels)
+        metric = self._get_or_create(
+            name,
+            description,
+            frozen,
+            lambda: Histogram(name, tuple(buckets), frozen),
+        )
+        if not isinstance(metric, Histogram):
+            message = f'Metric {name} is not a histogram'
+            raise TypeError(message)
+        return metric
+
+    def _get_or_create(
+        self,
+        name: str,
+        description: str,
+        labels: _LabelSet,
+        factory: Callable[[], Metric],
+    ) -> Metric:
+        key = (name, labels)
+        with self._lock:
+            metric = self._metrics.get(key)
+            if metric is None:
+                metric = factory()
+                self._metrics[key] = metric
+                self._descriptions.setdefault(name, description)
+            return metric
+
+    def render(self) -> str:
+        """Render every registered metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.items(), key=lambda item: item[0])
+            descriptions = dict(self._descriptions)
+
+        lines: list[str] = []
+        seen: set[str] = set()
+        for (name, _), metric in metrics:
+            if name not in seen:
+                seen.add(name)
+                lines.append(f'# HELP {name} {descriptions.get(name, name)}')
+                lines.append(f'# TYPE {name} {metric.kind}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY: Final = MetricsRegistry()
+
+
+def start_metrics_server(
+    port: int,
+    registry: MetricsRegistry = REGISTRY,
+    host: str = '0.0.0.0',  # noqa: S104
+) -> ThreadingHTTPServer:
+    """Expose *registry* over HTTP on ``/metrics`` from a daemon thread."""
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802 - http.server naming convention
+            if self.path.rstrip('/') not in {'', '/metrics'}:
+                self.send_error(404)
+                return
+            body = registry.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            LOGGER.debug(format, *args)
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    thread = threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True)
+    thread.start()
+    LOGGER.info('Serving metrics on port %s', port)
+    return server
+
+
+def start_metrics_server_from_env(env_name: str) -> ThreadingHTTPServer | None:
+    """Start the metrics endpoint when *env_name* holds a port number."""
+    raw_port = os.getenv(env_name, '').strip()
+    if not raw_port:
+        return None
+    try:
+        port = int(raw_port)
+    except ValueError as exc:
+        message = f'{env_name} must be a valid port number'
+        raise RuntimeError(message) from exc
+    return start_metrics_server(port)
+
+
+__all__: Final = (
+    'BATCH_SIZE_BUCKETS',
+    'DEFAULT_BUCKETS',
+    'REGISTRY',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'MetricsRegistry',
+    'start_metrics_server',
+    'start_metrics_server_from_env',
+)
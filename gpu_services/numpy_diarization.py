@@ -0,0 +1,300 @@
+"""CPU diarization with nothing but NumPy, for hosts without NeMo.
+
+The pipeline has the same shape as :mod:`gpu_services.inmemory_diarization`
+with every model replaced by signal processing: the energy detector from
+:mod:`gpu_services.vad` finds speech, each embedding window is described by
+its mean liftered MFCCs, and windows are grouped by average-linkage
+agglomeration on Euclidean distance. It separates voices with clearly
+different pitch and timbre; similar voices are better served by the NeMo
+backend.
+
+Cepstra are computed once per speech region and window means come from
+cumulative sums, so the cost is dominated by one FFT per 10 ms of speech.
+Clustering keeps a pairwise distance matrix over the windows, so long
+recordings are clustered on an evenly spaced subset of at most
+``max_clustered_windows`` windows and every window then joins the nearest
+speaker mean.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from gpu_services.audio import TARGET_SAMPLE_RATE
+from gpu_services.clustering import (
+    agglomerative_cluster_by_distance,
+    relabel_by_first_appearance,
+    speaker_centroids,
+)
+from gpu_services.inmemory_diarization import (
+    InMemoryDiarizationSettings,
+    SpeakerDiarization,
+    plan_embedding_windows,
+    windows_to_segments,
+)
+from gpu_services.vad import VadSettings, detect_speech
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.audio import AudioSource
+    from gpu_services.inmemory_diarization import DiarizedSegment, EmbeddingWindow
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_MAX_DISTANCE: Final = 'DIARIZATION_NUMPY_MAX_DISTANCE'
+DEFAULT_MAX_DISTANCE: Final = 8.0
+# About 25 minutes of speech at the default window shift.
+DEFAULT_MAX_CLUSTERED_WINDOWS: Final = 1000
+
+_READ_BLOCK_SECONDS: Final = 60.0
+_MIN_FREQUENCY_HZ: Final = 20.0
+_MAX_FREQUENCY_HZ: Final = 7600.0
+_LIFTER_SCALE: Final = 10.0
+_EPSILON: Final = 1e-10
+
+
+@dataclass(frozen=True)
+class NumpyDiarizationSettings:
+    """Feature, window and clustering parameters of the NumPy pipeline.
+
+    Embedding windows are longer than the NeMo defaults because averaged
+    cepstra need a few seconds of speech to settle. ``max_distance`` is the
+    largest average distance between two window clusters that are still
+    considered one speaker; lower it to split similar voices.
+    ``max_clustered_windows`` bounds the pairwise distance matrix.
+    """
+
+    frame_seconds: float = 0.025
+    hop_seconds: float = 0.01
+    num_mels: int = 40
+    num_cepstra: int = 20
+    embedding_window_seconds: float = 3.0
+    embedding_shift_seconds: float = 1.5
+    min_embedding_seconds: float = 0.5
+    max_distance: float = DEFAULT_MAX_DISTANCE
+    max_clustered_windows: int = DEFAULT_MAX_CLUSTERED_WINDOWS
+    vad: VadSettings = field(default_factory=VadSettings)
+
+    @classmethod
+    def from_env(cls) -> NumpyDiarizationSettings:
+        """Load the clustering threshold and VAD settings from the environment."""
+        raw_value = os.getenv(ENV_MAX_DISTANCE, '').strip()
+        try:
+            max_distance = float(raw_value) if raw_value else DEFAULT_MAX_DISTANCE
+        except ValueError as exc:
+            message = f'{ENV_MAX_DISTANCE} must be a number'
+            raise RuntimeError(message) from exc
+        if max_distance <= 0:
+            message = f'{ENV_MAX_DISTANCE} must be greater than 0'
+            raise RuntimeError(message)
+        return cls(max_distance=max_distance, vad=VadSettings.from_env())
+
+
+def mel_filterbank(
+    num_mels: int,
+    fft_size: int,
+    sample_rate: int,
+) -> NDArray[np.float64]:
+    """Return triangular mel filters as a ``[num_mels, fft_size // 2 + 1]`` matrix."""
+    high = min(_MAX_FREQUENCY_HZ, sample_rate / 2.0)
+    mel_edges = np.linspace(_hz_to_mel(_MIN_FREQUENCY_HZ), _hz_to_mel(high), num_mels + 2)
+    edges = 700.0 * (10.0 ** (mel_edges / 2595.0) - 1.0)
+    bins = np.fft.rfftfreq(fft_size, 1.0 / sample_rate)
+    lower, centre, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins[None, :] - lower) / (centre - lower)
+    falling = (upper - bins[None, :]) / (upper - centre)
+    return np.maximum(np.minimum(rising, falling), 0.0)
+
+
+def _hz_to_mel(frequency: float) -> float:
+    """Convert a frequency to the HTK mel scale."""
+    return 2595.0 * float(np.log10(1.0 + frequency / 700.0))
+
+
+def dct_matrix(num_cepstra: int, num_mels: int) -> NDArray[np.float64]:
+    """Return the orthonormal DCT-II rows that turn log mel energies into cepstra."""
+    rows = np.arange(num_cepstra)[:, None]
+    columns = np.arange(num_mels)[None, :]
+    return np.cos(np.pi * rows * (2 * columns + 1) / (2 * num_mels)) * np.sqrt(2.0 / num_mels)
+
+
+class NumpyDiarizer:
+    """Diarize an :class:`AudioSource` on the CPU without any model files."""
+
+    def __init__(
+        self,
+        settings: NumpyDiarizationSettings | None = None,
+        *,
+        sample_rate: int = TARGET_SAMPLE_RATE,
+    ) -> None:
+        """Precompute the analysis window, mel filterbank and DCT for *sample_rate*."""
+        self._settings = settings or NumpyDiarizationSettings()
+        self._sample_rate = sample_rate
+        settings = self._settings
+        self._frame = max(1, round(settings.frame_seconds * sample_rate))
+        self._hop = max(1, round(settings.hop_seconds * sample_rate))
+        fft_size = 1 << (self._frame - 1).bit_length()
+        self._fft_size = fft_size
+        self._analysis_window = np.hamming(self._frame)
+        self._filterbank = mel_filterbank(settings.num_mels, fft_size, sample_rate).T
+        # c0 only tracks loudness, so it is dropped; liftering evens out the
+        # scale of the remaining coefficients before distances are taken.
+        self._dct = dct_matrix(settings.num_cepstra, settings.num_mels)[1:].T
+        self._lifter = np.arange(1, settings.num_cepstra) / _LIFTER_SCALE
+        self._window_plan = InMemoryDiarizationSettings(
+            embedding_window_seconds=settings.embedding_window_seconds,
+            embedding_shift_seconds=settings.embedding_shift_seconds,
+            min_embedding_seconds=settings.min_embedding_seconds,
+        )
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate the features are computed at."""
+        return self._sample_rate
+
+    @property
+    def settings(self) -> NumpyDiarizationSettings:
+        """Return the active pipeline settings."""
+        return self._settings
+
+    def cepstra(self, samples: NDArray[np.floating[Any]]) -> NDArray[np.float64]:
+        """Return liftered MFCCs without c0, one row per ``hop_seconds`` frame."""
+        if len(samples) < self._frame:
+            return np.zeros((0, len(self._lifter)), dtype=np.float64)
+        frames = sliding_window_view(np.asarray(samples, dtype=np.float64), self._frame)
+        frames = frames[:: self._hop] * self._analysis_window
+        power = np.abs(np.fft.rfft(frames, self._fft_size)) ** 2
+        log_mel = np.log(power @ self._filterbank + _EPSILON)
+        cepstra: NDArray[np.float64] = (log_mel @ self._dct) * self._lifter
+        return cepstra
+
+    def region_cepstra(self, source: AudioSource, start: float, end: float) -> NDArray[np.float64]:
+        """Return the cepstra of ``[start, end)`` seconds of *source*, read in blocks."""
+        rate = source.sample_rate
+        first = max(0, round(start * rate))
+        stop = min(source.num_samples, round(end * rate))
+        # Blocks are a whole number of hops, and each read overlaps the next
+        # block by one frame minus one hop, so frames tile the region exactly.
+        block = self._hop * max(1, round(_READ_BLOCK_SECONDS * rate / self._hop))
+        parts: list[NDArray[np.float64]] = []
+        for offset in range(first, stop, block):
+            samples = source.read(offset, min(offset + block + self._frame - self._hop, stop))
+            parts.append(self.cepstra(samples))
+        if not parts:
+            return np.zeros((0, len(self._lifter)), dtype=np.float64)
+        return np.concatenate(parts)
+
+    def embed_windows(
+        self,
+        source: AudioSource,
+        regions: Sequence[tuple[float, float]],
+        windows: Sequence[EmbeddingWindow],
+    ) -> NDArray[np.float64]:
+        """Return the mean cepstrum of every window, in order.
+
+        Windows are grouped by region, and each region's cepstra are only
+        computed once.
+        """
+        embeddings = np.zeros((len(windows), len(self._lifter)), dtype=np.float64)
+        hop_seconds = self._hop / source.sample_rate
+        position = 0
+        while position < len(windows):
+            region = windows[position].region
+            region_start, region_end = regions[region]
+            cepstra = self.region_cepstra(source, region_start, region_end)
+            totals = np.concatenate([np.zeros((1, cepstra.shape[1])), np.cumsum(cepstra, axis=0)])
+            while position < len(windows) and windows[position].region == region:
+                window = windows[position]
+                low = min(round((window.start - region_start) / hop_seconds), len(cepstra) - 1)
+                high = min(round((window.end - region_start) / hop_seconds), len(cepstra))
+                low, high = max(low, 0), max(high, low + 1)
+                if len(cepstra):
+                    embeddings[position] = (totals[high] - totals[low]) / (high - low)
+                position += 1
+        return embeddings
+
+    def cluster_windows(self, embeddings: NDArray[np.float64]) -> NDArray[np.int64]:
+        """Group window embeddings into speakers numbered by first appearance.
+
+        Above ``max_clustered_windows`` windows, an evenly spaced subset is
+        clustered and every window is assigned to the nearest speaker mean,
+        so memory stays bounded however long the recording is.
+        """
+        settings = self._settings
+        count = len(embeddings)
+        limit = max(1, settings.max_clustered_windows)
+        if count <= limit:
+            return agglomerative_cluster_by_distance(
+                embeddings,
+                max_distance=settings.max_distance,
+            )
+
+        rows = np.linspace(0, count - 1, num=limit).round().astype(int)
+        sample_labels = agglomerative_cluster_by_distance(
+            embeddings[rows],
+            max_distance=settings.max_distance,
+        )
+        num_speakers = int(sample_labels.max()) + 1
+        means = np.zeros((num_speakers, embeddings.shape[1]))
+        np.add.at(means, sample_labels, embeddings[rows])
+        means /= np.bincount(sample_labels, minlength=num_speakers)[:, None]
+        # Squared distances up to a per-row constant, without an [N, k, d] array.
+        distances = (means**2).sum(axis=1)[None, :] - 2.0 * embeddings @ means.T
+        LOGGER.debug('Clustered %d of %d window(s) and assigned the rest', limit, count)
+        return relabel_by_first_appearance(np.argmin(distances, axis=1).astype(np.int64))
+
+    def diarize(self, source: AudioSource) -> list[DiarizedSegment]:
+        """Run VAD, feature extraction and clustering over *source*."""
+        return self.diarize_with_centroids(source).segments
+
+    def diarize_with_centroids(
+        self,
+        source: AudioSource,
+        regions: Sequence[tuple[float, float]] | None = None,
+    ) -> SpeakerDiarization:
+        """Diarize *source* and keep the mean embedding of every speaker.
+
+        Row ``n`` of the returned centroids belongs to speaker ``n``.
+
+        Args:
+            source: Audio to diarize.
+            regions: Precomputed ``(start, end)`` speech regions in seconds.
+                The energy detector runs when they are omitted.
+        """
+        settings = self._settings
+        if regions is None:
+            regions = detect_speech(source, settings.vad)
+        windows = plan_embedding_windows(regions, self._window_plan)
+        if not windows:
+            return SpeakerDiarization([], np.zeros((0, 0), dtype=np.float64))
+        embeddings = self.embed_windows(source, regions, windows)
+        labels = self.cluster_windows(embeddings)
+        LOGGER.debug(
+            'Clustered %d window(s) into %d speaker(s)',
+            len(windows),
+            int(labels.max()) + 1,
+        )
+        return SpeakerDiarization(
+            segments=windows_to_segments(regions, windows, labels.tolist()),
+            centroids=speaker_centroids(embeddings, labels),
+        )
+
+
+__all__: Final = (
+    'DEFAULT_MAX_CLUSTERED_WINDOWS',
+    'DEFAULT_MAX_DISTANCE',
+    'ENV_MAX_DISTANCE',
+    'NumpyDiarizationSettings',
+    'NumpyDiarizer',
+    'dct_matrix',
+    'mel_filterbank',
+)
@@ -0,0 +1,240 @@
+"""Serve one port from several forked processes that share the loaded model.
+
+The parent process loads the model once and then forks the workers. Model
+weights are never written after loading, so the workers keep sharing the
+parent's pages copy-on-write and every extra worker costs little more than
+its own activations. Each worker starts its own gRPC server on the same
+port with ``SO_REUSEPORT`` and the kernel spreads new connections across
+them.
+
+Forking has two preconditions that :func:`ensure_fork_safe` checks: the
+parent must not have created a gRPC server or channel yet, and CUDA must
+not be initialised, because neither survives ``fork``. Preforking is
+therefore meant for CPU hosts; GPU hosts scale with the resource pools
+inside one process instead. Threads do not survive ``fork`` either, so
+services restart their background threads in the worker.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gc
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import TYPE_CHECKING, Final, Protocol
+
+from gpu_services.metrics import start_metrics_server
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from http.server import ThreadingHTTPServer
+    from types import FrameType
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STOP_GRACE_SECONDS: Final = 30.0
+DEFAULT_RESTART_DELAY_SECONDS: Final = 1.0
+# Server option that lets every worker bind the shared port.
+REUSE_PORT_OPTIONS: Final = (('grpc.so_reuseport', 1),)
+
+
+class _StoppableServer(Protocol):
+    """Subset of ``grpc.Server`` used to stop a worker gracefully."""
+
+    def stop(self, grace: float | None) -> object:
+        """Stop accepting calls and cancel the rest after *grace* seconds."""
+
+
+def resolve_prefork_workers(env_name: str) -> int:
+    """Return the number of worker processes configured in *env_name*; ``0`` disables forking."""
+    raw_value = os.getenv(env_name, '').strip()
+    if not raw_value:
+        return 0
+    try:
+        workers = int(raw_value)
+    except ValueError as exc:
+        message = f'{env_name} must be a valid integer'
+        raise RuntimeError(message) from exc
+    if workers < 0:
+        message = f'{env_name} must not be negative'
+        raise RuntimeError(message)
+    return workers
+
+
+def ensure_fork_safe() -> None:
+    """Raise :class:`RuntimeError` when the current process cannot be forked safely."""
+    if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+        message = 'Preforked serving needs os.fork and SO_REUSEPORT (Linux)'
+        raise RuntimeError(message)
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_initialized():
+        message = 'Cannot fork after CUDA is initialised; preforked serving is CPU-only'
+        raise RuntimeError(message)
+
+
+@contextlib.contextmanager
+def reserve_port(port: int) -> Iterator[int]:
+    """Hold *port* with an ``SO_REUSEPORT`` socket while the workers bind it.
+
+    Binding fails right away if another program owns the port without
+    ``SO_REUSEPORT``, instead of in every worker. The socket never listens,
+    so it receives no connections.
+    """
+    family, host = (socket.AF_INET6, '::') if socket.has_ipv6 else (socket.AF_INET, '0.0.0.0')  # noqa: S104
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind((host, port))
+        yield sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+def stop_on_sigterm(server: _StoppableServer, grace: float = DEFAULT_STOP_GRACE_SECONDS) -> None:
+    """Let SIGTERM stop *server* gracefully so in-flight requests can finish."""
+
+    def _stop(*_: object) -> None:
+        LOGGER.info('Worker %d stopping with %.0f s grace', os.getpid(), grace)
+        server.stop(grace)
+
+    signal.signal(signal.SIGTERM, _stop)
+
+
+def start_worker_metrics_server(env_name: str, index: int) -> ThreadingHTTPServer | None:
+    """Start the metrics endpoint of worker *index* on the configured port plus *index*.
+
+    Every worker keeps its own counters, so each one needs its own port.
+    """
+    raw_port = os.getenv(env_name, '').strip()
+    if not raw_port:
+        return None
+    try:
+        port = int(raw_port)
+    except ValueError as exc:
+        message = f'{env_name} must be a valid port number'
+        raise RuntimeError(message) from exc
+    return start_metrics_server(port + index)
+
+
+class PreforkSupervisor:
+    """Fork worker processes and keep them running until the parent is told to stop.
+
+    ``worker_main(index)`` runs in every child. A worker that crashes is
+    forked again from the parent, which still holds the loaded model, so
+    restarts are fast. SIGTERM and SIGINT are forwarded to the workers as
+    SIGTERM; :meth:`run` returns once all of them have exited.
+    """
+
+    def __init__(
+        self,
+        worker_main: Callable[[int], None],
+        num_workers: int,
+        *,
+        name: str,
+        restart_delay: float = DEFAULT_RESTART_DELAY_SECONDS,
+    ) -> None:
+        """Prepare to run *num_workers* copies of *worker_main*."""
+        if num_workers < 1:
+            message = 'num_workers must be greater than 0'
+            raise ValueError(message)
+        self._worker_main = worker_main
+        self._num_workers = num_workers
+        self._name = name
+        self._restart_delay = restart_delay
+        self._workers: dict[int, int] = {}
+        self._stopping = False
+
+    @property
+    def worker_pids(self) -> dict[int, int]:
+        """Return the pid of every running worker mapped to its index."""
+        return dict(self._workers)
+
+    def run(self) -> None:
+        """Fork the workers and supervise them until all have exited."""
+        ensure_fork_safe()
+        # Objects that exist now are never collected in the workers, so the
+        # collector does not dirty the shared pages that hold them.
+        gc.freeze()
+        previous = {
+            signum: signal.signal(signum, self._forward_stop)
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+        try:
+            for index in range(self._num_workers):
+                self._spawn(index)
+            LOGGER.info('%s: %d worker(s) running', self._name, self._num_workers)
+            while self._workers:
+                pid, status = os.wait()
+                self._reap(pid, os.waitstatus_to_exitcode(status))
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+            gc.unfreeze()
+
+    def stop(self) -> None:
+        """Ask every worker to stop and stop restarting them."""
+        self._stopping = True
+        for pid in self._workers:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def _forward_stop(self, signum: int, frame: FrameType | None) -> None:
+        """Signal handler that stops the workers."""
+        del frame
+        LOGGER.info('%s: received signal %d, stopping workers', self._name, signum)
+        self.stop()
+
+    def _reap(self, pid: int, exit_code: int) -> None:
+        """Forget an exited worker and restart it if it crashed."""
+        index = self._workers.pop(pid, None)
+        if index is None:
+            return
+        if self._stopping or exit_code == 0:
+            LOGGER.info('%s: worker %d (pid %d) exited', self._name, index, pid)
+            return
+        LOGGER.warning(
+            '%s: worker %d (pid %d) died with exit code %d; restarting',
+            self._name,
+            index,
+            pid,
+            exit_code,
+        )
+        time.sleep(self._restart_delay)
+        if not self._stopping:
+            self._spawn(index)
+
+    def _spawn(self, index: int) -> None:
+        """Fork worker *index*; the child never returns from this call."""
+        pid = os.fork()
+        if pid:
+            self._workers[pid] = index
+            return
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        exit_code = 0
+        try:
+            self._worker_main(index)
+        except BaseException:
+            LOGGER.exception('%s: worker %d failed', self._name, index)
+            exit_code = 1
+        finally:
+            logging.shutdown()
+            os._exit(exit_code)
+
+
+__all__: Final = (
+    'DEFAULT_RESTART_DELAY_SECONDS',
+    'DEFAULT_STOP_GRACE_SECONDS',
+    'REUSE_PORT_OPTIONS',
+    'PreforkSupervisor',
+    'ensure_fork_safe',
+    'reserve_port',
+    'resolve_prefork_workers',
+    'start_worker_metrics_server',
+    'stop_on_sigterm',
+)
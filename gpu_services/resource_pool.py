@@ -0,0 +1,91 @@
+"""Blocking pool of interchangeable, non-thread-safe resources."""
+
+from __future__ import annotations
+
+import contextlib
+import queue
+import time
+from typing import TYPE_CHECKING, Final, Generic, TypeVar
+
+from gpu_services.metrics import REGISTRY, MetricsRegistry
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+ResourceT = TypeVar('ResourceT')
+
+
+class ResourcePool(Generic[ResourceT]):
+    """Hand out each resource to at most one caller at a time.
+
+    Callers block in :meth:`acquire` until a resource is free. Pool size,
+    resources in use, callers waiting and the time spent waiting are exported
+    through *registry* under the ``{name}_pool_*`` prefix.
+    """
+
+    def __init__(
+        self,
+        resources: Sequence[ResourceT],
+        *,
+        name: str,
+        registry: MetricsRegistry = REGISTRY,
+    ) -> None:
+        """Make *resources* available for exclusive use."""
+        if not resources:
+            message = 'A resource pool needs at least one resource'
+            raise ValueError(message)
+
+        self._size = len(resources)
+        self._idle: queue.Queue[ResourceT] = queue.Queue()
+        for resource in resources:
+            self._idle.put(resource)
+
+        registry.gauge(
+            f'{name}_pool_size',
+            'Number of resources in the pool',
+        ).set(self._size)
+        self._in_use = registry.gauge(
+            f'{name}_pool_in_use',
+            'Number of resources currently handed out',
+        )
+        self._waiting = registry.gauge(
+            f'{name}_pool_waiting',
+            'Number of callers blocked waiting for a resource',
+        )
+        self._wait_time = registry.histogram(
+            f'{name}_pool_wait_seconds',
+            'Time callers waited before a resource became free',
+        )
+
+    @property
+    def size(self) -> int:
+        """Return the number of resources managed by the pool."""
+        return self._size
+
+    @contextlib.contextmanager
+    def acquire(self, timeout: float | None = None) -> Iterator[ResourceT]:
+        """Borrow a resource for the duration of the ``with`` block.
+
+        Raises:
+            TimeoutError: If no resource became free within *timeout* seconds.
+        """
+        started = time.perf_counter()
+        self._waiting.inc()
+        try:
+            resource = self._idle.get(timeout=timeout)
+        except queue.Empty as exc:
+            message = f'No pooled resource became free within {timeout} seconds'
+            raise TimeoutError(message) from exc
+        finally:
+            self._waiting.dec()
+            self._wait_time.observe(time.perf_counter() - started)
+
+        self._in_use.inc()
+        try:
+            yield resource
+        finally:
+            self._in_use.dec()
+            self._idle.put(resource)
+
+
+__all__: Final = ('ResourcePool',)
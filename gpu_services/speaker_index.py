@@ -0,0 +1,295 @@
+"""On-disk store of speaker embeddings with a vectorised cosine-similarity index.
+
+The store is a directory holding three files:
+
+``index.json``
+    The embedding dimension.
+``embeddings.f32``
+    Unit-length little-endian float32 rows, appended in place.
+``speakers.txt``
+    One speaker id per line, row for row.
+
+Rows are only ever appended, so enrolling a meeting's speakers costs one
+write per file. Lookups memory-map the matrix and score every stored voice
+with a single matrix multiplication.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+from gpu_services.clustering import normalise_rows
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_INDEX_DIR: Final = 'DIARIZATION_SPEAKER_INDEX_DIR'
+ENV_MATCH_THRESHOLD: Final = 'DIARIZATION_SPEAKER_MATCH_THRESHOLD'
+DEFAULT_MATCH_THRESHOLD: Final = 0.7
+
+METADATA_FILE: Final = 'index.json'
+EMBEDDINGS_FILE: Final = 'embeddings.f32'
+SPEAKERS_FILE: Final = 'speakers.txt'
+_ROW_DTYPE: Final = np.dtype('<f4')
+
+
+class SpeakerIndexError(RuntimeError):
+    """Raised when the on-disk index is inconsistent or used incorrectly."""
+
+
+@dataclass(frozen=True)
+class SpeakerMatch:
+    """Stored speaker that resembles a query embedding."""
+
+    speaker_id: str
+    similarity: float
+
+
+def new_speaker_id() -> str:
+    """Return a fresh identifier for a speaker that is not in the index yet."""
+    return f'voice-{uuid.uuid4().hex[:12]}'
+
+
+def resolve_match_threshold() -> float:
+    """Return the minimum cosine similarity for a speaker match."""
+    raw_value = os.getenv(ENV_MATCH_THRESHOLD, str(DEFAULT_MATCH_THRESHOLD)).strip()
+    try:
+        threshold = float(raw_value)
+    except ValueError as exc:
+        message = f'{ENV_MATCH_THRESHOLD} must be a number'
+        raise RuntimeError(message) from exc
+    if not -1.0 <= threshold <= 1.0:
+        message = f'{ENV_MATCH_THRESHOLD} must be between -1 and 1'
+        raise RuntimeError(message)
+    return threshold
+
+
+class SpeakerIndex:
+    """Append-only matrix of speaker embeddings backed by a directory.
+
+    A speaker may own several rows, for example one centroid per meeting it
+    appeared in; searches report the best row per query. The index is safe to
+    share between threads, but only one process should append to a directory.
+    """
+
+    def __init__(self, directory: Path, *, dimension: int | None = None) -> None:
+        """Open (or create) the index stored in *directory*.
+
+        Args:
+            directory: Directory holding the index files.
+            dimension: Expected embedding dimension. Taken from the first
+                append when neither the caller nor the directory specifies it.
+
+        Raises:
+            SpeakerIndexError: If the stored dimension differs from *dimension*.
+        """
+        self._directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        stored = self._read_dimension()
+        if stored is not None and dimension is not None and stored != dimension:
+            message = f'Speaker index at {directory} stores {stored}-d embeddings, not {dimension}'
+            raise SpeakerIndexError(message)
+        self._dimension = stored if stored is not None else dimension
+        if stored is None and dimension is not None:
+            self._write_dimension(dimension)
+
+        self._speaker_ids: tuple[str, ...] = ()
+        self._matrix: NDArray[np.float32] = np.zeros((0, self._dimension or 0), np.float32)
+        self._reload()
+
+    @classmethod
+    def from_env(cls) -> SpeakerIndex | None:
+        """Open the index configured by ``DIARIZATION_SPEAKER_INDEX_DIR``, if any."""
+        raw_value = os.getenv(ENV_INDEX_DIR, '').strip()
+        if not raw_value:
+            return None
+        return cls(Path(raw_value).expanduser())
+
+    def __len__(self) -> int:
+        """Return the number of stored embeddings."""
+        return len(self._speaker_ids)
+
+    @property
+    def dimension(self) -> int | None:
+        """Return the embedding dimension, or ``None`` before the first append."""
+        return self._dimension
+
+    def append(self, speaker_ids: Sequence[str], embeddings: NDArray[Any]) -> None:
+        """Store one embedding per speaker id.
+
+        Raises:
+            SpeakerIndexError: If the shapes do not match the ids or the
+                index dimension, or an id contains a line break.
+        """
+        rows = normalise_rows(np.atleast_2d(embeddings)).astype(_ROW_DTYPE)
+        if rows.shape[0] != len(speaker_ids):
+            message = f'Got {len(speaker_ids)} speaker ids for {rows.shape[0]} embeddings'
+            raise SpeakerIndexError(message)
+        if any('\n' in speaker_id or '\r' in speaker_id for speaker_id in speaker_ids):
+            message = 'Speaker ids must not contain line breaks'
+            raise SpeakerIndexError(message)
+        if not speaker_ids:
+            return
+
+        with self._lock:
+            if self._dimension is None:
+                self._dimension = rows.shape[1]
+                self._write_dimension(self._dimension)
+            if rows.shape[1] != self._dimension:
+                message = f'Expected {self._dimension}-d embeddings, got {rows.shape[1]}-d'
+                raise SpeakerIndexError(message)
+
+            # Rows go first: a crash between the writes leaves surplus rows,
+            # which are ignored on load and cut off before the next append.
+            with (self._directory / EMBEDDINGS_FILE).open('ab') as handle:
+                handle.truncate(len(self._speaker_ids) * rows.shape[1] * _ROW_DTYPE.itemsize)
+                handle.write(rows.tobytes())
+            with (self._directory / SPEAKERS_FILE).open('a', encoding='utf-8') as handle:
+                handle.writelines(f'{speaker_id}\n' for speaker_id in speaker_ids)
+            self._speaker_ids = (*self._speaker_ids, *speaker_ids)
+            self._matrix = self._map_rows(len(self._speaker_ids))
+
+    def search(self, embeddings: NDArray[Any], *, top_k: int = 1) -> list[list[SpeakerMatch]]:
+        """Return the *top_k* most similar stored rows for every query row."""
+        scores, speaker_ids = self._score(embeddings)
+        if not speaker_ids:
+            return [[] for _ in range(scores.shape[0])]
+
+        k = min(top_k, scores.shape[1])
+        best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        ordered = np.take_along_axis(
+            best,
+            np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1),
+            axis=1,
+        )
+        return [
+            [SpeakerMatch(speaker_ids[column], float(scores[row, column])) for column in columns]
+            for row, columns in enumerate(ordered.tolist())
+        ]
+
+    def identify(
+        self,
+        embeddings: NDArray[Any],
+        *,
+        threshold: float = DEFAULT_MATCH_THRESHOLD,
+    ) -> list[SpeakerMatch | None]:
+        """Match each query to a stored speaker, or ``None`` when none is close enough.
+
+        Each stored speaker is scored by its best row, so a speaker with many
+        rows cannot crowd the others out of the candidates. Queries are the
+        speakers of one recording, so no stored speaker is assigned to two of
+        them: the most similar pair wins and the other query falls back to
+        its next candidate.
+        """
+        scores, speaker_ids = self._score(embeddings)
+        assigned: list[SpeakerMatch | None] = [None] * scores.shape[0]
+        if not speaker_ids:
+            return assigned
+
+        names, owners = np.unique(np.asarray(speaker_ids), return_inverse=True)
+        per_speaker = np.full((len(names), scores.shape[0]), -np.inf, dtype=np.float32)
+        np.maximum.at(per_speaker, owners, scores.T)
+        speakers, queries = np.nonzero(per_speaker >= threshold)
+        pairs = sorted(
+            (
+                (float(per_speaker[speaker, query]), query, str(names[speaker]))
+                for speaker, query in zip(speakers.tolist(), queries.tolist(), strict=True)
+            ),
+            reverse=True,
+        )
+
+        taken: set[str] = set()
+        for similarity, query, speaker_id in pairs:
+            if assigned[query] is None and speaker_id not in taken:
+                assigned[query] = SpeakerMatch(speaker_id, similarity)
+                taken.add(speaker_id)
+        return assigned
+
+    def _score(self, embeddings: NDArray[Any]) -> tuple[NDArray[np.float32], tuple[str, ...]]:
+        """Return the cosine similarity of every query to every stored row, and the row ids."""
+        queries = normalise_rows(np.atleast_2d(embeddings)).astype(np.float32)
+        with self._lock:
+            matrix, speaker_ids = self._matrix, self._speaker_ids
+        if not speaker_ids:
+            return np.zeros((queries.shape[0], 0), dtype=np.float32), speaker_ids
+        if queries.shape[1] != matrix.shape[1]:
+            message = f'Expected {matrix.shape[1]}-d embeddings, got {queries.shape[1]}-d'
+            raise SpeakerIndexError(message)
+        return queries @ matrix.T, speaker_ids
+
+    def _read_dimension(self) -> int | None:
+        """Return the dimension recorded in the metadata file, if present."""
+        path = self._directory / METADATA_FILE
+        if not path.is_file():
+            return None
+        try:
+            return int(json.loads(path.read_text(encoding='utf-8'))['dimension'])
+        except (KeyError, TypeError, ValueError) as exc:
+            message = f'Unreadable speaker index metadata at {path}'
+            raise SpeakerIndexError(message) from exc
+
+    def _write_dimension(self, dimension: int) -> None:
+        """Record the embedding dimension next to the matrix."""
+        payload = json.dumps({'dimension': dimension})
+        (self._directory / METADATA_FILE).write_text(payload + '\n', encoding='utf-8')
+
+    def _reload(self) -> None:
+        """Read the speaker ids and map the matrix stored in the directory."""
+        ids_path = self._directory / SPEAKERS_FILE
+        rows_path = self._directory / EMBEDDINGS_FILE
+        speaker_ids = (
+            tuple(ids_path.read_text(encoding='utf-8').splitlines()) if ids_path.is_file() else ()
+        )
+        dimension = self._dimension or 0
+        stored_rows = (
+            rows_path.stat().st_size // (dimension * _ROW_DTYPE.itemsize)
+            if dimension and rows_path.is_file()
+            else 0
+        )
+        count = min(len(speaker_ids), stored_rows)
+        if count < len(speaker_ids):
+            message = f'Speaker index at {self._directory} lists more ids than embeddings'
+            raise SpeakerIndexError(message)
+
+        self._speaker_ids = speaker_ids
+        self._matrix = self._map_rows(count)
+        LOGGER.debug('Speaker index at %s holds %d embeddings', self._directory, count)
+
+    def _map_rows(self, count: int) -> NDArray[np.float32]:
+        """Memory-map the first *count* rows of the embedding file."""
+        dimension = self._dimension or 0
+        if count == 0:
+            return np.zeros((0, dimension), dtype=np.float32)
+        return np.memmap(
+            self._directory / EMBEDDINGS_FILE,
+            dtype=_ROW_DTYPE,
+            mode='r',
+            shape=(count, dimension),
+        )
+
+
+__all__: Final = (
+    'DEFAULT_MATCH_THRESHOLD',
+    'ENV_INDEX_DIR',
+    'ENV_MATCH_THRESHOLD',
+    'SpeakerIndex',
+    'SpeakerIndexError',
+    'SpeakerMatch',
+    'new_speaker_id',
+    'resolve_match_threshold',
+)
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import contextlib
 import importlib
 import json
 import logging
 import os
 from concurrent import futures
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING, Any, Protocol, cast
 
 import httpx
 
 from app.clients import summarize_pb2, summarize_pb2_grpc
+from gpu_services.env import get_float_env, get_int_env
+from gpu_services.health import ServiceHealth
+from gpu_services.llm_balancer import CircuitOpenError, LlmEndpoint, parse_endpoints
+from gpu_services.llm_transport import ResilientTransport, TransportPolicy, build_llm_client
+from gpu_services.metrics import REGISTRY, start_metrics_server_from_env
+from gpu_services.summary_cache import SummaryCache, summary_cache_key
+from gpu_services.summary_chunking import ChunkBudget, TranscriptChunker, load_tokenizer
+from gpu_services.summary_prefilter import ExtractivePrefilter
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
 
     class TextRequest(Protocol):
         """Typed representation of the summarize.TextRequest message."""
@@ -40,6 +50,8 @@ else:  # pragma: no cover - runtime fallbacks
 
 grpc = importlib.import_module('grpc')
 
+SERVICE_NAME = 'services.summarize.Summarize'
+
 
 class ServicerContext(Protocol):
     """Minimal subset of the gRPC servicer context used by the summarizer."""
@@ -61,6 +73,23 @@ class GrpcServer(Protocol):
         """Block until the server shuts down."""
 
 
+class _MapAbortError(RuntimeError):
+    """Raised by :class:`_DeferredAbortContext` to carry an abort back to the handler thread."""
+
+    def __init__(self, code: object, details: str) -> None:
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _DeferredAbortContext:
+    """Servicer context stand-in for map workers that turns aborts into exceptions."""
+
+    def abort(self, code: object, details: str) -> None:
+        """Stop the worker and hand the status to the thread that owns the real context."""
+        raise _MapAbortError(code, details)
+
+
 LOGGER = logging.getLogger(__name__)
 
 DEFAULT_SYSTEM_PROMPT = (
@@ -70,15 +99,75 @@ DEFAULT_SYSTEM_PROMPT = (
 DEFAULT_MODEL_NAME = 'qwen-3'
 DEFAULT_TEMPERATURE = 0.25
 DEFAULT_TIMEOUT_SECONDS = 60.0
-DEFAULT_CHUNK_SIZE = 4000
-DEFAULT_CHUNK_OVERLAP = 300
+# Chunk sizes are measured in tokens of the summarization model.
+DEFAULT_CHUNK_SIZE = 3000
+DEFAULT_CHUNK_OVERLAP = 75
+DEFAULT_MAP_CONCURRENCY = 4
+DEFAULT_SERVER_WORKERS = 4
 HTTP_SERVER_ERROR_MIN = 500
 HTTP_SERVER_ERROR_MAX = 600
+# Server-sent event framing used by OpenAI-compatible streaming completions.
+SSE_DATA_PREFIX = 'data:'
+SSE_DONE_MARKER = '[DONE]'
+
+MAP_PROMPT = (
+    'Summarize the following meeting segment, highlighting action items, '
+    'decisions, and owner assignments.'
+)
+MERGE_PROMPT = (
+    'Merge the following consecutive segment summaries into one summary of the '
+    'whole span. Keep the timeline, decisions, action items, and owner assignments.'
+)
+REDUCE_PROMPT = (
+    'Produce a cohesive meeting summary based on the provided segment summaries. '
+    'Merge overlapping information, keep the timeline clear, and list actionable '
+    'next steps.'
+)
+TREE_DEPTH_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10)
+LLM_CALL_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+_TREE_DEPTH = REGISTRY.histogram(
+    'summarize_tree_depth',
+    'Sequential LLM rounds needed to summarize one transcript',
+    buckets=TREE_DEPTH_BUCKETS,
+)
+_LLM_CALLS = REGISTRY.histogram(
+    'summarize_llm_calls',
+    'Summary requests issued to summarize one transcript, cached ones included',
+    buckets=LLM_CALL_BUCKETS,
+)
+
+
+def _format_segment(index: int, summary: str) -> str:
+    """Return the labelled entry of one partial summary in a reduce request."""
+    return f'Segment {index} summary:\n{summary}'
+
+
+@dataclass(frozen=True)
+class SummaryPlan:
+    """Final summarization request and the shape of the tree that produced it.
+
+    Attributes:
+        user_content: User message of the request that yields the final summary.
+        depth: Sequential LLM rounds, the final request included.
+        llm_calls: Summary requests in the whole tree, the final request included.
+    """
+
+    user_content: str
+    depth: int
+    llm_calls: int
 
 
 @dataclass(frozen=True)
 class SummarizerSettings:
-    """Configuration container for calling the external LLM API."""
+    """Configuration container for calling the external LLM API.
+
+    ``LLM_API_BASE`` lists one or more comma-separated endpoints, each
+    optionally weighted as ``url;weight=N``; ``api_base`` is the first one.
+    Unless ``LLM_MAP_CONCURRENCY`` is set, the map stage keeps
+    ``DEFAULT_MAP_CONCURRENCY`` requests in flight per endpoint, so the
+    chunks of one meeting spread over every replica.
+    """
 
     api_base: str
     api_key: str
@@ -88,30 +177,49 @@ class SummarizerSettings:
     system_prompt: str
     chunk_size: int
     chunk_overlap: int
+    map_concurrency: int = DEFAULT_MAP_CONCURRENCY
+    tokenizer: str = ''
+    server_workers: int = DEFAULT_SERVER_WORKERS
+    endpoints: tuple[LlmEndpoint, ...] = ()
+    prefilter_tokens: int = 0
 
     @classmethod
     def from_env(cls) -> SummarizerSettings:
         """Load summarizer configuration from environment variables."""
-        api_base_raw = cls._get_required_env('LLM_API_BASE')
-        api_base = cls._normalize_api_base(api_base_raw)
+        endpoints = cls._get_endpoints_env('LLM_API_BASE')
 
         api_key = cls._get_required_env('LLM_API_KEY')
         model = os.getenv('LLM_MODEL', DEFAULT_MODEL_NAME).strip() or DEFAULT_MODEL_NAME
-        temperature = cls._get_float_env('LLM_TEMPERATURE', DEFAULT_TEMPERATURE)
-        timeout_seconds = cls._get_float_env('LLM_REQUEST_TIMEOUT_SECONDS', DEFAULT_TIMEOUT_SECONDS)
+        temperature = get_float_env('LLM_TEMPERATURE', DEFAULT_TEMPERATURE)
+        timeout_seconds = get_float_env('LLM_REQUEST_TIMEOUT_SECONDS', DEFAULT_TIMEOUT_SECONDS)
 
         system_prompt = os.getenv('LLM_SYSTEM_PROMPT', DEFAULT_SYSTEM_PROMPT).strip()
         if not system_prompt:
             system_prompt = DEFAULT_SYSTEM_PROMPT
 
-        chunk_size = cls._get_int_env('LLM_CHUNK_SIZE', DEFAULT_CHUNK_SIZE, minimum=1)
-        chunk_overlap = cls._get_int_env('LLM_CHUNK_OVERLAP', DEFAULT_CHUNK_OVERLAP, minimum=0)
+        chunk_size = get_int_env('LLM_CHUNK_SIZE', DEFAULT_CHUNK_SIZE, minimum=1)
+        chunk_overlap = get_int_env('LLM_CHUNK_OVERLAP', DEFAULT_CHUNK_OVERLAP, minimum=0)
         if chunk_overlap >= chunk_size:
             message = 'LLM_CHUNK_OVERLAP must be smaller than LLM_CHUNK_SIZE'
             raise RuntimeError(message)
 
+        map_concurrency = get_int_env(
+            'LLM_MAP_CONCURRENCY',
+            DEFAULT_MAP_CONCURRENCY * len(endpoints),
+            minimum=1,
+        )
+
+        tokenizer = os.getenv('LLM_TOKENIZER', '').strip()
+        # Transcripts longer than this many tokens are cut down to it; 0 keeps everything.
+        prefilter_tokens = get_int_env('LLM_PREFILTER_TOKENS', 0, minimum=0)
+        server_workers = get_int_env(
+            'SUMMARIZE_MAX_WORKERS',
+            DEFAULT_SERVER_WORKERS,
+            minimum=1,
+        )
+
         return cls(
-            api_base=api_base,
+            api_base=endpoints[0].url,
             api_key=api_key,
             model=model,
             temperature=temperature,
@@ -119,6 +227,11 @@ class SummarizerSettings:
             system_prompt=system_prompt,
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
+            map_concurrency=map_concurrency,
+            tokenizer=tokenizer,
+            server_workers=server_workers,
+            endpoints=endpoints,
+            prefilter_tokens=prefilter_tokens,
         )
 
     @staticmethod
@@ -128,6 +241,22 @@ class SummarizerSettings:
             return api_base
         return f'{api_base}/'
 
+    @classmethod
+    def _get_endpoints_env(cls, name: str) -> tuple[LlmEndpoint, ...]:
+        """Parse the weighted LLM API endpoints listed in a required environment variable."""
+        try:
+            endpoints = parse_endpoints(cls._get_required_env(name))
+        except ValueError as exc:
+            message = f'{name} is invalid: {exc}'
+            raise RuntimeError(message) from exc
+        if not endpoints:
+            message = f'{name} must list at least one endpoint'
+            raise RuntimeError(message)
+        return tuple(
+            LlmEndpoint(url=cls._normalize_api_base(endpoint.url), weight=endpoint.weight)
+            for endpoint in endpoints
+        )
+
     @staticmethod
     def _get_required_env(name: str) -> str:
         """Return a required environment variable, ensuring it is not empty."""
@@ -137,33 +266,6 @@ class SummarizerSettings:
             raise RuntimeError(message)
         return value
 
-    @staticmethod
-    def _get_float_env(name: str, default: float) -> float:
-        """Parse a float environment variable with fallback and validation."""
-        raw_value = os.getenv(name, str(default)).strip()
-        try:
-            return float(raw_value)
-        except ValueError as exc:  # pragma: no cover - defensive guard
-            message = f'{name} must be a valid float value'
-            raise RuntimeError(message) from exc
-
-    @staticmethod
-    def _get_int_env(name: str, default: int, *, minimum: int) -> int:
-        """Parse an integer environment variable, enforcing a minimum bound."""
-        raw_value = os.getenv(name, str(default)).strip()
-        try:
-            value = int(raw_value)
-        except ValueError as exc:  # pragma: no cover - defensive guard
-            message = f'{name} must be a valid integer'
-            raise RuntimeError(message) from exc
-
-        if value < minimum:
-            comparator = 'than or equal to' if minimum == 0 else 'than'
-            message = f'{name} must be greater {comparator} {minimum}'
-            raise RuntimeError(message)
-
-        return value
-
 
 class SummarizeService(SummarizeServicer):
     """gRPC servicer for the meeting summarization pipeline."""
@@ -172,14 +274,44 @@ class SummarizeService(SummarizeServicer):
         """Initialise the HTTP client and summarizer configuration."""
         self._settings = SummarizerSettings.from_env()
         LOGGER.info('Summarization service configured to use model %s', self._settings.model)
-        self._client = httpx.Client(
-            base_url=self._settings.api_base,
-            headers={
-                'Authorization': f'Bearer {self._settings.api_key}',
-                'Content-Type': 'application/json; charset=utf-8',
-            },
-            timeout=self._settings.timeout_seconds,
+        endpoints = self._settings.endpoints or (LlmEndpoint(url=self._settings.api_base),)
+        LOGGER.info(
+            'Balancing LLM requests over %s',
+            ', '.join(f'{endpoint.url} (weight {endpoint.weight:g})' for endpoint in endpoints),
         )
+        # Every gRPC worker can have a whole map level of requests in flight.
+        pool_size = self._settings.server_workers * self._settings.map_concurrency
+        policy = replace(TransportPolicy.from_env(), max_in_flight=pool_size)
+        headers = {
+            'Authorization': f'Bearer {self._settings.api_key}',
+            'Content-Type': 'application/json; charset=utf-8',
+        }
+        backends = [
+            (
+                build_llm_client(
+                    base_url=endpoint.url,
+                    headers=headers,
+                    timeout=self._settings.timeout_seconds,
+                    pool_size=pool_size,
+                    http2=policy.http2,
+                ),
+                endpoint.weight,
+            )
+            for endpoint in endpoints
+        ]
+        self._transport = ResilientTransport(backends, policy, name='summarize_llm')
+        tokenizer = load_tokenizer(self._settings.tokenizer)
+        self._chunker = TranscriptChunker(
+            ChunkBudget(
+                max_tokens=self._settings.chunk_size,
+                overlap_tokens=self._settings.chunk_overlap,
+            ),
+            tokenizer,
+        )
+        self._prefilter: ExtractivePrefilter | None = None
+        if self._settings.prefilter_tokens:
+            self._prefilter = ExtractivePrefilter(self._settings.prefilter_tokens, tokenizer)
+        self._cache = SummaryCache.from_env()
 
     def run(self, request: TextRequest, context: ServicerContext) -> Summary:
         """Handle summarization requests.
@@ -191,6 +323,41 @@ class SummarizeService(SummarizeServicer):
         Returns:
             Generated summary text produced by the external LLM.
         """
+        source_text = self._read_source_text(request, context)
+        summary_text = self._generate_summary(source_text, context)
+
+        summary_cls = getattr(summarize_pb2, 'Summary')  # noqa: B009
+        response = summary_cls(text=summary_text)
+        return cast('Summary', response)
+
+    Run = run
+
+    def stream_run(self, request: TextRequest, context: ServicerContext) -> Iterator[Summary]:
+        """Stream the summary as the LLM generates it.
+
+        Long transcripts still go through the concurrent map and reduce stages
+        first; only the final request is streamed. Every yielded message carries the next
+        piece of text, so the full summary is their concatenation.
+
+        Args:
+            request: Incoming gRPC request with source text.
+            context: gRPC request context.
+
+        Yields:
+            Summary messages holding consecutive text fragments.
+        """
+        source_text = self._read_source_text(request, context)
+        plan = self._build_final_request(source_text, context)
+
+        summary_cls = getattr(summarize_pb2, 'Summary')  # noqa: B009
+        for fragment in self._stream_summary(plan.user_content, context):
+            yield cast('Summary', summary_cls(text=fragment))
+
+    StreamRun = stream_run
+
+    @staticmethod
+    def _read_source_text(request: TextRequest, context: ServicerContext) -> str:
+        """Return the stripped request text, aborting when it is empty."""
         source_text = (request.text or '').strip()
         if not source_text:
             context.abort(
@@ -199,65 +366,188 @@ class SummarizeService(SummarizeServicer):
             )
 
         LOGGER.info('Received summarization request (length=%d)', len(source_text))
-
-        summary_text = self._generate_summary(source_text, context)
-
-        summary_cls = getattr(summarize_pb2, 'Summary')  # noqa: B009
-        response = summary_cls(text=summary_text)
-        return cast('Summary', response)
-
-    Run = run
+        return source_text
 
     def _generate_summary(self, text: str, context: ServicerContext) -> str:
         """Invoke the configured LLM API and return the resulting summary."""
+        plan = self._build_final_request(text, context)
+        return self._request_summary(plan.user_content, context)
+
+    def _build_final_request(self, text: str, context: ServicerContext) -> SummaryPlan:
+        """Return the request that produces the final summary of *text*.
+
+        When the extractive pre-filter is enabled, only the most informative
+        sentences of *text* within its token budget are summarized. Text that
+        fits into one chunk is summarized directly. Longer text is first
+        reduced to partial summaries by the map stage, which the reduce stage
+        merges until they fit into one final request.
+        """
+        if self._prefilter is not None:
+            text = self._prefilter.filter(text).text
         chunks = self._split_into_chunks(text)
         if len(chunks) == 1:
             LOGGER.debug('Summarizing text in a single request (length=%d)', len(text))
-            return self._request_summary(chunks[0], context)
+            return self._report_plan(SummaryPlan(user_content=chunks[0], depth=1, llm_calls=1))
 
         # Multi-stage summarization pipeline:
         # 1. Break the long transcript into overlapping chunks that fit the LLM context window.
-        # 2. Summarize each chunk individually so that no information is lost.
-        # 3. Combine the partial summaries and summarize them again to obtain the final result.
+        # 2. Summarize the chunks concurrently so that no information is lost.
+        # 3. Merge batches of partial summaries concurrently, level by level, until they
+        #    fit into one request, and summarize that request to obtain the final result.
         LOGGER.info(
-            'Summarizing text in %d chunks (chunk_size=%d, overlap=%d)',
+            'Summarizing text in %d chunks (chunk_size=%d tokens, overlap=%d tokens)',
             len(chunks),
             self._settings.chunk_size,
             self._settings.chunk_overlap,
         )
 
-        partial_summaries: list[str] = []
-        for index, chunk in enumerate(chunks, start=1):
-            LOGGER.debug(
-                'Generating partial summary %d/%d (length=%d)',
-                index,
-                len(chunks),
-                len(chunk),
-            )
-            prompt = (
-                'Summarize the following meeting segment, highlighting action items, '
-                'decisions, and owner assignments.'
+        summaries = self._summarize_concurrently(
+            [f'{MAP_PROMPT}\n\n{chunk}' for chunk in chunks],
+            context,
+        )
+        depth, llm_calls = 1, len(chunks)
+        while len(batches := self._group_for_reduce(summaries)) > 1:
+            LOGGER.info(
+                'Merging %d partial summaries in %d batches (level %d)',
+                len(summaries),
+                len(batches),
+                depth,
             )
-            partial_summary = self._request_summary(f'{prompt}\n\n{chunk}', context)
-            partial_summaries.append(partial_summary)
+            merge_requests = [
+                self._combine_summaries(MERGE_PROMPT, batch) for batch in batches if len(batch) > 1
+            ]
+            merged = iter(self._summarize_concurrently(merge_requests, context))
+            # A batch that holds a single summary moves up a level unchanged.
+            summaries = [next(merged) if len(batch) > 1 else batch[0] for batch in batches]
+            depth += 1
+            llm_calls += len(merge_requests)
+
+        return self._report_plan(
+            SummaryPlan(
+                # The last grouping may have truncated a summary to fit.
+                user_content=self._combine_summaries(REDUCE_PROMPT, batches[0]),
+                depth=depth + 1,
+                llm_calls=llm_calls + 1,
+            ),
+        )
 
-        combined_summary = '\n\n'.join(
-            f'Segment {idx} summary:\n{summary}'
-            for idx, summary in enumerate(partial_summaries, start=1)
+    def _group_for_reduce(self, summaries: list[str]) -> list[list[str]]:
+        """Pack consecutive summaries into batches whose request fits one chunk.
+
+        A single batch is returned once the final reduce request over all
+        summaries fits. Otherwise every batch except possibly the last one
+        takes at least two summaries, so each reduce level at least halves
+        the number of summaries and the tree stays ``O(log n)`` deep. Costs
+        include the prompt, segment headers and separators, and summaries
+        too long to fit are truncated rather than overflowing the request.
+        Merge batches are sized for the longer of the merge and reduce
+        prompts, so whatever they produce can still be reduced.
+        """
+        limit = self._settings.chunk_size
+        reduce_request = self._combine_summaries(REDUCE_PROMPT, summaries)
+        if self._chunker.count_tokens(reduce_request) <= limit:
+            return [summaries]
+        if len(summaries) == 1:
+            budget = limit - self._chunker.count_tokens(REDUCE_PROMPT)
+            return [[self._fit_summary(summaries[0], budget, position=1)]]
+
+        # Merged summaries may end up in the final request, so the longer
+        # prompt bounds both. Any two summaries within half of it fit.
+        prompt = max(
+            self._chunker.count_tokens(MERGE_PROMPT), self._chunker.count_tokens(REDUCE_PROMPT)
+        )
+        budget = limit - prompt
+        share = budget // 2
+        batches: list[list[str]] = []
+        batch: list[str] = []
+        used = 0
+        for summary in summaries:
+            fitted = self._fit_summary(summary, share, position=len(summaries))
+            cost = self._entry_tokens(len(batch) + 1, fitted)
+            if len(batch) > 1 and used + cost > budget:
+                batches.append(batch)
+                batch, used = [], 0
+                cost = self._entry_tokens(1, fitted)
+            batch.append(fitted)
+            used += cost
+        batches.append(batch)
+        return batches
+
+    def _entry_tokens(self, position: int, summary: str) -> int:
+        """Return the tokens *summary* adds to a reduce request, header and separator included."""
+        return self._chunker.count_tokens(f'\n\n{_format_segment(position, summary)}')
+
+    def _fit_summary(self, summary: str, max_tokens: int, *, position: int) -> str:
+        """Truncate *summary* so that its reduce request entry takes at most *max_tokens*."""
+        if self._entry_tokens(position, summary) <= max_tokens:
+            return summary
+        available = max_tokens - self._entry_tokens(position, '')
+        LOGGER.warning(
+            'Truncating a partial summary to %d tokens to fit the reduce request',
+            max(available, 0),
         )
+        return self._chunker.truncate(summary, available)
 
-        final_prompt = (
-            'Produce a cohesive meeting summary based on the provided segment summaries. '
-            'Merge overlapping information, keep the timeline clear, and list actionable '
-            'next steps.'
+    @staticmethod
+    def _combine_summaries(prompt: str, summaries: list[str]) -> str:
+        """Return the request that asks the LLM to merge *summaries* following *prompt*."""
+        combined = '\n\n'.join(
+            _format_segment(index, summary) for index, summary in enumerate(summaries, start=1)
         )
+        return f'{prompt}\n\n{combined}'
 
-        final_request = f'{final_prompt}\n\n{combined_summary}'
-        return self._request_summary(final_request, context)
+    @staticmethod
+    def _report_plan(plan: SummaryPlan) -> SummaryPlan:
+        """Log and record the shape of the summarization tree behind *plan*."""
+        LOGGER.info('Summary tree depth=%d, llm_calls=%d', plan.depth, plan.llm_calls)
+        _TREE_DEPTH.observe(plan.depth)
+        _LLM_CALLS.observe(plan.llm_calls)
+        return plan
+
+    def _summarize_concurrently(
+        self,
+        requests: list[str],
+        context: ServicerContext,
+    ) -> list[str]:
+        """Summarize every request concurrently and return the summaries in request order.
+
+        Up to ``map_concurrency`` requests are in flight at once. Workers never
+        abort the gRPC call themselves: the first failing request (in request
+        order) is reported through ``context`` on the calling thread with the
+        status code it would have produced when sent on its own, and requests
+        that have not started yet are cancelled.
+        """
 
-    def _request_summary(self, user_content: str, context: ServicerContext) -> str:
-        """Call the remote LLM API with the provided user content."""
-        payload = {
+        def _summarize(index: int, user_content: str) -> str:
+            LOGGER.debug(
+                'Generating partial summary %d/%d (length=%d)',
+                index + 1,
+                len(requests),
+                len(user_content),
+            )
+            return self._request_summary(user_content, _DeferredAbortContext())
+
+        max_workers = min(self._settings.map_concurrency, len(requests))
+        with futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='summarize-map',
+        ) as executor:
+            pending = [
+                executor.submit(_summarize, index, user_content)
+                for index, user_content in enumerate(requests)
+            ]
+            try:
+                return [future.result() for future in pending]
+            except _MapAbortError as exc:
+                context.abort(exc.code, exc.details)
+                raise
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _build_payload(self, user_content: str) -> dict[str, Any]:
+        """Return the chat completion request body for *user_content*."""
+        return {
             'model': self._settings.model,
             'temperature': self._settings.temperature,
             'messages': [
@@ -266,6 +556,13 @@ class SummarizeService(SummarizeServicer):
             ],
         }
 
+    def _request_summary(self, user_content: str, context: ServicerContext) -> str:
+        """Call the remote LLM API with the provided user content, unless it is cached."""
+        cached = self._cached_summary(user_content)
+        if cached is not None:
+            return cached
+
+        payload = self._build_payload(user_content)
         payload_data = self._execute_llm_request(payload, context)
 
         try:
@@ -278,8 +575,63 @@ class SummarizeService(SummarizeServicer):
             context.abort(grpc.StatusCode.INTERNAL, 'LLM API returned an empty summary')
 
         LOGGER.debug('Generated summary length=%d', len(summary_text))
+        self._remember_summary(user_content, summary_text)
         return summary_text
 
+    def _stream_summary(self, user_content: str, context: ServicerContext) -> Iterator[str]:
+        """Call the remote LLM API in streaming mode and yield text as it arrives.
+
+        Leading whitespace is dropped like in :meth:`_request_summary`, and a
+        stream without any text aborts with the same status. A cached summary
+        is yielded in one piece.
+        """
+        cached = self._cached_summary(user_content)
+        if cached is not None:
+            yield cached
+            return
+
+        payload = {**self._build_payload(user_content), 'stream': True}
+        fragments: list[str] = []
+        for delta in self._stream_llm_request(payload, context):
+            fragment = delta if fragments else delta.lstrip()
+            if fragment:
+                fragments.append(fragment)
+                yield fragment
+
+        summary_text = ''.join(fragments).strip()
+        if not summary_text:
+            context.abort(grpc.StatusCode.INTERNAL, 'LLM API returned an empty summary')
+
+        LOGGER.debug('Streamed summary length=%d', len(summary_text))
+        self._remember_summary(user_content, summary_text)
+
+    def _cache_key(self, user_content: str) -> str:
+        """Return the summary cache key of a request for *user_content*."""
+        return summary_cache_key(
+            model=self._settings.model,
+            temperature=self._settings.temperature,
+            system_prompt=self._settings.system_prompt,
+            user_content=user_content,
+        )
+
+    def _cached_summary(self, user_content: str) -> str | None:
+        """Return the cached summary for *user_content*, if caching is enabled."""
+        if self._cache is None:
+            return None
+        summary = self._cache.get(self._cache_key(user_content))
+        if summary is not None:
+            LOGGER.debug('Reusing cached summary (length=%d)', len(summary))
+        return summary
+
+    def _remember_summary(self, user_content: str, summary: str) -> None:
+        """Store *summary* for later requests with the same *user_content*."""
+        if self._cache is None:
+            return
+        try:
+            self._cache.put(self._cache_key(user_content), summary)
+        except OSError as exc:
+            LOGGER.warning('Could not cache summary: %s', exc)
+
     def _execute_llm_request(
         self,
         payload: dict[str, Any],
@@ -290,12 +642,59 @@ class SummarizeService(SummarizeServicer):
 
         response: httpx.Response | None = None
 
+        with self._abort_on_llm_error(context):
+            response = self._transport.post('chat/completions', content=payload_bytes)
+            response.raise_for_status()
+
         try:
-            response = self._client.post('chat/completions', content=payload_bytes)
+            if response is None:  # pragma: no cover - defensive guard
+                error_message = 'LLM API response was not initialised'
+                raise RuntimeError(error_message)
+
+            if response.encoding is None:
+                response.encoding = 'utf-8'
+            payload_data = response.json()
+        except ValueError as exc:
+            LOGGER.error('Failed to decode LLM API response as JSON: %s', exc)
+            context.abort(grpc.StatusCode.INTERNAL, 'Failed to decode LLM API response')
+
+        return payload_data
+
+    def _stream_llm_request(
+        self,
+        payload: dict[str, Any],
+        context: ServicerContext,
+    ) -> Iterator[str]:
+        """Send a streaming payload to the LLM API and yield every content delta."""
+        payload_bytes = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+        with (
+            self._abort_on_llm_error(context),
+            self._transport.stream('chat/completions', content=payload_bytes) as response,
+        ):
             response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith(SSE_DATA_PREFIX):
+                    continue
+                data = line[len(SSE_DATA_PREFIX) :].strip()
+                if data == SSE_DONE_MARKER:
+                    return
+                delta = self._extract_stream_delta(json.loads(data))
+                if delta:
+                    yield delta
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _abort_on_llm_error(context: ServicerContext) -> Iterator[None]:
+        """Translate failures of an LLM API call into gRPC status codes."""
+        try:
+            yield
         except httpx.TimeoutException as exc:
             LOGGER.error('LLM API request timed out: %s', exc)
             context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, 'LLM API request timed out')
+        except CircuitOpenError:
+            LOGGER.warning('Skipping LLM API request while every endpoint is ejected')
+            context.abort(grpc.StatusCode.UNAVAILABLE, 'LLM API is temporarily unavailable')
         except httpx.HTTPStatusError as exc:
             status_code = exc.response.status_code
             LOGGER.error('LLM API returned HTTP %s: %s', status_code, exc.response.text)
@@ -305,65 +704,17 @@ class SummarizeService(SummarizeServicer):
         except httpx.RequestError:
             LOGGER.exception('Failed to reach LLM API endpoint')
             context.abort(grpc.StatusCode.UNAVAILABLE, 'Failed to reach LLM API endpoint')
+        except ValueError as exc:
+            LOGGER.error('Failed to decode LLM API response as JSON: %s', exc)
+            context.abort(grpc.StatusCode.INTERNAL, 'Failed to decode LLM API response')
         except Exception:
             LOGGER.exception('Unexpected error while executing LLM API request')
             error_message = 'Unexpected error while executing LLM API request'
             context.abort(grpc.StatusCode.INTERNAL, error_message)
 
-        try:
-            if response is None:  # pragma: no cover - defensive guard
-                error_message = 'LLM API response was not initialised'
-                raise RuntimeError(error_message)
-
-            if response.encoding is None:
-                response.encoding = 'utf-8'
-            payload_data = response.json()
-        except ValueError as exc:
-            LOGGER.error('Failed to decode LLM API response as JSON: %s', exc)
-            context.abort(grpc.StatusCode.INTERNAL, 'Failed to decode LLM API response')
-
-        return payload_data
-
     def _split_into_chunks(self, text: str) -> list[str]:
-        """Split the text into context-friendly chunks with optional overlap."""
-        if len(text) <= self._settings.chunk_size:
-            return [text]
-
-        chunks: list[str] = []
-        start = 0
-        text_length = len(text)
-        while start < text_length:
-            end = min(text_length, start + self._settings.chunk_size)
-            boundary = self._locate_chunk_boundary(text, start, end) if end < text_length else end
-
-            boundary = max(boundary, start + 1)
-            chunk = text[start:boundary].strip()
-            if chunk:
-                chunks.append(chunk)
-
-            if boundary >= text_length:
-                break
-
-            overlap = min(self._settings.chunk_overlap, self._settings.chunk_size - 1)
-            start = max(boundary - overlap, 0)
-
-        return chunks
-
-    def _locate_chunk_boundary(self, text: str, start: int, end: int) -> int:
-        """Select a natural break point for a chunk, preferring paragraph or sentence ends."""
-        paragraph_break = text.rfind('\n\n', start, end)
-        if paragraph_break > start:
-            return paragraph_break
-
-        sentence_break = text.rfind('. ', start, end)
-        if sentence_break > start:
-            return sentence_break + 1
-
-        word_break = text.rfind(' ', start, end)
-        if word_break > start:
-            return word_break
-
-        return end
+        """Split the text into token-budgeted chunks that end at natural break points."""
+        return self._chunker.split(text) or [text]
 
     @staticmethod
     def _extract_summary(payload: dict[str, Any]) -> str:
@@ -383,6 +734,18 @@ class SummarizeService(SummarizeServicer):
 
         return content.strip()
 
+    @staticmethod
+    def _extract_stream_delta(payload: dict[str, Any]) -> str:
+        """Extract the content delta from one streamed completion chunk."""
+        try:
+            delta = payload['choices'][0].get('delta') or {}
+        except (KeyError, IndexError, TypeError, AttributeError) as exc:
+            error_message = 'LLM API stream chunk did not include a delta'
+            raise ValueError(error_message) from exc
+
+        content = delta.get('content')
+        return content if isinstance(content, str) else ''
+
 
 def _create_server(max_workers: int) -> GrpcServer:
     """Instantiate a gRPC server for the summarization service."""
@@ -394,13 +757,17 @@ def serve() -> None:
     logging.basicConfig(level=os.getenv('SUMMARIZE_LOG_LEVEL', 'INFO'))
     port = os.getenv('SUMMARIZE_SERVICE_PORT', '50053')
     max_workers = int(os.getenv('SUMMARIZE_MAX_WORKERS', '4'))
+    start_metrics_server_from_env('SUMMARIZE_METRICS_PORT')
 
     server = _create_server(max_workers=max_workers)
     add_summarize_servicer_to_server(SummarizeService(), server)
+    health = ServiceHealth(server, SERVICE_NAME, metric_prefix='summarize')
     server.add_insecure_port(f'[::]:{port}')
 
     LOGGER.info('Starting summarization service on port %s', port)
     server.start()
+    # The summarizer proxies to an external LLM, so there is no local model to warm up.
+    health.set_serving()
     server.wait_for_termination()
 
 
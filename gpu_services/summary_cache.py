@@ -0,0 +1,197 @@
+"""Disk cache of LLM summaries keyed by everything that shapes the response.
+
+A summary is stored under a hash of the model, temperature, system prompt
+and the full user message, which holds the prompt template and the chunk
+text. Summarizing the same transcript again, or a transcript that shares
+chunks with an earlier one, therefore reuses the stored partial and final
+summaries instead of calling the LLM.
+
+Entries are one text file each. The cache keeps its total size under a
+byte budget by evicting the least recently used entries; recency survives
+restarts because hits refresh the file modification time.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Final
+
+from gpu_services.metrics import REGISTRY
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_CACHE_DIR: Final = 'SUMMARIZE_CACHE_DIR'
+ENV_CACHE_MAX_BYTES: Final = 'SUMMARIZE_CACHE_MAX_BYTES'
+DEFAULT_MAX_BYTES: Final = 256 * 1024 * 1024
+
+_ENTRY_SUFFIX: Final = '.txt'
+
+_HITS: Final = REGISTRY.counter('summarize_cache_hits_total', 'Summaries served from the cache')
+_MISSES: Final = REGISTRY.counter(
+    'summarize_cache_misses_total',
+    'Summary requests that had to call the LLM',
+)
+_EVICTIONS: Final = REGISTRY.counter(
+    'summarize_cache_evictions_total',
+    'Cached summaries evicted to stay within the size limit',
+)
+_SIZE: Final = REGISTRY.gauge('summarize_cache_bytes', 'Bytes of cached summaries on disk')
+
+
+def summary_cache_key(
+    *,
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_content: str,
+) -> str:
+    """Return the cache key of a chat completion request."""
+    fields = json.dumps([model, temperature, system_prompt, user_content], ensure_ascii=False)
+    return hashlib.blake2b(fields.encode('utf-8'), digest_size=20).hexdigest()
+
+
+class SummaryCache:
+    """Size-bounded LRU cache of summary texts in a directory."""
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Open *directory*, creating it when needed, and index the entries it holds."""
+        if max_bytes < 1:
+            message = 'max_bytes must be greater than 0'
+            raise ValueError(message)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Entry sizes in bytes, least recently used first.
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._total_bytes = 0
+        directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    @classmethod
+    def from_env(cls) -> SummaryCache | None:
+        """Open the cache configured by ``SUMMARIZE_CACHE_DIR``; ``None`` when unset."""
+        raw_dir = os.getenv(ENV_CACHE_DIR, '').strip()
+        if not raw_dir:
+            return None
+        raw_max_bytes = os.getenv(ENV_CACHE_MAX_BYTES, '').strip()
+        try:
+            max_bytes = int(raw_max_bytes) if raw_max_bytes else DEFAULT_MAX_BYTES
+        except ValueError as exc:
+            message = f'{ENV_CACHE_MAX_BYTES} must be a valid integer'
+            raise RuntimeError(message) from exc
+        if max_bytes < 1:
+            message = f'{ENV_CACHE_MAX_BYTES} must be greater than 0'
+            raise RuntimeError(message)
+        return cls(Path(raw_dir).expanduser(), max_bytes)
+
+    @property
+    def total_bytes(self) -> int:
+        """Return the size of all cached entries."""
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Return the summary stored under *key*, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            summary = path.read_text(encoding='utf-8')
+        except FileNotFoundError:
+            with self._lock:
+                self._forget(key)
+            _MISSES.inc()
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning('Ignoring unreadable summary cache entry %s: %s', path, exc)
+            _MISSES.inc()
+            return None
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        # The entry may have been evicted by another process in the meantime.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        _HITS.inc()
+        return summary
+
+    def put(self, key: str, summary: str) -> None:
+        """Store *summary* under *key* and evict old entries beyond the size limit.
+
+        Concurrent writers never expose partial files.
+        """
+        data = summary.encode('utf-8')
+        handle, tmp_name = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(handle, 'wb') as tmp_file:
+            tmp_file.write(data)
+        Path(tmp_name).replace(self._path(key))
+
+        with self._lock:
+            self._forget(key)
+            self._entries[key] = len(data)
+            self._total_bytes += len(data)
+            evicted = self._evict()
+            _SIZE.set(self._total_bytes)
+        for stale_key in evicted:
+            self._path(stale_key).unlink(missing_ok=True)
+        if evicted:
+            _EVICTIONS.inc(len(evicted))
+            LOGGER.debug('Evicted %d cached summaries', len(evicted))
+
+    def _evict(self) -> list[str]:
+        """Drop least recently used entries until the cache fits; return their keys."""
+        evicted: list[str] = []
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(key)
+        return evicted
+
+    def _forget(self, key: str) -> None:
+        """Remove *key* from the index without touching the file."""
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    def _path(self, key: str) -> Path:
+        return self._directory / f'{key}{_ENTRY_SUFFIX}'
+
+    def _load_index(self) -> None:
+        """Index existing entries, ordered by when they were last used."""
+        found: list[tuple[float, str, int]] = []
+        for entry in os.scandir(self._directory):
+            if not entry.name.endswith(_ENTRY_SUFFIX):
+                continue
+            stat = entry.stat()
+            found.append((stat.st_mtime, entry.name.removesuffix(_ENTRY_SUFFIX), stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._total_bytes += size
+        for stale_key in self._evict():
+            self._path(stale_key).unlink(missing_ok=True)
+        _SIZE.set(self._total_bytes)
+        LOGGER.info(
+            'Summary cache at %s holds %d entries (%d bytes)',
+            self._directory,
+            len(self._entries),
+            self._total_bytes,
+        )
+
+
+__all__: Final = (
+    'DEFAULT_MAX_BYTES',
+    'ENV_CACHE_DIR',
+    'ENV_CACHE_MAX_BYTES',
+    'SummaryCache',
+    'summary_cache_key',
+)
@@ -0,0 +1,273 @@
+"""Split transcripts into chunks measured in model tokens.
+
+Chunk sizes are budgets in tokens of the summarization model, so a chunk
+fills the context window the same way whatever the script of the text.
+Every chunk ends at the best break point that keeps it within budget:
+speaker turns and paragraphs first, then line breaks, sentence ends and
+finally plain word boundaries. A weaker break point is only taken when
+the stronger ones would leave the chunk less than ``min_fill`` full.
+
+The text is tokenized once. Token start offsets and every candidate break
+point are kept in NumPy arrays, so finding the next boundary is a binary
+search plus a scan over the candidates inside one window.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final, Protocol
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIN_FILL: Final = 0.6
+
+# Break point strengths, strongest last.
+WORD_BREAK: Final = 0
+SENTENCE_BREAK: Final = 1
+LINE_BREAK: Final = 2
+TURN_BREAK: Final = 3
+
+# Each pattern matches the separator at the position where a chunk may end.
+_BREAK_PATTERNS: Final = (
+    (WORD_BREAK, re.compile(r'\s')),
+    (SENTENCE_BREAK, re.compile(r'(?<=[.!?…])\s|(?<=[。！？])')),
+    (LINE_BREAK, re.compile(r'\n')),
+    # A blank line, or a new line opening with a ``Speaker:`` label.
+    (TURN_BREAK, re.compile(r'\n(?=[ \t]*\n)|\n(?=[^\n:]{1,40}:\s)')),
+)
+# Scripts whose characters are roughly one token each in common vocabularies.
+IDEOGRAPH_PATTERN: Final = r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]'
+_PIECE_PATTERN: Final = re.compile(rf'{IDEOGRAPH_PATTERN}|[^\W\d_]+|\d{{1,3}}|[^\w\s]+')
+_APPROX_BYTES_PER_TOKEN: Final = 6
+# First code points that take two, three and four bytes in UTF-8.
+_UTF8_WIDTH_STEPS: Final = (0x80, 0x800, 0x10000)
+
+
+class Tokenizer(Protocol):
+    """Source of token boundaries for the chunker."""
+
+    def token_starts(self, text: str) -> NDArray[np.int64]:
+        """Return the character offset at which every token of *text* starts."""
+
+
+class ApproximateTokenizer:
+    """Estimate token boundaries without a vocabulary.
+
+    Text is cut into words, digit groups, punctuation runs and single CJK
+    characters. Every piece costs one token per started six bytes of UTF-8,
+    which tracks byte-level BPE vocabularies closely enough for budgeting:
+    short Latin words are one token, Cyrillic words cost about twice as
+    much per character and ideographs are one token each.
+    """
+
+    def token_starts(self, text: str) -> NDArray[np.int64]:
+        """Return estimated token start offsets, spreading long pieces evenly."""
+        spans = np.array(
+            [match.span() for match in _PIECE_PATTERN.finditer(text)],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        if not len(spans):
+            return np.zeros(0, dtype=np.int64)
+        code_points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        widths = 1 + np.searchsorted(_UTF8_WIDTH_STEPS, code_points, side='right')
+        byte_offsets = np.concatenate([[0], np.cumsum(widths)])
+        piece_bytes = byte_offsets[spans[:, 1]] - byte_offsets[spans[:, 0]]
+        costs = -(-piece_bytes // _APPROX_BYTES_PER_TOKEN)
+        # Token ``k`` of a piece with ``n`` tokens starts ``k / n`` of the way in.
+        owners = np.repeat(np.arange(len(spans)), costs)
+        ranks = np.arange(len(owners)) - np.repeat(np.cumsum(costs) - costs, costs)
+        lengths = spans[owners, 1] - spans[owners, 0]
+        return spans[owners, 0] + ranks * lengths // costs[owners]
+
+
+class TransformersTokenizer:
+    """Exact token boundaries from a Hugging Face fast tokenizer."""
+
+    def __init__(self, name: str) -> None:
+        """Load the tokenizer *name* (hub id or local directory)."""
+        transformers = importlib.import_module('transformers')
+        self._tokenizer = transformers.AutoTokenizer.from_pretrained(name, use_fast=True)
+        if not self._tokenizer.is_fast:
+            message = f'Tokenizer {name} has no fast implementation with offset mapping'
+            raise RuntimeError(message)
+
+    def token_starts(self, text: str) -> NDArray[np.int64]:
+        """Return the start offset of every token of *text*."""
+        encoding = self._tokenizer(
+            text,
+            add_special_tokens=False,
+            return_offsets_mapping=True,
+            verbose=False,
+        )
+        offsets = np.asarray(encoding['offset_mapping'], dtype=np.int64).reshape(-1, 2)
+        return offsets[:, 0]
+
+
+@functools.lru_cache(maxsize=4)
+def load_tokenizer(name: str = '') -> Tokenizer:
+    """Return the tokenizer *name*, loading every tokenizer once per process.
+
+    An empty name selects the :class:`ApproximateTokenizer`.
+    """
+    if not name:
+        return ApproximateTokenizer()
+    LOGGER.info('Loading summarizer tokenizer %s', name)
+    return TransformersTokenizer(name)
+
+
+@dataclass(frozen=True)
+class ChunkBudget:
+    """Token limits of one chunk.
+
+    Attributes:
+        max_tokens: Largest number of tokens in a chunk.
+        overlap_tokens: Tokens repeated from the end of the previous chunk.
+        min_fill: Fraction of ``max_tokens`` a chunk must reach before a
+            weaker break point is preferred over a stronger one.
+    """
+
+    max_tokens: int
+    overlap_tokens: int = 0
+    min_fill: float = DEFAULT_MIN_FILL
+
+
+class TranscriptChunker:
+    """Split text into token-budgeted chunks at natural break points."""
+
+    def __init__(self, budget: ChunkBudget, tokenizer: Tokenizer | None = None) -> None:
+        """Chunk with *budget*, counting tokens with *tokenizer* (approximate by default)."""
+        if budget.max_tokens < 1:
+            message = 'max_tokens must be greater than 0'
+            raise ValueError(message)
+        if not 0 <= budget.overlap_tokens < budget.max_tokens:
+            message = 'overlap_tokens must be at least 0 and smaller than max_tokens'
+            raise ValueError(message)
+        self._budget = budget
+        self._tokenizer = tokenizer or ApproximateTokenizer()
+
+    @property
+    def budget(self) -> ChunkBudget:
+        """Return the token limits of every chunk."""
+        return self._budget
+
+    def count_tokens(self, text: str) -> int:
+        """Return the number of tokens in *text*."""
+        return len(self._tokenizer.token_starts(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Return the longest prefix of *text* that holds at most *max_tokens* tokens."""
+        starts = self._tokenizer.token_starts(text)
+        if len(starts) <= max_tokens:
+            return text
+        return text[: int(starts[max(max_tokens, 0)])].rstrip()
+
+    def split(self, text: str) -> list[str]:
+        """Return the non-empty chunks of *text*, in order."""
+        starts = self._tokenizer.token_starts(text)
+        total = len(starts)
+        budget = self._budget
+        if total <= budget.max_tokens:
+            stripped = text.strip()
+            return [stripped] if stripped else []
+
+        positions, strengths = break_points(text)
+        # Number of tokens that start before every break point.
+        break_tokens = np.searchsorted(starts, positions, side='left')
+        min_tokens = max(1, int(budget.max_tokens * budget.min_fill))
+
+        chunks: list[str] = []
+        start_char, start_token = 0, 0
+        while True:
+            limit_token = start_token + budget.max_tokens
+            if limit_token >= total:
+                end_char = len(text)
+            else:
+                end_char = self._choose_break(
+                    positions,
+                    strengths,
+                    break_tokens,
+                    window=(start_char, int(starts[limit_token])),
+                    min_token=start_token + min_tokens,
+                )
+            chunk = text[start_char:end_char].strip()
+            if chunk:
+                chunks.append(chunk)
+            if end_char >= len(text):
+                return chunks
+
+            end_token = int(np.searchsorted(starts, end_char, side='left'))
+            next_token = max(end_token - budget.overlap_tokens, start_token + 1)
+            start_char = self._snap_to_word(positions, end_char, int(starts[next_token]))
+            start_token = int(np.searchsorted(starts, start_char, side='left'))
+
+    @staticmethod
+    def _choose_break(
+        positions: NDArray[np.int64],
+        strengths: NDArray[np.int64],
+        break_tokens: NDArray[np.int64],
+        *,
+        window: tuple[int, int],
+        min_token: int,
+    ) -> int:
+        """Return the end of a chunk that may not reach past ``window[1]``."""
+        low = int(np.searchsorted(positions, window[0], side='right'))
+        high = int(np.searchsorted(positions, window[1], side='right'))
+        if low == high:
+            # Not a single break point fits, so cut inside the word.
+            return window[1]
+        candidates = strengths[low:high]
+        full_enough = break_tokens[low:high] >= min_token
+        if full_enough.any():
+            candidates = np.where(full_enough, candidates, -1)
+        best = np.flatnonzero(candidates == candidates.max())[-1]
+        return int(positions[low + best])
+
+    @staticmethod
+    def _snap_to_word(positions: NDArray[np.int64], end_char: int, overlap_char: int) -> int:
+        """Move the start of the overlap forward to the next break point before *end_char*."""
+        index = int(np.searchsorted(positions, overlap_char, side='left'))
+        if index < len(positions) and positions[index] <= end_char:
+            return int(positions[index])
+        return overlap_char
+
+
+def break_points(text: str) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+    """Return sorted candidate chunk ends in *text* and the strength of each."""
+    found_positions: list[NDArray[np.int64]] = []
+    found_strengths: list[NDArray[np.int64]] = []
+    for strength, pattern in _BREAK_PATTERNS:
+        matches = np.fromiter((match.start() for match in pattern.finditer(text)), dtype=np.int64)
+        found_positions.append(matches)
+        found_strengths.append(np.full(len(matches), strength, dtype=np.int64))
+    all_positions = np.concatenate(found_positions)
+    all_strengths = np.concatenate(found_strengths)
+    positions, inverse = np.unique(all_positions, return_inverse=True)
+    strengths = np.full(len(positions), WORD_BREAK, dtype=np.int64)
+    np.maximum.at(strengths, inverse, all_strengths)
+    return positions, strengths
+
+
+__all__: Final = (
+    'DEFAULT_MIN_FILL',
+    'IDEOGRAPH_PATTERN',
+    'LINE_BREAK',
+    'SENTENCE_BREAK',
+    'TURN_BREAK',
+    'WORD_BREAK',
+    'ApproximateTokenizer',
+    'ChunkBudget',
+    'Tokenizer',
+    'TranscriptChunker',
+    'TransformersTokenizer',
+    'break_points',
+    'load_tokenizer',
+)
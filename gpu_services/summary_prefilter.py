@@ -0,0 +1,261 @@
+"""Shrink transcripts to a token budget before they reach the LLM.
+
+Transcripts carry a lot of filler ("yeah", "okay, so...") and repetition
+that costs LLM calls without adding to the summary. The extractive
+pre-filter splits the transcript into sentences, scores each one and keeps
+the best sentences that fit into the budget:
+
+* words (single characters for CJK scripts) are weighted by their
+  inverse document frequency over the sentences of the transcript, so
+  words that occur everywhere ("yeah", "the", "okay") weigh little and
+  specific ones (names, numbers, ticket ids) weigh a lot;
+* a sentence scores the mean weight of its distinct words times the
+  logarithm of their number: specific sentences rank first and short
+  fillers last;
+* repeated sentences only count once.
+
+Centroid similarity was tried as the ranking too, but it favours generic
+on-topic chatter over the one-off sentences that state decisions; see
+``python -m gpu_services.benchmarks.summary_prefilter``.
+
+Kept sentences stay in their original order and under their ``Speaker:``
+label, one line per speaker turn, so the summarizer still sees who said
+what and when. All scoring is vectorised in NumPy over sparse
+``(sentence, term)`` pairs, so long meetings are filtered in milliseconds.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.summary_chunking import IDEOGRAPH_PATTERN, ApproximateTokenizer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.summary_chunking import Tokenizer
+
+LOGGER = logging.getLogger(__name__)
+
+# A line that opens with a short ``Label:`` prefix starts a speaker turn.
+_SPEAKER_PATTERN: Final = re.compile(r'(?P<label>[^\n:]{1,40}):\s+')
+# A sentence runs up to and including its terminal punctuation.
+_SENTENCE_PATTERN: Final = re.compile(r'\S.*?(?:[.!?…]+(?=\s|$)|[。！？]+|$)')
+_TERM_PATTERN: Final = re.compile(rf'{IDEOGRAPH_PATTERN}|[^\W_]+')
+
+
+@dataclass(frozen=True)
+class FilteredTranscript:
+    """Result of :meth:`ExtractivePrefilter.filter`.
+
+    Attributes:
+        text: Kept sentences, grouped into speaker turns.
+        sentences: Number of sentences in the original transcript.
+        kept_sentences: Number of sentences in ``text``.
+        tokens: Tokens in the original transcript.
+        kept_tokens: Tokens of the kept sentences.
+    """
+
+    text: str
+    sentences: int
+    kept_sentences: int
+    tokens: int
+    kept_tokens: int
+
+    @property
+    def compression(self) -> float:
+        """Return the fraction of tokens that was kept."""
+        return self.kept_tokens / self.tokens if self.tokens else 1.0
+
+
+@dataclass(frozen=True)
+class SentenceSpans:
+    """Sentences of a transcript as parallel arrays of character offsets."""
+
+    starts: NDArray[np.int64]
+    ends: NDArray[np.int64]
+    # Index of the line (speaker turn) every sentence belongs to.
+    lines: NDArray[np.int64]
+    labels: tuple[str, ...]
+
+
+class ExtractivePrefilter:
+    """Keep the most informative sentences of a transcript within a token budget."""
+
+    def __init__(
+        self,
+        max_tokens: int,
+        tokenizer: Tokenizer | None = None,
+        *,
+        scorer: Callable[[Sequence[str]], NDArray[np.float64]] | None = None,
+    ) -> None:
+        """Filter down to *max_tokens*, counted with *tokenizer* (approximate by default).
+
+        *scorer* ranks the sentences, :func:`score_sentences` by default;
+        benchmarks pass other rankings to compare against.
+        """
+        if max_tokens < 1:
+            message = 'max_tokens must be greater than 0'
+            raise ValueError(message)
+        self._max_tokens = max_tokens
+        self._tokenizer = tokenizer or ApproximateTokenizer()
+        self._scorer = scorer or score_sentences
+
+    @property
+    def max_tokens(self) -> int:
+        """Return the token budget of a filtered transcript."""
+        return self._max_tokens
+
+    def filter(self, text: str) -> FilteredTranscript:
+        """Return *text* reduced to its best sentences; text within budget is kept whole."""
+        token_starts = self._tokenizer.token_starts(text)
+        sentences = split_sentences(text)
+        total = len(sentences.starts)
+        if len(token_starts) <= self._max_tokens or total <= 1:
+            return FilteredTranscript(
+                text=text,
+                sentences=total,
+                kept_sentences=total,
+                tokens=len(token_starts),
+                kept_tokens=len(token_starts),
+            )
+
+        costs = np.searchsorted(token_starts, sentences.ends) - np.searchsorted(
+            token_starts,
+            sentences.starts,
+        )
+        scores = self._scorer(
+            [text[start:end] for start, end in zip(sentences.starts, sentences.ends, strict=True)],
+        )
+        keep = select_within_budget(scores, costs, self._max_tokens)
+        filtered = FilteredTranscript(
+            text=render_sentences(text, sentences, keep),
+            sentences=total,
+            kept_sentences=int(keep.sum()),
+            tokens=len(token_starts),
+            kept_tokens=int(costs[keep].sum()),
+        )
+        LOGGER.info(
+            'Pre-filter kept %d/%d sentences (%d/%d tokens, %.0f%%)',
+            filtered.kept_sentences,
+            filtered.sentences,
+            filtered.kept_tokens,
+            filtered.tokens,
+            100 * filtered.compression,
+        )
+        return filtered
+
+
+def split_sentences(text: str) -> SentenceSpans:
+    """Return the sentence spans of *text* and the speaker turn each one belongs to."""
+    starts: list[int] = []
+    ends: list[int] = []
+    lines: list[int] = []
+    labels: list[str] = []
+    offset = 0
+    for line in text.split('\n'):
+        speaker = _SPEAKER_PATTERN.match(line)
+        body_start = speaker.end() if speaker else 0
+        found = False
+        for match in _SENTENCE_PATTERN.finditer(line, body_start):
+            starts.append(offset + match.start())
+            ends.append(offset + match.start() + len(match.group().rstrip()))
+            lines.append(len(labels))
+            found = True
+        if found:
+            labels.append(speaker.group('label') if speaker else '')
+        offset += len(line) + 1
+    return SentenceSpans(
+        starts=np.array(starts, dtype=np.int64),
+        ends=np.array(ends, dtype=np.int64),
+        lines=np.array(lines, dtype=np.int64),
+        labels=tuple(labels),
+    )
+
+
+def score_sentences(sentences: Sequence[str]) -> NDArray[np.float64]:
+    """Return the TF-IDF salience of every sentence; repeated sentences score ``0``."""
+    count = len(sentences)
+    vocabulary: dict[str, int] = {}
+    rows: list[int] = []
+    terms: list[int] = []
+    for row, sentence in enumerate(sentences):
+        for term in _TERM_PATTERN.findall(sentence.lower()):
+            rows.append(row)
+            terms.append(vocabulary.setdefault(term, len(vocabulary)))
+    if not rows:
+        return np.zeros(count, dtype=np.float64)
+
+    # Distinct (sentence, term) pairs of the sparse sentence-term matrix.
+    pairs = np.unique(
+        np.array(rows, dtype=np.int64) * len(vocabulary) + np.array(terms, dtype=np.int64),
+    )
+    row_of, term_of = np.divmod(pairs, len(vocabulary))
+    document_frequency = np.bincount(term_of, minlength=len(vocabulary))
+    idf = np.log((1 + count) / (1 + document_frequency)) + 1
+    distinct_terms = np.bincount(row_of, minlength=count)
+    mean_idf = np.bincount(row_of, idf[term_of], minlength=count) / np.maximum(distinct_terms, 1)
+    scores = (mean_idf * np.log1p(distinct_terms)).astype(np.float64)
+
+    # Only the first copy of a repeated sentence keeps its score.
+    fingerprints = [' '.join(_TERM_PATTERN.findall(sentence.lower())) for sentence in sentences]
+    _, first = np.unique(np.array(fingerprints, dtype=object), return_index=True)
+    repeated = np.ones(count, dtype=bool)
+    repeated[first] = False
+    scores[repeated] = 0.0
+    return scores
+
+
+def select_within_budget(
+    scores: NDArray[np.float64],
+    costs: NDArray[np.int64],
+    max_tokens: int,
+) -> NDArray[np.bool_]:
+    """Return the mask of the best-scoring sentences whose costs fit into *max_tokens*.
+
+    Sentences are taken in order of decreasing score (earlier first on ties);
+    a sentence that does not fit is skipped and smaller ones may still be taken.
+    """
+    order = np.lexsort((np.arange(len(scores)), -scores))
+    keep = np.zeros(len(scores), dtype=bool)
+    # Whole prefix of the ranking that fits, then fill the remainder greedily.
+    prefix = int(np.searchsorted(np.cumsum(costs[order]), max_tokens, side='right'))
+    keep[order[:prefix]] = True
+    used = int(costs[order[:prefix]].sum())
+    for index in order[prefix:]:
+        if used + costs[index] <= max_tokens:
+            keep[index] = True
+            used += int(costs[index])
+    return keep
+
+
+def render_sentences(text: str, sentences: SentenceSpans, keep: NDArray[np.bool_]) -> str:
+    """Return the kept sentences as one ``Label: ...`` line per speaker turn."""
+    turns: dict[int, list[str]] = {}
+    for index in np.flatnonzero(keep):
+        sentence = text[sentences.starts[index] : sentences.ends[index]]
+        turns.setdefault(int(sentences.lines[index]), []).append(sentence)
+    rendered: list[str] = []
+    for line, parts in turns.items():
+        label = sentences.labels[line]
+        body = ' '.join(parts)
+        rendered.append(f'{label}: {body}' if label else body)
+    return '\n'.join(rendered)
+
+
+__all__: Final = (
+    'ExtractivePrefilter',
+    'FilteredTranscript',
+    'SentenceSpans',
+    'render_sentences',
+    'score_sentences',
+    'select_within_budget',
+    'split_sentences',
+)
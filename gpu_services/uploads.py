@@ -0,0 +1,117 @@
+"""Helpers for receiving audio uploaded over client-streaming RPCs."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Final, Protocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_UPLOAD_DIR: Final = 'AUDIO_UPLOAD_DIR'
+ENV_UPLOAD_MAX_BYTES: Final = 'AUDIO_UPLOAD_MAX_BYTES'
+
+DEFAULT_UPLOAD_MAX_BYTES: Final = 2 * 1024 * 1024 * 1024
+DEFAULT_UPLOAD_SUFFIX: Final = '.wav'
+
+
+class AudioChunk(Protocol):
+    """Typed representation of the ``AudioChunk`` messages in the service protos."""
+
+    data: bytes
+
+
+class AudioUploadError(ValueError):
+    """Raised when an uploaded audio stream cannot be accepted."""
+
+
+class AudioUploadTooLargeError(AudioUploadError):
+    """Raised when an uploaded audio stream exceeds the configured limit."""
+
+
+def resolve_upload_max_bytes() -> int:
+    """Return the largest accepted upload size in bytes."""
+    raw_value = os.getenv(ENV_UPLOAD_MAX_BYTES, '').strip()
+    if not raw_value:
+        return DEFAULT_UPLOAD_MAX_BYTES
+    try:
+        value = int(raw_value)
+    except ValueError as exc:
+        message = f'{ENV_UPLOAD_MAX_BYTES} must be an integer'
+        raise RuntimeError(message) from exc
+    if value <= 0:
+        message = f'{ENV_UPLOAD_MAX_BYTES} must be greater than 0'
+        raise RuntimeError(message)
+    return value
+
+
+def _resolve_upload_dir() -> Path | None:
+    """Return the directory used for spooled uploads, if configured."""
+    raw_value = os.getenv(ENV_UPLOAD_DIR, '').strip()
+    return Path(raw_value) if raw_value else None
+
+
+@contextlib.contextmanager
+def spool_audio_chunks(
+    chunks: Iterable[AudioChunk],
+    *,
+    max_bytes: int | None = None,
+) -> Iterator[Path]:
+    """Write streamed audio chunks to a temporary file and yield its path.
+
+    The temporary file is removed when the context exits.
+
+    Args:
+        chunks: Request iterator received by a client-streaming servicer.
+        max_bytes: Largest accepted upload size. Defaults to the value of
+            ``AUDIO_UPLOAD_MAX_BYTES``.
+
+    Yields:
+        Path to the fully received audio file.
+
+    Raises:
+        AudioUploadError: If the stream contains no audio data.
+        AudioUploadTooLargeError: If the stream exceeds ``max_bytes``.
+    """
+    limit = resolve_upload_max_bytes() if max_bytes is None else max_bytes
+    handle = tempfile.NamedTemporaryFile(  # noqa: SIM115 - closed explicitly below
+        prefix='upload-',
+        suffix=DEFAULT_UPLOAD_SUFFIX,
+        dir=_resolve_upload_dir(),
+        delete=False,
+    )
+    path = Path(handle.name)
+    try:
+        received = 0
+        with handle:
+            for chunk in chunks:
+                received += len(chunk.data)
+                if received > limit:
+                    message = f'Audio upload exceeds the limit of {limit} bytes'
+                    raise AudioUploadTooLargeError(message)
+                handle.write(chunk.data)
+        if received == 0:
+            message = 'Audio upload contained no data'
+            raise AudioUploadError(message)
+        LOGGER.debug('Spooled %d uploaded bytes to %s', received, path)
+        yield path
+    finally:
+        path.unlink(missing_ok=True)
+
+
+__all__: Final = (
+    'DEFAULT_UPLOAD_MAX_BYTES',
+    'ENV_UPLOAD_DIR',
+    'ENV_UPLOAD_MAX_BYTES',
+    'AudioChunk',
+    'AudioUploadError',
+    'AudioUploadTooLargeError',
+    'resolve_upload_max_bytes',
+    'spool_audio_chunks',
+)
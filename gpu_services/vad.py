@@ -0,0 +1,310 @@
+"""Shared voice-activity detection with a content-addressed region cache.
+
+Speech regions are computed once per recording and stored on disk under a
+hash of the file contents and the detector settings. The ASR and
+diarization services point ``VAD_CACHE_DIR`` at the same directory, so
+whichever service sees a recording first pays for detection and the other
+reuses the result.
+
+The detector is a frame-energy detector that adapts to the noise floor of
+each recording. It needs nothing beyond NumPy and runs in a few seconds on
+hours of audio.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+import numpy as np
+
+from gpu_services.env import get_float_env
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.audio import AudioSource
+
+LOGGER = logging.getLogger(__name__)
+
+ENV_CACHE_DIR: Final = 'VAD_CACHE_DIR'
+DEFAULT_CACHE_DIR: Final = Path(tempfile.gettempdir()) / 'voicerec-vad'
+
+SpeechRegion = tuple[float, float]
+
+_HASH_CHUNK_BYTES: Final = 1 << 20
+_READ_BLOCK_SECONDS: Final = 60.0
+_NOISE_FLOOR_PERCENTILE: Final = 10.0
+_EPSILON: Final = 1e-10
+
+
+@dataclass(frozen=True)
+class VadSettings:
+    """Thresholds of the energy detector and how regions are post-processed.
+
+    A frame is speech when its level is ``threshold_db`` above the
+    recording's noise floor and above ``min_level_db`` (dBFS). Speech is
+    padded by ``pad_seconds`` on both sides, pauses shorter than
+    ``min_silence_seconds`` are bridged and regions shorter than
+    ``min_speech_seconds`` are dropped. The defaults only cut clear,
+    sustained silence.
+    """
+
+    frame_seconds: float = 0.03
+    threshold_db: float = 12.0
+    min_level_db: float = -55.0
+    pad_seconds: float = 0.3
+    min_silence_seconds: float = 1.0
+    min_speech_seconds: float = 0.2
+
+    @classmethod
+    def from_env(cls) -> VadSettings:
+        """Load detector settings from ``VAD_*`` environment variables."""
+        defaults = cls()
+        settings = cls(
+            frame_seconds=defaults.frame_seconds,
+            threshold_db=get_float_env('VAD_THRESHOLD_DB', defaults.threshold_db),
+            min_level_db=get_float_env('VAD_MIN_LEVEL_DB', defaults.min_level_db),
+            pad_seconds=get_float_env('VAD_PAD_SECONDS', defaults.pad_seconds),
+            min_silence_seconds=get_float_env(
+                'VAD_MIN_SILENCE_SECONDS',
+                defaults.min_silence_seconds,
+            ),
+            min_speech_seconds=defaults.min_speech_seconds,
+        )
+        if settings.pad_seconds < 0 or settings.min_silence_seconds < 0:
+            message = 'VAD_PAD_SECONDS and VAD_MIN_SILENCE_SECONDS must not be negative'
+            raise RuntimeError(message)
+        return settings
+
+    def fingerprint(self) -> str:
+        """Return a short digest that changes whenever a setting changes."""
+        payload = json.dumps(asdict(self), sort_keys=True).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=6).hexdigest()
+
+
+def frame_levels_db(source: AudioSource, frame_seconds: float) -> NDArray[np.float64]:
+    """Return the RMS level in dBFS of consecutive frames of *source*.
+
+    The source is read in blocks, so memory stays bounded for long files.
+    """
+    frame = max(1, round(frame_seconds * source.sample_rate))
+    block = frame * max(1, round(_READ_BLOCK_SECONDS / frame_seconds))
+    levels: list[NDArray[np.float64]] = []
+    for start in range(0, source.num_samples, block):
+        samples = source.read(start, min(start + block, source.num_samples)).astype(np.float64)
+        padded = np.zeros(-(-len(samples) // frame) * frame)
+        padded[: len(samples)] = samples
+        power = (padded.reshape(-1, frame) ** 2).mean(axis=1)
+        levels.append(10.0 * np.log10(power + _EPSILON))
+    if not levels:
+        return np.zeros(0, dtype=np.float64)
+    return np.concatenate(levels)
+
+
+def levels_to_regions(
+    levels: NDArray[np.float64],
+    settings: VadSettings,
+    *,
+    total_seconds: float,
+) -> list[SpeechRegion]:
+    """Threshold frame levels and turn speech frames into padded, merged regions."""
+    if not len(levels):
+        return []
+    noise_floor = float(np.percentile(levels, _NOISE_FLOOR_PERCENTILE))
+    threshold = max(noise_floor + settings.threshold_db, settings.min_level_db)
+    speech = levels >= threshold
+
+    # Rising and falling edges of the speech mask give the raw regions.
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], speech.astype(np.int8), [0]])))
+    frame = settings.frame_seconds
+    regions: list[SpeechRegion] = []
+    for start_frame, end_frame in edges.reshape(-1, 2).tolist():
+        start = max(0.0, start_frame * frame - settings.pad_seconds)
+        end = min(total_seconds, end_frame * frame + settings.pad_seconds)
+        if regions and start - regions[-1][1] < settings.min_silence_seconds:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return [(start, end) for start, end in regions if end - start >= settings.min_speech_seconds]
+
+
+def detect_speech(source: AudioSource, settings: VadSettings | None = None) -> list[SpeechRegion]:
+    """Return the speech regions of *source* in seconds."""
+    settings = settings or VadSettings()
+    levels = frame_levels_db(source, settings.frame_seconds)
+    return levels_to_regions(
+        levels,
+        settings,
+        total_seconds=source.num_samples / source.sample_rate,
+    )
+
+
+def content_hash(path: Path) -> str:
+    """Return a digest of the bytes of *path*."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open('rb') as handle:
+        while chunk := handle.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SpeechRegionCache:
+    """Speech regions stored as one small JSON file per recording."""
+
+    def __init__(self, directory: Path) -> None:
+        """Use *directory* for cache files, creating it when needed."""
+        self._directory = directory
+        directory.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> SpeechRegionCache:
+        """Open the cache directory configured by ``VAD_CACHE_DIR``."""
+        raw_value = os.getenv(ENV_CACHE_DIR, '').strip()
+        directory = Path(raw_value).expanduser() if raw_value else DEFAULT_CACHE_DIR
+        return cls(directory)
+
+    def get(self, key: str) -> list[SpeechRegion] | None:
+        """Return the cached regions for *key*, or ``None`` on a miss."""
+        path = self._directory / f'{key}.json'
+        try:
+            payload = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOGGER.warning('Ignoring unreadable speech region cache entry %s: %s', path, exc)
+            return None
+        return [(float(start), float(end)) for start, end in payload['regions']]
+
+    def put(self, key: str, regions: Sequence[SpeechRegion]) -> None:
+        """Store *regions* under *key*; concurrent writers never expose partial files."""
+        path = self._directory / f'{key}.json'
+        payload = json.dumps({'regions': [list(region) for region in regions]})
+        handle, tmp_name = tempfile.mkstemp(dir=self._directory, suffix='.tmp')
+        with os.fdopen(handle, 'w', encoding='utf-8') as tmp_file:
+            tmp_file.write(payload)
+        Path(tmp_name).replace(path)
+
+
+def cached_speech_regions(
+    path: Path,
+    source: AudioSource,
+    *,
+    cache: SpeechRegionCache,
+    settings: VadSettings | None = None,
+) -> list[SpeechRegion]:
+    """Return the speech regions of the recording at *path*, computing them at most once.
+
+    Args:
+        path: File the regions are cached for; its contents form the key.
+        source: Decoded audio of *path*, only read on a cache miss.
+        cache: Region cache shared between services.
+        settings: Detector settings; part of the cache key.
+    """
+    settings = settings or VadSettings()
+    key = f'{content_hash(path)}-{settings.fingerprint()}'
+    regions = cache.get(key)
+    if regions is not None:
+        LOGGER.debug('Reusing %d cached speech region(s) for %s', len(regions), path)
+        return regions
+
+    regions = detect_speech(source, settings)
+    try:
+        cache.put(key, regions)
+    except OSError as exc:
+        LOGGER.warning('Could not cache speech regions for %s: %s', path, exc)
+    LOGGER.info('Detected %d speech region(s) in %s', len(regions), path)
+    return regions
+
+
+class SpeechOnlySource:
+    """Audio source that plays only the speech regions of another source, back to back.
+
+    Positions in the compacted audio map back to the original timeline with
+    :meth:`to_original_seconds`.
+    """
+
+    def __init__(self, source: AudioSource, regions: Sequence[SpeechRegion]) -> None:
+        """Wrap *source*, keeping the samples inside *regions* (in seconds)."""
+        rate = source.sample_rate
+        spans = [
+            (max(0, round(start * rate)), min(source.num_samples, round(end * rate)))
+            for start, end in regions
+        ]
+        spans = [(start, stop) for start, stop in spans if stop > start]
+        self._source = source
+        self._starts = np.asarray([start for start, _ in spans], dtype=np.int64)
+        self._lengths = np.asarray([stop - start for start, stop in spans], dtype=np.int64)
+        self._offsets = np.concatenate([[0], np.cumsum(self._lengths)]).astype(np.int64)
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the wrapped source."""
+        return self._source.sample_rate
+
+    @property
+    def num_samples(self) -> int:
+        """Return the total number of speech samples."""
+        return int(self._offsets[-1])
+
+    def read(self, start: int, stop: int) -> NDArray[np.float32]:
+        """Return compacted samples ``[start, stop)``."""
+        start = max(start, 0)
+        stop = min(stop, self.num_samples)
+        if stop <= start:
+            return np.zeros(0, dtype=np.float32)
+        first = int(np.searchsorted(self._offsets, start, side='right')) - 1
+        pieces: list[NDArray[np.float32]] = []
+        position = start
+        span = first
+        while position < stop:
+            inner = position - int(self._offsets[span])
+            take = min(stop - position, int(self._lengths[span]) - inner)
+            original = int(self._starts[span]) + inner
+            pieces.append(self._source.read(original, original + take))
+            position += take
+            span += 1
+        return np.concatenate(pieces)
+
+    def close(self) -> None:
+        """Leave the wrapped source open; its owner closes it."""
+
+    def to_original_seconds(self, seconds: float, *, is_end: bool = False) -> float:
+        """Map a time in the compacted audio back to the original recording.
+
+        A time on the seam between two regions maps to the start of the later
+        region, or to the end of the earlier one when *is_end* is set.
+        """
+        if not len(self._starts):
+            return seconds
+        rate = self.sample_rate
+        sample = min(max(round(seconds * rate), 0), self.num_samples)
+        if is_end:
+            span = int(np.searchsorted(self._offsets, sample, side='left')) - 1
+        else:
+            span = int(np.searchsorted(self._offsets, sample, side='right')) - 1
+        span = min(max(span, 0), len(self._starts) - 1)
+        return float(self._starts[span] + (sample - self._offsets[span])) / rate
+
+
+__all__: Final = (
+    'DEFAULT_CACHE_DIR',
+    'ENV_CACHE_DIR',
+    'SpeechOnlySource',
+    'SpeechRegion',
+    'SpeechRegionCache',
+    'VadSettings',
+    'cached_speech_regions',
+    'content_hash',
+    'detect_speech',
+    'frame_levels_db',
+    'levels_to_regions',
+)
@@ -0,0 +1,230 @@
+"""Diarize long recordings window by window with bounded memory.
+
+Clustering a whole recording needs an affinity matrix over every speaker
+embedding, which grows quadratically with its length. Here the recording is
+diarized in fixed-length windows instead. Each window's speakers are linked
+to the speakers seen so far through their centroid embeddings, and the
+global centroids are re-clustered once at the end so that speakers split
+early on are merged again. Only the current window's embeddings and one
+centroid per global speaker are kept in memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from typing import TYPE_CHECKING, Any, Final
+
+import numpy as np
+
+from gpu_services.clustering import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    agglomerative_cluster,
+    normalise_rows,
+)
+from gpu_services.inmemory_diarization import DiarizedSegment, SpeakerDiarization
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from gpu_services.audio import AudioSource
+    from gpu_services.inmemory_diarization import InMemoryDiarizer
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS: Final = 1200.0
+
+
+class AudioWindow:
+    """Expose samples ``[offset, offset + length)`` of a source as a source of its own."""
+
+    def __init__(self, source: AudioSource, offset: int, length: int) -> None:
+        """Wrap a slice of *source*; the slice is clamped to the source length."""
+        self._source = source
+        self._offset = offset
+        self._length = max(0, min(length, source.num_samples - offset))
+
+    @property
+    def sample_rate(self) -> int:
+        """Return the sample rate of the wrapped source."""
+        return self._source.sample_rate
+
+    @property
+    def num_samples(self) -> int:
+        """Return the number of samples in the window."""
+        return self._length
+
+    def read(self, start: int, stop: int) -> NDArray[np.float32]:
+        """Return window samples ``[start, stop)``."""
+        start = max(start, 0)
+        stop = min(stop, self._length)
+        if stop <= start:
+            return np.zeros(0, dtype=np.float32)
+        return self._source.read(self._offset + start, self._offset + stop)
+
+    def close(self) -> None:
+        """Leave the wrapped source open; its owner closes it."""
+
+
+class SpeakerLinker:
+    """Incrementally map per-window speakers onto recording-wide speakers.
+
+    Every global speaker is represented by the duration-weighted sum of the
+    unit centroids linked to it. A window speaker joins the most similar
+    global speaker above *threshold*; each global speaker takes at most one
+    speaker per window, since two voices in the same window are distinct.
+    """
+
+    def __init__(self, *, threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+        """Start without any global speakers."""
+        self._threshold = threshold
+        self._sums: NDArray[np.float64] | None = None
+
+    @property
+    def num_speakers(self) -> int:
+        """Return the number of global speakers created so far."""
+        return 0 if self._sums is None else self._sums.shape[0]
+
+    @property
+    def centroids(self) -> NDArray[np.float64]:
+        """Return the unit-length centroid of every global speaker."""
+        if self._sums is None:
+            return np.zeros((0, 0), dtype=np.float64)
+        return normalise_rows(self._sums)
+
+    def link(self, centroids: NDArray[Any], weights: Sequence[float]) -> list[int]:
+        """Assign a global speaker id to every row of *centroids*.
+
+        Args:
+            centroids: One centroid embedding per speaker found in a window.
+            weights: Speech duration of each window speaker, used to weight
+                its contribution to the global centroid.
+
+        Returns:
+            Global speaker ids, row for row.
+        """
+        unit = normalise_rows(np.atleast_2d(centroids))
+        assigned: list[int | None] = [None] * unit.shape[0]
+        if self._sums is not None:
+            similarity = unit @ normalise_rows(self._sums).T
+            rows, columns = np.nonzero(similarity >= self._threshold)
+            taken: set[int] = set()
+            for position in np.argsort(-similarity[rows, columns], kind='stable').tolist():
+                row, column = int(rows[position]), int(columns[position])
+                if assigned[row] is None and column not in taken:
+                    assigned[row] = column
+                    taken.add(column)
+
+        sums = self._sums
+        global_ids: list[int] = []
+        for row, match in enumerate(assigned):
+            weighted = unit[row] * max(float(weights[row]), 1e-6)
+            if match is None or sums is None:
+                sums = weighted[None, :] if sums is None else np.vstack([sums, weighted])
+                global_ids.append(sums.shape[0] - 1)
+            else:
+                sums[match] += weighted
+                global_ids.append(match)
+        self._sums = sums
+        return global_ids
+
+    def merge_map(self) -> list[int]:
+        """Re-cluster the global centroids and return the final id of every global speaker."""
+        if self.num_speakers <= 1:
+            return list(range(self.num_speakers))
+        labels = agglomerative_cluster(self.centroids, threshold=self._threshold)
+        return [int(label) for label in labels.tolist()]
+
+
+def diarize_windowed(
+    diarizer: InMemoryDiarizer,
+    source: AudioSource,
+    *,
+    window_seconds: float = DEFAULT_WINDOW_SECONDS,
+    regions: Sequence[tuple[float, float]] | None = None,
+) -> SpeakerDiarization:
+    """Diarize *source* in windows of *window_seconds* and link speakers across them.
+
+    Recordings no longer than one window are diarized in a single pass.
+    Precomputed speech *regions* (seconds, whole-recording timeline) are
+    clipped to each window instead of running the diarizer's VAD.
+    """
+    window = max(1, round(window_seconds * source.sample_rate))
+    if source.num_samples <= window:
+        return diarizer.diarize_with_centroids(source, regions)
+
+    linker = SpeakerLinker(threshold=diarizer.settings.similarity_threshold)
+    linked: list[DiarizedSegment] = []
+    num_windows = math.ceil(source.num_samples / window)
+    for index in range(num_windows):
+        offset = index * window
+        shift = offset / source.sample_rate
+        part = diarizer.diarize_with_centroids(
+            AudioWindow(source, offset, window),
+            None if regions is None else clip_regions(regions, shift, window / source.sample_rate),
+        )
+        if not part.segments:
+            continue
+        durations = np.zeros(part.centroids.shape[0])
+        for segment in part.segments:
+            durations[segment.speaker] += segment.end - segment.start
+        global_ids = linker.link(part.centroids, durations.tolist())
+        linked.extend(
+            DiarizedSegment(segment.start + shift, segment.end + shift, global_ids[segment.speaker])
+            for segment in part.segments
+        )
+        LOGGER.debug(
+            'Window %d/%d: %d speaker(s), %d global speaker(s) so far',
+            index + 1,
+            num_windows,
+            part.centroids.shape[0],
+            linker.num_speakers,
+        )
+
+    return _finalise(linked, linker)
+
+
+def clip_regions(
+    regions: Sequence[tuple[float, float]],
+    start: float,
+    length: float,
+) -> list[tuple[float, float]]:
+    """Return the parts of *regions* inside ``[start, start + length)``, relative to *start*."""
+    end = start + length
+    return [
+        (max(region_start, start) - start, min(region_end, end) - start)
+        for region_start, region_end in regions
+        if region_end > start and region_start < end
+    ]
+
+
+def _finalise(segments: list[DiarizedSegment], linker: SpeakerLinker) -> SpeakerDiarization:
+    """Apply the global re-clustering, merge touching segments and renumber speakers."""
+    merge_map = linker.merge_map()
+    order: dict[int, int] = {}
+    merged: list[DiarizedSegment] = []
+    for segment in segments:
+        speaker = order.setdefault(merge_map[segment.speaker], len(order))
+        last = merged[-1] if merged else None
+        if last is not None and last.speaker == speaker and math.isclose(last.end, segment.start):
+            merged[-1] = DiarizedSegment(last.start, segment.end, speaker)
+        else:
+            merged.append(DiarizedSegment(segment.start, segment.end, speaker))
+
+    centroids = linker.centroids
+    sums = np.zeros((len(order), centroids.shape[1]))
+    for global_id, final_id in enumerate(merge_map):
+        if final_id in order:
+            sums[order[final_id]] += centroids[global_id]
+    return SpeakerDiarization(segments=merged, centroids=normalise_rows(sums))
+
+
+__all__: Final = (
+    'DEFAULT_WINDOW_SECONDS',
+    'AudioWindow',
+    'SpeakerLinker',
+    'clip_regions',
+    'diarize_windowed',
+)
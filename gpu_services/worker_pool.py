@@ -0,0 +1,152 @@
+"""Process pool whose workers each own a disjoint set of CPU cores."""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from concurrent.futures import Future
+
+LOGGER = logging.getLogger(__name__)
+
+# Native thread pools that size themselves from these variables when first used.
+THREAD_ENV_VARS: Final = (
+    'OMP_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+)
+
+
+def available_cores() -> tuple[int, ...]:
+    """Return the CPU ids the current process may run on."""
+    get_affinity = getattr(os, 'sched_getaffinity', None)
+    if get_affinity is None:  # pragma: no cover - macOS and Windows
+        return tuple(range(os.cpu_count() or 1))
+    return tuple(sorted(get_affinity(0)))
+
+
+def partition_cores(
+    num_workers: int,
+    cores: Iterable[int] | None = None,
+) -> list[tuple[int, ...]]:
+    """Split *cores* into ``num_workers`` contiguous, disjoint groups.
+
+    Args:
+        num_workers: Number of groups to produce.
+        cores: CPU ids to distribute. Defaults to :func:`available_cores`.
+
+    Returns:
+        One tuple of CPU ids per worker. Earlier workers receive one extra
+        core when the cores do not divide evenly.
+
+    Raises:
+        ValueError: If there are fewer cores than workers.
+    """
+    core_ids = available_cores() if cores is None else tuple(cores)
+    if num_workers < 1:
+        message = 'num_workers must be greater than 0'
+        raise ValueError(message)
+    if num_workers > len(core_ids):
+        message = (
+            f'Cannot give {num_workers} workers disjoint cores: only {len(core_ids)} available'
+        )
+        raise ValueError(message)
+
+    base, extra = divmod(len(core_ids), num_workers)
+    partitions: list[tuple[int, ...]] = []
+    start = 0
+    for index in range(num_workers):
+        size = base + (1 if index < extra else 0)
+        partitions.append(core_ids[start : start + size])
+        start += size
+    return partitions
+
+
+def pin_current_process(cores: Sequence[int]) -> None:
+    """Restrict the current process to *cores* and size native thread pools to match."""
+    set_affinity = getattr(os, 'sched_setaffinity', None)
+    if set_affinity is None:  # pragma: no cover - macOS and Windows
+        LOGGER.warning('CPU affinity is not supported on this platform; workers share all cores')
+    else:
+        set_affinity(0, cores)
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(len(cores))
+
+
+def _initialize_worker(
+    cores: tuple[int, ...],
+    initializer: Callable[..., None],
+    initargs: tuple[Any, ...],
+) -> None:
+    """Pin the worker before running the caller's initializer."""
+    pin_current_process(cores)
+    LOGGER.info('Worker %d pinned to cores %s', os.getpid(), ','.join(map(str, cores)))
+    initializer(len(cores), *initargs)
+
+
+class PinnedProcessPool:
+    """Fixed set of single-process executors, each pinned to its own cores.
+
+    Every worker is started with the ``spawn`` method so it never inherits
+    gRPC or torch threads from the parent. ``initializer`` runs once per
+    worker after pinning and receives the worker's core count followed by
+    ``initargs``; it is where each worker loads its own copy of a model.
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        *,
+        initializer: Callable[..., None],
+        initargs: tuple[Any, ...] = (),
+        cores: Iterable[int] | None = None,
+    ) -> None:
+        """Partition the cores and create one executor per worker."""
+        self._core_sets = partition_cores(num_workers, cores)
+        context = multiprocessing.get_context('spawn')
+        self._executors = [
+            ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_initialize_worker,
+                initargs=(core_set, initializer, initargs),
+            )
+            for core_set in self._core_sets
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of worker processes."""
+        return len(self._executors)
+
+    @property
+    def core_sets(self) -> list[tuple[int, ...]]:
+        """Return the CPU ids assigned to each worker."""
+        return list(self._core_sets)
+
+    def submit(self, worker: int, fn: Callable[..., Any], *args: object) -> Future[Any]:
+        """Run ``fn(*args)`` on the given worker process."""
+        return self._executors[worker].submit(fn, *args)
+
+    def wait_ready(self) -> list[int]:
+        """Block until every worker finished its initializer and return their PIDs."""
+        pending = [executor.submit(os.getpid) for executor in self._executors]
+        return [future.result() for future in pending]
+
+    def shutdown(self) -> None:
+        """Stop every worker process."""
+        for executor in self._executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+__all__: Final = (
+    'THREAD_ENV_VARS',
+    'PinnedProcessPool',
+    'available_cores',
+    'partition_cores',
+    'pin_current_process',
+)
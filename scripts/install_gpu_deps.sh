@@ -33,6 +33,8 @@ else
 fi
 
 uv pip install --python "$PYTHON_BIN" \
+  "numpy>=1.26.0" \
+  "grpcio-health-checking>=1.68.0" \
   "transformers>=4.48.0" \
   "openai-whisper>=20240918" \
   "nemo_toolkit[asr]>=1.25.0" \